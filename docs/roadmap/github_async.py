@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Async GitHub REST client used by the issue generator
+کلاینت async برای ساخت همزمان ایشوها
+
+Requests run with bounded concurrency and follow GitHub's rate-limit rules:
+- Primary limit: when ``x-ratelimit-remaining`` runs out, every request
+  waits until ``x-ratelimit-reset``.
+- Secondary limit: a 403/429 is retried after ``retry-after`` or an
+  exponential backoff, and concurrency is halved. It grows back one slot
+  at a time after a run of successful requests.
+
+A 5xx is retried with exponential backoff, except for a POST: GitHub may
+have created the resource before failing, so ``post`` only sends it again
+once ``find_existing`` has looked for it and come back empty.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+RETRYABLE_STATUSES = {500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"}
+
+
+class GitHubAPIError(Exception):
+    """Non-retryable (or retried out) error response from the GitHub API"""
+
+    def __init__(self, status: int, message: str, method: str, path: str):
+        super().__init__(f"{method} {path} failed with {status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that shrinks on secondary rate limits and slowly grows back"""
+
+    def __init__(self, limit: int, recovery_streak: int = 20):
+        self.max_limit = max(1, limit)
+        self.limit = self.max_limit
+        self.active = 0
+        self.peak = 0
+        self.recovery_streak = recovery_streak
+        self._streak = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    async def __aexit__(self, *exc_info):
+        async with self._condition:
+            self.active -= 1
+            self._condition.notify_all()
+
+    def throttle(self) -> None:
+        """Halve the limit after a secondary rate limit"""
+        self.limit = max(1, self.limit // 2)
+        self._streak = 0
+
+    async def succeeded(self) -> None:
+        """Count a success; give a slot back after a long enough streak"""
+        if self.limit >= self.max_limit:
+            return
+        self._streak += 1
+        if self._streak >= self.recovery_streak:
+            self._streak = 0
+            async with self._condition:
+                self.limit += 1
+                self._condition.notify_all()
+
+
+class AsyncGitHubClient:
+    """Minimal async GitHub REST client with rate-limit aware retries"""
+
+    def __init__(self, token: str, api_url: str = "https://api.github.com",
+                 concurrency: int = 4, max_retries: int = 5, backoff_base: float = 1.0,
+                 secondary_backoff: float = 60.0, reserve: int = 0,
+                 sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            token: GitHub personal access token
+            api_url: REST API root
+            concurrency: Maximum requests in flight
+            max_retries: Retries per request for rate limits and 5xx responses
+            backoff_base: First delay of the exponential backoff for 5xx responses
+            secondary_backoff: First delay for a secondary limit without ``retry-after``
+            reserve: Pause once ``x-ratelimit-remaining`` drops to this many requests
+            sleep: Awaitable sleep, replaceable in tests
+            clock: Wall clock in epoch seconds (``x-ratelimit-reset`` is epoch based)
+        """
+        self.http = httpx.AsyncClient(
+            base_url=api_url.rstrip('/'),
+            headers={
+                "Authorization": f"token {token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
+            timeout=30.0,
+        )
+        self.limiter = AdaptiveLimiter(concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.secondary_backoff = secondary_backoff
+        self.reserve = reserve
+        self.retries = 0
+        self._sleep = sleep
+        self._clock = clock
+        self._paused_until = 0.0
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.http.aclose()
+
+    async def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """
+        Send a request, waiting out rate limits and retrying transient failures
+
+        Rate-limited requests were never processed, so they are retried for
+        every method; a 5xx only for idempotent ones.
+
+        Returns:
+            The successful response
+
+        Raises:
+            GitHubAPIError: On a client error, or once retries are exhausted
+        """
+        attempt = 0
+        while True:
+            await self._wait_for_pause()
+            async with self.limiter:
+                # Another request may have hit a limit while this one was queued
+                await self._wait_for_pause()
+                response = await self.http.request(method, path, **kwargs)
+            self._track_remaining(response)
+
+            if response.status_code < 400:
+                await self.limiter.succeeded()
+                return response
+
+            delay = self._retry_delay(response, attempt, method.upper() in IDEMPOTENT_METHODS)
+            if delay is None or attempt == self.max_retries:
+                raise GitHubAPIError(response.status_code, _error_message(response), method, path)
+            self.retries += 1
+            attempt += 1
+            print(f"⏳ {method} {path} got {response.status_code}, retrying in {delay:.1f}s")
+            self._pause(delay)
+
+    async def get(self, path: str, **kwargs) -> Any:
+        return (await self.request("GET", path, **kwargs)).json()
+
+    async def post(self, path: str, payload: Dict[str, Any],
+                   find_existing: Optional[Callable[[], Awaitable[Any]]] = None) -> Any:
+        """
+        Create a resource; after a 5xx, resend only if ``find_existing`` does not find it
+
+        Args:
+            path: Collection to POST to
+            payload: JSON body
+            find_existing: Looks up the resource this POST creates; returns it, or None.
+                Without it a 5xx is final.
+
+        Returns:
+            The created (or found) resource
+        """
+        attempt = 0
+        while True:
+            try:
+                return (await self.request("POST", path, json=payload)).json()
+            except GitHubAPIError as e:
+                if (e.status not in RETRYABLE_STATUSES or find_existing is None
+                        or attempt == self.max_retries):
+                    raise
+            existing = await find_existing()
+            if existing is not None:
+                print(f"♻️  POST {path} failed but had gone through; not resending")
+                return existing
+            delay = self.backoff_base * 2 ** attempt
+            self.retries += 1
+            attempt += 1
+            print(f"⏳ POST {path} failed and created nothing, retrying in {delay:.1f}s")
+            self._pause(delay)
+
+    async def patch(self, path: str, payload: Dict[str, Any]) -> Any:
+        return (await self.request("PATCH", path, json=payload)).json()
+
+    async def paginate(self, path: str, params: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """Fetch every page of a list endpoint, following ``Link: rel="next"``"""
+        items: List[Any] = []
+        response = await self.request("GET", path, params={"per_page": 100, **(params or {})})
+        while True:
+            items.extend(response.json())
+            next_url = response.links.get("next", {}).get("url")
+            if not next_url:
+                return items
+            response = await self.request("GET", next_url)
+
+    def _retry_delay(self, response: httpx.Response, attempt: int,
+                     idempotent: bool = True) -> Optional[float]:
+        """Seconds to wait before retrying, or None when the error is final"""
+        status = response.status_code
+        if status in RETRYABLE_STATUSES:
+            return self.backoff_base * 2 ** attempt if idempotent else None
+        if status not in (403, 429):
+            return None
+
+        retry_after = response.headers.get("retry-after")
+        if response.headers.get("x-ratelimit-remaining") == "0" and not retry_after:
+            # Primary limit: nothing helps until the window resets
+            reset = float(response.headers.get("x-ratelimit-reset") or 0)
+            return max(reset - self._clock(), 0.0) + 1.0
+
+        message = _error_message(response).lower()
+        if not retry_after and status == 403 and "rate limit" not in message:
+            return None  # A plain permission error
+        # Secondary limit: back off and send fewer requests at once
+        self.limiter.throttle()
+        if retry_after:
+            return float(retry_after)
+        return self.secondary_backoff * 2 ** attempt
+
+    def _track_remaining(self, response: httpx.Response) -> None:
+        """Pause proactively when the primary budget is about to run out"""
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset = response.headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None or response.status_code >= 400:
+            return
+        if int(remaining) <= self.reserve:
+            self._pause(max(float(reset) - self._clock(), 0.0) + 1.0)
+
+    def _pause(self, delay: float) -> None:
+        self._paused_until = max(self._paused_until, self._clock() + delay)
+
+    async def _wait_for_pause(self) -> None:
+        delay = self._paused_until - self._clock()
+        while delay > 0:
+            await self._sleep(delay)
+            delay = self._paused_until - self._clock()
+
+
+def _error_message(response: httpx.Response) -> str:
+    try:
+        return str(response.json().get("message", response.text))
+    except ValueError:
+        return response.text
@@ -4,6 +4,7 @@ GitHub Issue Generator Script - YAML Version
 تولید خودکار ایشوها از فایل YAML roadmap
 """
 
+import asyncio
 import os
 import re
 import json
@@ -11,14 +12,23 @@ import argparse
 import hashlib
 import yaml
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
+from urllib.parse import quote
 
 import requests
 from github import Github
 from github.GithubException import GithubException
 
+from github_async import AsyncGitHubClient, GitHubAPIError
+from roadmap_planner import RoadmapPlan, RoadmapPlanner
+
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "zen_issue_generator"
+SIGNATURE_PATTERN = re.compile(r'<!-- UNIQUE_SIGNATURE: ([0-9a-f]{32}) -->')
+SIGNATURE_INDEX_VERSION = 2
+
 
 @dataclass
 class Task:
@@ -61,7 +71,8 @@ class Phase:
 class GitHubIssueGenerator:
     """GitHub Issue Generator از YAML roadmap"""
     
-    def __init__(self, token: str, repo_owner: str, repo_name: str):
+    def __init__(self, token: str, repo_owner: str, repo_name: str,
+                 api_url: str = DEFAULT_API_URL, cache_dir: Optional[str] = None):
         """
         Initialize GitHub client
         
@@ -69,11 +80,25 @@ class GitHubIssueGenerator:
             token: GitHub personal access token
             repo_owner: Repository owner username
             repo_name: Repository name
+            api_url: REST API root (GitHub Enterprise or a local fake for tests)
+            cache_dir: Where the signature index is cached between runs
         """
-        self.github = Github(token)
+        self.github = Github(token, base_url=api_url)
         self.repo = self.github.get_repo(f"{repo_owner}/{repo_name}")
         self.token = token
         self.repo_owner = repo_owner
+        self.repo_name = repo_name
+        self.api_url = api_url.rstrip('/')
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github+json",
+        })
+        self._signature_index: Optional[Dict[str, int]] = None
+        self._signature_index_state: Dict[str, Any] = {}
+        self._repo_path = f"/repos/{repo_owner}/{repo_name}"
+        self._collaborator_lookup: Optional[asyncio.Future] = None
         
     def parse_yaml_roadmap(self, file_path: str) -> List[Phase]:
         """
@@ -148,7 +173,7 @@ class GitHubIssueGenerator:
                                 task_title, task_description_text, phase_name, week_title, 
                                 week_number, clean_category, estimated_hours, subtasks, 
                                 project_name
-                            ) if not "Unknown Project" else ""
+                            )
                             
                             # Create task labels
                             task_labels = [
@@ -279,14 +304,106 @@ Example: `git commit -m "Implement {title}, closes #<issue_number>"`
         return hashlib.md5(unique_string.encode('utf-8')).hexdigest()
     
     def _issue_exists(self, signature: str) -> bool:
-        """Check if an issue with the given signature already exists"""
-        query = f"repo:{self.repo.full_name} is:issue \"{signature}\" in:body"
+        """Check if an issue with the given signature already exists (dict lookup, no API call)"""
+        return signature in self.load_signature_index()
+    
+    def _remember_signature(self, signature: str, number: int) -> None:
+        """Record the signature of an issue created during this run"""
+        self.load_signature_index()[signature] = number
+    
+    def _signature_index_path(self) -> Path:
+        """Cache file for this repository's signature index"""
+        return self.cache_dir / f"{self.repo_owner}_{self.repo_name}_signatures.json"
+    
+    def load_signature_index(self, refresh: bool = False) -> Dict[str, int]:
+        """
+        Map the UNIQUE_SIGNATURE of every issue in the repository to its number
+        
+        Issues are listed once, 100 per page, most recently updated first. The
+        first page is requested with the cached ETag: a 304 means nothing
+        changed and costs no rate limit. Otherwise pages are read only until
+        issues older than the cached watermark show up, and the new signatures
+        are merged into the cached ones.
+        
+        Args:
+            refresh: Reload from the API even if the index is already in memory
+            
+        Returns:
+            Issue number by MD5 signature
+        """
+        if self._signature_index is not None and not refresh:
+            return self._signature_index
+        
+        cached = self._read_signature_cache()
+        signatures = dict(cached.get("signatures", {}))
+        watermark = cached.get("updated_at")
+        url = f"{self.api_url}{self._repo_path}/issues"
+        params = {"state": "all", "sort": "updated", "direction": "desc", "per_page": 100}
+        headers = {"If-None-Match": cached["etag"]} if cached.get("etag") else {}
+        
+        response = self.session.get(url, params=params, headers=headers)
+        if response.status_code == 304:
+            print(f"⏭️  Signature index unchanged ({len(signatures)} issues, cached)")
+            self._signature_index = signatures
+            self._signature_index_state = cached
+            return signatures
+        response.raise_for_status()
+        
+        etag = response.headers.get("ETag")
+        newest = watermark
+        pages = 0
+        while response is not None:
+            pages += 1
+            reached_watermark = False
+            for issue in response.json():
+                updated_at = issue.get("updated_at") or ""
+                if watermark and updated_at < watermark:
+                    reached_watermark = True
+                    break
+                if newest is None or updated_at > newest:
+                    newest = updated_at
+                for signature in SIGNATURE_PATTERN.findall(issue.get("body") or ""):
+                    signatures[signature] = issue["number"]
+            next_url = response.links.get("next", {}).get("url")
+            if reached_watermark or not next_url:
+                break
+            response = self.session.get(next_url)
+            response.raise_for_status()
+        
+        print(f"✅ Indexed {len(signatures)} issue signatures ({pages} page request(s))")
+        self._signature_index = signatures
+        self._signature_index_state = {"etag": etag, "updated_at": newest}
+        self.save_signature_index()
+        return signatures
+    
+    def _read_signature_cache(self) -> Dict[str, Any]:
+        """Load the cached index, ignoring missing or incompatible files"""
+        path = self._signature_index_path()
         try:
-            issues = self.github.search_issues(query=query)
-            return issues.totalCount > 0
-        except GithubException as e:
-            print(f"❌ Error searching for existing issue with signature {signature}: {e}")
-            return False
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != SIGNATURE_INDEX_VERSION:
+            return {}
+        return data
+    
+    def save_signature_index(self) -> None:
+        """Write the in-memory index (including issues created this run) to the cache"""
+        if self._signature_index is None:
+            return
+        path = self._signature_index_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": SIGNATURE_INDEX_VERSION,
+            "etag": self._signature_index_state.get("etag"),
+            "updated_at": self._signature_index_state.get("updated_at"),
+            "signatures": self._signature_index,
+        }
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
     
     def save_parsed_to_file(self, phases: List[Phase], file_path: str) -> None:
         """Save parsed phases to JSON file"""
@@ -313,8 +430,8 @@ Example: `git commit -m "Implement {title}, closes #<issue_number>"`
         print(f"✅ Loaded parsed data from: {file_path}")
         return phases
     
-    def create_labels(self, phases: List[Phase]) -> None:
-        """Create GitHub labels for phases and categories"""
+    def _standard_labels(self, phases: List[Phase]) -> List[Dict[str, str]]:
+        """Labels every roadmap repository gets: priorities, areas, phases and weeks"""
         standard_labels = [
             {"name": "high", "color": "d73a4a", "description": "High priority task"},
             {"name": "medium", "color": "fbca04", "description": "Medium priority task"},
@@ -372,200 +489,556 @@ Example: `git commit -m "Implement {title}, closes #<issue_number>"`
                 "description": f"Week {i} tasks"
             })
         
-        existing_labels = {label.name for label in self.repo.get_labels()}
-        for label_data in standard_labels:
-            if label_data["name"] not in existing_labels:
+        return standard_labels
+    
+    def create_labels(self, phases: List[Phase]) -> None:
+        """Create missing GitHub labels and fix changed ones; see reconcile_labels_async"""
+        asyncio.run(self.reconcile_labels_async(phases))
+    
+    def create_milestones(self, phases: List[Phase]) -> Dict[str, int]:
+        """Create missing GitHub milestones; see reconcile_milestones_async"""
+        return asyncio.run(self.reconcile_milestones_async(phases))
+    
+    async def reconcile_labels_async(self, phases: List[Phase], concurrency: int = 4) -> Dict[str, int]:
+        """
+        Make the repository's labels match the standard labels
+        
+        All labels are fetched in one paginated listing (each page revalidated
+        with its cached ETag, so an unchanged repository costs one free 304 a
+        page), the difference is computed locally, and only missing labels are
+        created and only labels whose color or description changed are updated.
+        
+        Returns:
+            Count of created, updated and unchanged labels
+        """
+        unique: Dict[str, Dict[str, str]] = {}
+        for label in self._standard_labels(phases):
+            unique.setdefault(label["name"].lower(), label)
+        wanted = list(unique.values())
+        async with AsyncGitHubClient(self.token, self.api_url, concurrency=concurrency) as client:
+            existing = {label["name"].lower(): label
+                        for label in await self._cached_listing(client, "labels")}
+            creates, updates = [], []
+            for label in wanted:
+                current = existing.get(label["name"].lower())
+                if current is None:
+                    creates.append(label)
+                elif (current["color"].lower(), current.get("description") or "") != (label["color"], label["description"]):
+                    updates.append((current["name"], label))
+            
+            async def apply(method: str, path: str, label: Dict[str, str]) -> bool:
                 try:
-                    self.repo.create_label(
-                        name=label_data["name"],
-                        color=label_data["color"],
-                        description=label_data["description"]
-                    )
-                    print(f"✅ Created label: {label_data['name']}")
-                except GithubException as e:
-                    print(f"❌ Failed to create label {label_data['name']}: {e}")
-            else:
-                print(f"⏭️  Label already exists: {label_data['name']}")
+                    await client.request(method, path, json=label)
+                except GitHubAPIError as e:
+                    print(f"❌ Failed to {'create' if method == 'POST' else 'update'} label {label['name']}: {e}")
+                    return False
+                print(f"✅ {'Created' if method == 'POST' else 'Updated'} label: {label['name']}")
+                return True
+            
+            results = await asyncio.gather(
+                *(apply("POST", f"{self._repo_path}/labels", label) for label in creates),
+                *(apply("PATCH", f"{self._repo_path}/labels/{quote(name, safe='')}", label)
+                  for name, label in updates),
+            )
+        
+        if any(results):
+            self._forget_listing("labels")
+        counts = {"created": sum(results[:len(creates)]), "updated": sum(results[len(creates):]),
+                  "unchanged": len(wanted) - len(creates) - len(updates)}
+        print(f"🏷️  Labels: {counts['created']} created, {counts['updated']} updated, "
+              f"{counts['unchanged']} already up to date")
+        return counts
     
-    def create_milestones(self, phases: List[Phase]) -> Dict[str, Any]:
-        """Create GitHub milestones for phases"""
-        milestones = {}
-        base_date = datetime.now()
+    async def reconcile_milestones_async(self, phases: List[Phase], concurrency: int = 4) -> Dict[str, int]:
+        """
+        Make sure every phase has a milestone
         
-        for i, phase in enumerate(phases):
-            try:
-                weeks_offset = sum(p.duration_weeks for p in phases[:i])
-                due_date = base_date + timedelta(weeks=weeks_offset + phase.duration_weeks)
+        Milestones are fetched in one paginated listing (ETag-revalidated like
+        labels). Missing ones are created concurrently with a due date counted
+        from today; existing ones only get their description updated, so their
+        due dates do not drift on every run.
+        
+        Returns:
+            Milestone number by phase name
+        """
+        base_date = datetime.now()
+        async with AsyncGitHubClient(self.token, self.api_url, concurrency=concurrency) as client:
+            existing = {milestone["title"]: milestone
+                        for milestone in await self._cached_listing(client, "milestones", {"state": "all"})}
+            
+            async def apply(i: int, phase: Phase) -> Tuple[bool, Optional[int]]:
                 _goalsstr = f"\nGoals:\n" + "\n".join(f"- {goal}" for goal in phase.goals or '') if phase.goals else ""
-                milestone = self.repo.create_milestone(
-                    title=phase.name,
-                    description=f"{phase.description}\n{_goalsstr}",
-                    due_on=due_date
-                )
-                milestones[phase.name] = milestone
-                print(f"✅ Created milestone: {phase.name}")
-                
-            except GithubException as e:
-                if "already_exists" in str(e):
-                    for milestone in self.repo.get_milestones():
-                        if milestone.title == phase.name:
-                            milestones[phase.name] = milestone
-                            print(f"⏭️  Milestone already exists: {phase.name}")
-                            break
-                else:
-                    print(f"❌ Failed to create milestone {phase.name}: {e}")
+                description = f"{phase.description}\n{_goalsstr}"
+                current = existing.get(phase.name)
+                try:
+                    if current is None:
+                        weeks_offset = sum(p.duration_weeks for p in phases[:i])
+                        due_date = base_date + timedelta(weeks=weeks_offset + phase.duration_weeks)
+                        current = await client.post(f"{self._repo_path}/milestones", {
+                            "title": phase.name,
+                            "description": description,
+                            "due_on": due_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        })
+                        print(f"✅ Created milestone: {phase.name}")
+                    elif (current.get("description") or "") != description:
+                        current = await client.patch(f"{self._repo_path}/milestones/{current['number']}",
+                                                     {"description": description})
+                        print(f"✅ Updated milestone: {phase.name}")
+                    else:
+                        return False, current["number"]
+                except GitHubAPIError as e:
+                    print(f"❌ Failed to reconcile milestone {phase.name}: {e}")
+                    return False, None
+                return True, current["number"]
+            
+            results = await asyncio.gather(*(apply(i, phase) for i, phase in enumerate(phases)))
         
+        changed = sum(1 for applied, _ in results if applied)
+        if changed:
+            self._forget_listing("milestones")
+        milestones = {phase.name: number for phase, (_, number) in zip(phases, results) if number is not None}
+        print(f"🎯 Milestones: {changed} created or updated, {len(milestones) - changed} already up to date")
         return milestones
     
-    def _validate_assignee(self, assignee: str) -> bool:
-        """Validate if the assignee is a collaborator in the repository"""
+    def _listing_cache_path(self, name: str) -> Path:
+        return self.cache_dir / f"{self.repo_owner}_{self.repo_name}_{name}.json"
+    
+    async def _cached_listing(self, client: AsyncGitHubClient, name: str,
+                              params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Every item of a repository list endpoint, cached between runs
+        
+        Each cached page is requested with its own ETag, and a 304 keeps the
+        cached copy of that page (an ETag covers one page only). A 304 on a
+        full last page is not trusted: a new item would start a page the
+        cache does not know of, so that page is read again.
+        """
+        path = self._listing_cache_path(name)
         try:
-            collaborators = self.repo.get_collaborators()
-            return any(collaborator.login == assignee for collaborator in collaborators)
+            with open(path, 'r', encoding='utf-8') as f:
+                cached_pages = json.load(f).get("pages", [])
+        except (OSError, ValueError, AttributeError):
+            cached_pages = []
+        query = {"per_page": 100, **(params or {})}
+        url = f"{self._repo_path}/{name}"
+        pages = []
+        while url:
+            index = len(pages)
+            cached = cached_pages[index] if index < len(cached_pages) else None
+            if cached is not None and (cached["url"] != url or (
+                    cached["next"] is None and len(cached["items"]) >= query["per_page"])):
+                cached = None
+            headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else {}
+            response = await client.request("GET", url, params=query if index == 0 else None,
+                                            headers=headers)
+            if response.status_code == 304:
+                page = cached
+            else:
+                page = {"url": url, "etag": response.headers.get("ETag"), "items": response.json(),
+                        "next": response.links.get("next", {}).get("url")}
+            pages.append(page)
+            url = page["next"]
+        
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"pages": pages}, f)
+        return [item for page in pages for item in page["items"]]
+    
+    def _forget_listing(self, name: str) -> None:
+        """Drop a cached listing after changing it; the next run fetches it once again"""
+        self._listing_cache_path(name).unlink(missing_ok=True)
+    
+    
+    def _collaborators(self) -> Set[str]:
+        """Logins that can be assigned, fetched once per run"""
+        try:
+            return {collaborator.login for collaborator in self.repo.get_collaborators()}
         except GithubException as e:
-            print(f"❌ Error validating assignee {assignee}: {e}")
-            return False
+            print(f"❌ Error listing collaborators, assigning issues to {self.repo_owner}: {e}")
+            return set()
+    
+    async def _assignee(self, task: Task) -> str:
+        """The task's assignee if they are a collaborator, else the repository owner"""
+        if self._collaborator_lookup is None:
+            # Only runs that create issues pay for the lookup, and only once
+            self._collaborator_lookup = asyncio.ensure_future(asyncio.to_thread(self._collaborators))
+        collaborators = await self._collaborator_lookup
+        return task.assignee if task.assignee in collaborators else self.repo_owner
+    
+    def _checkpoint_path(self) -> Path:
+        """Progress file of the current (or last interrupted) issue creation run"""
+        return self.cache_dir / f"{self.repo_owner}_{self.repo_name}_checkpoint.json"
     
-    def create_issues(self, phases: List[Phase], milestones: Dict[str, Any], max_tasks: int) -> List[Dict[str, Any]]:
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        """Load the checkpoint of an interrupted run, or start a fresh one"""
+        try:
+            with open(self._checkpoint_path(), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            print(f"🔁 Resuming from checkpoint: {len(data['issues'])} issues already created")
+            return data
+        except (OSError, ValueError, KeyError):
+            return {"issues": {}, "done": []}
+    
+    def _save_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        path = self._checkpoint_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, path)
+    
+    def create_issues(self, phases: List[Phase], milestones: Dict[str, Any], max_tasks: int,
+                      concurrency: int = 4) -> List[Dict[str, Any]]:
         """Create GitHub issues from tasks, with sub-tasks as linked sub-issues"""
-        created_issues = []
+        return asyncio.run(self.create_issues_async(phases, milestones, max_tasks, concurrency))
+    
+    async def create_issues_async(self, phases: List[Phase], milestones: Dict[str, Any],
+                                  max_tasks: int, concurrency: int = 4) -> List[Dict[str, Any]]:
+        """
+        Create GitHub issues concurrently
+        
+        Tasks are created in parallel with at most ``concurrency`` requests in
+        flight, throttled by GitHub's rate-limit headers. An epic is created
+        first, then its sub-issues in parallel, then the epic is linked to
+        them. Every created issue is checkpointed, so rerunning after an
+        interruption or failure resumes without creating anything twice.
+        
+        Returns:
+            Issues created by this run
+        """
+        # One paginated listing up front; every duplicate check below is a dict lookup
+        self.load_signature_index()
+        checkpoint = self._load_checkpoint()
+        done = set(checkpoint["done"])
+        selected = []
+        selected_signatures = set()
         skipped_issues = []
-        task_count = 0
         
         for phase in phases:
-            print(f"\n🚀 Processing issues for {phase.name}...")
-            
             for task in phase.tasks:
-                if task_count >= max_tasks:
-                    print(f"⏹️ Reached maximum task limit ({max_tasks}). Stopping issue creation.")
+                if len(selected) >= max_tasks:
                     break
-                
-                # Generate signature and check for duplicates
                 signature = self._generate_signature(task.title, task.phase, task.week)
-                if self._issue_exists(signature):
+                if signature in done:
+                    continue
+                duplicate = signature not in checkpoint["issues"] and self._issue_exists(signature)
+                if duplicate or signature in selected_signatures:
                     print(f"⏭️ Skipped duplicate issue: {task.title} (signature: {signature})")
                     skipped_issues.append(task.title)
                     continue
-                
-                task_count += 1
-                
-                try:
-                    milestone = milestones.get(task.milestone or "")
-                    
-                    # Determine assignee
-                    assignee = task.assignee if task.assignee and self._validate_assignee(task.assignee) else self.repo_owner
-                    
-                    if task.subtasks:
-                        # Create main epic issue first, without subtasks in description
-                        main_description = self._generate_yaml_task_description(
-                            task.title, task.description, task.phase, f"Week {task.week}", 
-                            task.week, task.category, float(task.estimated_hours or 0.0), [], "Unknown Project"
-                        ) + "\n\nThis is an epic issue. Sub-issues will be linked below."
-                        
-                        main_labels = task.labels or[] + ['epic', 'coordination']
-                        
-                        main_issue_kwargs = {
-                            "title": f"{task.title} (Coordination)",
-                            "body": main_description,
-                            "labels": main_labels,
-                            "assignee": assignee
-                        }
-                        if milestone is not None:
-                            main_issue_kwargs["milestone"] = milestone
-                        
-                        main_issue = self.repo.create_issue(**main_issue_kwargs)
-                        
-                        created_issues.append({
-                            'number': main_issue.number,
-                            'title': main_issue.title,
-                            'url': main_issue.html_url,
-                            'phase': task.phase,
-                            'week': task.week,
-                            'estimated_hours': 0  # Coordination has no direct hours
-                        })
-                        
-                        print(f"✅ Created main issue #{main_issue.number}: {main_issue.title} (0h)")
-                        
-                        sub_issues = []
-                        sub_estimated_hours = task.estimated_hours / len(task.subtasks) if task.estimated_hours and len(task.subtasks) > 0 else 0
-                        
-                        for i, subtask_desc in enumerate(task.subtasks, 1):
-                            sub_title = f"Subtask {i}: {subtask_desc} (part of {task.title})"
-                            sub_signature = self._generate_signature(sub_title, task.phase, task.week)
-                            if self._issue_exists(sub_signature):
-                                print(f"⏭️ Skipped duplicate sub-issue: {sub_title} (signature: {sub_signature})")
-                                skipped_issues.append(sub_title)
-                                continue
-                            
-                            sub_description = self._generate_yaml_task_description(
-                                sub_title, subtask_desc, task.phase, f"Week {task.week}", 
-                                task.week, task.category, sub_estimated_hours, [], "Unknown Project"
-                            ) + f"\n\nThis is a sub-issue of #{main_issue.number}"
-                            
-                            sub_labels = task.labels or [] + ['sub-task']
-                            
-                            sub_issue_kwargs = {
-                                "title": sub_title,
-                                "body": sub_description,
-                                "labels": sub_labels,
-                                "assignee": assignee
-                            }
-                            if milestone is not None:
-                                sub_issue_kwargs["milestone"] = milestone
-                            
-                            sub_issue = self.repo.create_issue(**sub_issue_kwargs)
-                            
-                            sub_issues.append((sub_issue.number, subtask_desc))
-                            
-                            created_issues.append({
-                                'number': sub_issue.number,
-                                'title': sub_issue.title,
-                                'url': sub_issue.html_url,
-                                'phase': task.phase,
-                                'week': task.week,
-                                'estimated_hours': sub_estimated_hours
-                            })
-                            
-                            print(f"✅ Created sub-issue #{sub_issue.number}: {sub_title} ({sub_estimated_hours}h)")
-                        
-                        # Update main issue with sub-issues list
-                        if sub_issues:
-                            sub_section = "### Sub-issues\n" + "\n".join(f"- [ ] [#{num}] {desc}" for num, desc in sub_issues)
-                            updated_body = main_issue.body + "\n\n" + sub_section
-                            main_issue.edit(body=updated_body)
-                            print(f"✅ Updated main issue #{main_issue.number} with sub-issues links")
-                    else:
-                        # No subtasks, create single issue
-                        issue_kwargs = {
-                            "title": task.title,
-                            "body": task.description,
-                            "labels": task.labels,
-                            "assignee": assignee
-                        }
-                        if milestone is not None:
-                            issue_kwargs["milestone"] = milestone
-                        
-                        issue = self.repo.create_issue(**issue_kwargs)
-                        
-                        created_issues.append({
-                            'number': issue.number,
-                            'title': issue.title,
-                            'url': issue.html_url,
-                            'phase': task.phase,
-                            'week': task.week,
-                            'estimated_hours': task.estimated_hours
-                        })
-                        
-                        print(f"✅ Created issue #{issue.number}: {task.title} ({task.estimated_hours}h)")
-                
-                except GithubException as e:
-                    print(f"❌ Failed to create issue for '{task.title}': {e}")
+                selected.append(task)
+                selected_signatures.add(signature)
+        if len(selected) >= max_tasks:
+            print(f"⏹️ Reached maximum task limit ({max_tasks}). Stopping issue creation.")
+        
+        created_issues, _ = await self._run_changes(
+            selected, milestones, checkpoint, concurrency, skipped_issues
+        )
         
         total_hours = sum(issue.get('estimated_hours', 0) for issue in created_issues)
         print(f"\n📊 Issues Summary: Created {len(created_issues)}, Skipped {len(skipped_issues)} duplicates")
         print(f"📊 Total Estimated Hours: {total_hours} hours")
         return created_issues
     
+    async def _run_changes(self, tasks: List[Task], milestones: Dict[str, Any], checkpoint: Dict[str, Any],
+                           concurrency: int, skipped_issues: List[str], relink: Set[str] = frozenset(),
+                           edits: List[Tuple[int, Dict[str, Any]]] = ()) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Create the issues of ``tasks`` and apply ``edits`` (issue number, PATCH fields) concurrently
+        
+        Returns:
+            (issues created, number of failed requests)
+        """
+        self._collaborator_lookup = None
+        async with AsyncGitHubClient(self.token, self.api_url, concurrency=concurrency) as client:
+            results = await asyncio.gather(
+                *(self._create_task_issues(client, task, milestones, checkpoint, skipped_issues,
+                                           relink=self._task_signature(task) in relink)
+                  for task in tasks),
+                *(self._edit_issue(client, number, fields) for number, fields in edits),
+            )
+        
+        created_issues = [issue for issues, _ in results for issue in issues]
+        failed = sum(failures for _, failures in results)
+        self.save_signature_index()
+        if failed:
+            print(f"⚠️  {failed} request(s) failed. Run again to resume from {self._checkpoint_path()}")
+        else:
+            self._checkpoint_path().unlink(missing_ok=True)
+        return created_issues, failed
+    
+    def _task_signature(self, task: Task) -> str:
+        return self._generate_signature(task.title, task.phase, task.week)
+    
+    def task_issue_specs(self, task: Task) -> List[Dict[str, Any]]:
+        """
+        The issues a task maps to: a single issue, or an epic followed by its sub-issues
+        
+        A sub-issue's body gets its epic's number appended when it is sent, and an
+        epic's body gets the list of its sub-issues once they exist.
+        """
+        signature = self._task_signature(task)
+        if not task.subtasks:
+            return [{"signature": signature, "title": task.title, "body": task.description,
+                     "labels": task.labels, "estimated_hours": task.estimated_hours}]
+        
+        # Main epic issue, without subtasks in description
+        main_description = self._generate_yaml_task_description(
+            task.title, task.description, task.phase, f"Week {task.week}",
+            task.week, task.category, float(task.estimated_hours or 0.0), [], "Unknown Project"
+        ) + "\n\nThis is an epic issue. Sub-issues will be linked below."
+        specs = [{"signature": signature, "title": f"{task.title} (Coordination)", "body": main_description,
+                  "labels": (task.labels or []) + ['epic', 'coordination'],
+                  "estimated_hours": 0}]  # Coordination has no direct hours
+        
+        sub_estimated_hours = task.estimated_hours / len(task.subtasks) if task.estimated_hours else 0
+        for i, subtask_desc in enumerate(task.subtasks, 1):
+            sub_title = f"Subtask {i}: {subtask_desc} (part of {task.title})"
+            specs.append({
+                "signature": self._generate_signature(sub_title, task.phase, task.week),
+                "title": sub_title,
+                "body": self._generate_yaml_task_description(
+                    sub_title, subtask_desc, task.phase, f"Week {task.week}",
+                    task.week, task.category, sub_estimated_hours, [], "Unknown Project"
+                ),
+                "labels": (task.labels or []) + ['sub-task'],
+                "estimated_hours": sub_estimated_hours,
+                "subtask": subtask_desc,
+            })
+        return specs
+    
+    @staticmethod
+    def sub_issue_body(spec: Dict[str, Any], epic_number: int) -> str:
+        return spec["body"] + f"\n\nThis is a sub-issue of #{epic_number}"
+    
+    async def _create_task_issues(self, client: AsyncGitHubClient, task: Task, milestones: Dict[str, Any],
+                                  checkpoint: Dict[str, Any], skipped_issues: List[str],
+                                  relink: bool = False) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Create one task's issue, or its epic and sub-issues; returns (created issues, failures)
+        
+        Issues already in the checkpoint are reused. With ``relink`` the epic's body
+        and labels are rewritten even when no sub-issue had to be created.
+        """
+        created = []
+        main_spec, *sub_specs = self.task_issue_specs(task)
+        milestone = milestones.get(task.milestone or "")
+        payload = {}
+        if milestone is not None:
+            payload["milestone"] = getattr(milestone, "number", milestone)
+        
+        main_issue = await self._create_issue(client, checkpoint, main_spec, created, task, payload)
+        if main_issue is None:
+            return created, 1
+        if not sub_specs:
+            self._mark_done(checkpoint, main_spec["signature"])
+            return created, 0
+        
+        async def create_sub_issue(spec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            if spec["signature"] not in checkpoint["issues"] and self._issue_exists(spec["signature"]):
+                print(f"⏭️ Skipped duplicate sub-issue: {spec['title']} (signature: {spec['signature']})")
+                skipped_issues.append(spec['title'])
+                return {}
+            spec = {**spec, "body": self.sub_issue_body(spec, main_issue['number'])}
+            return await self._create_issue(client, checkpoint, spec, created, task, payload)
+        
+        # Sub-issues only need the epic's number, so they go out in parallel
+        sub_results = await asyncio.gather(*(create_sub_issue(spec) for spec in sub_specs))
+        failed = sum(1 for sub_issue in sub_results if sub_issue is None)
+        if failed:
+            # Leave the epic unlinked; the next run creates the missing sub-issues and links them all
+            return created, failed
+        
+        # Update main issue with sub-issues list
+        sub_issues = [(sub_issue['number'], spec['subtask']) for sub_issue, spec in zip(sub_results, sub_specs) if sub_issue]
+        if sub_issues or relink:
+            sub_section = "### Sub-issues\n" + "\n".join(f"- [ ] [#{num}] {desc}" for num, desc in sub_issues)
+            _, failed = await self._edit_issue(client, main_issue['number'], {
+                "title": main_spec["title"],
+                "body": main_spec["body"] + "\n\n" + sub_section,
+                "labels": main_spec["labels"],
+            })
+            if failed:
+                return created, failed
+            print(f"✅ Updated main issue #{main_issue['number']} with sub-issues links")
+        self._mark_done(checkpoint, main_spec["signature"])
+        return created, 0
+    
+    async def _create_issue(self, client: AsyncGitHubClient, checkpoint: Dict[str, Any], spec: Dict[str, Any],
+                            created: List[Dict[str, Any]], task: Task,
+                            payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Create an issue unless the checkpoint already has it; None if creation failed"""
+        signature = spec["signature"]
+        if signature in checkpoint["issues"]:
+            return checkpoint["issues"][signature]
+        try:
+            issue = await client.post(f"{self._repo_path}/issues", {
+                **payload, "title": spec["title"], "body": spec["body"], "labels": spec["labels"],
+                "assignees": [await self._assignee(task)],
+            }, find_existing=lambda: self._find_new_issue(client, signature))
+        except GitHubAPIError as e:
+            print(f"❌ Failed to create issue for '{spec['title']}': {e}")
+            return None
+        
+        record = {
+            'number': issue['number'],
+            'title': issue['title'],
+            'url': issue['html_url'],
+            'phase': task.phase,
+            'week': task.week,
+            'estimated_hours': spec["estimated_hours"],
+            'signature': signature
+        }
+        checkpoint["issues"][signature] = record
+        self._save_checkpoint(checkpoint)
+        self._remember_signature(signature, issue['number'])
+        created.append(record)
+        print(f"✅ Created issue #{issue['number']}: {issue['title']} ({spec['estimated_hours']}h)")
+        return record
+    
+    async def _find_new_issue(self, client: AsyncGitHubClient,
+                              signature: str) -> Optional[Dict[str, Any]]:
+        """The issue carrying ``signature`` among the newest ones, if a failed POST created it"""
+        issues = await client.get(f"{self._repo_path}/issues", params={
+            "state": "all", "sort": "created", "direction": "desc", "per_page": 100,
+        })
+        for issue in issues:
+            if signature in SIGNATURE_PATTERN.findall(issue.get("body") or ""):
+                return issue
+        return None
+    
+    async def _edit_issue(self, client: AsyncGitHubClient, number: int,
+                          fields: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int]:
+        """PATCH an issue; returns ([], failures) so it can be gathered with task creation"""
+        try:
+            await client.patch(f"{self._repo_path}/issues/{number}", fields)
+        except GitHubAPIError as e:
+            print(f"❌ Failed to update issue #{number}: {e}")
+            return [], 1
+        return [], 0
+    
+    def _mark_done(self, checkpoint: Dict[str, Any], signature: str) -> None:
+        checkpoint["done"].append(signature)
+        self._save_checkpoint(checkpoint)
+    
+    def _roadmap_state_path(self) -> Path:
+        """Snapshot of the roadmap as last applied to this repository"""
+        return self.cache_dir / f"{self.repo_owner}_{self.repo_name}_roadmap_state.json"
+    
+    def roadmap_planner(self, full: bool = False) -> RoadmapPlanner:
+        """Planner diffing against the last applied snapshot, or against nothing when ``full``"""
+        previous = None
+        if not full:
+            try:
+                with open(self._roadmap_state_path(), 'r', encoding='utf-8') as f:
+                    previous = json.load(f)
+            except (OSError, ValueError):
+                pass
+        return RoadmapPlanner(self.task_issue_specs, self._task_signature, previous)
+    
+    def plan_changes(self, phases: List[Phase], source_hash: Optional[str] = None) -> RoadmapPlan:
+        """Minimal create/update/close plan turning the last applied roadmap into ``phases``"""
+        return self.roadmap_planner().plan(phases, source_hash)
+    
+    def apply_plan(self, plan: RoadmapPlan, milestones: Dict[str, Any], max_tasks: Optional[int] = None,
+                   concurrency: int = 4) -> List[Dict[str, Any]]:
+        """Apply a change plan; see apply_plan_async"""
+        return asyncio.run(self.apply_plan_async(plan, milestones, max_tasks, concurrency))
+    
+    async def apply_plan_async(self, plan: RoadmapPlan, milestones: Dict[str, Any],
+                               max_tasks: Optional[int] = None, concurrency: int = 4) -> List[Dict[str, Any]]:
+        """
+        Apply a change plan
+        
+        New tasks and epics whose sub-issue list changed go through the same
+        concurrent creation path as create_issues (issues that already exist
+        are reused, not recreated). Other updates and closes are single PATCH
+        requests. The snapshot is saved only when the whole plan was applied,
+        so a partial run is simply planned again next time.
+        
+        Args:
+            plan: Output of plan_changes
+            milestones: Milestones by phase name, for new issues
+            max_tasks: Maximum number of tasks with new issues
+            concurrency: Maximum GitHub requests in flight
+            
+        Returns:
+            Issues created by this run
+        """
+        if not plan.changes:
+            print("✅ GitHub issues already match the roadmap")
+            self._save_roadmap_state(plan.snapshot)
+            return []
+        
+        issues = plan.snapshot["issues"]
+        index = self.load_signature_index() if plan.of('create') or any(
+            change.number is None for change in plan.changes) else {}
+        checkpoint = self._load_checkpoint()
+        for signature, issue in issues.items():
+            number = issue["number"] or index.get(signature)
+            if number is not None:
+                checkpoint["issues"].setdefault(signature, {"number": number})
+        
+        # Tasks with new issues, and epics that must list a different set of sub-issues
+        tasks: Dict[str, Task] = {}
+        relink = set()
+        for change in plan.changes:
+            if change.action == 'create' or (change.action == 'update' and change.signature == change.task_signature
+                                             and change.task.subtasks):
+                tasks.setdefault(change.task_signature, change.task)
+                if change.action == 'update':
+                    relink.add(change.task_signature)
+        task_list = list(tasks.values())
+        complete = max_tasks is None or len(task_list) <= max_tasks
+        task_list = task_list if complete else task_list[:max_tasks]
+        
+        edits = []
+        missing = 0
+        for change in plan.changes:
+            if change.action == 'create' or (change.signature in relink and change.action == 'update'):
+                continue
+            number = change.number or index.get(change.signature)
+            if number is None:
+                print(f"⚠️  No issue found for '{change.title}', leaving it for the next run")
+                missing += 1
+                continue
+            if change.action == 'close':
+                edits.append((number, {"state": "closed", "state_reason": "not_planned"}))
+                print(f"🗑️  Closing issue #{number}: task removed from the roadmap")
+                continue
+            specs = {spec["signature"]: spec for spec in self.task_issue_specs(change.task)}
+            spec = specs[change.signature]
+            if spec.get("subtask") is not None and 'body' in change.fields:
+                epic_number = checkpoint["issues"][change.task_signature]["number"]
+                spec = {**spec, "body": self.sub_issue_body(spec, epic_number)}
+            edits.append((number, {name: spec[name] for name in change.fields}))
+            print(f"✏️  Updating issue #{number}: {', '.join(change.fields)}")
+        
+        skipped_issues: List[str] = []
+        created_issues, failed = await self._run_changes(
+            task_list, milestones, checkpoint, concurrency, skipped_issues, relink=relink, edits=edits
+        )
+        
+        if failed or missing or not complete:
+            print("⚠️  Plan partially applied; the next run plans the remaining changes again")
+        else:
+            for signature, issue in issues.items():
+                if issue["number"] is None:
+                    issue["number"] = checkpoint["issues"].get(signature, {}).get("number")
+            self._save_roadmap_state(plan.snapshot)
+        
+        print(f"\n📊 Plan Summary: Created {len(created_issues)}, Updated {len(edits)} "
+              f"({len(plan.of('close'))} closed)")
+        return created_issues
+    
+    def _save_roadmap_state(self, snapshot: Dict[str, Any]) -> None:
+        path = self._roadmap_state_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    
     def generate_summary_report(self, phases: List[Phase], created_issues: List[Dict[str, Any]]) -> str:
         """Generate summary report of created issues"""
         total_estimated_hours = sum(issue.get('estimated_hours', 0) for issue in created_issues)
@@ -610,6 +1083,10 @@ def main():
     parser.add_argument('--output', help='Output file for summary report')
     parser.add_argument('--dry-run', action='store_true', help='Parse only, do not create issues')
     parser.add_argument('--from-parsed', help='Load parsed phases from JSON file instead of parsing YAML')
+    parser.add_argument('--api-url', default=DEFAULT_API_URL, help='GitHub REST API root URL')
+    parser.add_argument('--concurrency', type=int, default=4, help='Maximum GitHub requests in flight')
+    parser.add_argument('--cache-dir', help=f'Signature index cache directory (default: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--full', action='store_true', help='Ignore the last applied roadmap and plan every task')
     
     args = parser.parse_args()
     
@@ -619,19 +1096,24 @@ def main():
         print("❌ Repository format should be: owner/repo-name")
         return
     
-    generator = GitHubIssueGenerator(args.token, repo_owner, repo_name)
+    generator = GitHubIssueGenerator(args.token, repo_owner, repo_name,
+                                     api_url=args.api_url, cache_dir=args.cache_dir)
     print(f"🚀 Connected to repository: {args.repo}")
     
     try:
+        source = args.from_parsed or args.file
+        if not source or not Path(source).exists():
+            print(f"❌ File not found: {source}")
+            return
+        source_hash = hashlib.sha256(Path(source).read_bytes()).hexdigest()
+        planner = generator.roadmap_planner(full=args.full)
+        if planner.unchanged(source_hash):
+            print("✅ Roadmap unchanged since the last applied run, nothing to do")
+            return
+        
         if args.from_parsed:
-            if not Path(args.from_parsed).exists():
-                print(f"❌ File not found: {args.from_parsed}")
-                return
             phases = generator.load_parsed_from_file(args.from_parsed)
         else:
-            if not args.file or not Path(args.file).exists():
-                print(f"❌ File not found: {args.file}")
-                return
             print("📖 Parsing YAML roadmap...")
             phases = generator.parse_yaml_roadmap(args.file)
             total_tasks = sum(len(p.tasks) for p in phases)
@@ -643,7 +1125,10 @@ def main():
                 save_file = input("Enter filename to save (default: parsed_phases.json): ").strip() or 'parsed_phases.json'
                 generator.save_parsed_to_file(phases, save_file)
         
-        total_tasks = sum(len(phase.tasks) for phase in phases)
+        plan = planner.plan(phases, source_hash)
+        print(plan.summary())
+        new_tasks = {change.task_signature for change in plan.of('create')}
+        total_tasks = len(new_tasks)
         if args.dry_run:
             print("\n🔍 DRY RUN - No issues will be created")
             for phase in phases:
@@ -656,33 +1141,45 @@ def main():
                     print(f"  - {task.title}{hours_info}")
                 if len(phase.tasks) > 3:
                     print(f"  ... and {len(phase.tasks) - 3} more tasks")
+            print("\n📋 Planned changes:")
+            for change in plan.changes:
+                number = f" #{change.number}" if change.number else ""
+                fields = f" ({', '.join(change.fields)})" if change.fields else ""
+                print(f"  {change.action}{number}: {change.title}{fields}")
             return
         
-        # Prompt for number of tasks to convert to issues
+        if not plan.changes:
+            generator.apply_plan(plan, {})
+            return
+        
+        # Prompt for number of new tasks to convert to issues
         max_tasks = total_tasks
-        prompt = f"You have {total_tasks} tasks. How many tasks do you want to create as GitHub issues? (1-{total_tasks}, default {total_tasks}): "
-        try:
-            task_limit = input(prompt).strip()
-            max_tasks = int(task_limit) if task_limit else total_tasks
-            if max_tasks < 1 or max_tasks > total_tasks:
-                raise ValueError
-        except ValueError:
-            print(f"❌ Invalid input. Using default: {total_tasks} tasks")
-            max_tasks = total_tasks
-        
-        create_response = input("Do you want to create issues in GitHub? (y/n): ").strip().lower()
+        if total_tasks:
+            prompt = f"You have {total_tasks} new tasks. How many tasks do you want to create as GitHub issues? (1-{total_tasks}, default {total_tasks}): "
+            try:
+                task_limit = input(prompt).strip()
+                max_tasks = int(task_limit) if task_limit else total_tasks
+                if max_tasks < 1 or max_tasks > total_tasks:
+                    raise ValueError
+            except ValueError:
+                print(f"❌ Invalid input. Using default: {total_tasks} tasks")
+                max_tasks = total_tasks
+        
+        create_response = input("Do you want to apply the plan to GitHub? (y/n): ").strip().lower()
         if create_response != 'y':
             print("❌ Aborting issue creation.")
             return
         
-        print("\n🏷️  Creating labels...")
-        generator.create_labels(phases)
-        
-        print("\n🎯 Creating milestones...")
-        milestones = generator.create_milestones(phases)
+        milestones = {}
+        if new_tasks:
+            print("\n🏷️  Creating labels...")
+            generator.create_labels(phases)
+            
+            print("\n🎯 Creating milestones...")
+            milestones = generator.create_milestones(phases)
         
-        print("\n📝 Creating issues...")
-        created_issues = generator.create_issues(phases, milestones, max_tasks)
+        print("\n📝 Applying plan...")
+        created_issues = generator.apply_plan(plan, milestones, max_tasks, args.concurrency)
         
         report = generator.generate_summary_report(phases, created_issues)
         
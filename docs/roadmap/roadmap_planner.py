@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Incremental roadmap planner
+برنامه‌ریز تغییرات افزایشی roadmap
+
+Every phase, week, category and task of a parsed roadmap is hashed into a
+tree whose parent hashes cover their children. Comparing that tree with the
+snapshot saved after the last successful run skips every unchanged subtree
+and yields the minimal plan: issues to create, issues whose body or labels
+changed, and issues whose task left the roadmap.
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+SNAPSHOT_VERSION = 1
+ISSUE_FIELDS = ("title", "body", "labels")
+
+
+def digest(value: Any) -> str:
+    """Stable hash of any JSON-serialisable value"""
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class PlannedChange:
+    """One issue-level change"""
+    action: str  # 'create', 'update' or 'close'
+    signature: str
+    title: str
+    task: Any = None
+    task_signature: Optional[str] = None
+    number: Optional[int] = None
+    fields: List[str] = field(default_factory=list)  # 'title', 'body' and/or 'labels' for updates
+
+
+@dataclass
+class RoadmapPlan:
+    """Changes to apply, and the snapshot to save once they are all applied"""
+    changes: List[PlannedChange]
+    snapshot: Dict[str, Any]
+
+    def of(self, action: str) -> List[PlannedChange]:
+        return [change for change in self.changes if change.action == action]
+
+    def summary(self) -> str:
+        return (f"📋 Plan: {len(self.of('create'))} to create, {len(self.of('update'))} to update, "
+                f"{len(self.of('close'))} to close")
+
+
+class RoadmapPlanner:
+    """Diffs a parsed roadmap against the snapshot of the last applied plan"""
+
+    def __init__(self, issue_specs: Callable[[Any], List[Dict[str, Any]]],
+                 task_signature: Callable[[Any], str], previous: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            issue_specs: Maps a task to its issues (see GitHubIssueGenerator.task_issue_specs)
+            task_signature: Maps a task to its signature
+            previous: Snapshot saved by the last fully applied plan
+        """
+        self.issue_specs = issue_specs
+        self.task_signature = task_signature
+        if previous and previous.get("version") == SNAPSHOT_VERSION:
+            self.previous = previous
+        else:
+            self.previous = {"tree": {}, "issues": {}}
+
+    def unchanged(self, source_hash: str) -> bool:
+        """True when the roadmap file is byte-for-byte the one last applied; no parsing needed"""
+        return self.previous.get("source_hash") == source_hash
+
+    def build_tree(self, phases: List[Any]) -> Dict[str, Any]:
+        """Hash tree: phase -> week -> category -> task signature -> task hash"""
+        tree = {}
+        for phase in phases:
+            weeks: Dict[str, Any] = {}
+            for task in phase.tasks:
+                week = weeks.setdefault(str(task.week), {"categories": {}})
+                category = week["categories"].setdefault(task.category, {"tasks": {}})
+                category["tasks"][self.task_signature(task)] = digest(asdict(task))
+            for week in weeks.values():
+                for category in week["categories"].values():
+                    category["hash"] = digest(category["tasks"])
+                week["hash"] = digest({name: c["hash"] for name, c in week["categories"].items()})
+            header = [phase.name, phase.description, phase.duration_weeks, phase.labels, phase.goals]
+            tree[phase.name] = {
+                "hash": digest([header, {key: week["hash"] for key, week in weeks.items()}]),
+                "weeks": weeks,
+            }
+        return tree
+
+    def plan(self, phases: List[Any], source_hash: Optional[str] = None) -> RoadmapPlan:
+        """
+        Compute the minimal change plan
+
+        Args:
+            phases: Parsed roadmap
+            source_hash: Hash of the roadmap file, stored so an identical file skips parsing
+
+        Returns:
+            RoadmapPlan with issue-level changes and the snapshot to save after applying it
+        """
+        tree = self.build_tree(phases)
+        old_tree = self.previous["tree"]
+        old_issues = self.previous["issues"]
+        tasks = {self.task_signature(task): task for phase in phases for task in phase.tasks}
+
+        changed = _changed_tasks(tree, old_tree)
+        stale = _changed_tasks(old_tree, tree)
+        removed = [signature for signature in stale if signature not in tasks]
+
+        issues_by_task: Dict[str, List[str]] = {}
+        for signature, issue in old_issues.items():
+            issues_by_task.setdefault(issue["task"], []).append(signature)
+
+        changes: List[PlannedChange] = []
+        issues = dict(old_issues)
+        for task_signature in changed:
+            task = tasks[task_signature]
+            specs = self.issue_specs(task)
+            wanted = {spec["signature"] for spec in specs}
+            touched = False
+            for spec in specs:
+                entry = {"task": task_signature, **{name: digest(spec[name]) for name in ISSUE_FIELDS}}
+                old = old_issues.get(spec["signature"])
+                if old is None:
+                    changes.append(
+                        PlannedChange('create', spec["signature"], spec["title"], task, task_signature)
+                    )
+                    issues[spec["signature"]] = {**entry, "number": None}
+                    touched = True
+                    continue
+                fields = [name for name in ISSUE_FIELDS if old[name] != entry[name]]
+                if fields:
+                    changes.append(PlannedChange('update', spec["signature"], spec["title"], task,
+                                                 task_signature, old.get("number"), fields))
+                issues[spec["signature"]] = {**entry, "number": old.get("number")}
+            for signature in issues_by_task.get(task_signature, []):
+                if signature not in wanted:
+                    changes.append(self._close(signature, old_issues[signature]))
+                    del issues[signature]
+                    touched = True
+            if touched and len(specs) > 1:
+                # The epic lists its sub-issues, so it is rewritten when that list changes
+                self._ensure_update(changes, specs[0], task, task_signature, old_issues)
+
+        for task_signature in removed:
+            for signature in issues_by_task.get(task_signature, []):
+                changes.append(self._close(signature, old_issues[signature]))
+                issues.pop(signature, None)
+
+        snapshot = {"version": SNAPSHOT_VERSION, "source_hash": source_hash, "tree": tree, "issues": issues}
+        return RoadmapPlan(changes, snapshot)
+
+    @staticmethod
+    def _close(signature: str, issue: Dict[str, Any]) -> PlannedChange:
+        return PlannedChange('close', signature, signature, task_signature=issue["task"],
+                             number=issue.get("number"))
+
+    @staticmethod
+    def _ensure_update(changes: List[PlannedChange], epic: Dict[str, Any], task: Any,
+                       task_signature: str, old_issues: Dict[str, Any]) -> None:
+        for change in changes:
+            if change.signature == epic["signature"]:
+                if change.action == 'update' and 'body' not in change.fields:
+                    change.fields.append('body')
+                return
+        changes.append(PlannedChange('update', epic["signature"], epic["title"], task, task_signature,
+                                     old_issues[epic["signature"]].get("number"), ['body']))
+
+
+def _changed_tasks(tree: Dict[str, Any], other: Dict[str, Any]) -> List[str]:
+    """Task signatures in ``tree`` whose hash differs from ``other``, skipping equal subtrees"""
+    changed = []
+    for phase_name, phase in tree.items():
+        other_phase = other.get(phase_name, {})
+        if other_phase.get("hash") == phase["hash"]:
+            continue
+        for week_key, week in phase["weeks"].items():
+            other_week = other_phase.get("weeks", {}).get(week_key, {})
+            if other_week.get("hash") == week["hash"]:
+                continue
+            for category_name, category in week["categories"].items():
+                other_category = other_week.get("categories", {}).get(category_name, {})
+                if other_category.get("hash") == category["hash"]:
+                    continue
+                other_tasks = other_category.get("tasks", {})
+                changed.extend(signature for signature, task_hash in category["tasks"].items()
+                               if other_tasks.get(signature) != task_hash)
+    return changed
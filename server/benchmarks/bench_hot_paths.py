@@ -0,0 +1,350 @@
+"""In-process hot paths, measured with pytest-benchmark.
+
+Usage:
+    pytest benchmarks/bench_hot_paths.py --benchmark-json=benchmarks/baselines/<name>.json
+    python -m benchmarks.compare benchmarks/baselines/<name>.json current.json [--threshold 10]
+
+Offline and self-contained; the whole file runs in well under two minutes.
+"""
+
+import asyncio
+import dataclasses
+import logging
+import random
+import uuid
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from benchmarks.bench_serialization import makeRows
+from benchmarks.dataset import SyntheticDataset
+from src.config.exceptions import failure_exception
+from src.config.exceptions.failure_exception import (ExceptionType,
+                                                     FailureException,
+                                                     LogLevel)
+from src.config.exceptions.log_sink import BufferedLogSink, setLogSink
+from src.core.ratelimit.buckets import LocalBucketStore, RateLimit
+from src.core.ratelimit.middleware import RateLimitMiddleware
+from src.core.realtime.hub import RealtimeHub
+from src.core.scheduling.engine import PlanTask, ScheduleEngine
+from src.core.scheduling.work_calendar import WorkCalendar
+from src.core.security.auth.services.password_hasher import (PasswordHasher,
+                                                             hashPassword)
+from src.core.security.auth.services.token_service import TokenService
+from src.core.utils.pagination import decodeCursor, encodeCursor
+from src.core.utils.serialization import dumpRows, serializerFor
+from src.features.todos.data.datasource.daos.template_dao import TemplateDao
+from src.features.todos.data.datasource.tables.registry import metadata
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.features.todos.data.models.task_model import TaskModel
+from src.workers.tasks.rescoring import countDependents, scoreTask
+
+TASK_ROWS = 5000
+GRAPH_TASKS = 20_000
+BACKLOG_TASKS = 10_000
+REALTIME_CLIENTS = 5000
+REALTIME_PROJECTS = 20
+REALTIME_UPDATES = 10_000
+TEMPLATE_TASKS = 500
+
+
+@pytest.fixture(scope="module")
+def taskRows():
+    return makeRows(TASK_ROWS)
+
+
+@pytest.fixture(scope="module")
+def taskGraph():
+    return list(SyntheticDataset(GRAPH_TASKS, seed=1).rows("tasks"))
+
+
+@pytest.fixture(scope="module")
+def backlog():
+    """A user's open tasks: minutes, some deadlines, priorities and short dependency chains."""
+    rng = random.Random(11)
+    ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(BACKLOG_TASKS)]
+    tasks = []
+    for index, id in enumerate(ids):
+        window = ids[max(0, index - 30) : index]
+        dependencies = tuple(rng.sample(window, min(len(window), rng.randint(1, 2))))
+        tasks.append(
+            PlanTask(
+                id,
+                minutes=rng.randint(15, 600),
+                deadline=rng.randint(600, 1_000_000) if rng.random() < 0.6 else None,
+                priority=rng.randint(0, 4),
+                dependencies=dependencies if rng.random() < 0.3 else (),
+                order=index,
+            )
+        )
+    return tasks
+
+
+def _planned(tasks) -> ScheduleEngine:
+    engine = ScheduleEngine(WorkCalendar(datetime(2025, 1, 6, 7, 0)))
+    engine.load(tasks)
+    return engine
+
+
+@pytest.fixture
+def templateSession():
+    """An in-memory database holding one template: 100 tasks with four subtasks each."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    metadata.create_all(engine)
+    week = {
+        "week_number": 1,
+        "categories": [
+            {
+                "category": "Build",
+                "tasks": [
+                    {"title": f"task {index}", "estimated_hours": 4, "subtasks": list("abcd")}
+                    for index in range(TEMPLATE_TASKS // 5)
+                ],
+            }
+        ],
+    }
+    with Session(engine) as session:
+        templateId = TemplateDao(session).importRoadmap(
+            {"project": {"name": "Bench"}, "phases": [{"name": "Phase 1", "weeks": [week]}]}
+        )
+        session.commit()
+        yield session, templateId
+    engine.dispose()
+
+
+class _NullSocket:
+    async def send_text(self, data: str) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+@pytest.fixture
+def realtimeHub():
+    """5k clients on 20 project channels, on a loop of their own that runs between rounds."""
+    loop = asyncio.new_event_loop()
+
+    async def snapshot(channel):
+        return {"channel": channel}
+
+    async def connect():
+        hub = RealtimeHub(snapshot, coalesceMs=20, maxQueue=32, maxChangesPerMessage=500)
+        clients = [hub.connect(_NullSocket()) for _ in range(REALTIME_CLIENTS)]
+        for index, client in enumerate(clients):
+            hub.subscribe(client, f"project:p{index % REALTIME_PROJECTS}")
+        await asyncio.sleep(0.05)
+        return hub, clients
+
+    hub, clients = loop.run_until_complete(connect())
+    yield loop, hub
+
+    async def disconnect():
+        for client in clients:
+            hub.disconnect(client)
+        await asyncio.sleep(0.05)
+
+    loop.run_until_complete(disconnect())
+    loop.close()
+
+
+@pytest.fixture
+def quietSink(tmp_path):
+    # Real sink and console queue, but nothing printed: only the raising thread's cost is measured.
+    sink = BufferedLogSink(tmp_path, maxQueue=1_000_000)
+    setLogSink(sink)
+    level = failure_exception.console_handler.level
+    failure_exception.console_handler.setLevel(logging.CRITICAL)
+    yield sink
+    failure_exception.console_handler.setLevel(level)
+    setLogSink(None)
+    sink.close()
+
+
+def test_serialize_task_list(benchmark, taskRows):
+    serializer = serializerFor(TaskModel)
+    body = benchmark(dumpRows, taskRows, serializer)
+    assert body.startswith(b"[")
+
+
+def test_failure_exception_not_found(benchmark, quietSink):
+    def raiseNotFound():
+        return FailureException(
+            level=LogLevel.NOT_FOUND, message="Task 42 not found.", userMessage="Task not found."
+        )
+
+    assert benchmark(raiseNotFound).level == LogLevel.NOT_FOUND
+
+
+def test_failure_exception_validation(benchmark, quietSink):
+    """An ignored validation failure; the caller's budget is 200us."""
+
+    def raiseValidation():
+        return FailureException(type=ExceptionType.VALIDATION, level=LogLevel.IGNORE, message="bad")
+
+    assert benchmark(raiseValidation).type == ExceptionType.VALIDATION
+
+
+def test_failure_exception_with_error(benchmark, quietSink):
+    error = ValueError("connection reset by peer")
+
+    def raiseDatabaseError():
+        return FailureException(
+            type=ExceptionType.DATABASE, level=LogLevel.ERROR, message="Query failed.", error=error
+        )
+
+    assert benchmark(raiseDatabaseError).hasError
+
+
+def test_parse_yaml_roadmap_100x(benchmark, issueGenerator, scaledRoadmap):
+    phases = benchmark.pedantic(
+        issueGenerator.parse_yaml_roadmap, args=(str(scaledRoadmap),), rounds=3, iterations=1
+    )
+    assert len(phases) >= 100
+
+
+def test_count_dependents(benchmark, taskGraph):
+    dependents = benchmark(countDependents, taskGraph)
+    assert dependents
+
+
+def test_score_tasks(benchmark, taskGraph):
+    dependents = countDependents(taskGraph)
+    today = date(2025, 6, 30)
+
+    def scoreAll():
+        return [scoreTask(task, dependents.get(str(task["id"]), 0), today) for task in taskGraph]
+
+    assert len(benchmark(scoreAll)) == GRAPH_TASKS
+
+
+def test_full_replan_10k_backlog(benchmark, backlog):
+    """A full plan of a 10k-task backlog; the budget is 200ms."""
+    engine = benchmark(_planned, backlog)
+    assert len(engine.sequence) == BACKLOG_TASKS
+
+
+def test_incremental_replan_10k_backlog(benchmark, backlog):
+    """One task changing mid-plan in a 10k-task backlog; the budget is 200ms."""
+    engine = _planned(backlog)
+    victim = engine.tasks[engine.sequence[len(engine.sequence) // 2]]
+    versions = [dataclasses.replace(victim, minutes=victim.minutes + 45), victim]
+
+    def replanOne():
+        # Alternate between two estimates so every round has a real change to apply.
+        versions.reverse()
+        return engine.apply([versions[0]])
+
+    assert benchmark(replanOne).resumedAt > 0
+
+
+def test_realtime_bulk_import_publish(benchmark, realtimeHub):
+    """A 10k-task bulk import published to 5k subscribed clients; the budget is 1s."""
+    loop, hub = realtimeHub
+    rng = random.Random(7)
+
+    async def publishAll():
+        for _ in range(REALTIME_UPDATES):
+            project, task = rng.randrange(REALTIME_PROJECTS), rng.randrange(500)
+            hub.publish(f"project:p{project}", f"t{project}-{task}", {"progress": rng.random()})
+
+    rounds = []
+
+    def freshRound():
+        # Untimed: the last round's coalesced deltas go out before the next round publishes.
+        loop.run_until_complete(asyncio.sleep(0.05))
+        rounds.append(publishAll())
+        return (rounds[-1],), {}
+
+    benchmark.pedantic(loop.run_until_complete, setup=freshRound, rounds=3)
+    assert hub.stats.published == len(rounds) * REALTIME_UPDATES
+
+
+def test_instantiate_500_task_template(benchmark, templateSession):
+    """Cloning a 500-task template into a new project, commit included; the budget is 500ms."""
+    session, templateId = templateSession
+    dao = TemplateDao(session)
+
+    def instantiate():
+        projectId = dao.instantiateProject(templateId)
+        session.commit()
+        return projectId
+
+    projectId = benchmark.pedantic(instantiate, rounds=5, iterations=1)
+    tasks = TaskTable.__table__
+    count = session.execute(
+        select(func.count()).where(tasks.c.project_id == projectId, tasks.c.type != "phase")
+    ).scalar()
+    assert count == TEMPLATE_TASKS
+
+
+def test_event_loop_tick_during_login_storm(benchmark):
+    """A 5ms sleep on the loop while 12 logins hash; the budget is 50ms."""
+    hasher = PasswordHasher(workers=2, maxPending=64, rounds=10)
+    passwordHash = hashPassword("pw", 10)
+    loop = asyncio.new_event_loop()
+    results, logins = [], []
+
+    def finishStorm():
+        results.extend(loop.run_until_complete(asyncio.gather(*logins)) if logins else ())
+
+    def startStorm():
+        # Untimed: the last storm finishes; the new one starts once the timed tick runs the loop.
+        finishStorm()
+        logins[:] = [loop.create_task(hasher.verify("pw", passwordHash)) for _ in range(12)]
+
+    try:
+        loop.run_until_complete(hasher.verify("pw", passwordHash))  # start the pool untimed
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(asyncio.sleep(0.005)), setup=startStorm, rounds=10
+        )
+        finishStorm()
+    finally:
+        hasher.shutdown()
+        loop.close()
+
+    assert results and all(results)
+
+
+def test_cursor_round_trip(benchmark):
+    values = [datetime(2025, 6, 30, 12, 0), uuid.UUID("7d1f6c52-57b1-4c3e-9d6a-5c7f6f0e2f11")]
+
+    def roundTrip():
+        return decodeCursor(encodeCursor([values[0].isoformat(), str(values[1])]))
+
+    assert benchmark(roundTrip) == values
+
+
+def test_rate_limit_middleware(benchmark):
+    """Per-request cost of the limiter for an authenticated client; the budget is 50us."""
+
+    async def app(scope, receive, send):
+        pass
+
+    tokens = TokenService("bench-secret-key")
+    middleware = RateLimitMiddleware(
+        app,
+        limits={"read": RateLimit(rate=1e9, burst=10**9)},
+        store=LocalBucketStore(),
+        tokens=tokens,
+    )
+    token = tokens.issue(uuid.uuid4())[0]
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/tasks",
+        "headers": [(b"host", b"api"), (b"authorization", f"Bearer {token}".encode())],
+        "client": ("10.0.0.1", 5000),
+    }
+
+    def handleRequest():
+        # Nothing inside awaits, so one send() runs the whole request without an event loop.
+        try:
+            middleware(scope, None, None).send(None)
+        except StopIteration:
+            return True
+
+    assert benchmark(handleRequest)
@@ -0,0 +1,87 @@
+"""Throughput of the task list response path: Pydantic + default encoder vs. compiled rows + orjson.
+
+Usage: python -m benchmarks.bench_serialization [--rows 5000] [--repeat 20]
+"""
+
+import argparse
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+
+from src.core.utils.serialization import (dumpRows, schemaFields,
+                                          serializerFor)
+from src.features.todos.data.models.task_model import TaskModel
+from src.features.todos.domain.enums.priority import PriorityEnum
+
+
+def makeRows(count: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    projectId = uuid.UUID(int=rng.getrandbits(128))
+    base = datetime(2025, 1, 1)
+    rows = []
+    for i in range(count):
+        created = base + timedelta(minutes=i)
+        row = {
+            "id": uuid.UUID(int=rng.getrandbits(128)),
+            "title": f"Task {i}",
+            "status": rng.choice(["todo", "doing", "done"]),
+            "priority": rng.choice(list(PriorityEnum)),
+            "type": "task",
+            "parent_task_id": None,
+            "project_id": projectId,
+            "assigned_to": uuid.UUID(int=rng.getrandbits(128)),
+            "estimated_hours": rng.uniform(1, 16),
+            "actual_hours": None,
+            "progress_percentage": rng.uniform(0, 100),
+            "labels": ["backend", f"week-{i % 16}"],
+            "due_date": (created + timedelta(days=14)).date(),
+            "completed_at": None,
+            "created_at": created,
+            "updated_at": created,
+        }
+        rows.append(tuple(row[field] for field in schemaFields(TaskModel)))
+    return rows
+
+
+def pydanticPath(rows) -> bytes:
+    fields = schemaFields(TaskModel)
+    models = [TaskModel.model_validate(dict(zip(fields, row))) for row in rows]
+    return json.dumps(jsonable_encoder({"items": models})).encode("utf-8")
+
+
+def fastPath(rows) -> bytes:
+    return dumpRows(rows, serializerFor(TaskModel))
+
+
+def measure(fn, rows, repeat: int) -> float:
+    fn(rows)
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = makeRows(args.rows)
+    results = {
+        "pydantic+json": measure(pydanticPath, rows, args.repeat),
+        "compiled+orjson": measure(fastPath, rows, args.repeat),
+    }
+    for name, seconds in results.items():
+        print(f"{name:>16}: {seconds * 1000:8.2f} ms  {args.rows / seconds:12,.0f} rows/s")
+    print(f"{'speedup':>16}: {results['pydantic+json'] / results['compiled+orjson']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
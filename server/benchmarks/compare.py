@@ -0,0 +1,80 @@
+"""Compare two pytest-benchmark JSON files and fail on regressions.
+
+Usage: python -m benchmarks.compare BASELINE.json CURRENT.json [--threshold 10] [--stat median]
+
+Exits with status 1 when any benchmark present in both files got slower
+than the baseline by more than ``--threshold`` percent.
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+STATS = ("min", "median", "mean")
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: Optional[float]
+    current: Optional[float]
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change in percent; positive means slower."""
+        if not self.baseline or self.current is None:
+            return None
+        return (self.current / self.baseline - 1) * 100
+
+
+def loadStats(path: str, stat: str) -> Dict[str, float]:
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    return {bench["name"]: bench["stats"][stat] for bench in data["benchmarks"]}
+
+
+def compare(baseline: Dict[str, float], current: Dict[str, float]) -> List[Comparison]:
+    names = list(baseline) + [name for name in current if name not in baseline]
+    return [Comparison(name, baseline.get(name), current.get(name)) for name in names]
+
+
+def regressions(comparisons: List[Comparison], threshold: float) -> List[Comparison]:
+    return [item for item in comparisons if item.change is not None and item.change > threshold]
+
+
+def formatComparison(comparisons: List[Comparison], threshold: float) -> str:
+    lines = [f"{'benchmark':<40} {'baseline':>12} {'current':>12} {'change':>9}"]
+    for item in comparisons:
+        baseline = f"{item.baseline * 1e6:10.1f}us" if item.baseline is not None else "-"
+        current = f"{item.current * 1e6:10.1f}us" if item.current is not None else "-"
+        change = item.change
+        if change is None:
+            note = "new" if item.baseline is None else "missing"
+            lines.append(f"{item.name:<40} {baseline:>12} {current:>12} {note:>9}")
+            continue
+        flag = "  REGRESSION" if change > threshold else ""
+        lines.append(f"{item.name:<40} {baseline:>12} {current:>12} {change:>+8.1f}%{flag}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown in %%")
+    parser.add_argument("--stat", choices=STATS, default="median")
+    args = parser.parse_args(argv)
+
+    comparisons = compare(loadStats(args.baseline, args.stat), loadStats(args.current, args.stat))
+    print(formatComparison(comparisons, args.threshold))
+    slower = regressions(comparisons, args.threshold)
+    if slower:
+        print(f"\n{len(slower)} benchmark(s) regressed by more than {args.threshold:g}%")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
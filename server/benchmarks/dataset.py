@@ -0,0 +1,429 @@
+"""Seeded synthetic workspace at production scale, bulk-loaded with COPY.
+
+Usage: python -m benchmarks.dataset --scale 100k [--seed 42] [--reset]
+
+The same scale and seed always produce the same rows (ids included), so
+load-test and benchmark results are comparable across machines and runs.
+"""
+
+import argparse
+import itertools
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from datetime import time as dtime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import orjson
+import pyarrow as pa
+from sqlalchemy import JSON, Engine, Table, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import AddConstraint, DropConstraint
+
+from src.core.snapshot.columns import arrowSchema, toArrowArray
+from src.core.snapshot.restore import CopyStream
+from src.features.todos.domain.enums.priority import PriorityEnum
+from src.features.todos.domain.enums.status import StatusEnum
+from src.features.todos.domain.enums.user_role import UserRole
+
+SCALES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+# Parents before children; tags and entity_tags reference each other (see _cyclicForeignKeys).
+TABLE_ORDER = ("users", "projects", "tasks", "task_logs", "time_blocks", "tags", "entity_tags")
+
+BATCH_SIZE = 50_000
+TASKS_PER_PROJECT = 250
+PROJECTS_PER_USER = 2
+MAX_DEPTH = 3
+
+STATUSES = ("todo", "doing", "done", "blocked")
+STATUS_WEIGHTS = (40, 20, 35, 5)
+PRIORITY_WEIGHTS = (30, 35, 20, 10, 5)
+TASK_TYPES = ("task", "bug", "feature", "chore", "research")
+LABELS = ("backend", "frontend", "infra", "docs", "design", "ops", "qa", "mobile", "data", "ai")
+CATEGORIES = ("product", "internal", "client", "research", "personal")
+WORDS = (
+    "api", "sync", "board", "login", "export", "search", "cache", "billing", "vault",
+    "roadmap", "calendar", "reminder", "import", "onboarding", "metrics", "graph",
+)
+VERBS = ("Implement", "Fix", "Refactor", "Document", "Review", "Test", "Design", "Migrate")
+LOCATIONS = ("home", "office", "cafe", "train", None)
+DEVICES = ("laptop", "desktop", "tablet", "phone")
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+class SyntheticDataset:
+    """Users, projects, nested tasks with dependencies, daily logs, time blocks and tags.
+
+    Rows are generated table by table and never held in memory as a whole:
+    every project draws from its own seeded RNG, so child tables regenerate
+    the project's task skeleton instead of keeping a million tasks around.
+    """
+
+    def __init__(self, tasks: int, seed: int = 42, now: Optional[datetime] = None):
+        self.tasks = tasks
+        self.seed = seed
+        self.now = now or datetime(2025, 6, 30, 18, 0)
+        projectCount = max(1, tasks // TASKS_PER_PROJECT)
+        userCount = max(2, projectCount // PROJECTS_PER_USER)
+
+        rng = self._rng("users")
+        self.userIds = [_uuid(rng) for _ in range(userCount)]
+        rng = self._rng("projects")
+        self.projectIds = [_uuid(rng) for _ in range(projectCount)]
+        self.projectSizes = self._projectSizes(rng, projectCount)
+
+        rng = self._rng("tags")
+        tagCount = max(20, tasks // 1000)
+        self.tagIds = [_uuid(rng) for _ in range(tagCount)]
+        # Each tag points back at the entity_tags row that first attached it.
+        self.pinnedEntityTagIds = [_uuid(rng) for _ in range(tagCount)]
+
+    def _rng(self, *scope) -> random.Random:
+        return random.Random(":".join(str(part) for part in (self.seed, *scope)))
+
+    def _projectSizes(self, rng: random.Random, projectCount: int) -> List[int]:
+        # Heavy-tailed but capped: a few large projects, many small ones, summing exactly to tasks.
+        weights = [min(rng.paretovariate(1.5), 20.0) for _ in range(projectCount)]
+        total = sum(weights)
+        sizes = [max(1, int(self.tasks * weight / total)) for weight in weights]
+        difference = self.tasks - sum(sizes)
+        index = 0
+        while difference:
+            step = 1 if difference > 0 else -1
+            if sizes[index % projectCount] + step >= 1:
+                sizes[index % projectCount] += step
+                difference -= step
+            index += 1
+        return sizes
+
+    def _team(self, projectIndex: int) -> List[uuid.UUID]:
+        owner = projectIndex // PROJECTS_PER_USER
+        return [self.userIds[(owner + offset) % len(self.userIds)] for offset in range(5)]
+
+    def rows(self, tableName: str) -> Iterator[dict]:
+        return getattr(self, f"_{tableName}")()
+
+    def _users(self) -> Iterator[dict]:
+        rng = self._rng("users", "rows")
+        for index, userId in enumerate(self.userIds):
+            createdAt = self.now - timedelta(days=rng.randrange(30, 720))
+            yield {
+                "id": userId,
+                "username": f"user{index}",
+                "email": f"user{index}@example.com",
+                "password_hash": None,
+                "role": UserRole.admin if index % 50 == 0 else UserRole.user,
+                "status": StatusEnum.active if rng.random() < 0.95 else StatusEnum.suspended,
+                "last_login": self.now - timedelta(minutes=rng.randrange(60 * 24 * 30)),
+                "created_at": createdAt,
+                "updated_at": createdAt,
+            }
+
+    def _projects(self) -> Iterator[dict]:
+        rng = self._rng("projects", "rows")
+        for index, projectId in enumerate(self.projectIds):
+            start = (self.now - timedelta(days=rng.randrange(30, 365))).date()
+            yield {
+                "id": projectId,
+                "name": f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} {index}",
+                "description": f"Synthetic project {index}",
+                "owner_id": self._team(index)[0],
+                "category": rng.choice(CATEGORIES),
+                "status": "active" if rng.random() < 0.8 else "archived",
+                "start_date": start,
+                "end_date": start + timedelta(days=rng.randrange(60, 400)),
+                "budget": round(rng.uniform(1_000, 250_000), 2),
+                "progress_percentage": round(rng.uniform(0, 100), 1),
+                "ai_health_score": round(rng.random(), 3),
+                "created_at": datetime.combine(start, dtime(9)),
+                "updated_at": self.now - timedelta(hours=rng.randrange(24 * 60)),
+            }
+
+    def _projectTasks(self, projectIndex: int) -> List[dict]:
+        rng = self._rng("tasks", projectIndex)
+        projectId = self.projectIds[projectIndex]
+        team = self._team(projectIndex)
+        size = self.projectSizes[projectIndex]
+        start = self.now - timedelta(days=rng.randrange(30, 365))
+        gap = (self.now - start) / (size + 1)
+        tasks: List[dict] = []
+        depths: List[int] = []
+        for index in range(size):
+            createdAt = start + gap * index + timedelta(minutes=rng.randrange(60))
+            status = rng.choices(STATUSES, STATUS_WEIGHTS)[0]
+            parentId, depth = None, 0
+            if index and rng.random() < 0.35:
+                parentIndex = rng.randrange(max(0, index - 50), index)
+                if depths[parentIndex] < MAX_DEPTH - 1:
+                    parentId, depth = tasks[parentIndex]["id"], depths[parentIndex] + 1
+            # Only earlier tasks of the same project: the dependency graph stays acyclic.
+            dependencies = []
+            if index and rng.random() < 0.3:
+                window = range(max(0, index - 30), index)
+                picks = rng.sample(window, min(len(window), rng.randint(1, 3)))
+                dependencies = [str(tasks[pick]["id"]) for pick in picks]
+            estimated = round(rng.uniform(0.5, 24), 1)
+            completedAt = (
+                createdAt + timedelta(hours=rng.randrange(1, 24 * 30)) if status == "done" else None
+            )
+            tasks.append(
+                {
+                    "id": _uuid(rng),
+                    "title": f"{rng.choice(VERBS)} {rng.choice(WORDS)} {index}",
+                    "description": None if rng.random() < 0.5 else f"Details for task {index}",
+                    "status": status,
+                    "priority": rng.choices(list(PriorityEnum), PRIORITY_WEIGHTS)[0],
+                    "type": rng.choice(TASK_TYPES),
+                    "estimated_hours": estimated,
+                    "actual_hours": (
+                        round(estimated * rng.uniform(0.5, 2), 1) if completedAt else None
+                    ),
+                    "parent_task_id": parentId,
+                    "project_id": projectId,
+                    "created_at": createdAt,
+                    "updated_at": min(
+                        self.now, (completedAt or createdAt) + timedelta(hours=rng.randrange(48))
+                    ),
+                    "assigned_to": rng.choice(team) if rng.random() < 0.85 else None,
+                    "labels": rng.sample(LABELS, rng.randint(0, 3)),
+                    "dependencies": dependencies,
+                    "progress_percentage": 100.0 if completedAt else round(rng.uniform(0, 90), 1),
+                    "effort_level": rng.choice(("low", "medium", "high")),
+                    "due_date": (createdAt + timedelta(days=rng.randrange(3, 60))).date(),
+                    "completed_at": completedAt,
+                    "ai_priority_score": round(rng.random(), 3),
+                    "blocked_reason": "Waiting on review" if status == "blocked" else None,
+                }
+            )
+            depths.append(depth)
+        return tasks
+
+    def _allTasks(self) -> Iterator[dict]:
+        for projectIndex in range(len(self.projectIds)):
+            yield from self._projectTasks(projectIndex)
+
+    def _tasks(self) -> Iterator[dict]:
+        return self._allTasks()
+
+    def _task_logs(self) -> Iterator[dict]:
+        rng = self._rng("task_logs")
+        for task in self._allTasks():
+            if task["status"] == "todo":
+                continue
+            day = task["created_at"].date()
+            progress = 0.0
+            for _ in range(rng.randint(1, 5)):
+                day += timedelta(days=rng.randint(1, 3))
+                progress = min(100.0, progress + rng.uniform(5, 40))
+                yield {
+                    "id": _uuid(rng),
+                    "task_id": task["id"],
+                    "date": day,
+                    "progress_percentage": round(progress, 1),
+                    "notes": None if rng.random() < 0.6 else "Progress update",
+                    "time_spent": round(rng.uniform(0.25, 6), 2),
+                    "mood_score": rng.randint(1, 5),
+                    "energy_level": rng.randint(1, 5),
+                    "obstacles": None if rng.random() < 0.85 else "Blocked by dependency",
+                }
+
+    def _time_blocks(self) -> Iterator[dict]:
+        rng = self._rng("time_blocks")
+        for task in self._allTasks():
+            if task["status"] == "todo" and rng.random() < 0.7:
+                continue
+            for _ in range(rng.randint(1, 3)):
+                day = task["created_at"].date() + timedelta(days=rng.randrange(14))
+                start = datetime.combine(
+                    day, dtime(rng.randrange(8, 18), rng.choice((0, 15, 30, 45)))
+                )
+                end = start + timedelta(minutes=rng.choice((25, 50, 90, 120)))
+                done = end <= self.now
+                yield {
+                    "id": _uuid(rng),
+                    "task_id": task["id"],
+                    "scheduled_start": start,
+                    "scheduled_end": end,
+                    "actual_start": start + timedelta(minutes=rng.randrange(10)) if done else None,
+                    "actual_end": end + timedelta(minutes=rng.randrange(-10, 20)) if done else None,
+                    "focus_score": round(rng.random(), 2) if done else None,
+                    "interruptions": rng.randint(0, 6) if done else None,
+                    "location": rng.choice(LOCATIONS),
+                    "device_used": rng.choice(DEVICES),
+                }
+
+    def _tags(self) -> Iterator[dict]:
+        rng = self._rng("tags", "rows")
+        for index, (tagId, entityTagId) in enumerate(zip(self.tagIds, self.pinnedEntityTagIds)):
+            yield {
+                "id": tagId,
+                "entity_id": entityTagId,
+                "name": f"{rng.choice(WORDS)}-{index}",
+                "color": f"#{rng.getrandbits(24):06x}",
+                "icon": None,
+                "description": None,
+            }
+
+    def _entity_tags(self) -> Iterator[dict]:
+        rng = self._rng("entity_tags")
+        firstProject = self._projectTasks(0)
+        for index, (tagId, entityTagId) in enumerate(zip(self.tagIds, self.pinnedEntityTagIds)):
+            task = firstProject[index % len(firstProject)]
+            yield self._entityTag(entityTagId, tagId, task)
+        for task in self._allTasks():
+            if rng.random() < 0.3:
+                for tagIndex in rng.sample(range(len(self.tagIds)), rng.randint(1, 2)):
+                    yield self._entityTag(_uuid(rng), self.tagIds[tagIndex], task)
+
+    @staticmethod
+    def _entityTag(entityTagId: uuid.UUID, tagId: uuid.UUID, task: dict) -> dict:
+        return {
+            "id": entityTagId,
+            "tag_id": tagId,
+            "title": task["title"],
+            "description": None,
+            "entity_type": "task",
+            "entity_id": task["id"],
+        }
+
+
+def _chunks(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _recordBatch(chunk: List[dict], columns, schema: pa.Schema) -> pa.RecordBatch:
+    arrays = []
+    for column, field in zip(columns, schema):
+        values = [row[column.name] for row in chunk]
+        if isinstance(column.type, JSON):
+            # COPY takes JSON as its text form, like snapshots store it.
+            values = [None if value is None else orjson.dumps(value).decode() for value in values]
+        arrays.append(toArrowArray(values, column, field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _cyclicForeignKeys(tables: Dict[str, Table]):
+    # use_alter marks the FKs that close a cycle; COPY can only satisfy them once both sides exist.
+    return [
+        constraint
+        for name in TABLE_ORDER
+        for constraint in tables[name].foreign_key_constraints
+        if constraint.use_alter and constraint.referred_table.name in TABLE_ORDER
+    ]
+
+
+def _copyTable(cursor, table: Table, rows: Iterable[dict], batchSize: int, quote) -> int:
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return 0
+    columns = [table.c[name] for name in first]
+    schema = arrowSchema(columns)
+    sizes: List[int] = []
+
+    def batches() -> Iterator[pa.RecordBatch]:
+        for chunk in _chunks(itertools.chain([first], rows), batchSize):
+            sizes.append(len(chunk))
+            yield _recordBatch(chunk, columns, schema)
+
+    columnList = ", ".join(quote(column.name) for column in columns)
+    cursor.copy_expert(
+        f"COPY {quote(table.name)} ({columnList}) FROM STDIN WITH (FORMAT csv)",
+        CopyStream(batches()),
+    )
+    return sum(sizes)
+
+
+def _copyTables(
+    engine: Engine, dataset: SyntheticDataset, tables: Dict[str, Table], batchSize: int
+):
+    quote = engine.dialect.identifier_preparer.quote
+    ddl = lambda element: str(element.compile(dialect=engine.dialect))  # noqa: E731
+    cyclic = _cyclicForeignKeys(tables)
+    counts: Dict[str, int] = {}
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SET LOCAL synchronous_commit = off")
+        for constraint in cyclic:
+            cursor.execute(ddl(DropConstraint(constraint, if_exists=True)))
+        for name in TABLE_ORDER:
+            counts[name] = _copyTable(cursor, tables[name], dataset.rows(name), batchSize, quote)
+        for constraint in cyclic:
+            cursor.execute(ddl(AddConstraint(constraint)))
+        for name in TABLE_ORDER:
+            cursor.execute(f"ANALYZE {quote(name)}")
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+    return counts
+
+
+def _insertTables(
+    engine: Engine, dataset: SyntheticDataset, tables: Dict[str, Table], batchSize: int
+):
+    # Engines without COPY (SQLite in tests) take batched executemany inserts.
+    counts: Dict[str, int] = {}
+    with Session(engine) as session, session.begin():
+        for name in TABLE_ORDER:
+            counts[name] = 0
+            for chunk in _chunks(dataset.rows(name), batchSize):
+                session.execute(insert(tables[name]), chunk)
+                counts[name] += len(chunk)
+    return counts
+
+
+def loadDataset(
+    engine: Engine, dataset: SyntheticDataset, batchSize: int = BATCH_SIZE
+) -> Dict[str, int]:
+    """Bulk-load ``dataset`` in one transaction; returns the row count per table."""
+    from src.features.todos.data.datasource.tables.registry import metadata
+
+    tables = {table.name: table for table in metadata.sorted_tables}
+    load = _copyTables if engine.dialect.name == "postgresql" else _insertTables
+    return load(engine, dataset, tables, batchSize)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument("--scale", choices=SCALES, default="10k")
+    size.add_argument("--tasks", type=int, help="exact task count instead of a named scale")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--reset", action="store_true", help="drop and recreate every table first")
+    args = parser.parse_args()
+
+    from src.config.database.zen_task_db_handler import ZenTaskDbHandler
+    from src.features.todos.data.datasource.tables.registry import metadata
+
+    engine = ZenTaskDbHandler.db().getEngine()
+    if args.reset:
+        metadata.drop_all(engine)
+        metadata.create_all(engine)
+
+    dataset = SyntheticDataset(args.tasks or SCALES[args.scale], seed=args.seed)
+    started = time.perf_counter()
+    counts = loadDataset(engine, dataset, args.batch_size)
+    elapsed = time.perf_counter() - started
+    for name, rows in counts.items():
+        print(f"{name:>12}: {rows:>10,}")
+    total = sum(counts.values())
+    print(f"{'total':>12}: {total:>10,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
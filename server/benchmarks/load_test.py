@@ -0,0 +1,282 @@
+"""Replay a realistic API mix against a running server and report latency per endpoint.
+
+Usage: python -m benchmarks.load_test [--base-url http://127.0.0.1:8000] [--duration 60]
+                                      [--concurrency 32] [--seed 7] [--json results.json]
+
+Load a dataset first (python -m benchmarks.dataset --scale 100k). Target ids
+are discovered through the API, so any populated database works. Rate limiting
+is on by default; start the server with RATE_LIMIT_ENABLED=false, or the
+requests it turns away are reported in the 429 column instead of measured.
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+import orjson
+
+API = "/api/v1"
+
+
+@dataclass
+class Targets:
+    projectIds: List[str] = field(default_factory=list)
+    taskIds: List[str] = field(default_factory=list)
+    userIds: List[str] = field(default_factory=list)
+    etags: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class EndpointResult:
+    latencies: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    failures: int = 0
+    throttled: int = 0  # 429s: turned away by the rate limiter, so no latency is recorded
+
+
+Call = Callable[[httpx.AsyncClient, Targets, random.Random], Awaitable[httpx.Response]]
+
+
+@dataclass(frozen=True)
+class Operation:
+    name: str
+    weight: int
+    call: Call
+
+
+async def _listProjects(client, targets, rng):
+    return await client.get(f"{API}/projects", params={"limit": 50})
+
+
+async def _getProject(client, targets, rng):
+    return await client.get(f"{API}/projects/{rng.choice(targets.projectIds)}")
+
+
+async def _listProjectTasks(client, targets, rng):
+    return await client.get(
+        f"{API}/projects/{rng.choice(targets.projectIds)}/tasks", params={"limit": 100}
+    )
+
+
+async def _getTask(client, targets, rng):
+    taskId = rng.choice(targets.taskIds)
+    response = await client.get(f"{API}/tasks/{taskId}")
+    if "etag" in response.headers:
+        targets.etags[taskId] = response.headers["etag"]
+    return response
+
+
+async def _revalidateTask(client, targets, rng):
+    # Clients that already hold a copy send If-None-Match; most answers should be 304.
+    taskId = rng.choice(list(targets.etags) or targets.taskIds)
+    headers = {"If-None-Match": targets.etags[taskId]} if taskId in targets.etags else {}
+    return await client.get(f"{API}/tasks/{taskId}", headers=headers)
+
+
+async def _updateTask(client, targets, rng):
+    return await client.patch(
+        f"{API}/tasks/{rng.choice(targets.taskIds)}",
+        json={"progress_percentage": round(rng.uniform(0, 100), 1)},
+    )
+
+
+async def _getUser(client, targets, rng):
+    return await client.get(f"{API}/users/{rng.choice(targets.userIds)}")
+
+
+async def _exportTasks(client, targets, rng):
+    return await client.get(
+        f"{API}/projects/{rng.choice(targets.projectIds)}/tasks/export",
+        params={"format": "ndjson"},
+    )
+
+
+# Read-heavy board traffic: list and detail views dominate, writes and exports are rare.
+DEFAULT_MIX = (
+    Operation("GET /projects", 8, _listProjects),
+    Operation("GET /projects/{projectId}", 10, _getProject),
+    Operation("GET /projects/{projectId}/tasks", 30, _listProjectTasks),
+    Operation("GET /tasks/{taskId}", 25, _getTask),
+    Operation("GET /tasks/{taskId} (If-None-Match)", 12, _revalidateTask),
+    Operation("PATCH /tasks/{taskId}", 8, _updateTask),
+    Operation("GET /users/{userId}", 5, _getUser),
+    Operation("GET /projects/{projectId}/tasks/export", 2, _exportTasks),
+)
+
+
+async def discoverTargets(
+    client: httpx.AsyncClient, maxProjects: int = 200, tasksPerProject: int = 100
+) -> Targets:
+    targets = Targets()
+    response = await client.get(f"{API}/projects", params={"limit": maxProjects})
+    response.raise_for_status()
+    users = set()
+    for project in response.json()["items"]:
+        targets.projectIds.append(project["id"])
+        if project.get("owner_id"):
+            users.add(project["owner_id"])
+    for projectId in targets.projectIds:
+        response = await client.get(
+            f"{API}/projects/{projectId}/tasks", params={"limit": tasksPerProject}
+        )
+        response.raise_for_status()
+        for task in response.json()["items"]:
+            targets.taskIds.append(task["id"])
+            if task.get("assigned_to"):
+                users.add(task["assigned_to"])
+    targets.userIds = sorted(users)
+    if not targets.projectIds or not targets.taskIds or not targets.userIds:
+        raise SystemExit("No projects, tasks or users found; load a dataset first.")
+    return targets
+
+
+async def runLoadTest(
+    client: httpx.AsyncClient,
+    targets: Targets,
+    duration: float,
+    concurrency: int = 32,
+    seed: int = 7,
+    warmup: float = 0.0,
+    mix=DEFAULT_MIX,
+) -> Dict[str, EndpointResult]:
+    """Closed-loop load: ``concurrency`` workers issue requests back to back until ``duration``.
+
+    Requests started during the warmup are sent but not recorded.
+    """
+    results = {operation.name: EndpointResult() for operation in mix}
+    weights = [operation.weight for operation in mix]
+    started = time.perf_counter()
+    recordFrom = started + warmup
+    deadline = recordFrom + duration
+
+    async def worker(index: int) -> None:
+        rng = random.Random(f"{seed}:{index}")
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                return
+            operation = rng.choices(mix, weights)[0]
+            try:
+                response = await operation.call(client, targets, rng)
+                await response.aread()
+                status = response.status_code
+            except httpx.HTTPError:
+                status = None
+            if now < recordFrom:
+                continue
+            result = results[operation.name]
+            result.statuses[status] += 1
+            if status == 429:
+                result.throttled += 1
+                continue
+            result.latencies.append(time.perf_counter() - now)
+            if status is None or status >= 500:
+                result.failures += 1
+
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    return results
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted ``values``."""
+    if not values:
+        return 0.0
+    rank = max(1, -(-len(values) * q // 100))
+    return values[int(rank) - 1]
+
+
+def summarize(results: Dict[str, EndpointResult], duration: float) -> List[dict]:
+    rows = []
+    everything: List[float] = []
+    for name, result in results.items():
+        latencies = sorted(result.latencies)
+        everything.extend(latencies)
+        rows.append(
+            _summaryRow(
+                name, latencies, duration, result.failures, result.throttled, result.statuses
+            )
+        )
+    everything.sort()
+    failures = sum(result.failures for result in results.values())
+    throttled = sum(result.throttled for result in results.values())
+    statuses = sum((result.statuses for result in results.values()), Counter())
+    rows.append(_summaryRow("total", everything, duration, failures, throttled, statuses))
+    return rows
+
+
+def _summaryRow(name, latencies, duration, failures, throttled, statuses) -> dict:
+    return {
+        "endpoint": name,
+        "requests": len(latencies),
+        "throughput": len(latencies) / duration if duration else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "failures": failures,
+        "throttled": throttled,
+        "statuses": {str(status): count for status, count in sorted(statuses.items(), key=str)},
+    }
+
+
+def formatReport(rows: List[dict]) -> str:
+    header = (
+        f"{'endpoint':<42} {'requests':>9} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'fail':>6} {'429':>6}"
+    )
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['endpoint']:<42} {row['requests']:>9,} {row['throughput']:>9.1f} "
+            f"{row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f} "
+            f"{row['failures']:>6} {row['throttled']:>6}"
+        )
+    return "\n".join(lines)
+
+
+async def _main(args) -> List[dict]:
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+        targets = await discoverTargets(client)
+        print(
+            f"{len(targets.projectIds)} projects, {len(targets.taskIds)} tasks, "
+            f"{len(targets.userIds)} users; {args.concurrency} workers for {args.duration:.0f}s"
+        )
+        results = await runLoadTest(
+            client, targets, args.duration, args.concurrency, args.seed, args.warmup
+        )
+    return summarize(results, args.duration)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="also write the summary to this file")
+    args = parser.parse_args(argv)
+
+    rows = asyncio.run(_main(args))
+    print(formatReport(rows))
+    if rows[-1]["throttled"]:
+        print(
+            f"{rows[-1]['throttled']:,} requests were rate limited (429) and left out of the "
+            "latencies; rerun against a server with RATE_LIMIT_ENABLED=false.",
+            file=sys.stderr,
+        )
+    if args.json:
+        with open(args.json, "wb") as file:
+            file.write(orjson.dumps(rows, option=orjson.OPT_INDENT_2))
+
+
+if __name__ == "__main__":
+    main()
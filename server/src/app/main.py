@@ -1,8 +1,96 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 
 from src.config.database.zen_task_db_handler import ZenTaskDbHandler
+from src.config.exceptions.failure_exception import (ExceptionType,
+                                                     FailureException,
+                                                     LogLevel)
+from src.config.settings.config import getSettings
+from src.core.metrics.router import MetricsHandler, installMetrics
+from src.core.profiling.middleware import installSqlProfiling
+from src.core.ratelimit.middleware import installRateLimiting
+from src.core.realtime.publishing import installRealtimePublishing
+from src.core.realtime.router import RealtimeHubHandler
+from src.core.realtime.router import router as realtimeRouter
+from src.core.security.presentation.controllers.auth_controller import \
+    router as authRouter
+from src.core.sync.router import router as syncRouter
+from src.core.utils.http_cache import PreconditionFailure
+from src.core.utils.lazy_app import LazyASGIApp
+from src.core.utils.serialization import FastJSONResponse
+from src.features.todos.presentation.controllers.project_controller import \
+    router as projectRouter
+from src.features.todos.presentation.controllers.task_controller import \
+    router as taskRouter
+from src.features.todos.presentation.controllers.user_controller import \
+    router as userRouter
 
-app = FastAPI()
+settings = getSettings()
+
+app = FastAPI(default_response_class=FastJSONResponse)
+app.include_router(realtimeRouter)
+app.include_router(authRouter, prefix=settings.API_V1_STR)
+app.include_router(projectRouter, prefix=settings.API_V1_STR)
+app.include_router(syncRouter, prefix=settings.API_V1_STR)
+app.include_router(taskRouter, prefix=settings.API_V1_STR)
+app.include_router(userRouter, prefix=settings.API_V1_STR)
+
+
+def _graphQLApp():
+    # Strawberry and the GraphQL schema are imported by the first /graphql request, not at startup.
+    from src.features.todos.presentation.api.schema import createGraphQLApp
+
+    return createGraphQLApp(app)
+
+
+app.add_route(
+    "/graphql", LazyASGIApp(_graphQLApp), methods=["GET", "POST"], include_in_schema=False
+)
+# Installed first so it sits inside the metrics middleware: rejected requests still get counted.
+installRateLimiting(app)
+installMetrics(app)
+installSqlProfiling(app)
+
+
+@app.exception_handler(FailureException)
+async def failureExceptionHandler(request: Request, exc: FailureException):
+    if isinstance(exc, PreconditionFailure):
+        return FastJSONResponse(exc.toDict(), status_code=exc.statusCode, headers=exc.headers)
+    if exc.type == ExceptionType.VALIDATION:
+        statusCode = 400
+    elif exc.level == LogLevel.NOT_FOUND:
+        statusCode = 404
+    else:
+        statusCode = 500
+    return FastJSONResponse(exc.toDict(), status_code=statusCode)
+
+
+@app.on_event("startup")
+async def startup():
+    from src.core.cache.cache_handler import CacheHandler
+    from src.core.cache.invalidation import installCacheInvalidation
+    from src.core.scheduling.triggers import installReplanScheduling
+    from src.core.security.auth.services.principal_cache import (
+        PrincipalCacheHandler, installPrincipalInvalidation)
+    from src.core.sync.changelog import installChangeLog
+    from src.features.todos.data.datasource.tables.registry import \
+        configureTables
+
+    configureTables()
+    cache = CacheHandler.cache()
+    MetricsHandler.registry().addCollector(cache.stats.metrics)
+    installCacheInvalidation(cache)
+    installRealtimePublishing(RealtimeHubHandler.hub())
+    installPrincipalInvalidation(PrincipalCacheHandler.cache())
+    installChangeLog()
+    installReplanScheduling()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    from src.core.security.auth.services.password_hasher import \
+        PasswordHasherHandler
+
+    PasswordHasherHandler.hasher().shutdown()
 
 
 @app.get("/")
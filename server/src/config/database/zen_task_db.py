@@ -43,14 +43,21 @@ class ZenTaskDatabase():
     
     def initialize(self):
         if self._engine and self._sessionFactory and self._scopedSession:
+            # Registers every table on the metadata; otherwise only the ones imported so far are created.
+            from src.features.todos.data.datasource.tables.registry import \
+                configureTables
+
+            configureTables()
             BaseTable.metadata.create_all(self._engine)
             logger.info("Database initialized successfully.")
         else:
             raise FailureException(message="Database initialization failed. Please check the configuration.")
         
     def getSession(self):
-        if self._scopedSession:
-            return self._scopedSession()
+        # A new Session per call: callers close it when done, and a thread-local one would be
+        # shared by requests that interleave on the same pool thread.
+        if self._sessionFactory:
+            return self._sessionFactory()
         else:
             raise FailureException(message="Session factory is not configured. Please initialize the database first.")
         
@@ -1,9 +1,8 @@
-
+from typing import Optional
 
 from src.config.database.zen_task_db import ZenTaskDatabase
 
-_db = ZenTaskDatabase()
-_db.initialize()
+_db: Optional[ZenTaskDatabase] = None
 
 
 class ZenTaskDbHandler:
@@ -13,4 +12,19 @@ class ZenTaskDbHandler:
 
     @staticmethod
     def db() -> ZenTaskDatabase:
+        # Connect on first use rather than at import, so importing the app never needs the database.
+        global _db
+        if _db is None:
+            _db = ZenTaskDatabase()
+            _db.initialize()
         return _db
+
+
+def getDbSession():
+    """FastAPI dependency yielding a session that is closed after the request."""
+    db = ZenTaskDbHandler.db()
+    session = db.getSession()
+    try:
+        yield session
+    finally:
+        db.closeSession(session)
@@ -1,9 +1,12 @@
+import atexit
 import logging
-import os
+import queue
 from datetime import datetime
 from enum import Enum
-from pathlib import Path
-from typing import Any, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, List, Optional
+
+from src.config.exceptions.log_sink import getLogSink
 
 
 class ExceptionType(Enum):
@@ -22,14 +25,26 @@ class LogLevel(Enum):
     NOT_FOUND = "NOT_FOUND"
 
 
-# Initialize logger
+# Initialize logger; console output is written by a listener thread, not the raising thread.
 logger = logging.getLogger("Artaban")
 logger.setLevel(logging.DEBUG)
 console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.DEBUG)
 formatter = logging.Formatter("[%(asctime)s] [%(levelname)s] %(message)s")
 console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
+_console_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_console_queue))
+_console_listener = QueueListener(_console_queue, console_handler, respect_handler_level=True)
+_console_listener.start()
+atexit.register(_console_listener.stop)
+
+# Called with every constructed exception (metrics); must be cheap and must not raise.
+_failureListeners: List[Callable[["FailureException"], None]] = []
+
+
+def addFailureListener(listener: Callable[["FailureException"], None]) -> None:
+    if listener not in _failureListeners:
+        _failureListeners.append(listener)
 
 
 class FailureException(Exception):
@@ -47,6 +62,8 @@ class FailureException(Exception):
         self.user_message = userMessage or ""
         self.error = error
         self._logException()
+        for listener in _failureListeners:
+            listener(self)
 
     @property
     def isActive(self) -> bool:
@@ -73,8 +90,7 @@ class FailureException(Exception):
         )
 
     def _logException(self):
-        logMessage = self._buildLogMessage()
-        self._writeLogToFile(logMessage)
+        getLogSink().emit(self._buildLogMessage())
 
         if self.level == LogLevel.INFO:
             logger.info(self.message or "")
@@ -101,33 +117,6 @@ class FailureException(Exception):
             log += f" - Error: {self.error}"
         return log
 
-    def _writeLogToFile(self, log_message: str):
-        try:
-            log_dir = Path.home() / ".Artaban"
-            log_dir.mkdir(parents=True, exist_ok=True)
-            log_filename = f"Artaban_logs_{datetime.now().date()}.txt"
-            log_path = log_dir / log_filename
-
-            self._manageLogFiles(log_dir)
-
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(log_message + "\n")
-
-        except Exception as e:
-            logger.info(f"Failed to write log to file: {e}")
-
-    def _manageLogFiles(self, log_dir: Path):
-        max_log_files = 5
-        log_files = sorted(
-            log_dir.glob("Artaban_logs_*.txt"), key=lambda f: f.stat().st_mtime
-        )
-        if len(log_files) >= max_log_files:
-            for file in log_files[: len(log_files) - (max_log_files - 1)]:
-                try:
-                    file.unlink()
-                except Exception as e:
-                    logger.info(f"Failed to delete old log file {file}: {e}")
-
     def __str__(self):
         return (
             f"FailureException(type: {self.type.name}, level: {self.level.name}, "
@@ -0,0 +1,176 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional, TextIO
+
+_FLUSH = object()
+_STOP = object()
+
+_fallbackLogger = logging.getLogger("Artaban.sink")
+
+
+class BufferedLogSink:
+    """Append-only log file written by a background thread.
+
+    ``emit`` only enqueues the line, so callers (exception constructors on
+    the request path) never touch the filesystem. The writer thread drains
+    the queue in batches, writes each batch with a single call, and rotates
+    when the date changes or the file grows past ``maxBytes``, keeping at
+    most ``maxFiles`` files.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        prefix: str = "Artaban_logs_",
+        maxBytes: int = 5 * 1024 * 1024,
+        maxFiles: int = 5,
+        batchSize: int = 512,
+        flushInterval: float = 0.25,
+        maxQueue: int = 50_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._directory = Path(directory)
+        self._prefix = prefix
+        self._maxBytes = maxBytes
+        self._maxFiles = maxFiles
+        self._batchSize = batchSize
+        self._flushInterval = flushInterval
+        self._clock = clock
+        self._queue: "queue.Queue" = queue.Queue(maxQueue)
+        self._file: Optional[TextIO] = None
+        self._fileDate: Optional[str] = None
+        self._fileIndex = 0
+        self._fileSize = 0
+        self.dropped = 0
+        self.batches = 0
+        self._thread = threading.Thread(target=self._run, name="failure-log-sink", daemon=True)
+        self._thread.start()
+
+    def emit(self, line: str) -> None:
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            # Never block the caller; losing log lines beats stalling requests.
+            self.dropped += 1
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until everything emitted so far is on disk."""
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self._thread.is_alive():
+            self._queue.put((_STOP, None))
+            self._thread.join(timeout)
+
+    @property
+    def currentPath(self) -> Optional[Path]:
+        return Path(self._file.name) if self._file is not None else None
+
+    def _run(self) -> None:
+        while True:
+            batch: List[str] = []
+            events: List[threading.Event] = []
+            stop = False
+            try:
+                item = self._queue.get(timeout=self._flushInterval)
+            except queue.Empty:
+                continue
+            while True:
+                if isinstance(item, tuple):
+                    marker, event = item
+                    if marker is _STOP:
+                        stop = True
+                        break
+                    events.append(event)
+                else:
+                    batch.append(item)
+                if len(batch) >= self._batchSize:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
+            for event in events:
+                event.set()
+            if stop:
+                self._closeFile()
+                return
+
+    def _write(self, lines: List[str]) -> None:
+        data = "\n".join(lines) + "\n"
+        try:
+            self._rotateIfNeeded(len(data))
+            self._file.write(data)
+            self._file.flush()
+            self._fileSize += len(data)
+            self.batches += 1
+        except Exception as e:
+            _fallbackLogger.info(f"Failed to write log to file: {e}")
+            self._closeFile()
+
+    def _rotateIfNeeded(self, incoming: int) -> None:
+        today = datetime.fromtimestamp(self._clock()).date().isoformat()
+        if self._file is not None and self._fileDate == today:
+            if self._fileSize == 0 or self._fileSize + incoming <= self._maxBytes:
+                return
+            self._fileIndex += 1
+        elif self._fileDate != today:
+            self._fileIndex = 0
+        self._closeFile()
+        self._fileDate = today
+        self._directory.mkdir(parents=True, exist_ok=True)
+        suffix = f".{self._fileIndex}" if self._fileIndex else ""
+        path = self._directory / f"{self._prefix}{today}{suffix}.txt"
+        self._file = open(path, "a", encoding="utf-8")
+        self._fileSize = self._file.tell()
+        self._prune()
+
+    def _prune(self) -> None:
+        # Only runs on rotation, never per record.
+        files = sorted(
+            self._directory.glob(f"{self._prefix}*.txt"), key=lambda f: f.stat().st_mtime
+        )
+        for file in files[: max(0, len(files) - self._maxFiles)]:
+            if self._file is not None and file == Path(self._file.name):
+                continue
+            try:
+                file.unlink()
+            except OSError as e:
+                _fallbackLogger.info(f"Failed to delete old log file {file}: {e}")
+
+    def _closeFile(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            finally:
+                self._file = None
+
+
+_sink: Optional[BufferedLogSink] = None
+_sinkLock = threading.Lock()
+
+
+def getLogSink() -> BufferedLogSink:
+    global _sink
+    if _sink is None:
+        with _sinkLock:
+            if _sink is None:
+                _sink = BufferedLogSink(Path.home() / ".Artaban")
+                atexit.register(_sink.close)
+    return _sink
+
+
+def setLogSink(sink: Optional[BufferedLogSink]) -> None:
+    """Swap the process-wide sink (tests, custom log directories)."""
+    global _sink
+    _sink = sink
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, Hashable, Optional, TypeVar
 
 from returns.result import Result  # Assume you have an Either[L, R]
 
@@ -12,4 +12,15 @@ P = TypeVar("P")  # Param type
 class Usecase(Generic[T, P], ABC):
     @abstractmethod
     async def call(self, params: P) -> Result[FailureException, T]:
-        pass
\ No newline at end of file
+        pass
+
+    def singleFlightKey(self, params: P) -> Optional[Hashable]:
+        """What makes another call's result good for this one; None if nothing does.
+
+        Used by ``UsecaseExecutor``: calls with equal keys share one ``call``,
+        run by the first caller's instance. The key must hold everything the
+        result depends on besides the use case class (the caller's user, for a
+        per-user read), and ``call`` must not rely on anything of that first
+        caller, such as its request's Session.
+        """
+        return None
\ No newline at end of file
@@ -0,0 +1,157 @@
+import asyncio
+import dataclasses
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import orjson
+from pydantic import BaseModel
+from returns.pipeline import is_successful
+from returns.result import Result
+
+from src.config.exceptions.failure_exception import FailureException
+from src.config.generics.usecase import P, T, Usecase
+from src.config.settings.config import getSettings
+from src.core.metrics.registry import MetricsRegistry
+
+# Expired memo entries are swept once the table grows past this.
+MAX_MEMO_ENTRIES = 10_000
+
+
+def paramsKey(params: Any) -> Hashable:
+    """Equal params give equal keys, whether or not the params object itself is hashable."""
+    if isinstance(params, BaseModel):
+        return (type(params).__qualname__, params.model_dump_json())
+    if isinstance(params, tuple):  # e.g. a ``singleFlightKey`` of (user, params)
+        return tuple(paramsKey(part) for part in params)
+    if dataclasses.is_dataclass(params) and not isinstance(params, type):
+        params = (type(params).__qualname__, dataclasses.asdict(params))
+    try:
+        hash(params)
+        return params
+    except TypeError:
+        return orjson.dumps(
+            params, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str
+        )
+
+
+@dataclass
+class SingleFlightStats:
+    executed: int = 0
+    collapsed: int = 0
+    memoized: int = 0
+
+    @property
+    def calls(self) -> int:
+        return self.executed + self.collapsed + self.memoized
+
+    def toDict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "executed": self.executed,
+            "collapsed": self.collapsed,
+            "memoized": self.memoized,
+        }
+
+
+class UsecaseExecutor:
+    """Runs read use cases single-flight.
+
+    Concurrent calls of the same use case class with equal
+    ``singleFlightKey``s share one in-flight ``call``: the first caller starts
+    it, the others await the same task and get the same ``Result``. With a
+    memo window, a successful result is also handed to calls arriving shortly
+    after it finished. A use case without a key runs for its caller alone.
+    Only use it for reads; writes must never be collapsed.
+    """
+
+    def __init__(
+        self,
+        memoSeconds: float = 0.0,
+        registry: Optional[MetricsRegistry] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._memoSeconds = memoSeconds
+        self._clock = clock
+        self._inFlight: Dict[Hashable, asyncio.Future] = {}
+        self._memo: Dict[Hashable, Tuple[float, Any]] = {}
+        self._calls = None
+        if registry is not None:
+            self._calls = registry.counter(
+                "usecase_calls_total", "Read use case calls by outcome.", ("usecase", "outcome")
+            )
+        self.stats = SingleFlightStats()
+
+    async def read(
+        self, usecase: Usecase[T, P], params: P, memoSeconds: Optional[float] = None
+    ) -> Result[FailureException, T]:
+        name = type(usecase).__qualname__
+        scope = usecase.singleFlightKey(params)
+        if scope is None:
+            self._record(name, "executed")
+            return await usecase.call(params)
+        key = (type(usecase).__module__, name, paramsKey(scope))
+        window = self._memoSeconds if memoSeconds is None else memoSeconds
+
+        if window > 0:
+            memo = self._memo.get(key)
+            if memo is not None and memo[0] > self._clock():
+                self._record(name, "memoized")
+                return memo[1]
+
+        task = self._inFlight.get(key)
+        if task is not None:
+            self._record(name, "collapsed")
+        else:
+            task = asyncio.ensure_future(usecase.call(params))
+            self._inFlight[key] = task
+            task.add_done_callback(lambda done: self._settle(key, done, window))
+            self._record(name, "executed")
+        # Shielded: one caller going away must not cancel the read for everybody else.
+        return await asyncio.shield(task)
+
+    def _settle(self, key: Hashable, task: asyncio.Future, window: float) -> None:
+        if self._inFlight.get(key) is task:
+            del self._inFlight[key]
+        if window <= 0 or task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if is_successful(result):
+            if len(self._memo) >= MAX_MEMO_ENTRIES:
+                now = self._clock()
+                self._memo = {k: v for k, v in self._memo.items() if v[0] > now}
+            self._memo[key] = (self._clock() + window, result)
+
+    def _record(self, name: str, outcome: str) -> None:
+        setattr(self.stats, outcome, getattr(self.stats, outcome) + 1)
+        if self._calls is not None:
+            self._calls.inc((name, outcome))
+
+
+class SingleFlightUsecase(Usecase[T, P]):
+    """Drop-in ``Usecase`` whose ``call`` goes through a ``UsecaseExecutor``."""
+
+    def __init__(self, usecase: Usecase[T, P], executor: Optional[UsecaseExecutor] = None):
+        self._usecase = usecase
+        self._executor = executor
+
+    async def call(self, params: P) -> Result[FailureException, T]:
+        executor = self._executor or UsecaseExecutorHandler.executor()
+        return await executor.read(self._usecase, params)
+
+
+_executor: Optional[UsecaseExecutor] = None
+
+
+class UsecaseExecutorHandler:
+    @staticmethod
+    def executor() -> UsecaseExecutor:
+        global _executor
+        if _executor is None:
+            from src.core.metrics.router import MetricsHandler
+
+            _executor = UsecaseExecutor(
+                memoSeconds=getSettings().USECASE_MEMO_SECONDS,
+                registry=MetricsHandler.registry(),
+            )
+        return _executor
@@ -1,4 +1,5 @@
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 
 from pydantic import validator
 from pydantic_settings import BaseSettings
@@ -17,16 +18,91 @@ class Settings(BaseSettings):
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_SOCKET_TIMEOUT: float = 0.25
+
+    # Cache
+    CACHE_ENABLED: bool = True
+    CACHE_KEY_PREFIX: str = "zen"
+    CACHE_TTL_PROJECT_BOARD: int = 30  # seconds
+    CACHE_TTL_USER_OPEN_TASKS: int = 30  # seconds
+    CACHE_TTL_PROJECT_DETAIL: int = 120  # seconds
+    CACHE_LOCK_TIMEOUT_MS: int = 3000
+    CACHE_RETRY_AFTER_SECONDS: int = 10  # backoff once Redis is unreachable
+
+    # Conditional requests
+    REQUIRE_IF_MATCH: bool = False  # PATCH without If-Match gets 428 instead of overwriting
+
+    # Background workers
+    CELERY_BROKER_URL: str = "redis://localhost:6379/1"
+    CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
+    CELERY_RESULT_EXPIRES: int = 3600  # seconds
+    CELERY_TASK_ALWAYS_EAGER: bool = False
+    WORKER_FANOUT_CHUNK_SIZE: int = 50
+    WORKER_IDEMPOTENCY_TTL: int = 300  # seconds
+
+    # Reminders
+    REMINDER_HORIZON_MINUTES: int = 60  # reminders held in memory ahead of now
+    REMINDER_REFRESH_SECONDS: int = 30
+    REMINDER_BATCH_SIZE: int = 500
+    REMINDER_SHARD_INDEX: int = 0
+    REMINDER_SHARD_COUNT: int = 1  # dispatcher instances; each owns schedule ids where id % count == index
+
+    # Rate limiting
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # "redis" shares the buckets between workers
+    RATE_LIMIT_AUTH: str = "10/minute"  # per client and route class; the whole amount may burst
+    RATE_LIMIT_READ: str = "600/minute"
+    RATE_LIMIT_WRITE: str = "120/minute"
+    RATE_LIMIT_GRAPHQL: str = "300/minute"
+    RATE_LIMIT_MAX_KEYS: int = 100000  # in-process buckets
+    RATE_LIMIT_EXEMPT_PATHS: List[str] = ["/health", "/metrics"]
+
+    # Delta sync
+    SYNC_PAGE_SIZE: int = 500  # changes per pull page unless the client asks for fewer
+    SYNC_MAX_PAGE_SIZE: int = 5000
+    SYNC_MAX_PUSH_CHANGES: int = 1000
+    SYNC_COMPRESS_MIN_BYTES: int = 1024  # smaller pull pages are not worth gzipping
+    SYNC_TOMBSTONE_DAYS: int = 90  # clients offline for longer re-sync from scratch
+
+    # Realtime
+    REALTIME_COALESCE_MS: int = 50
+    REALTIME_MAX_QUEUE: int = 64  # messages buffered per socket before resync
+    REALTIME_MAX_CHANGES_PER_MESSAGE: int = 500
+    REALTIME_RESYNC_COOLDOWN_SECONDS: float = 5.0  # a second overflow inside this drops the socket
+
+    # Metrics
+    METRICS_ENABLED: bool = True
+    METRICS_MULTIPROC_DIR: Optional[str] = None  # shared by uvicorn workers; unset = single process
+    METRICS_FLUSH_SECONDS: float = 5.0
+
+    # SQL profiling
+    SQL_PROFILER_ENABLED: bool = True
+    SQL_SLOW_QUERY_MS: float = 200.0
+    SQL_EXPLAIN_SLOW_QUERIES: bool = False  # EXPLAIN ANALYZE re-runs the query; honoured only with DEBUG
+    SQL_NPLUSONE_THRESHOLD: int = 5  # identical SELECT shapes per request before it is flagged
+
+    # Use cases
+    USECASE_MEMO_SECONDS: float = 0.0  # reuse a finished read this long; 0 = only share in-flight calls
 
     # JWT
+    JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 10080  # 7 days
+    TOKEN_CACHE_SIZE: int = 10000  # verified tokens kept until they expire
+
+    # Passwords and principals
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2  # processes; caps the cores a login storm can take
+    PASSWORD_HASH_MAX_PENDING: int = 64  # queued hash/verify jobs before logins get a 503
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_SECONDS: float = 60.0  # bounds staleness of edits made by other processes
 
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = []
 
     @validator("BACKEND_CORS_ORIGINS", pre=True)
-    def assemble_cors_origins(self, v):
+    @classmethod
+    def assemble_cors_origins(cls, v):
         if isinstance(v, str) and not v.startswith("["):
             return [i.strip() for i in v.split(",")]
         elif isinstance(v, (list, str)):
@@ -36,3 +112,8 @@ class Settings(BaseSettings):
     class Config:
         env_file = "env"
         case_sensitive = True
+
+
+@lru_cache()
+def getSettings() -> Settings:
+    return Settings()
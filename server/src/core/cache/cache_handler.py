@@ -0,0 +1,23 @@
+from typing import Optional
+
+from src.config.settings.config import getSettings
+from src.core.cache.redis_cache import RedisCache
+
+_cache: Optional[RedisCache] = None
+
+
+class CacheHandler:
+    @staticmethod
+    def cache() -> RedisCache:
+        global _cache
+        if _cache is None:
+            settings = getSettings()
+            _cache = RedisCache.fromUrl(
+                settings.REDIS_URL,
+                socketTimeout=settings.REDIS_SOCKET_TIMEOUT,
+                prefix=settings.CACHE_KEY_PREFIX,
+                enabled=settings.CACHE_ENABLED,
+                lockTimeoutMs=settings.CACHE_LOCK_TIMEOUT_MS,
+                retryAfterSeconds=settings.CACHE_RETRY_AFTER_SECONDS,
+            )
+        return _cache
@@ -0,0 +1,82 @@
+from typing import Callable, Optional, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.core.cache.redis_cache import GLOBAL_SCOPE, RedisCache
+
+_PENDING_SCOPES = "cache_pending_scopes"
+_installed = False
+
+
+def projectScope(projectId) -> str:
+    return f"project:{projectId}"
+
+
+def userScope(userId) -> str:
+    return f"user:{userId}"
+
+
+def _attributeScopes(obj, attribute: str, scopeOf: Callable) -> Set[str]:
+    # Both the old and the new value are affected when a task moves between projects/users.
+    history = inspect(obj).attrs[attribute].history
+    values = set(history.added or ()) | set(history.deleted or ()) | set(history.unchanged or ())
+    return {scopeOf(value) for value in values if value is not None}
+
+
+def scopesFor(obj) -> Set[str]:
+    tableName = getattr(obj, "__tablename__", None)
+    if tableName == "tasks":
+        return _attributeScopes(obj, "project_id", projectScope) | _attributeScopes(
+            obj, "assigned_to", userScope
+        )
+    if tableName == "projects":
+        return {projectScope(obj.id)} | _attributeScopes(obj, "owner_id", userScope)
+    return set()
+
+
+def _pending(session: Session) -> Set[str]:
+    return session.info.setdefault(_PENDING_SCOPES, set())
+
+
+def _collectFlushed(session: Session, flushContext) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        scopes = scopesFor(obj)
+        if scopes:
+            _pending(session).update(scopes)
+
+
+def _collectBulk(executeState) -> None:
+    if not (executeState.is_update or executeState.is_delete or executeState.is_insert):
+        return
+    mapper = executeState.bind_mapper
+    tableName = getattr(mapper.class_, "__tablename__", None) if mapper else None
+    if tableName in ("tasks", "projects"):
+        _pending(executeState.session).add(GLOBAL_SCOPE)
+
+
+def installCacheInvalidation(cache: RedisCache, target=Session) -> None:
+    """Invalidate cached task/project reads once a transaction writing them commits."""
+    global _installed
+    if _installed:
+        return
+
+    def _publish(session: Session) -> None:
+        # Read, not popped: every installed cache (app, tests) sees the same scopes.
+        scopes = session.info.get(_PENDING_SCOPES)
+        if scopes:
+            cache.invalidate(*scopes)
+
+    def _discard(session: Session, transaction: Optional[SessionTransaction] = None) -> None:
+        session.info.pop(_PENDING_SCOPES, None)
+
+    def _finish(session: Session, transaction: SessionTransaction) -> None:
+        if transaction.parent is None:  # after_commit has run; savepoints keep their scopes
+            _discard(session)
+
+    event.listen(target, "after_flush", _collectFlushed)
+    event.listen(target, "do_orm_execute", _collectBulk)
+    event.listen(target, "after_commit", _publish)
+    event.listen(target, "after_rollback", _discard)
+    event.listen(target, "after_transaction_end", _finish)
+    _installed = True
@@ -0,0 +1,239 @@
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import redis
+from fastapi.logger import logger
+
+T = TypeVar("T")
+
+# Bump whenever the shape of cached payloads changes so old entries are never read.
+CACHE_SCHEMA_VERSION = 1
+
+# Bumped by bulk writes that cannot be mapped to individual scopes.
+GLOBAL_SCOPE = "all"
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    errors: int = 0
+    bypassed: int = 0
+    lockWaits: int = 0
+
+    @property
+    def hitRatio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def toDict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "errors": self.errors,
+            "bypassed": self.bypassed,
+            "lock_waits": self.lockWaits,
+            "hit_ratio": round(self.hitRatio, 4),
+        }
+
+    def metrics(self) -> Dict[str, dict]:
+        """Metric snapshots for ``MetricsRegistry.addCollector``.
+
+        The hit ratio is per process (a sum over workers means nothing), so it
+        is labelled with the pid; the counters add up.
+        """
+
+        def metric(type: str, documentation: str, value: float, labels=()) -> dict:
+            return {
+                "type": type,
+                "help": documentation,
+                "labels": [name for name, _ in labels],
+                "samples": [[[label for _, label in labels], value]],
+            }
+
+        return {
+            "cache_hits_total": metric("counter", "Read-through cache hits.", self.hits),
+            "cache_misses_total": metric("counter", "Read-through cache misses.", self.misses),
+            "cache_loads_total": metric("counter", "Values loaded after a miss.", self.loads),
+            "cache_errors_total": metric(
+                "counter", "Redis errors served from the loader.", self.errors
+            ),
+            "cache_hit_ratio": metric(
+                "gauge", "Hits over lookups in this process.", self.hitRatio,
+                (("pid", str(os.getpid())),),
+            ),
+        }
+
+
+class RedisCache:
+    """Read-through cache over Redis with versioned keys.
+
+    Every cached value lives under a scope (``project:<id>``, ``user:<id>``).
+    Writes never delete entries; they bump the scope version instead, so all
+    keys built from the previous version become unreachable and expire on
+    their own. When Redis is unreachable the loader is called directly.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        prefix: str = "zen",
+        enabled: bool = True,
+        lockTimeoutMs: int = 3000,
+        retryAfterSeconds: int = 10,
+        lockPollSeconds: float = 0.05,
+    ):
+        self._client = client
+        self._prefix = f"{prefix}:c{CACHE_SCHEMA_VERSION}"
+        self._enabled = enabled
+        self._lockTimeoutMs = lockTimeoutMs
+        self._retryAfterSeconds = retryAfterSeconds
+        self._lockPollSeconds = lockPollSeconds
+        self._unavailableUntil = 0.0
+        self._localLocks: Dict[str, threading.Lock] = {}
+        self._localLocksGuard = threading.Lock()
+        self._releaseLock = client.register_script(_RELEASE_LOCK_SCRIPT)
+        self.stats = CacheStats()
+
+    @classmethod
+    def fromUrl(cls, url: str, socketTimeout: float = 0.25, **kwargs) -> "RedisCache":
+        client = redis.Redis.from_url(
+            url,
+            socket_timeout=socketTimeout,
+            socket_connect_timeout=socketTimeout,
+        )
+        return cls(client, **kwargs)
+
+    @property
+    def isAvailable(self) -> bool:
+        return self._enabled and time.monotonic() >= self._unavailableUntil
+
+    def getOrLoad(
+        self,
+        scope: str,
+        name: str,
+        loader: Callable[[], T],
+        ttl: int,
+        *args: Any,
+    ) -> T:
+        """Return the cached value for ``name(*args)`` in ``scope``, loading it on a miss."""
+        if not self.isAvailable:
+            self.stats.bypassed += 1
+            return loader()
+
+        try:
+            key = self._dataKey(scope, name, args)
+            cached = self._client.get(key)
+        except redis.RedisError as e:
+            self._markUnavailable(e)
+            return loader()
+
+        if cached is not None:
+            self.stats.hits += 1
+            return json.loads(cached)
+
+        self.stats.misses += 1
+        return self._loadWithLock(key, loader, ttl)
+
+    def invalidate(self, *scopes: str) -> None:
+        """Bump the version of every scope so previously cached keys are never read again."""
+        if not scopes or not self._enabled:
+            return
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for scope in scopes:
+                pipe.incr(self._versionKey(scope))
+            pipe.execute()
+        except redis.RedisError as e:
+            self._markUnavailable(e)
+
+    def _loadWithLock(self, key: str, loader: Callable[[], T], ttl: int) -> T:
+        # Collapse concurrent misses inside this process first, then across processes.
+        with self._localLock(key):
+            try:
+                cached = self._client.get(key)
+                if cached is not None:
+                    return json.loads(cached)
+
+                lockKey = f"{key}:lock"
+                token = uuid.uuid4().hex
+                if self._client.set(lockKey, token, nx=True, px=self._lockTimeoutMs):
+                    return self._loadAndStore(key, lockKey, token, loader, ttl)
+
+                cached = self._waitForValue(key)
+                if cached is not None:
+                    return json.loads(cached)
+            except redis.RedisError as e:
+                self._markUnavailable(e)
+
+            # Lock holder took too long or Redis went away: serve straight from the source.
+            return loader()
+
+    def _loadAndStore(
+        self, key: str, lockKey: str, token: str, loader: Callable[[], T], ttl: int
+    ) -> T:
+        try:
+            value = loader()
+            self.stats.loads += 1
+            # Jitter keeps keys written together from expiring together.
+            expire = max(1, int(ttl * random.uniform(0.9, 1.1)))
+            self._client.set(key, json.dumps(value, default=str), ex=expire)
+            return value
+        except redis.RedisError as e:
+            self._markUnavailable(e)
+            return value
+        finally:
+            try:
+                self._releaseLock(keys=[lockKey], args=[token])
+            except redis.RedisError:
+                pass
+
+    def _waitForValue(self, key: str) -> Optional[bytes]:
+        self.stats.lockWaits += 1
+        deadline = time.monotonic() + self._lockTimeoutMs / 1000
+        while time.monotonic() < deadline:
+            time.sleep(self._lockPollSeconds)
+            cached = self._client.get(key)
+            if cached is not None:
+                return cached
+        return None
+
+    def _dataKey(self, scope: str, name: str, args: tuple) -> str:
+        globalVersion, scopeVersion = self._client.mget(
+            self._versionKey(GLOBAL_SCOPE), self._versionKey(scope)
+        )
+        version = f"{int(globalVersion or 0)}.{int(scopeVersion or 0)}"
+        argsPart = ":".join(str(arg) for arg in args)
+        return f"{self._prefix}:{scope}:v{version}:{name}:{argsPart}"
+
+    def _versionKey(self, scope: str) -> str:
+        return f"{self._prefix}:ver:{scope}"
+
+    def _localLock(self, key: str) -> threading.Lock:
+        with self._localLocksGuard:
+            lock = self._localLocks.get(key)
+            if lock is None:
+                if len(self._localLocks) > 10_000:
+                    self._localLocks.clear()
+                lock = self._localLocks[key] = threading.Lock()
+            return lock
+
+    def _markUnavailable(self, error: Exception) -> None:
+        self.stats.errors += 1
+        self._unavailableUntil = time.monotonic() + self._retryAfterSeconds
+        logger.warning(f"Redis cache unavailable, serving from database: {error}")
@@ -0,0 +1,70 @@
+import time
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.metrics.registry import MetricsRegistry
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording latency, in-flight count and status per route template.
+
+    Routes are labelled by their template (``/api/v1/tasks/{taskId}``), never
+    the raw path, so label cardinality stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry):
+        self.app = app
+        self._requests = registry.counter(
+            "http_requests_total", "HTTP requests by route and status.", ("method", "route", "status")
+        )
+        self._latency = registry.histogram(
+            "http_request_duration_seconds", "HTTP request latency.", ("method", "route")
+        )
+        self._inFlight = registry.gauge(
+            "http_requests_in_progress", "HTTP requests being served.", ("method",)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def sendWithStatus(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self._inFlight.inc((method,))
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, sendWithStatus)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._inFlight.dec((method,))
+            route = _routeTemplate(scope)
+            self._latency.observe(elapsed, (method, route))
+            self._requests.inc((method, route, str(status)))
+
+
+def _routeTemplate(scope: Scope) -> str:
+    # Newer FastAPI resolves included routers lazily; the effective route carries the full prefix.
+    effective = (scope.get("fastapi") or {}).get("effective_route_context")
+    if effective is not None:
+        return effective.path
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    # Plain Starlette routes (the lazily mounted GraphQL app) don't set scope["route"].
+    router = scope.get("router")
+    for candidate in getattr(router, "routes", ()):
+        match, _ = candidate.matches(scope)
+        if match == Match.FULL:
+            return getattr(candidate, "path", UNMATCHED_ROUTE)
+    return UNMATCHED_ROUTE
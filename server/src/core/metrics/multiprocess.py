@@ -0,0 +1,79 @@
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import orjson
+from fastapi.logger import logger
+
+from src.core.metrics.registry import mergeSnapshots
+
+
+def _isAlive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MultiprocessStore:
+    """Aggregates metrics across uvicorn workers through one JSON file per process.
+
+    Every worker dumps its own snapshot (atomically, via rename) on a timer
+    and on each scrape; whichever worker serves ``/metrics`` sums all files.
+    Counters and histograms of exited workers are kept so totals never go
+    backwards; their gauges (in-flight requests) are dropped.
+    """
+
+    def __init__(self, directory: str, pid: Optional[int] = None):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._pid = pid or os.getpid()
+        self._timer: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    @property
+    def path(self) -> Path:
+        return self._directory / f"metrics-{self._pid}.json"
+
+    def write(self, snapshot: Dict[str, dict]) -> None:
+        temporary = self.path.with_suffix(".tmp")
+        temporary.write_bytes(orjson.dumps(snapshot))
+        os.replace(temporary, self.path)
+
+    def readAll(self, own: Dict[str, dict]) -> Dict[str, dict]:
+        snapshots: List[Dict[str, dict]] = [own]
+        for file in self._directory.glob("metrics-*.json"):
+            pid = int(file.stem.split("-", 1)[1])
+            if pid == self._pid:
+                continue
+            try:
+                snapshot = orjson.loads(file.read_bytes())
+            except (OSError, orjson.JSONDecodeError):
+                continue
+            if not _isAlive(pid):
+                snapshot = {
+                    name: metric for name, metric in snapshot.items() if metric["type"] != "gauge"
+                }
+            snapshots.append(snapshot)
+        return mergeSnapshots(snapshots)
+
+    def startFlushing(self, snapshot: Callable[[], Dict[str, dict]], interval: float) -> None:
+        if self._timer is not None:
+            return
+
+        def run() -> None:
+            while not self._stopped.wait(interval):
+                try:
+                    self.write(snapshot())
+                except OSError as e:
+                    logger.warning(f"Could not write metrics snapshot: {e}")
+
+        self._timer = threading.Thread(target=run, name="metrics-flush", daemon=True)
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
@@ -0,0 +1,223 @@
+import bisect
+import threading
+from typing import Callable, Dict, List, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class _ThreadShards:
+    """One plain dict per thread.
+
+    Each thread only ever writes its own dict, so recording needs no lock;
+    readers copy every shard (a single C-level operation under the GIL) and
+    sum them.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._registerLock = threading.Lock()
+
+    def mine(self) -> dict:
+        try:
+            return self._local.values
+        except AttributeError:
+            values: dict = {}
+            with self._registerLock:
+                self._shards.append(values)
+            self._local.values = values
+            return values
+
+    def copies(self) -> List[dict]:
+        return [dict(shard) for shard in list(self._shards)]
+
+
+class Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelNames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelNames = tuple(labelNames)
+        self._shards = _ThreadShards()
+
+    def samples(self) -> Dict[LabelValues, float]:
+        totals: Dict[LabelValues, float] = {}
+        for shard in self._shards.copies():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def snapshot(self) -> dict:
+        return {
+            "type": self.type,
+            "help": self.documentation,
+            "labels": list(self.labelNames),
+            "samples": [[list(labels), value] for labels, value in self.samples().items()],
+        }
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        shard = self._shards.mine()
+        shard[labels] = shard.get(labels, 0) + amount
+
+
+class Gauge(Counter):
+    """Up/down value; per-thread shards may go negative, only their sum is meaningful."""
+
+    type = "gauge"
+
+    def dec(self, labels: LabelValues = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelNames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelNames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        shard = self._shards.mine()
+        state = shard.get(labels)
+        if state is None:
+            # Non-cumulative bucket counts, then +Inf, sum.
+            state = shard[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect.bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def samples(self) -> Dict[LabelValues, List[float]]:
+        totals: Dict[LabelValues, List[float]] = {}
+        for shard in self._shards.copies():
+            for labels, state in shard.items():
+                state = list(state)
+                total = totals.get(labels)
+                totals[labels] = state if total is None else [a + b for a, b in zip(total, state)]
+        return totals
+
+    def snapshot(self) -> dict:
+        snapshot = super().snapshot()
+        snapshot["buckets"] = list(self.buckets)
+        return snapshot
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], Dict[str, dict]]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        # Re-registering returns the existing metric so module reloads don't double count.
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelNames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelNames))
+
+    def gauge(self, name: str, documentation: str, labelNames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelNames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelNames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelNames, buckets))
+
+    def addCollector(self, collector: Callable[[], Dict[str, dict]]) -> None:
+        """``collector`` returns metric snapshots (same shape as ``Metric.snapshot``) at scrape time."""
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def snapshot(self) -> Dict[str, dict]:
+        snapshot = {name: metric.snapshot() for name, metric in self._metrics.items()}
+        for collector in self._collectors:
+            snapshot.update(collector())
+        return snapshot
+
+
+def mergeSnapshots(snapshots: Sequence[Dict[str, dict]]) -> Dict[str, dict]:
+    """Sum snapshots from several processes, label set by label set."""
+    merged: Dict[str, dict] = {}
+    for snapshot in snapshots:
+        for name, metric in snapshot.items():
+            target = merged.get(name)
+            if target is None:
+                merged[name] = {
+                    **metric,
+                    "samples": [
+                        [list(labels), list(value) if isinstance(value, list) else value]
+                        for labels, value in metric["samples"]
+                    ],
+                }
+                continue
+            index = {tuple(sample[0]): sample for sample in target["samples"]}
+            for labels, value in metric["samples"]:
+                existing = index.get(tuple(labels))
+                if existing is None:
+                    sample = [list(labels), list(value) if isinstance(value, list) else value]
+                    target["samples"].append(sample)
+                    index[tuple(labels)] = sample
+                elif isinstance(value, list):
+                    # Histograms: bucket counts, +Inf and sum add element-wise.
+                    existing[1] = [a + b for a, b in zip(existing[1], value)]
+                else:
+                    existing[1] += value
+    return merged
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+def renderText(snapshot: Dict[str, dict]) -> str:
+    """Prometheus text exposition format 0.0.4."""
+    lines: List[str] = []
+    for name in sorted(snapshot):
+        metric = snapshot[name]
+        names = metric["labels"]
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for values, value in sorted(metric["samples"], key=lambda sample: sample[0]):
+            if metric["type"] != "histogram":
+                lines.append(f"{name}{_labels(names, values)} {_number(value)}")
+                continue
+            cumulative = 0
+            for bound, count in zip(metric["buckets"], value):
+                cumulative += count
+                bucketLabels = _labels(names, values, f'le="{bound}"')
+                lines.append(f"{name}_bucket{bucketLabels} {_number(cumulative)}")
+            cumulative += value[len(metric["buckets"])]
+            infLabels = _labels(names, values, 'le="+Inf"')
+            lines.append(f"{name}_bucket{infLabels} {_number(cumulative)}")
+            lines.append(f"{name}_sum{_labels(names, values)} {_number(value[-1])}")
+            lines.append(f"{name}_count{_labels(names, values)} {_number(cumulative)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,73 @@
+import atexit
+from typing import Dict, Optional
+
+from fastapi import APIRouter, FastAPI
+from starlette.responses import Response
+
+from src.config.exceptions.failure_exception import (FailureException,
+                                                     addFailureListener)
+from src.config.settings.config import getSettings
+from src.core.metrics.middleware import MetricsMiddleware
+from src.core.metrics.multiprocess import MultiprocessStore
+from src.core.metrics.registry import MetricsRegistry, renderText
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter()
+
+_registry: Optional[MetricsRegistry] = None
+_store: Optional[MultiprocessStore] = None
+
+
+class MetricsHandler:
+    @staticmethod
+    def registry() -> MetricsRegistry:
+        global _registry
+        if _registry is None:
+            _registry = MetricsRegistry()
+        return _registry
+
+    @staticmethod
+    def store() -> Optional[MultiprocessStore]:
+        global _store
+        directory = getSettings().METRICS_MULTIPROC_DIR
+        if _store is None and directory:
+            _store = MultiprocessStore(directory)
+        return _store
+
+
+def collectMetrics() -> Dict[str, dict]:
+    snapshot = MetricsHandler.registry().snapshot()
+    store = MetricsHandler.store()
+    if store is None:
+        return snapshot
+    store.write(snapshot)
+    return store.readAll(snapshot)
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    return Response(renderText(collectMetrics()), media_type=CONTENT_TYPE)
+
+
+def installMetrics(app: FastAPI) -> None:
+    """Add the timing middleware, the /metrics route and FailureException counting to ``app``."""
+    settings = getSettings()
+    if not settings.METRICS_ENABLED:
+        return
+    registry = MetricsHandler.registry()
+    failures = registry.counter(
+        "failure_exceptions_total", "FailureExceptions raised.", ("type", "level")
+    )
+
+    def countFailure(exc: FailureException) -> None:
+        failures.inc((exc.type.name, exc.level.name))
+
+    addFailureListener(countFailure)
+    app.add_middleware(MetricsMiddleware, registry=registry)
+    app.include_router(router)
+
+    store = MetricsHandler.store()
+    if store is not None:
+        store.startFlushing(registry.snapshot, settings.METRICS_FLUSH_SECONDS)
+        atexit.register(lambda: store.write(registry.snapshot()))
@@ -0,0 +1,61 @@
+from fastapi import FastAPI
+from fastapi.logger import logger
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.settings.config import getSettings
+from src.core.metrics.middleware import _routeTemplate
+from src.core.profiling.sql_profiler import (SqlProfilerHandler, endProfile,
+                                             startProfile)
+
+
+class SqlProfilerMiddleware:
+    """Pure ASGI middleware giving every request its own ``QueryProfile``.
+
+    At the end of the request, SELECT shapes repeated ``nPlusOneThreshold``
+    times or more are logged as a likely N+1. With ``exposeHeaders`` the
+    query count and database time are added to the response
+    (``X-Query-Count`` and ``Server-Timing``).
+    """
+
+    def __init__(self, app: ASGIApp, nPlusOneThreshold: int = 5, exposeHeaders: bool = False):
+        self.app = app
+        self._nPlusOneThreshold = nPlusOneThreshold
+        self._exposeHeaders = exposeHeaders
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile, token = startProfile()
+
+        async def sendWithHeaders(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Query-Count"] = str(profile.count)
+                headers.append("Server-Timing", f"db;dur={profile.seconds * 1000:.1f}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, sendWithHeaders if self._exposeHeaders else send)
+        finally:
+            endProfile(token)
+            for shape, count in profile.repeatedShapes(self._nPlusOneThreshold):
+                logger.warning(
+                    f"Possible N+1 in {scope['method']} {_routeTemplate(scope)}: "
+                    f"{count} x {shape}"
+                )
+
+
+def installSqlProfiling(app: FastAPI) -> None:
+    """Time every statement on every engine and attribute it to the request that issued it."""
+    settings = getSettings()
+    if not settings.SQL_PROFILER_ENABLED:
+        return
+    SqlProfilerHandler.profiler().install()
+    app.add_middleware(
+        SqlProfilerMiddleware,
+        nPlusOneThreshold=settings.SQL_NPLUSONE_THRESHOLD,
+        exposeHeaders=settings.DEBUG,
+    )
@@ -0,0 +1,195 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+from fastapi.logger import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Placeholders of every DBAPI paramstyle, and the lists an expanding IN produces from them.
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+|\$\d+)"
+_IN_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SPACES = re.compile(r"\s+")
+
+
+def statementShape(statement: str) -> str:
+    """Statement with literals and IN-list lengths normalised, so N+1 loops collapse to one shape."""
+    shape = _LITERAL.sub("?", statement)
+    shape = _IN_LIST.sub("(?)", shape)
+    return _SPACES.sub(" ", shape).strip()
+
+
+@dataclass
+class SlowQuery:
+    statement: str
+    parameters: Any
+    seconds: float
+    plan: Optional[str] = None
+
+
+@dataclass
+class QueryProfile:
+    """Statements issued on behalf of one request (or one ``QueryRecorder`` block)."""
+
+    count: int = 0
+    seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    statements: List[str] = field(default_factory=list)
+    slow: List[SlowQuery] = field(default_factory=list)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statementShape(statement)] += 1
+        self.statements.append(statement)
+
+    def repeatedShapes(self, threshold: int) -> List[Tuple[str, int]]:
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= threshold and shape.lstrip("( ").upper().startswith("SELECT")
+        ]
+
+    def report(self) -> str:
+        lines = [f"{self.count} queries in {self.seconds * 1000:.1f} ms"]
+        lines += [f"  {count:>4} x {shape}" for shape, count in self.shapes.most_common()]
+        return "\n".join(lines)
+
+
+_currentProfile: ContextVar[Optional[QueryProfile]] = ContextVar("sqlProfile", default=None)
+
+
+def currentProfile() -> Optional[QueryProfile]:
+    return _currentProfile.get()
+
+
+def startProfile() -> Tuple[QueryProfile, Any]:
+    profile = QueryProfile()
+    return profile, _currentProfile.set(profile)
+
+
+def endProfile(token) -> None:
+    _currentProfile.reset(token)
+
+
+class SqlProfiler:
+    """Engine event hooks timing every statement and attributing it to the current request.
+
+    Sync endpoints run in the threadpool with a copy of the request context,
+    so the ContextVar still points at the request's profile there.
+    """
+
+    def __init__(
+        self,
+        slowQueryMs: float = 200.0,
+        explainSlowQueries: bool = False,
+        target: Any = Engine,
+    ):
+        self._slowQuerySeconds = slowQueryMs / 1000
+        self._explainSlowQueries = explainSlowQueries
+        self._target = target
+        self._installed = False
+        # Per instance, so profilers on the class and on a single engine don't share timings.
+        self._startedKey = f"_zen_query_started_{id(self)}"
+
+    def install(self) -> "SqlProfiler":
+        if not self._installed:
+            event.listen(self._target, "before_cursor_execute", self._before)
+            event.listen(self._target, "after_cursor_execute", self._after)
+            self._installed = True
+        return self
+
+    def uninstall(self) -> None:
+        if self._installed:
+            event.remove(self._target, "before_cursor_execute", self._before)
+            event.remove(self._target, "after_cursor_execute", self._after)
+            self._installed = False
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info[self._startedKey] = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info.pop(self._startedKey, None)
+        if started is None:
+            return
+        seconds = time.perf_counter() - started
+        profile = _currentProfile.get()
+        if profile is not None:
+            profile.record(statement, seconds)
+        if seconds >= self._slowQuerySeconds:
+            slow = SlowQuery(statement, parameters, seconds)
+            if self._explainSlowQueries and not executemany:
+                slow.plan = self._explain(conn, cursor, statement, parameters)
+            if profile is not None:
+                profile.slow.append(slow)
+            logger.warning(
+                f"Slow query ({seconds * 1000:.1f} ms): {statement} -- params: {parameters!r}"
+                + (f"\n{slow.plan}" if slow.plan else "")
+            )
+
+    def _explain(self, conn, cursor, statement, parameters) -> Optional[str]:
+        if conn.dialect.name != "postgresql" or not statement.lstrip().upper().startswith("SELECT"):
+            return None
+        # A fresh DBAPI cursor, so the original result set is untouched and no events fire;
+        # note that ANALYZE executes the query a second time.
+        explainCursor = conn.connection.cursor()
+        try:
+            # A failed EXPLAIN must not abort the caller's transaction.
+            explainCursor.execute("SAVEPOINT zen_explain")
+            try:
+                explainCursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+                plan = "\n".join(row[0] for row in explainCursor.fetchall())
+                explainCursor.execute("RELEASE SAVEPOINT zen_explain")
+                return plan
+            except Exception:
+                explainCursor.execute("ROLLBACK TO SAVEPOINT zen_explain")
+                raise
+        except Exception as e:
+            return f"EXPLAIN failed: {e}"
+        finally:
+            explainCursor.close()
+
+
+class QueryRecorder:
+    """Count every statement run on ``engine`` inside a ``with`` block, whatever thread runs it."""
+
+    def __init__(self, engine: Engine):
+        self._engine = engine
+        self.profile = QueryProfile()
+
+    @property
+    def count(self) -> int:
+        return self.profile.count
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.profile.record(statement, 0.0)
+
+    def __enter__(self) -> "QueryRecorder":
+        event.listen(self._engine, "after_cursor_execute", self._after)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(self._engine, "after_cursor_execute", self._after)
+
+
+_profiler: Optional[SqlProfiler] = None
+
+
+class SqlProfilerHandler:
+    @staticmethod
+    def profiler() -> SqlProfiler:
+        """The process-wide profiler on every ``Engine``, configured from settings."""
+        global _profiler
+        if _profiler is None:
+            from src.config.settings.config import getSettings
+
+            settings = getSettings()
+            _profiler = SqlProfiler(
+                slowQueryMs=settings.SQL_SLOW_QUERY_MS,
+                explainSlowQueries=settings.DEBUG and settings.SQL_EXPLAIN_SLOW_QUERIES,
+            )
+        return _profiler
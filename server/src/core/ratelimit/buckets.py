@@ -0,0 +1,79 @@
+import re
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Protocol
+
+_PERIODS = {"second": 1.0, "minute": 60.0, "hour": 3600.0, "day": 86400.0}
+_RATE = re.compile(r"^\s*(\d+)\s*/\s*(\d*)\s*(second|minute|hour|day)s?\s*$")
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """``burst`` requests at once, refilled at ``rate`` per second."""
+
+    rate: float
+    burst: int
+
+    @classmethod
+    def parse(cls, text: str) -> "RateLimit":
+        """``"120/minute"`` or ``"10/30seconds"``: that many requests per period, all at once."""
+        match = _RATE.match(text or "")
+        if not match:
+            raise ValueError(f"Invalid rate limit {text!r}; expected e.g. '120/minute'.")
+        count, multiple, unit = int(match.group(1)), match.group(2), match.group(3)
+        period = _PERIODS[unit] * (int(multiple) if multiple else 1)
+        return cls(rate=count / period, burst=count)
+
+
+class BucketStore(Protocol):
+    async def take(self, key: str, limit: RateLimit) -> float:
+        """Take one token; returns 0 when allowed, otherwise seconds until a token is back."""
+        ...
+
+
+class LocalBucketStore:
+    """Token buckets in a dict, for one process.
+
+    A bucket is ``[tokens, updatedAt, fullAt]``; a full bucket behaves
+    exactly like a missing one, so when ``maxKeys`` is reached the full
+    ones are dropped first. Only the event loop thread touches it.
+    """
+
+    def __init__(self, maxKeys: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.maxKeys = maxKeys
+        self._clock = clock
+        self._buckets: Dict[str, List[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def take(self, key: str, limit: RateLimit) -> float:
+        return self.takeNow(key, limit)
+
+    def takeNow(self, key: str, limit: RateLimit) -> float:
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.maxKeys:
+                self._sweep(now)
+            self._buckets[key] = [limit.burst - 1.0, now, now + 1.0 / limit.rate]
+            return 0.0
+        tokens = bucket[0] + (now - bucket[1]) * limit.rate
+        if tokens > limit.burst:
+            tokens = limit.burst
+        bucket[1] = now
+        if tokens >= 1.0:
+            tokens -= 1.0
+            bucket[0] = tokens
+            bucket[2] = now + (limit.burst - tokens) / limit.rate
+            return 0.0
+        bucket[0] = tokens
+        return (1.0 - tokens) / limit.rate
+
+    def _sweep(self, now: float) -> None:
+        for key in [key for key, bucket in self._buckets.items() if bucket[2] <= now]:
+            del self._buckets[key]
+        if len(self._buckets) >= self.maxKeys:
+            # Still full of active clients: forget the least recently created half.
+            for key in list(self._buckets)[: len(self._buckets) // 2]:
+                del self._buckets[key]
@@ -0,0 +1,150 @@
+import json
+import math
+from typing import Callable, Dict, Iterable, Optional
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.config.settings.config import getSettings
+from src.core.ratelimit.buckets import BucketStore, LocalBucketStore, RateLimit
+from src.core.security.auth.services.token_service import (TokenService,
+                                                           TokenServiceHandler)
+
+AUTH, GRAPHQL, READ, WRITE = "auth", "graphql", "read", "write"
+_READ_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+
+def _denialBody(routeClass: str) -> bytes:
+    # Same shape as FailureException.toDict(), without raising one (and logging it) per rejection.
+    return json.dumps(
+        {
+            "type": "NETWORK",
+            "level": "WARNING",
+            "message": f"Rate limit exceeded for {routeClass} requests.",
+            "user_message": "Too many requests, please slow down and try again shortly.",
+            "error": None,
+        }
+    ).encode()
+
+
+class RateLimitMiddleware:
+    """Pure ASGI middleware applying a token bucket per client and route class.
+
+    The client is the user behind a valid bearer token (verified through
+    the token cache, so a known token costs a dict lookup), else an
+    ``X-API-Key`` accepted by ``verifyApiKey``, else the peer address. An
+    unverified key is ignored: rotating made-up keys must not buy a fresh
+    bucket per request (nor flood the store). Route classes get separate
+    buckets, so a client hammering writes can still read. Rejected
+    requests get a 429 with ``Retry-After`` and never reach the app.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limits: Dict[str, Optional[RateLimit]],
+        store: BucketStore,
+        tokens: Optional[TokenService] = None,
+        apiPrefix: str = "/api/v1",
+        exemptPaths: Iterable[str] = (),
+        verifyApiKey: Optional[Callable[[str], bool]] = None,
+    ):
+        self.app = app
+        self._limits = limits
+        self._store = store
+        # Local buckets are taken synchronously: no coroutine per request on the hot path.
+        self._takeNow = store.takeNow if isinstance(store, LocalBucketStore) else None
+        self._tokens = tokens
+        self._verifyApiKey = verifyApiKey
+        self._authPrefix = f"{apiPrefix}/auth/"
+        self._exempt = frozenset(exemptPaths)
+        self._denials = {routeClass: _denialBody(routeClass) for routeClass in limits}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self._exempt:
+            await self.app(scope, receive, send)
+            return
+        routeClass = self._classify(scope)
+        limit = self._limits.get(routeClass)
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = f"{self._identify(scope)}|{routeClass}"
+        if self._takeNow is not None:
+            retryAfter = self._takeNow(key, limit)
+        else:
+            retryAfter = await self._store.take(key, limit)
+        if not retryAfter:
+            await self.app(scope, receive, send)
+            return
+
+        body = self._denials[routeClass]
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(max(1, math.ceil(retryAfter))).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    def _classify(self, scope: Scope) -> str:
+        path = scope["path"]
+        if path.startswith(self._authPrefix):
+            return AUTH
+        if path == "/graphql":
+            return GRAPHQL
+        return READ if scope["method"] in _READ_METHODS else WRITE
+
+    def _identify(self, scope: Scope) -> str:
+        apiKey = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                if value[:7].lower() == b"bearer ":
+                    claims = (self._tokens or TokenServiceHandler.tokens()).verify(
+                        value[7:].decode("latin-1").strip()
+                    )
+                    if claims is not None:
+                        return f"user:{claims.userId}"
+            elif name == b"x-api-key" and self._verifyApiKey is not None:
+                apiKey = value.decode("latin-1")
+        if apiKey and self._verifyApiKey(apiKey):
+            return f"key:{apiKey}"
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+
+def installRateLimiting(app: FastAPI) -> None:
+    """Add per-client token buckets in front of the routes (shared through Redis if configured)."""
+    settings = getSettings()
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    limits = {
+        AUTH: RateLimit.parse(settings.RATE_LIMIT_AUTH),
+        GRAPHQL: RateLimit.parse(settings.RATE_LIMIT_GRAPHQL),
+        READ: RateLimit.parse(settings.RATE_LIMIT_READ),
+        WRITE: RateLimit.parse(settings.RATE_LIMIT_WRITE),
+    }
+    store: BucketStore = LocalBucketStore(maxKeys=settings.RATE_LIMIT_MAX_KEYS)
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        from src.core.ratelimit.redis_buckets import RedisBucketStore
+
+        store = RedisBucketStore.fromUrl(
+            settings.REDIS_URL,
+            socketTimeout=settings.REDIS_SOCKET_TIMEOUT,
+            prefix=settings.CACHE_KEY_PREFIX,
+            fallback=store,
+            retryAfterSeconds=settings.CACHE_RETRY_AFTER_SECONDS,
+        )
+    app.add_middleware(
+        RateLimitMiddleware,
+        limits=limits,
+        store=store,
+        apiPrefix=settings.API_V1_STR,
+        exemptPaths=settings.RATE_LIMIT_EXEMPT_PATHS,
+    )
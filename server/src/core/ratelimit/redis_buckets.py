@@ -0,0 +1,74 @@
+import hashlib
+import time
+from typing import Optional
+
+import redis
+import redis.asyncio
+from fastapi.logger import logger
+
+from src.core.ratelimit.buckets import LocalBucketStore, RateLimit
+
+# Redis' own clock is used so every worker refills the bucket at the same pace.
+_TAKE_SCRIPT = """
+local now = redis.call("TIME")
+local t = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local state = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or t
+tokens = math.min(burst, tokens + math.max(0, t - ts) * rate)
+local retry = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry = (1 - tokens) / rate
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(t))
+redis.call("PEXPIRE", KEYS[1], math.ceil((burst - tokens) / rate * 1000) + 1000)
+return tostring(retry)
+"""
+
+
+class RedisBucketStore:
+    """Token buckets shared by every worker, one atomic script call per request.
+
+    Keys are hashed, so API keys never end up in Redis. While Redis is
+    unreachable, requests are limited by the in-process ``fallback`` buckets
+    instead (per worker, so the limit is looser but still there).
+    """
+
+    def __init__(
+        self,
+        client: "redis.asyncio.Redis",
+        prefix: str = "zen",
+        fallback: Optional[LocalBucketStore] = None,
+        retryAfterSeconds: int = 10,
+    ):
+        self._prefix = f"{prefix}:rl:"
+        self._script = client.register_script(_TAKE_SCRIPT)
+        self._fallback = fallback or LocalBucketStore()
+        self._retryAfterSeconds = retryAfterSeconds
+        self._unavailableUntil = 0.0
+
+    @classmethod
+    def fromUrl(cls, url: str, socketTimeout: float = 0.25, **kwargs) -> "RedisBucketStore":
+        client = redis.asyncio.Redis.from_url(
+            url, socket_timeout=socketTimeout, socket_connect_timeout=socketTimeout
+        )
+        return cls(client, **kwargs)
+
+    async def take(self, key: str, limit: RateLimit) -> float:
+        if time.monotonic() < self._unavailableUntil:
+            return self._fallback.takeNow(key, limit)
+        try:
+            return float(
+                await self._script(keys=[self._key(key)], args=[limit.rate, limit.burst])
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Rate limit store unavailable, using local buckets: {e}")
+            self._unavailableUntil = time.monotonic() + self._retryAfterSeconds
+            return self._fallback.takeNow(key, limit)
+
+    def _key(self, key: str) -> str:
+        return self._prefix + hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
@@ -0,0 +1,285 @@
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, Set, Tuple
+
+from fastapi.logger import logger
+
+SnapshotProvider = Callable[[str], Awaitable[Any]]
+
+
+class RealtimeSocket(Protocol):
+    async def send_text(self, data: str) -> None: ...
+
+    async def close(self, code: int = 1000) -> None: ...
+
+
+def projectChannel(projectId) -> str:
+    return f"project:{projectId}"
+
+
+def userChannel(userId) -> str:
+    return f"user:{userId}"
+
+
+def _encodeDefault(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def encodeMessage(message: dict) -> str:
+    return json.dumps(message, default=_encodeDefault, separators=(",", ":"))
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    channel: str
+
+
+@dataclass
+class HubStats:
+    published: int = 0
+    coalesced: int = 0
+    messages: int = 0
+    enqueued: int = 0
+    snapshots: int = 0
+    resyncs: int = 0
+    dropped: int = 0
+
+    def toDict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class ClientConnection:
+    """One socket with a bounded outbox drained by its own writer task.
+
+    The hub never awaits a socket; it only offers already-encoded messages,
+    so a slow reader can fill its own queue but cannot stall the fan-out.
+    """
+
+    def __init__(self, hub: "RealtimeHub", socket: RealtimeSocket, maxQueue: int):
+        self.id = uuid.uuid4().hex
+        self.channels: Set[str] = set()
+        self.lastResyncAt = float("-inf")
+        self.closed = False
+        self._hub = hub
+        self._socket = socket
+        self._queue: asyncio.Queue = asyncio.Queue(maxQueue)
+        self._writer: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._writer = asyncio.get_running_loop().create_task(self._run())
+
+    def offer(self, item: Any) -> bool:
+        if self.closed:
+            return False
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            self._hub._onOverflow(self)
+            return False
+
+    def resetToSnapshots(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        for channel in self.channels:
+            self._queue.put_nowait(_Snapshot(channel))
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    async def close(self) -> None:
+        self.closed = True
+        if self._writer is not None and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+        try:
+            await self._socket.close()
+        except Exception:
+            pass
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                item = await self._queue.get()
+                if isinstance(item, _Snapshot):
+                    if item.channel not in self.channels:
+                        continue
+                    item = await self._hub._snapshotMessage(item.channel)
+                await self._socket.send_text(item)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.info(f"Realtime socket {self.id} failed: {e}")
+            self._hub.disconnect(self)
+
+
+class RealtimeHub:
+    """Per-project/per-user fan-out with a snapshot-plus-delta protocol.
+
+    Clients first receive ``{"type": "snapshot", "version": v, "data": ...}`` for a
+    channel, then ``{"type": "delta", "version": v+n, "changes": [...]}`` messages
+    and apply those with a higher version. Changes to the same entity inside
+    the coalescing window are merged, every delta is encoded once per channel
+    and shared by all subscribers, and a socket whose outbox overflows gets a
+    fresh snapshot instead of the backlog (or is dropped if it overflows again
+    within the cooldown).
+    """
+
+    def __init__(
+        self,
+        snapshotProvider: SnapshotProvider,
+        coalesceMs: int = 50,
+        maxQueue: int = 64,
+        maxChangesPerMessage: int = 500,
+        resyncCooldownSeconds: float = 5.0,
+    ):
+        self._snapshotProvider = snapshotProvider
+        self._coalesceSeconds = coalesceMs / 1000
+        self._maxQueue = max(maxQueue, 8)
+        self._maxChangesPerMessage = maxChangesPerMessage
+        self._resyncCooldownSeconds = resyncCooldownSeconds
+        self._subscribers: Dict[str, Set[ClientConnection]] = {}
+        self._versions: Dict[str, int] = {}
+        self._pending: Dict[str, Dict[str, dict]] = {}
+        self._snapshots: Dict[str, Tuple[int, asyncio.Future]] = {}
+        self._flushHandle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats = HubStats()
+
+    def connect(self, socket: RealtimeSocket) -> ClientConnection:
+        self._loop = asyncio.get_running_loop()
+        client = ClientConnection(self, socket, self._maxQueue)
+        client.start()
+        return client
+
+    def subscribe(self, client: ClientConnection, channel: str) -> None:
+        if channel in client.channels:
+            return
+        client.channels.add(channel)
+        self._subscribers.setdefault(channel, set()).add(client)
+        client.offer(_Snapshot(channel))
+
+    def unsubscribe(self, client: ClientConnection, channel: str) -> None:
+        client.channels.discard(channel)
+        subscribers = self._subscribers.get(channel)
+        if subscribers is not None:
+            subscribers.discard(client)
+            if not subscribers:
+                del self._subscribers[channel]
+                self._pending.pop(channel, None)
+                self._snapshots.pop(channel, None)
+
+    def disconnect(self, client: ClientConnection) -> None:
+        for channel in list(client.channels):
+            self.unsubscribe(client, channel)
+        if not client.closed:
+            asyncio.get_running_loop().create_task(client.close())
+
+    def subscriberCount(self, channel: str) -> int:
+        return len(self._subscribers.get(channel, ()))
+
+    def version(self, channel: str) -> int:
+        return self._versions.get(channel, 0)
+
+    def publish(self, channel: str, entityId: str, change: dict) -> None:
+        """Queue a change to ``entityId``; it goes out with the next coalesced delta."""
+        if channel not in self._subscribers:
+            return
+        self.stats.published += 1
+        entityId = str(entityId)
+        pending = self._pending.setdefault(channel, {})
+        existing = pending.get(entityId)
+        if existing is None or change.get("op") == "delete" or existing.get("op") == "delete":
+            pending[entityId] = {"id": entityId, "op": "upsert", **change}
+        else:
+            self.stats.coalesced += 1
+            existing.update(change)
+
+        if self._flushHandle is None:
+            self._flushHandle = asyncio.get_running_loop().call_later(
+                self._coalesceSeconds, self.flush
+            )
+
+    def publishThreadsafe(self, channel: str, entityId: str, change: dict) -> None:
+        """Entry point for code running outside the event loop (sync DB sessions)."""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self.publish, channel, entityId, change)
+
+    def resync(self, channel: str) -> None:
+        """Send every subscriber a fresh snapshot, for writes that left no changes to publish."""
+        subscribers = self._subscribers.get(channel)
+        if not subscribers:
+            return
+        # A new version, so the snapshot is loaded again instead of shared from before the write.
+        self._versions[channel] = self._versions.get(channel, 0) + 1
+        for client in list(subscribers):
+            client.offer(_Snapshot(channel))
+
+    def resyncThreadsafe(self, channel: str) -> None:
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self.resync, channel)
+
+    def flush(self) -> None:
+        self._flushHandle = None
+        pending, self._pending = self._pending, {}
+        for channel, changes in pending.items():
+            subscribers = self._subscribers.get(channel)
+            if not subscribers or not changes:
+                continue
+            values = list(changes.values())
+            for start in range(0, len(values), self._maxChangesPerMessage):
+                version = self._versions.get(channel, 0) + 1
+                self._versions[channel] = version
+                message = encodeMessage(
+                    {
+                        "type": "delta",
+                        "channel": channel,
+                        "version": version,
+                        "changes": values[start : start + self._maxChangesPerMessage],
+                    }
+                )
+                self.stats.messages += 1
+                for client in list(subscribers):
+                    if client.offer(message):
+                        self.stats.enqueued += 1
+
+    async def _snapshotMessage(self, channel: str) -> str:
+        # Sockets resyncing the same channel at the same version share one provider call.
+        version = self._versions.get(channel, 0)
+        cached = self._snapshots.get(channel)
+        if cached is None or cached[0] != version:
+            future = asyncio.get_running_loop().create_future()
+            self._snapshots[channel] = (version, future)
+            try:
+                data = await self._snapshotProvider(channel)
+                self.stats.snapshots += 1
+                future.set_result(
+                    encodeMessage(
+                        {"type": "snapshot", "channel": channel, "version": version, "data": data}
+                    )
+                )
+            except Exception as e:
+                self._snapshots.pop(channel, None)
+                future.set_exception(e)
+                raise
+            return future.result()
+        return await asyncio.shield(cached[1])
+
+    def _onOverflow(self, client: ClientConnection) -> None:
+        now = time.monotonic()
+        if now - client.lastResyncAt < self._resyncCooldownSeconds:
+            self.stats.dropped += 1
+            self.disconnect(client)
+            return
+        client.lastResyncAt = now
+        self.stats.resyncs += 1
+        client.resetToSnapshots()
+
+    def subscribedChannels(self) -> List[str]:
+        return list(self._subscribers)
@@ -0,0 +1,115 @@
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.core.realtime.hub import RealtimeHub, projectChannel, userChannel
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+
+_PENDING_EVENTS = "realtime_pending_events"
+_PENDING_RESYNCS = "realtime_pending_resyncs"
+_installed = False
+
+
+def _changedColumns(obj) -> dict:
+    state = inspect(obj)
+    return {
+        attr.key: attr.value
+        for attr in state.attrs
+        if attr.key in state.mapper.columns and attr.history.has_changes()
+    }
+
+
+def _channels(projectId, userId) -> List[str]:
+    return [
+        channel
+        for channel in (
+            projectChannel(projectId) if projectId else None,
+            userChannel(userId) if userId else None,
+        )
+        if channel
+    ]
+
+
+def _keepPrevious(target, value, oldvalue, initiator) -> None:
+    """Nothing to do: listening with ``active_history`` is what loads an expired old value."""
+
+
+def _previous(obj, key: str):
+    """The value ``key`` had before this flush, or None if it did not change."""
+    deleted = getattr(inspect(obj).attrs, key).history.deleted
+    return deleted[0] if deleted else None
+
+
+def taskEvents(session: Session) -> List[Tuple[str, str, dict]]:
+    events = []
+    for obj, op in (
+        *((obj, "upsert") for obj in session.new),
+        *((obj, "upsert") for obj in session.dirty),
+        *((obj, "delete") for obj in session.deleted),
+    ):
+        if getattr(obj, "__tablename__", None) != "tasks":
+            continue
+        change = {"op": "delete"} if op == "delete" else _changedColumns(obj)
+        if not change:
+            continue
+        channels = _channels(obj.project_id, obj.assigned_to)
+        events.extend((channel, obj.id, change) for channel in channels)
+        if op == "upsert":
+            # Moved or reassigned: the channels it left see it go.
+            left = _channels(_previous(obj, "project_id"), _previous(obj, "assigned_to"))
+            events.extend(
+                (channel, obj.id, {"op": "delete"}) for channel in left if channel not in channels
+            )
+    return events
+
+
+def requestResync(session: Session, channels: Iterable[str]) -> None:
+    """Resend snapshots of these channels once the session commits.
+
+    For writes the session cannot see, i.e. ``INSERT ... SELECT`` and other
+    Core statements, which leave no task events behind.
+    """
+    session.info.setdefault(_PENDING_RESYNCS, set()).update(channels)
+
+
+def installRealtimePublishing(hub: RealtimeHub, target=Session) -> None:
+    """Publish committed task changes to the project and assignee channels.
+
+    A task moved to another project or assignee is published as a delete
+    to the channels it left.
+    """
+    global _installed
+    if _installed:
+        return
+
+    # Keyed by hub, so a second installation (another target) does not take this one's events.
+    pendingKey = (_PENDING_EVENTS, id(hub))
+
+    def _collect(session: Session, flushContext) -> None:
+        session.info.setdefault(pendingKey, []).extend(taskEvents(session))
+
+    def _publish(session: Session) -> None:
+        for channel, entityId, change in session.info.pop(pendingKey, ()):
+            hub.publishThreadsafe(channel, str(entityId), change)
+        # Read, not popped: every installed hub resyncs the same channels.
+        for channel in session.info.get(_PENDING_RESYNCS, ()):
+            hub.resyncThreadsafe(channel)
+
+    def _discard(session: Session, transaction: Optional[SessionTransaction] = None) -> None:
+        session.info.pop(pendingKey, None)
+        session.info.pop(_PENDING_RESYNCS, None)
+
+    def _finish(session: Session, transaction: SessionTransaction) -> None:
+        if transaction.parent is None:  # after_commit has run; savepoints keep their resyncs
+            session.info.pop(_PENDING_RESYNCS, None)
+
+    # A task's old project and assignee must be in its history, even when they had expired.
+    for attribute in (TaskTable.project_id, TaskTable.assigned_to):
+        if not event.contains(attribute, "set", _keepPrevious):
+            event.listen(attribute, "set", _keepPrevious, active_history=True)
+    event.listen(target, "after_flush", _collect)
+    event.listen(target, "after_commit", _publish)
+    event.listen(target, "after_rollback", _discard)
+    event.listen(target, "after_transaction_end", _finish)
+    _installed = True
@@ -0,0 +1,168 @@
+import uuid
+from typing import Any, Iterable, List, Optional, Set
+
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect, status
+from sqlalchemy import or_, select
+from starlette.concurrency import run_in_threadpool
+
+from src.config.settings.config import getSettings
+from src.core.realtime.hub import RealtimeHub, projectChannel, userChannel
+from src.core.security.auth.services.principal_cache import (
+    Principal, PrincipalCacheHandler)
+from src.core.security.auth.services.token_service import TokenServiceHandler
+from src.features.todos.data.datasource.tables.project_table import \
+    ProjectTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+
+router = APIRouter()
+
+_hub: Optional[RealtimeHub] = None
+
+
+def _loadSnapshot(channel: str) -> Any:
+    from src.config.database.zen_task_db_handler import ZenTaskDbHandler
+    from src.core.cache.cache_handler import CacheHandler
+    from src.features.todos.data.datasource.daos.project_dao import ProjectDao
+    from src.features.todos.data.datasource.daos.task_dao import TaskDao
+    from src.features.todos.data.repository.task_repository_impl import \
+        TaskRepositoryImpl
+
+    db = ZenTaskDbHandler.db()
+    session = db.getSession()
+    try:
+        repository = TaskRepositoryImpl(
+            TaskDao(session), ProjectDao(session), CacheHandler.cache(), getSettings()
+        )
+        kind, id = channel.split(":", 1)
+        if kind == "project":
+            return repository.getProjectBoard(id)
+        return repository.getUserOpenTasks(id)
+    finally:
+        db.closeSession(session)
+
+
+async def _snapshot(channel: str) -> Any:
+    return await run_in_threadpool(_loadSnapshot, channel)
+
+
+class RealtimeHubHandler:
+    @staticmethod
+    def hub() -> RealtimeHub:
+        global _hub
+        if _hub is None:
+            settings = getSettings()
+            _hub = RealtimeHub(
+                _snapshot,
+                coalesceMs=settings.REALTIME_COALESCE_MS,
+                maxQueue=settings.REALTIME_MAX_QUEUE,
+                maxChangesPerMessage=settings.REALTIME_MAX_CHANGES_PER_MESSAGE,
+                resyncCooldownSeconds=settings.REALTIME_RESYNC_COOLDOWN_SECONDS,
+            )
+        return _hub
+
+
+def _authenticate(token: Optional[str]) -> Optional[Principal]:
+    from src.config.database.zen_task_db_handler import ZenTaskDbHandler
+
+    claims = TokenServiceHandler.tokens().verify(token) if token else None
+    if claims is None:
+        return None
+    db = ZenTaskDbHandler.db()
+    session = db.getSession()
+    try:
+        principal = PrincipalCacheHandler.cache().get(session, claims.userId)
+    finally:
+        db.closeSession(session)
+    return principal if principal is not None and principal.isActive else None
+
+
+def _accessibleProjects(userId: uuid.UUID, projectIds: Iterable[str]) -> Set[str]:
+    """The projects ``userId`` owns or has a task assigned in."""
+    from src.config.database.zen_task_db_handler import ZenTaskDbHandler
+
+    ids = {}
+    for projectId in projectIds:
+        try:
+            ids[uuid.UUID(projectId)] = projectId
+        except ValueError:
+            continue
+    if not ids:
+        return set()
+    projects, tasks = ProjectTable.__table__, TaskTable.__table__
+    db = ZenTaskDbHandler.db()
+    session = db.getSession()
+    try:
+        found = session.scalars(
+            select(projects.c.id).where(
+                projects.c.id.in_(ids),
+                or_(
+                    projects.c.owner_id == userId,
+                    projects.c.id.in_(
+                        select(tasks.c.project_id).where(tasks.c.assigned_to == userId)
+                    ),
+                ),
+            )
+        )
+        return {ids[projectId] for projectId in found}
+    finally:
+        db.closeSession(session)
+
+
+async def _allowedChannels(
+    principal: Principal, projectIds: Iterable[str], userIds: Iterable[str]
+) -> List[str]:
+    """Channels of the requested ones the principal may watch: its projects and its own user."""
+    projectIds = list(projectIds)
+    allowed = set()
+    if projectIds:
+        allowed = await run_in_threadpool(_accessibleProjects, principal.id, projectIds)
+    return [projectChannel(projectId) for projectId in projectIds if projectId in allowed] + [
+        userChannel(userId) for userId in userIds if userId == str(principal.id)
+    ]
+
+
+def _bearerToken(websocket: WebSocket, token: Optional[str]) -> Optional[str]:
+    # Browsers cannot set headers on a WebSocket handshake, hence the query parameter.
+    scheme, _, credentials = websocket.headers.get("authorization", "").partition(" ")
+    return credentials if scheme.lower() == "bearer" and credentials else token
+
+
+@router.websocket("/ws")
+async def realtime(
+    websocket: WebSocket,
+    projects: List[str] = Query(default=[]),
+    user: Optional[str] = None,
+    token: Optional[str] = None,
+):
+    """Client messages: ``{"action": "subscribe"|"unsubscribe", "project"|"user": "<id>"}``.
+
+    The handshake needs a bearer token (``Authorization`` header or ``token``
+    query parameter). Subscriptions to projects the user neither owns nor
+    has a task in, or to another user's channel, are ignored.
+    """
+    principal = await run_in_threadpool(_authenticate, _bearerToken(websocket, token))
+    if principal is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    hub = RealtimeHubHandler.hub()
+    await websocket.accept()
+    client = hub.connect(websocket)
+    for channel in await _allowedChannels(principal, projects, [user] if user else []):
+        hub.subscribe(client, channel)
+
+    try:
+        while True:
+            message = await websocket.receive_json()
+            action = message.get("action")
+            projectIds = [str(message["project"])] if "project" in message else []
+            userIds = [str(message["user"])] if "user" in message else []
+            if action == "subscribe":
+                for channel in await _allowedChannels(principal, projectIds, userIds):
+                    hub.subscribe(client, channel)
+            elif action == "unsubscribe":
+                for channel in [*map(projectChannel, projectIds), *map(userChannel, userIds)]:
+                    hub.unsubscribe(client, channel)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        hub.disconnect(client)
@@ -0,0 +1,33 @@
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional, Protocol, Sequence
+
+from fastapi.logger import logger
+
+
+@dataclass(frozen=True)
+class Reminder:
+    scheduleId: uuid.UUID
+    taskId: uuid.UUID
+    userId: Optional[uuid.UUID]
+    title: str
+    dueDate: date
+    remindAt: datetime  # naive UTC
+
+
+class ReminderNotifier(Protocol):
+    def send(self, reminders: Sequence[Reminder]) -> None:
+        """Deliver one batch; raising leaves the whole batch to be retried."""
+        ...
+
+
+class LoggingNotifier:
+    """Stand-in until push delivery exists: reminders only show up in the logs."""
+
+    def send(self, reminders: Sequence[Reminder]) -> None:
+        for reminder in reminders:
+            logger.info(
+                f"Reminder for task {reminder.taskId} ({reminder.title!r}) "
+                f"to user {reminder.userId}, due {reminder.dueDate}"
+            )
@@ -0,0 +1,232 @@
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, ContextManager, Dict, List, Optional, Set
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from fastapi.logger import logger
+from sqlalchemy import Row, or_, select, update
+from sqlalchemy.orm import Session
+
+from src.core.reminders.notifier import Reminder, ReminderNotifier
+from src.core.reminders.timing_wheel import TimingWheel
+from src.features.todos.data.datasource.tables.task_schedule_table import \
+    TaskScheduleTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.features.todos.data.datasource.tables.user_settings_table import \
+    UserSettingsTable
+
+taskSchedules = TaskScheduleTable.__table__
+tasks = TaskTable.__table__
+userSettings = UserSettingsTable.__table__
+
+REMINDER_COLUMNS = (
+    taskSchedules.c.id,
+    taskSchedules.c.task_id,
+    taskSchedules.c.due_date,
+    taskSchedules.c.reminder_time,
+    taskSchedules.c.reminded_at,
+    taskSchedules.c.updated_at,
+    tasks.c.title,
+    tasks.c.assigned_to,
+    tasks.c.completed_at,
+    userSettings.c.timezone,
+)
+
+# Local dates around a UTC window: no timezone is more than 14 hours away.
+DATE_SLACK = timedelta(days=1)
+
+
+def _remindAt(row: Row) -> Optional[datetime]:
+    """The reminder moment of a schedule row in naive UTC, or None if it has none."""
+    if row.due_date is None or row.reminder_time is None or row.completed_at is not None:
+        return None
+    try:
+        zone = ZoneInfo(row.timezone or "UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        zone = timezone.utc
+    local = datetime.combine(row.due_date, row.reminder_time, tzinfo=zone)
+    return local.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class ReminderService:
+    """Fires ``task_schedules`` reminders from an in-memory timing wheel.
+
+    Only reminders inside a sliding ``horizon`` are held in memory; each
+    refresh loads the slice of time that just entered it. Schedule edits are
+    made by the API and worker processes, never by this one, so they reach
+    the wheel through the refresh: it re-reads the rows whose ``updated_at``
+    moved since the last one.
+
+    Instances split schedules by ``id % shardCount``. A reminder is only
+    sent after a conditional UPDATE of ``reminded_at`` claims it, so two
+    instances with overlapping shards (during a rebalance, or a restart
+    catching up) still deliver it once. If the notifier fails, the claim is
+    rolled back and the batch comes round again after ``retryAfter``.
+    """
+
+    def __init__(
+        self,
+        sessionFactory: Callable[[], ContextManager[Session]],
+        notifier: ReminderNotifier,
+        clock: Callable[[], datetime] = datetime.utcnow,
+        horizon: timedelta = timedelta(hours=1),
+        refreshEvery: timedelta = timedelta(seconds=30),
+        catchUp: timedelta = timedelta(minutes=5),
+        retryAfter: timedelta = timedelta(seconds=30),
+        batchSize: int = 500,
+        shardIndex: int = 0,
+        shardCount: int = 1,
+        tick: timedelta = timedelta(seconds=1),
+    ):
+        if not 0 <= shardIndex < shardCount:
+            raise ValueError(f"shard {shardIndex} is outside 0..{shardCount - 1}")
+        self._sessionFactory = sessionFactory
+        self._notifier = notifier
+        self._clock = clock
+        self.horizon = horizon
+        self.refreshEvery = refreshEvery
+        self.catchUp = catchUp
+        self.retryAfter = retryAfter
+        self.batchSize = batchSize
+        self.shardIndex = shardIndex
+        self.shardCount = shardCount
+        self._tick = tick
+        self._wheel: Optional[TimingWheel] = None
+        self._loadedUntil: Optional[datetime] = None
+        self._changesSince: Optional[datetime] = None
+        self._refreshedAt: Optional[datetime] = None
+
+    @property
+    def scheduled(self) -> int:
+        return len(self._wheel) if self._wheel else 0
+
+    def tick(self) -> int:
+        """Load what is due for loading, fire what is due; returns reminders delivered."""
+        now = self._clock()
+        with self._sessionFactory() as session:
+            if self._wheel is None:
+                self._start(session, now)
+            elif now - self._refreshedAt >= self.refreshEvery:
+                self._refresh(session, now)
+            return self._dispatch(session, self._wheel.advance(now), now)
+
+    def run(self, stop: threading.Event, interval: float = 1.0) -> None:
+        while not stop.is_set():
+            try:
+                self.tick()
+            except Exception as e:
+                logger.warning(f"Reminder tick failed: {e}")
+            stop.wait(interval)
+
+    def _start(self, session: Session, now: datetime) -> None:
+        # Starting the wheel in the past replays reminders missed while no instance was running.
+        self._wheel = TimingWheel(now - self.catchUp, self._tick)
+        self._loadedUntil = now - self.catchUp
+        self._changesSince = now
+        self._extend(session, now)
+
+    def _refresh(self, session: Session, now: datetime) -> None:
+        rows = session.execute(
+            # Overlap the previous read: a transaction can commit an older updated_at late.
+            self._select(outer=True).where(
+                taskSchedules.c.updated_at >= self._changesSince - self.refreshEvery
+            )
+        ).all()
+        for row in rows:
+            self._changesSince = max(self._changesSince, row.updated_at)
+        self._replace(rows, {row.id for row in rows})
+        self._extend(session, now)
+
+    def _extend(self, session: Session, now: datetime) -> None:
+        """Load the reminders between the previous horizon and the new one."""
+        start, end = self._loadedUntil, now + self.horizon
+        rows = session.execute(
+            self._select().where(
+                taskSchedules.c.due_date >= (start - DATE_SLACK).date(),
+                taskSchedules.c.due_date <= (end + DATE_SLACK).date(),
+            )
+        ).all()
+        for row in rows:
+            self._offer(row, start, end)
+        self._loadedUntil = end
+        self._refreshedAt = now
+
+    def _replace(self, rows: List[Row], scheduleIds: Set[uuid.UUID]) -> None:
+        # Deleted rows are simply not returned; everything is cancelled first and offered again.
+        for scheduleId in scheduleIds:
+            self._wheel.cancel(scheduleId)
+        for row in rows:
+            # Anything the wheel has not turned past yet is still deliverable; moments past
+            # the loaded window are picked up when the horizon slides over them.
+            self._offer(row, self._wheel.now, self._loadedUntil)
+
+    def _select(self, outer: bool = False):
+        stmt = (
+            select(*REMINDER_COLUMNS)
+            .select_from(taskSchedules)
+            .join(tasks, tasks.c.id == taskSchedules.c.task_id, isouter=outer)
+            .outerjoin(userSettings, userSettings.c.user_id == tasks.c.assigned_to)
+        )
+        if not outer:
+            stmt = stmt.where(
+                taskSchedules.c.reminder_time.isnot(None), tasks.c.completed_at.is_(None)
+            )
+        return stmt
+
+    def _offer(self, row: Row, start: datetime, end: datetime) -> None:
+        if row.id.int % self.shardCount != self.shardIndex:
+            return
+        remindAt = _remindAt(row)
+        if remindAt is None or not start <= remindAt < end or row.reminded_at == remindAt:
+            return
+        self._wheel.add(
+            row.id,
+            remindAt,
+            Reminder(row.id, row.task_id, row.assigned_to, row.title, row.due_date, remindAt),
+        )
+
+    def _dispatch(self, session: Session, due: list, now: datetime) -> int:
+        reminders = [reminder for _, reminder in due]
+        sent = 0
+        for index in range(0, len(reminders), self.batchSize):
+            batch = reminders[index : index + self.batchSize]
+            try:
+                claimed = self._claim(session, batch)
+                delivered = [reminder for reminder in batch if reminder.scheduleId in claimed]
+                if delivered:
+                    self._notifier.send(delivered)
+                session.commit()
+                sent += len(delivered)
+            except Exception as e:
+                session.rollback()
+                logger.warning(f"Delivering {len(batch)} reminders failed, retrying: {e}")
+                for reminder in batch:
+                    self._wheel.add(reminder.scheduleId, now + self.retryAfter, reminder)
+        return sent
+
+    def _claim(self, session: Session, batch: List[Reminder]) -> Set[uuid.UUID]:
+        """Mark reminders delivered; returns the ids this instance won."""
+        byMoment: Dict[datetime, List[uuid.UUID]] = {}
+        for reminder in batch:
+            byMoment.setdefault(reminder.remindAt, []).append(reminder.scheduleId)
+        claimed: Set[uuid.UUID] = set()
+        for remindAt, scheduleIds in byMoment.items():
+            claimed.update(
+                session.execute(
+                    update(taskSchedules)
+                    .where(
+                        taskSchedules.c.id.in_(scheduleIds),
+                        or_(
+                            taskSchedules.c.reminded_at.is_(None),
+                            taskSchedules.c.reminded_at != remindAt,
+                        ),
+                        taskSchedules.c.task_id.in_(
+                            select(tasks.c.id).where(tasks.c.completed_at.is_(None))
+                        ),
+                    )
+                    .values(reminded_at=remindAt)
+                    .returning(taskSchedules.c.id)
+                ).scalars()
+            )
+        return claimed
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Hashable, List, Sequence, Tuple
+
+Entry = Tuple[int, Any]  # (due tick, payload)
+
+EPOCH = datetime(1970, 1, 1)
+
+
+class TimingWheel:
+    """Hierarchical timing wheel keyed by an id, so entries can be moved or cancelled in O(1).
+
+    Level 0 has ``slots[0]`` buckets of one ``tick``; every further level's
+    bucket spans a whole turn of the level below. An entry sits in the lowest
+    level whose current turn still reaches it and cascades down as the wheel
+    turns, so advancing costs one bucket per tick plus one re-placement per
+    level an entry passes through. Entries beyond the top level wait in an
+    overflow bucket that is re-placed once per top-level turn.
+    """
+
+    def __init__(
+        self,
+        start: datetime,
+        tick: timedelta = timedelta(seconds=1),
+        slots: Sequence[int] = (60, 60, 24),
+    ):
+        self.tick = tick
+        self.slots = tuple(slots)
+        self._spans: List[int] = []  # ticks covered by one bucket of each level
+        span = 1
+        for count in self.slots:
+            self._spans.append(span)
+            span *= count
+        self._buckets: List[List[Dict[Hashable, Entry]]] = [
+            [{} for _ in range(count)] for count in self.slots
+        ]
+        self._overflow: Dict[Hashable, Entry] = {}
+        self._due: Dict[Hashable, Entry] = {}  # already due, returned by the next advance
+        self._where: Dict[Hashable, Dict[Hashable, Entry]] = {}
+        self._now = self._ticks(start)
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    @property
+    def now(self) -> datetime:
+        return EPOCH + self._now * self.tick
+
+    def add(self, key: Hashable, at: datetime, payload: Any = None) -> None:
+        """Schedule ``key`` at ``at``, replacing any earlier entry for it."""
+        self.cancel(key)
+        self._place(key, (self._ticks(at), payload))
+
+    def cancel(self, key: Hashable) -> bool:
+        bucket = self._where.pop(key, None)
+        if bucket is None:
+            return False
+        del bucket[key]
+        return True
+
+    def advance(self, to: datetime) -> List[Tuple[Hashable, Any]]:
+        """Turn the wheel up to ``to`` and return ``(key, payload)`` of every entry now due."""
+        target = self._ticks(to)
+        fired: List[Tuple[Hashable, Any]] = []
+        self._collect(self._due, fired)
+        if not self._where:
+            self._now = max(self._now, target)
+            return fired
+        while self._now < target:
+            self._now += 1
+            now = self._now
+            # Higher levels first, so their entries can still land in this tick's bucket
+            for level in range(len(self.slots) - 1, 0, -1):
+                span = self._spans[level]
+                if now % span == 0:
+                    self._cascade(self._buckets[level][(now // span) % self.slots[level]])
+            if now % (self._spans[-1] * self.slots[-1]) == 0:
+                self._cascade(self._overflow)
+            self._collect(self._buckets[0][now % self.slots[0]], fired)
+            self._collect(self._due, fired)
+            if not self._where:
+                self._now = target
+        return fired
+
+    def _ticks(self, moment: datetime) -> int:
+        return (moment - EPOCH) // self.tick
+
+    def _place(self, key: Hashable, entry: Entry) -> None:
+        due = entry[0]
+        if due <= self._now:
+            bucket = self._due
+        else:
+            bucket = self._overflow
+            for level, span in enumerate(self._spans):
+                if due // span - self._now // span < self.slots[level]:
+                    bucket = self._buckets[level][(due // span) % self.slots[level]]
+                    break
+        bucket[key] = entry
+        self._where[key] = bucket
+
+    def _cascade(self, bucket: Dict[Hashable, Entry]) -> None:
+        entries = list(bucket.items())
+        bucket.clear()
+        for key, entry in entries:
+            self._place(key, entry)
+
+    def _collect(self, bucket: Dict[Hashable, Entry], fired: List[Tuple[Hashable, Any]]) -> None:
+        if not bucket:
+            return
+        for key, (_, payload) in bucket.items():
+            del self._where[key]
+            fired.append((key, payload))
+        bucket.clear()
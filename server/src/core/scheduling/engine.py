@@ -0,0 +1,331 @@
+import heapq
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.core.scheduling.work_calendar import Span, WorkCalendar
+
+INFINITY = math.inf
+
+
+@dataclass(frozen=True)
+class PlanTask:
+    id: Any
+    minutes: int
+    deadline: Optional[int] = None  # working-minute offset the task should finish by
+    priority: float = 2.0
+    dependencies: Tuple[Any, ...] = ()
+    order: Any = ""  # final tie-break, e.g. creation time
+
+
+@dataclass
+class PlanDiff:
+    """Tasks whose interval changed, and tasks that left the plan."""
+
+    changed: Set[Any] = field(default_factory=set)
+    removed: Set[Any] = field(default_factory=set)
+    resumedAt: int = 0  # sequence position the run restarted from (0 = from scratch)
+
+
+class ScheduleEngine:
+    """Single-resource list scheduler over a ``WorkCalendar``.
+
+    Ready tasks (every dependency in the plan already scheduled) are taken in
+    order of their modified deadline: a task must also leave room for every
+    task that depends on it, so its deadline is pulled forward by their
+    durations. That is EDF with precedence, optimal for maximum lateness on
+    one resource. Dependencies outside the backlog (done, or someone
+    else's) count as satisfied.
+
+    ``apply`` re-plans incrementally. The list scheduler is deterministic, so
+    the new sequence matches the old one up to the first position where a
+    changed task was placed or would now win; only the tail after that
+    position is scheduled again.
+
+    Internally tasks live in integer slots, so the hot loops never hash ids.
+    """
+
+    def __init__(self, calendar: WorkCalendar):
+        self.calendar = calendar
+        self.tasks: Dict[Any, PlanTask] = {}
+        self.sequence: List[Any] = []
+        self.starts: List[int] = []
+        self.cyclic = False
+        self._slots: Dict[Any, int] = {}
+        self._ids: List[Any] = []  # None once removed
+        self._minutes: List[int] = []
+        self._deps: List[List[int]] = []
+        self._succ: List[Set[int]] = []
+        self._effective: List[float] = []  # modified deadlines
+        self._rank: List[tuple] = []  # tie-breaks after the modified deadline
+        self._order: List[int] = []  # sequence, as slots
+        self._position: List[int] = []  # slot -> index in the sequence, -1 if not placed
+        self._resumedAt = 0
+
+    def load(self, tasks: Iterable[PlanTask]) -> PlanDiff:
+        """Plan from scratch."""
+        removed = set(self.tasks)
+        self.tasks = {task.id: task for task in tasks}
+        self._ids = list(self.tasks)
+        self._slots = {id: slot for slot, id in enumerate(self._ids)}
+        self._minutes = [self.tasks[id].minutes for id in self._ids]
+        self._rank = [_rank(self.tasks[id]) for id in self._ids]
+        self._succ = [set() for _ in self._ids]
+        self._deps = [self._resolve(self.tasks[id]) for id in self._ids]
+        for slot, deps in enumerate(self._deps):
+            for dependency in deps:
+                self._succ[dependency].add(slot)
+        self._effective = [INFINITY] * len(self._ids)
+        self._position = [-1] * len(self._ids)
+        self._allDeadlines()
+        self._schedule(0, [], [])
+        return PlanDiff(changed=set(self.tasks), removed=removed - set(self.tasks))
+
+    def apply(self, changed: Iterable[PlanTask] = (), removed: Iterable[Any] = ()) -> PlanDiff:
+        """Re-plan after some tasks were added, edited or removed."""
+        oldOrder, oldStarts, oldPosition = self._order, self.starts, list(self._position)
+        oldMinutes: Dict[int, int] = {}
+        dirty: Set[int] = set()
+        refresh: Set[int] = set()
+
+        removedIds = {id for id in removed if id in self.tasks}
+        for id in removedIds:
+            slot = self._slots.pop(id)
+            del self.tasks[id]
+            for dependency in self._deps[slot]:
+                self._succ[dependency].discard(slot)
+                refresh.add(dependency)
+            # Successors lose a dependency and may become ready earlier
+            for successor in self._succ[slot]:
+                self._deps[successor].remove(slot)
+                dirty.add(successor)
+            dirty.add(slot)
+            self._ids[slot] = None
+            self._deps[slot], self._succ[slot] = [], set()
+            self._position[slot] = -1
+
+        added: Set[Any] = set()
+        rewired: Set[int] = set()
+        for task in changed:
+            if self.tasks.get(task.id) == task:
+                continue
+            slot = self._slots.get(task.id)
+            if slot is None:
+                slot = self._slots[task.id] = len(self._ids)
+                self._ids.append(task.id)
+                self._minutes.append(task.minutes)
+                self._rank.append(None)
+                self._deps.append([])
+                self._succ.append(set())
+                self._effective.append(INFINITY)
+                self._position.append(-1)
+                added.add(task.id)
+            else:
+                oldMinutes[slot] = self._minutes[slot]
+            self.tasks[task.id] = task
+            self._minutes[slot] = task.minutes
+            self._rank[slot] = _rank(task)
+            rewired.add(slot)
+        if added:
+            # Tasks already in the plan may have been waiting for one of the new ids
+            rewired.update(
+                slot for id, slot in self._slots.items()
+                if not added.isdisjoint(self.tasks[id].dependencies)
+            )
+
+        newEdges: List[Tuple[int, int]] = []
+        for slot in rewired:
+            previous = set(self._deps[slot])
+            for dependency in previous:
+                self._succ[dependency].discard(slot)
+                refresh.add(dependency)
+            self._deps[slot] = self._resolve(self.tasks[self._ids[slot]])
+            for dependency in self._deps[slot]:
+                self._succ[dependency].add(slot)
+                refresh.add(dependency)
+                if dependency not in previous:
+                    newEdges.append((dependency, slot))
+            dirty.add(slot)
+            refresh.add(slot)
+
+        dirty |= self._refreshDeadlines(refresh)
+        if self.cyclic or any(self._reaches(after, before) for before, after in newEdges):
+            # Cycles make the resume point ambiguous; they are rare enough to replan fully.
+            self._schedule(0, [], [])
+        else:
+            self._schedule(self._resumePoint(dirty, oldOrder, oldPosition), oldOrder, oldStarts)
+
+        diff = PlanDiff(removed=removedIds, resumedAt=self._resumedAt)
+        for index in range(self._resumedAt, len(self._order)):
+            slot = self._order[index]
+            before = oldPosition[slot] if slot < len(oldPosition) else -1
+            if (
+                before < 0
+                or oldStarts[before] != self.starts[index]
+                or oldMinutes.get(slot, self._minutes[slot]) != self._minutes[slot]
+            ):
+                diff.changed.add(self._ids[slot])
+        return diff
+
+    def interval(self, id) -> Tuple[int, int]:
+        slot = self._slots[id]
+        start = self.starts[self._position[slot]]
+        return start, start + self._minutes[slot]
+
+    def spans(self, id) -> List[Span]:
+        return self.calendar.spans(*self.interval(id))
+
+    def lateness(self, id) -> Optional[int]:
+        """Working minutes past the task's own deadline (negative: slack), None without one."""
+        deadline = self.tasks[id].deadline
+        return None if deadline is None else self.interval(id)[1] - deadline
+
+    def confidence(self, id) -> float:
+        """1.0 with plenty of slack, 0.5 when it finishes exactly on time, towards 0 when late."""
+        lateness = self.lateness(id)
+        if lateness is None:
+            return 1.0
+        scale = max(self.tasks[id].minutes, 60)
+        if lateness <= 0:
+            return round(0.5 + 0.5 * -lateness / (-lateness + scale), 3)
+        return round(0.5 * scale / (lateness + scale), 3)
+
+    def _resolve(self, task: PlanTask) -> List[int]:
+        slots = self._slots
+        return list(dict.fromkeys(slots[id] for id in task.dependencies if id in slots))
+
+    def _deadline(self, slot: int) -> float:
+        deadline = self.tasks[self._ids[slot]].deadline
+        value = INFINITY if deadline is None else deadline
+        effective, minutes = self._effective, self._minutes
+        for successor in self._succ[slot]:
+            room = effective[successor] - minutes[successor]
+            if room < value:
+                value = room
+        return value
+
+    def _allDeadlines(self) -> None:
+        """Modified deadlines for every task, successors first (reverse topological order)."""
+        pending = [len(successors) for successors in self._succ]
+        stack = [slot for slot, count in enumerate(pending) if not count]
+        while stack:
+            slot = stack.pop()
+            self._effective[slot] = self._deadline(slot)
+            for dependency in self._deps[slot]:
+                pending[dependency] -= 1
+                if not pending[dependency]:
+                    stack.append(dependency)
+        for slot, count in enumerate(pending):
+            if count > 0:  # part of a dependency cycle
+                self._effective[slot] = self._deadline(slot)
+
+    def _refreshDeadlines(self, seeds: Iterable[int]) -> Set[int]:
+        """Recompute modified deadlines upwards from ``seeds``; returns slots whose value moved."""
+        moved: Set[int] = set()
+        stack = [slot for slot in seeds if self._ids[slot] is not None]
+        # A seed's own duration may have changed, which moves its dependencies even if it did not
+        forced = set(stack)
+        visits = 0
+        while stack:
+            slot = stack.pop()
+            visits += 1
+            if visits > 4 * len(self._ids) + 16:
+                break  # a dependency cycle keeps lowering deadlines; the cycle is handled later
+            value = self._deadline(slot)
+            if self._effective[slot] != value:
+                self._effective[slot] = value
+                moved.add(slot)
+            elif slot not in forced:
+                continue
+            forced.discard(slot)
+            stack.extend(self._deps[slot])
+        return moved
+
+    def _reaches(self, source: int, target: int) -> bool:
+        """True if ``target`` depends (transitively) on ``source``."""
+        stack, seen = [source], {source}
+        while stack:
+            for successor in self._succ[stack.pop()]:
+                if successor == target:
+                    return True
+                if successor not in seen:
+                    seen.add(successor)
+                    stack.append(successor)
+        return False
+
+    def _resumePoint(self, dirty: Set[int], oldOrder: List[int], oldPosition: List[int]) -> int:
+        point = len(oldOrder)
+        for slot in dirty:
+            if slot < len(oldPosition) and oldPosition[slot] >= 0:
+                point = min(point, oldPosition[slot])
+        effective, rank = self._effective, self._rank
+        for slot in dirty:
+            if self._ids[slot] is None:
+                continue
+            # Earliest step it could be picked, then the first old pick it now beats
+            readyAt = 0
+            for dependency in self._deps[slot]:
+                before = oldPosition[dependency] if dependency < len(oldPosition) else -1
+                readyAt = max(readyAt, before + 1 if before >= 0 else len(oldOrder) + 1)
+            key = (effective[slot], rank[slot])
+            for step in range(readyAt, point):
+                other = oldOrder[step]
+                if key < (effective[other], rank[other]):
+                    point = step
+                    break
+        return point
+
+    def _schedule(self, resumeAt: int, oldOrder: List[int], oldStarts: List[int]) -> None:
+        order = oldOrder[:resumeAt]
+        starts = oldStarts[:resumeAt]
+        minutes, effective, rank, deps = self._minutes, self._effective, self._rank, self._deps
+        clock = starts[-1] + minutes[order[-1]] if order else 0
+        placed = bytearray(len(self._ids))
+        for slot in order:
+            placed[slot] = 1
+
+        waiting: Dict[int, int] = {}
+        ready: List[tuple] = []
+        for slot, id in enumerate(self._ids):
+            if id is None or placed[slot]:
+                continue
+            count = 0
+            for dependency in deps[slot]:
+                if not placed[dependency]:
+                    count += 1
+            if count:
+                waiting[slot] = count
+            else:
+                ready.append((effective[slot], rank[slot], slot))
+        heapq.heapify(ready)
+
+        self.cyclic = False
+        while ready or waiting:
+            if ready:
+                slot = heapq.heappop(ready)[2]
+            else:
+                # Only cycles are left: break one at its most urgent task
+                self.cyclic = True
+                slot = min(waiting, key=lambda slot: (effective[slot], rank[slot]))
+                del waiting[slot]
+            order.append(slot)
+            starts.append(clock)
+            clock += minutes[slot]
+            for successor in self._succ[slot]:
+                if successor in waiting:
+                    waiting[successor] -= 1
+                    if not waiting[successor]:
+                        del waiting[successor]
+                        heapq.heappush(ready, (effective[successor], rank[successor], successor))
+
+        position = self._position
+        for index in range(resumeAt, len(order)):
+            position[order[index]] = index
+        self._order = order
+        self.starts = starts
+        self.sequence = [self._ids[slot] for slot in order]
+        self._resumedAt = resumeAt
+
+
+def _rank(task: PlanTask) -> tuple:
+    return (-task.priority, task.order, str(task.id))
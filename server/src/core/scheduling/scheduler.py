@@ -0,0 +1,201 @@
+import math
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import Row, event
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.core.scheduling.engine import PlanDiff, PlanTask, ScheduleEngine
+from src.core.scheduling.store import ScheduleStore
+from src.core.scheduling.work_calendar import WorkCalendar
+from src.features.todos.domain.enums.priority import PriorityEnum
+
+PRIORITY_RANKS = {priority.value: rank for rank, priority in enumerate(PriorityEnum)}
+
+_PENDING_PLANS = "scheduler_pending_plans"
+
+
+def _dependencyIds(values) -> Tuple[Any, ...]:
+    ids = []
+    for value in values or ():
+        try:
+            ids.append(value if isinstance(value, uuid.UUID) else uuid.UUID(str(value)))
+        except ValueError:
+            continue
+    return tuple(ids)
+
+
+def planTask(row: Row, calendar: WorkCalendar) -> PlanTask:
+    """Remaining work of a task row, in the calendar's working minutes."""
+    done = min(row.progress_percentage or 0.0, 100.0) / 100
+    remaining = (row.estimated_hours or 0.0) * (1 - done)
+    priority = getattr(row.priority, "value", row.priority)
+    return PlanTask(
+        id=row.id,
+        minutes=max(0, math.ceil(remaining * 60)),
+        deadline=calendar.deadlineOf(row.due_date) if row.due_date else None,
+        priority=PRIORITY_RANKS.get(priority, PRIORITY_RANKS["medium"]),
+        dependencies=_dependencyIds(row.dependencies),
+        order=row.created_at or datetime.min,
+    )
+
+
+@dataclass
+class _UserPlan:
+    engine: ScheduleEngine
+    watermark: Optional[datetime]
+    stamp: uuid.UUID  # written on the plan's blocks; another stamp there means it was superseded
+
+
+@dataclass
+class ReplanResult:
+    incremental: bool
+    diff: PlanDiff
+    blocksWritten: int
+
+
+class Scheduler:
+    """Fills ``time_blocks`` and ``task_schedules`` from a user's open tasks.
+
+    The last plan of recently scheduled users stays in memory. A replan then
+    only reads tasks updated since that plan and resumes the engine from the
+    first affected position. Anything it cannot account for incrementally
+    (changed settings or busy time, a stale origin, tasks reassigned or
+    deleted behind its back) falls back to a full plan.
+
+    Workers run in several processes, each with its own cache: replans of a
+    user are serialized in the database, and a cached plan is only resumed
+    while the blocks on record are still the ones it wrote. A plan is cached,
+    or its watermark advanced, when the caller's transaction commits; one
+    whose transaction does not commit is dropped.
+    """
+
+    def __init__(
+        self,
+        maxUsers: int = 256,
+        reuseFor: timedelta = timedelta(minutes=15),
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ):
+        self.maxUsers = maxUsers
+        self.reuseFor = reuseFor
+        self._clock = clock
+        self._plans: "OrderedDict[Any, _UserPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._userLocks: Dict[Any, threading.Lock] = {}
+
+    def replan(self, session: Session, userId, full: bool = False) -> ReplanResult:
+        # A cached engine is mutated in place, so replans of one user never overlap; the lock
+        # in the database extends that to other processes until the caller commits.
+        with self._userLock(userId):
+            ScheduleStore(session).lockUser(userId)
+            return self._replan(session, userId, full)
+
+    def forget(self, userId) -> None:
+        with self._lock:
+            self._plans.pop(userId, None)
+
+    def _replan(self, session: Session, userId, full: bool) -> ReplanResult:
+        store = ScheduleStore(session)
+        now = self._clock()
+        plan = None if full else self._cached(userId)
+        origin = plan.engine.calendar.origin if plan else now
+        if plan and now - origin > self.reuseFor:
+            plan, origin = None, now
+
+        hoursPerDay, timezoneName = store.settings(userId)
+        calendar = WorkCalendar(
+            origin, timezoneName or "UTC", hoursPerDay, busy=store.busySpans(userId, origin)
+        )
+        if plan and plan.engine.calendar.key == calendar.key:
+            result = self._incremental(session, userId, plan, now)
+            if result is not None:
+                return result
+        return self._full(session, userId, calendar, now)
+
+    def _incremental(self, session: Session, userId, plan: _UserPlan,
+                     now: datetime) -> Optional[ReplanResult]:
+        store = ScheduleStore(session)
+        if not store.planStamps(userId) <= {plan.stamp}:
+            return None  # another process replanned this user since
+        count, watermark = store.backlogVersion(userId)
+        if watermark is None or plan.watermark is None:
+            return None
+        engine = plan.engine
+        changed, removed = [], []
+        for row in store.backlog(userId, updatedSince=plan.watermark):
+            if row.completed_at is not None:
+                removed.append(row.id)
+            else:
+                changed.append(planTask(row, engine.calendar))
+        diff = engine.apply(changed, removed)
+        if len(engine.tasks) != count:
+            return None  # reassigned or deleted tasks never show up as updates
+        written = store.save(engine, diff.changed, diff.removed, now, stamp=plan.stamp)
+
+        def advance() -> None:
+            plan.watermark = watermark
+
+        # The engine has already moved on; until the commit, the plan is only good to drop.
+        self._onCommit(session, userId, advance)
+        return ReplanResult(True, diff, written)
+
+    def _full(self, session: Session, userId, calendar: WorkCalendar,
+              now: datetime) -> ReplanResult:
+        store = ScheduleStore(session)
+        _, watermark = store.backlogVersion(userId)
+        engine = ScheduleEngine(calendar)
+        diff = engine.load(planTask(row, calendar) for row in store.backlog(userId))
+        stamp = uuid.uuid4()
+        written = store.save(engine, engine.sequence, now=now, replaceUserId=userId, stamp=stamp)
+        plan = _UserPlan(engine, watermark, stamp)
+        self.forget(userId)
+        self._onCommit(session, userId, lambda: self._cache(userId, plan))
+        return ReplanResult(False, diff, written)
+
+    def _cache(self, userId, plan: _UserPlan) -> None:
+        with self._lock:
+            self._plans[userId] = plan
+            self._plans.move_to_end(userId)
+            while len(self._plans) > self.maxUsers:
+                self._plans.popitem(last=False)
+
+    def _onCommit(self, session: Session, userId, apply: Callable[[], None]) -> None:
+        """Run ``apply`` when the session's transaction commits, or forget the user's plan."""
+        key = (_PENDING_PLANS, id(self))
+        pending = session.info.get(key)
+        if pending is None:
+            pending = session.info[key] = {}
+
+            def _commit(session: Session) -> None:
+                applied = list(pending.values())
+                pending.clear()
+                for apply in applied:
+                    apply()
+
+            def _end(session: Session, transaction: SessionTransaction) -> None:
+                if transaction.parent is None:  # rolled back, or closed without a commit
+                    for userId in list(pending):
+                        self.forget(userId)
+                    pending.clear()
+
+            event.listen(session, "after_commit", _commit)
+            event.listen(session, "after_transaction_end", _end)
+        pending[userId] = apply
+
+    def _userLock(self, userId) -> threading.Lock:
+        with self._lock:
+            lock = self._userLocks.get(userId)
+            if lock is None:
+                lock = self._userLocks[userId] = threading.Lock()
+            return lock
+
+    def _cached(self, userId) -> Optional[_UserPlan]:
+        with self._lock:
+            plan = self._plans.get(userId)
+            if plan is not None:
+                self._plans.move_to_end(userId)
+            return plan
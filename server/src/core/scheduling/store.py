@@ -0,0 +1,206 @@
+import uuid
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import (Row, bindparam, case, delete, func, insert, or_,
+                        select, update)
+from sqlalchemy.orm import Session
+
+from src.core.scheduling.engine import ScheduleEngine
+from src.core.scheduling.work_calendar import Span
+from src.features.todos.data.datasource.tables.task_schedule_table import \
+    TaskScheduleTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.features.todos.data.datasource.tables.time_block_table import \
+    TimeBlockTable
+from src.features.todos.data.datasource.tables.user_settings_table import \
+    UserSettingsTable
+
+tasks = TaskTable.__table__
+timeBlocks = TimeBlockTable.__table__
+taskSchedules = TaskScheduleTable.__table__
+userSettings = UserSettingsTable.__table__
+
+SCHEDULER_SOURCE = "scheduler"
+# First key of the PostgreSQL advisory locks that serialize one user's replans.
+_REPLAN_LOCK_CLASS = 0x5CED
+
+BACKLOG_COLUMNS = (
+    tasks.c.id,
+    tasks.c.estimated_hours,
+    tasks.c.progress_percentage,
+    tasks.c.due_date,
+    tasks.c.priority,
+    tasks.c.dependencies,
+    tasks.c.created_at,
+    tasks.c.completed_at,
+)
+
+
+class ScheduleStore:
+    """Reads a user's scheduling inputs and writes plan changes back in a few statements."""
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def lockUser(self, userId) -> None:
+        """Hold off other processes' replans of this user until the transaction ends.
+
+        PostgreSQL only; SQLite (tests, local tooling) serializes writers on its own.
+        """
+        if self._session.get_bind().dialect.name != "postgresql":
+            return
+        key = int.from_bytes(uuid.UUID(str(userId)).bytes[:4], "big", signed=True)
+        self._session.execute(select(func.pg_advisory_xact_lock(_REPLAN_LOCK_CLASS, key)))
+
+    def planStamps(self, userId) -> Set[uuid.UUID]:
+        """Stamps of the plans that wrote the user's current scheduler blocks."""
+        return set(
+            self._session.execute(
+                select(timeBlocks.c.plan_stamp)
+                .join(tasks, tasks.c.id == timeBlocks.c.task_id)
+                .where(tasks.c.assigned_to == userId, *_owned())
+                .distinct()
+                .limit(2)
+            ).scalars()
+        )
+
+    def settings(self, userId) -> Tuple[Optional[int], Optional[str]]:
+        row = self._session.execute(
+            select(userSettings.c.work_hours_per_day, userSettings.c.timezone).where(
+                userSettings.c.user_id == userId
+            )
+        ).first()
+        return (row.work_hours_per_day, row.timezone) if row else (None, None)
+
+    def busySpans(self, userId, since: datetime) -> List[Span]:
+        """Time blocks the scheduler does not own: meetings, manual bookings, work in progress."""
+        rows = self._session.execute(
+            select(timeBlocks.c.scheduled_start, timeBlocks.c.scheduled_end)
+            .join(tasks, tasks.c.id == timeBlocks.c.task_id)
+            .where(
+                tasks.c.assigned_to == userId,
+                timeBlocks.c.scheduled_end > since,
+                or_(timeBlocks.c.source.is_(None), timeBlocks.c.source != SCHEDULER_SOURCE),
+            )
+        ).all()
+        return [(row.scheduled_start, row.scheduled_end) for row in rows if row.scheduled_start]
+
+    def backlog(self, userId, updatedSince: Optional[datetime] = None) -> List[Row]:
+        """Open tasks of the user; with ``updatedSince``, every task touched since (closed too)."""
+        stmt = select(*BACKLOG_COLUMNS).where(tasks.c.assigned_to == userId)
+        if updatedSince is None:
+            stmt = stmt.where(tasks.c.completed_at.is_(None))
+        else:
+            stmt = stmt.where(tasks.c.updated_at >= updatedSince)
+        return self._session.execute(stmt).all()
+
+    def backlogVersion(self, userId) -> Tuple[int, Optional[datetime]]:
+        """(open task count, latest update among all of the user's tasks)."""
+        row = self._session.execute(
+            select(
+                func.coalesce(
+                    func.sum(case((tasks.c.completed_at.is_(None), 1), else_=0)), 0
+                ).label("count"),
+                func.max(tasks.c.updated_at).label("updated_at"),
+            ).where(tasks.c.assigned_to == userId)
+        ).one()
+        return int(row.count), row.updated_at
+
+    def save(
+        self,
+        engine: ScheduleEngine,
+        changed: Iterable[Any],
+        removed: Iterable[Any] = (),
+        now: Optional[datetime] = None,
+        replaceUserId=None,
+        stamp: Optional[uuid.UUID] = None,
+    ) -> int:
+        """Rewrite the time blocks and schedule rows of ``changed`` tasks; returns blocks written.
+
+        ``replaceUserId`` clears every scheduler-owned block of that user first (full replans).
+        New blocks carry ``stamp``, the plan they belong to.
+        """
+        now = now or datetime.utcnow()
+        changed = list(changed)
+        stale = changed + list(removed)
+        owned = _owned()
+        if replaceUserId is not None:
+            self._session.execute(
+                delete(timeBlocks).where(
+                    *owned,
+                    timeBlocks.c.task_id.in_(
+                        select(tasks.c.id).where(tasks.c.assigned_to == replaceUserId)
+                    ),
+                )
+            )
+        elif stale:
+            self._session.execute(delete(timeBlocks).where(*owned, timeBlocks.c.task_id.in_(stale)))
+        if not changed:
+            return 0
+
+        blocks = []
+        schedules = []
+        for taskId in changed:
+            spans = engine.spans(taskId)
+            blocks.extend(
+                {
+                    "id": uuid.uuid4(),
+                    "task_id": taskId,
+                    "scheduled_start": start,
+                    "scheduled_end": end,
+                    "source": SCHEDULER_SOURCE,
+                    "plan_stamp": stamp,
+                }
+                for start, end in spans
+            )
+            schedules.append(
+                {
+                    "task_id": taskId,
+                    "start_date": engine.calendar.localDate(spans[0][0]) if spans else None,
+                    "due_date": engine.calendar.localDate(spans[-1][1]) if spans else None,
+                    "scheduling_confidence": engine.confidence(taskId),
+                    "last_rescheduled_at": now,
+                }
+            )
+        if blocks:
+            self._session.execute(insert(timeBlocks), blocks)
+
+        existing = set(
+            self._session.execute(
+                select(taskSchedules.c.task_id).where(taskSchedules.c.task_id.in_(changed))
+            ).scalars()
+        )
+        updates = [
+            {
+                "key": row["task_id"],
+                "start": row["start_date"],
+                "due": row["due_date"],
+                "confidence": row["scheduling_confidence"],
+                "at": row["last_rescheduled_at"],
+            }
+            for row in schedules
+            if row["task_id"] in existing
+        ]
+        if updates:
+            # One executemany round-trip instead of an UPDATE per task.
+            self._session.connection().execute(
+                update(taskSchedules)
+                .where(taskSchedules.c.task_id == bindparam("key"))
+                .values(
+                    start_date=bindparam("start"),
+                    due_date=bindparam("due"),
+                    scheduling_confidence=bindparam("confidence"),
+                    last_rescheduled_at=bindparam("at"),
+                ),
+                updates,
+            )
+        inserts = [{"id": uuid.uuid4(), **row} for row in schedules if row["task_id"] not in existing]
+        if inserts:
+            self._session.execute(insert(taskSchedules), inserts)
+        return len(blocks)
+
+
+def _owned() -> List[Any]:
+    """Blocks the scheduler may move: its own, not started yet."""
+    return [timeBlocks.c.source == SCHEDULER_SOURCE, timeBlocks.c.actual_start.is_(None)]
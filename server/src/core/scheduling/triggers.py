@@ -0,0 +1,119 @@
+from typing import Any, Callable, Set
+
+from fastapi.logger import logger
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from src.core.scheduling.store import SCHEDULER_SOURCE
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.features.todos.data.datasource.tables.time_block_table import \
+    TimeBlockTable
+
+_PENDING_REPLANS = "scheduling_pending_replans"
+_installed = False
+
+# Task columns a plan is made of; other edits (titles, notes) leave the schedule as it is.
+PLAN_COLUMNS = frozenset({
+    "assigned_to",
+    "estimated_hours",
+    "progress_percentage",
+    "due_date",
+    "priority",
+    "dependencies",
+    "completed_at",
+})
+SETTINGS_COLUMNS = frozenset({"work_hours_per_day", "timezone"})
+BUSY_COLUMNS = frozenset({"task_id", "scheduled_start", "scheduled_end", "actual_start", "source"})
+
+
+def _changed(obj, columns) -> bool:
+    state = inspect(obj)
+    return any(getattr(state.attrs, key).history.has_changes() for key in columns)
+
+
+def _keepPrevious(target, value, oldvalue, initiator) -> None:
+    """Nothing to do: listening with ``active_history`` is what loads an expired old value."""
+
+
+def _values(obj, key: str) -> list:
+    """What ``key`` holds now and held before this flush."""
+    return [getattr(obj, key), *getattr(inspect(obj).attrs, key).history.deleted]
+
+
+def _isBusy(block) -> bool:
+    """Busy time is or was anything but an untouched block the scheduler wrote."""
+    return block.actual_start is not None or any(
+        source != SCHEDULER_SOURCE for source in _values(block, "source")
+    )
+
+
+def replanTargets(session: Session) -> Set[Any]:
+    """Users whose schedule this flush changed: their tasks, work settings or busy time."""
+    users, busyTasks = set(), set()
+    for obj, changed in (
+        *((obj, True) for obj in session.new),
+        *((obj, None) for obj in session.dirty),
+        *((obj, True) for obj in session.deleted),
+    ):
+        table = getattr(obj, "__tablename__", None)
+        if table == "tasks" and (changed or _changed(obj, PLAN_COLUMNS)):
+            users.update(_values(obj, "assigned_to"))
+        elif table == "user_settings" and (changed or _changed(obj, SETTINGS_COLUMNS)):
+            users.add(obj.user_id)
+        elif table == "time_blocks" and (changed or _changed(obj, BUSY_COLUMNS)):
+            # The scheduler's own blocks are its output; replanning on them would never settle.
+            if _isBusy(obj):
+                busyTasks.update(_values(obj, "task_id"))
+    busyTasks.discard(None)
+    if busyTasks:
+        users.update(
+            session.scalars(select(TaskTable.assigned_to).where(TaskTable.id.in_(busyTasks)))
+        )
+    users.discard(None)
+    return users
+
+
+def enqueueReplan(userId: str) -> None:
+    # Imported on first use: Celery stays out of the API's startup.
+    from src.workers.tasks.scheduling import replanUserSchedule
+
+    replanUserSchedule.delay(userId)
+
+
+def installReplanScheduling(
+    enqueue: Callable[[str], Any] = enqueueReplan, target=Session
+) -> None:
+    """Enqueue a replan of every user whose schedule a committed transaction changed.
+
+    Writes made with Core statements are not seen; the scheduler's own are
+    among them, so its replans do not trigger more.
+    """
+    global _installed
+    if _installed:
+        return
+
+    # Keyed by callback, so a second installation (another target) does not take this one's users.
+    pendingKey = (_PENDING_REPLANS, id(enqueue))
+
+    def _collect(session: Session, flushContext) -> None:
+        session.info.setdefault(pendingKey, set()).update(replanTargets(session))
+
+    def _enqueue(session: Session) -> None:
+        for userId in session.info.pop(pendingKey, ()):
+            try:
+                enqueue(str(userId))
+            except Exception as e:
+                # The write is committed; its schedule catches up with the user's next change.
+                logger.warning(f"Could not enqueue a replan of user {userId}: {e}")
+
+    def _discard(session: Session) -> None:
+        session.info.pop(pendingKey, None)
+
+    # A reassigned task's old assignee must be in its history, even when it had expired.
+    for attribute in (TaskTable.assigned_to, TimeBlockTable.task_id):
+        if not event.contains(attribute, "set", _keepPrevious):
+            event.listen(attribute, "set", _keepPrevious, active_history=True)
+    event.listen(target, "after_flush", _collect)
+    event.listen(target, "after_commit", _enqueue)
+    event.listen(target, "after_rollback", _discard)
+    _installed = True
@@ -0,0 +1,152 @@
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta, timezone
+from typing import FrozenSet, List, Sequence, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+Span = Tuple[datetime, datetime]
+
+DEFAULT_HOURS_PER_DAY = 8
+DEFAULT_DAY_START = time(9, 0)
+DEFAULT_WORKDAYS = frozenset(range(5))  # Monday to Friday
+
+
+def _zone(name: str):
+    try:
+        return ZoneInfo(name or "UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        return timezone.utc
+
+
+def _toUtc(local: datetime) -> datetime:
+    return local.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _minute(value: datetime, up: bool = False) -> datetime:
+    floored = value.replace(second=0, microsecond=0)
+    return floored + timedelta(minutes=1) if up and floored != value else floored
+
+
+class WorkCalendar:
+    """Maps a user's free working time onto a single axis of working minutes.
+
+    Minute 0 is ``origin``. The axis only advances inside the daily working
+    window (``hoursPerDay`` from ``dayStart`` in the user's timezone, on
+    ``workdays``) and skips ``busy`` spans. Windows are generated lazily, so
+    the horizon grows as far as the plan needs. All datetimes are naive UTC,
+    as stored in the database.
+    """
+
+    def __init__(
+        self,
+        origin: datetime,
+        timezoneName: str = "UTC",
+        hoursPerDay: int = DEFAULT_HOURS_PER_DAY,
+        busy: Sequence[Span] = (),
+        dayStart: time = DEFAULT_DAY_START,
+        workdays: FrozenSet[int] = DEFAULT_WORKDAYS,
+    ):
+        self.origin = _minute(origin, up=True)
+        self.timezoneName = timezoneName or "UTC"
+        self.hoursPerDay = max(1, min(int(hoursPerDay or DEFAULT_HOURS_PER_DAY), 24))
+        self.dayStart = dayStart
+        self.workdays = workdays
+        self.busy = tuple(
+            sorted((_minute(start), _minute(end, up=True)) for start, end in busy if end > start)
+        )
+        self._zone = _zone(self.timezoneName)
+        self._nextDay: date = self.localDate(self.origin)
+        self._busyIndex = 0
+        self._starts: List[datetime] = []  # segment start times
+        self._offsets: List[int] = []  # working minutes before each segment
+        self._segments: List[Span] = []
+        self._total = 0
+
+    @property
+    def key(self) -> tuple:
+        """Inputs that define the axis; a plan is only reusable while this is unchanged."""
+        return (self.origin, self.timezoneName, self.hoursPerDay, self.dayStart, self.workdays,
+                self.busy)
+
+    def localDate(self, moment: datetime) -> date:
+        """Calendar date of a naive UTC ``moment`` in the user's timezone."""
+        return moment.replace(tzinfo=timezone.utc).astimezone(self._zone).date()
+
+    def deadlineOf(self, day: date) -> int:
+        """Working-minute offset of the end of ``day`` (local midnight after it)."""
+        midnight = datetime.combine(day + timedelta(days=1), time(0, 0), tzinfo=self._zone)
+        return self.offsetOf(_toUtc(midnight))
+
+    def offsetOf(self, moment: datetime) -> int:
+        """Working minutes between ``origin`` and ``moment`` (0 for anything earlier)."""
+        if moment <= self.origin:
+            return 0
+        while not self._segments or self._segments[-1][1] < moment:
+            self._extend()
+        index = bisect_right(self._starts, moment) - 1
+        if index < 0:
+            return 0
+        start, end = self._segments[index]
+        return self._offsets[index] + int((min(moment, end) - start).total_seconds() // 60)
+
+    def spans(self, startOffset: int, endOffset: int) -> List[Span]:
+        """Wall-clock spans covering the working minutes ``[startOffset, endOffset)``."""
+        if endOffset <= startOffset:
+            return []
+        while self._total < endOffset:
+            self._extend()
+        index = bisect_right(self._offsets, startOffset) - 1
+        result: List[Span] = []
+        while startOffset < endOffset:
+            segmentStart, segmentEnd = self._segments[index]
+            base = self._offsets[index]
+            length = int((segmentEnd - segmentStart).total_seconds() // 60)
+            if startOffset < base + length:
+                take = min(endOffset, base + length)
+                result.append(
+                    (
+                        segmentStart + timedelta(minutes=startOffset - base),
+                        segmentStart + timedelta(minutes=take - base),
+                    )
+                )
+                startOffset = take
+            index += 1
+        return result
+
+    def _extend(self) -> None:
+        """Append the next working day's free segments."""
+        while True:
+            day = self._nextDay
+            self._nextDay = day + timedelta(days=1)
+            if day.weekday() not in self.workdays:
+                continue
+            localStart = datetime.combine(day, self.dayStart, tzinfo=self._zone)
+            start = max(_toUtc(localStart), self.origin)
+            end = _toUtc(localStart + timedelta(hours=self.hoursPerDay))
+            if end <= start:
+                continue
+            added = False
+            for segment in self._subtractBusy(start, end):
+                self._starts.append(segment[0])
+                self._offsets.append(self._total)
+                self._segments.append(segment)
+                self._total += int((segment[1] - segment[0]).total_seconds() // 60)
+                added = True
+            if added:
+                return
+
+    def _subtractBusy(self, start: datetime, end: datetime) -> List[Span]:
+        # Busy spans are sorted and windows arrive in order, so one cursor walks them once.
+        while self._busyIndex < len(self.busy) and self.busy[self._busyIndex][1] <= start:
+            self._busyIndex += 1
+        free: List[Span] = []
+        index = self._busyIndex
+        while start < end:
+            if index >= len(self.busy) or self.busy[index][0] >= end:
+                free.append((start, end))
+                break
+            busyStart, busyEnd = self.busy[index]
+            if busyStart > start:
+                free.append((start, busyStart))
+            start = max(start, busyEnd)
+            index += 1
+        return free
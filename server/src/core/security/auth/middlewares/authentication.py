@@ -0,0 +1,38 @@
+from typing import Optional
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.orm import Session
+
+from src.config.database.zen_task_db_handler import getDbSession
+from src.core.security.auth.services.principal_cache import (
+    Principal, PrincipalCacheHandler)
+from src.core.security.auth.services.token_service import TokenServiceHandler
+
+bearer = HTTPBearer(auto_error=False)
+
+
+def _unauthorized() -> HTTPException:
+    return HTTPException(
+        status_code=401, detail="Not authenticated.", headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+def getCurrentPrincipal(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer),
+    session: Session = Depends(getDbSession),
+) -> Principal:
+    """FastAPI dependency: the active user behind the bearer token.
+
+    A token seen before and a principal still cached cost two dict lookups;
+    the session only connects when one of them has to be (re)loaded.
+    """
+    if credentials is None:
+        raise _unauthorized()
+    claims = TokenServiceHandler.tokens().verify(credentials.credentials)
+    if claims is None:
+        raise _unauthorized()
+    principal = PrincipalCacheHandler.cache().get(session, claims.userId)
+    if principal is None or not principal.isActive:
+        raise _unauthorized()
+    return principal
@@ -0,0 +1,109 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import bcrypt
+
+from src.config.exceptions.failure_exception import FailureException, LogLevel
+from src.config.settings.config import getSettings
+
+# bcrypt only reads the first 72 bytes; passlib truncated silently, so we do too.
+MAX_SECRET_BYTES = 72
+
+
+def _secret(password: str) -> bytes:
+    return password.encode("utf-8")[:MAX_SECRET_BYTES]
+
+
+def hashPassword(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(_secret(password), bcrypt.gensalt(rounds)).decode("ascii")
+
+
+def verifyPassword(password: str, passwordHash: Optional[str], rounds: int = 12) -> bool:
+    if not passwordHash:
+        # Unknown users and users without a password still cost a hash, so timing does not tell.
+        hashPassword(password, rounds)
+        return False
+    try:
+        return bcrypt.checkpw(_secret(password), passwordHash.encode("ascii"))
+    except ValueError:  # not a bcrypt hash
+        return False
+
+
+def hashRounds(passwordHash: str) -> Optional[int]:
+    parts = passwordHash.split("$")
+    return int(parts[2]) if len(parts) > 3 and parts[2].isdigit() else None
+
+
+class PasswordHasher:
+    """Runs bcrypt in a small process pool so a login never blocks the event loop.
+
+    A hash costs ~250ms of CPU at the default cost; inline in an async
+    handler that stalls every other request on the worker, and in a thread
+    it still holds a core. The pool caps how many cores logins can take,
+    and ``maxPending`` caps the queue: beyond it a login storm gets an
+    immediate "try again" instead of piling up minutes of work.
+    """
+
+    def __init__(self, workers: int = 2, maxPending: int = 64, rounds: int = 12):
+        self.workers = workers
+        self.maxPending = maxPending
+        self.rounds = rounds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hashPassword, password, self.rounds)
+
+    async def verify(self, password: str, passwordHash: Optional[str]) -> bool:
+        return await self._run(verifyPassword, password, passwordHash, self.rounds)
+
+    def needsRehash(self, passwordHash: str) -> bool:
+        return hashRounds(passwordHash) != self.rounds
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, function, *args):
+        with self._lock:
+            if self._pending >= self.maxPending:
+                raise FailureException(
+                    level=LogLevel.WARNING,
+                    message=f"Password hashing queue is full ({self._pending} pending).",
+                    userMessage="Too many sign-in attempts right now, please try again shortly.",
+                )
+            self._pending += 1
+            if self._executor is None:
+                # spawn: forking a process that runs threads (uvicorn, SQLAlchemy pools) is unsafe.
+                self._executor = ProcessPoolExecutor(
+                    self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            executor = self._executor
+        try:
+            return await asyncio.wrap_future(executor.submit(function, *args))
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+
+_hasher: Optional[PasswordHasher] = None
+
+
+class PasswordHasherHandler:
+    @staticmethod
+    def hasher() -> PasswordHasher:
+        global _hasher
+        if _hasher is None:
+            settings = getSettings()
+            _hasher = PasswordHasher(
+                workers=settings.PASSWORD_HASH_WORKERS,
+                maxPending=settings.PASSWORD_HASH_MAX_PENDING,
+                rounds=settings.PASSWORD_HASH_ROUNDS,
+            )
+        return _hasher
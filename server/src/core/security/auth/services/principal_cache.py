@@ -0,0 +1,151 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from src.config.settings.config import getSettings
+from src.features.todos.data.datasource.tables.user_table import UserTable
+from src.features.todos.domain.enums.status import StatusEnum
+from src.features.todos.domain.enums.user_role import UserRole
+
+users = UserTable.__table__
+
+_PENDING_USERS = "principal_pending_users"
+_ALL_USERS = "*"
+_installed = False
+
+
+@dataclass(frozen=True)
+class Principal:
+    id: uuid.UUID
+    username: str
+    email: str
+    role: Optional[UserRole]
+    status: Optional[StatusEnum]
+
+    @property
+    def isActive(self) -> bool:
+        return self.status in (None, StatusEnum.active)
+
+
+class PrincipalCache:
+    """LRU of authenticated users, so a request with a cached token needs no database read.
+
+    Entries are dropped when a transaction that changed the user commits
+    (see ``installPrincipalInvalidation``) and, because that only sees this
+    process, after ``maxAge`` seconds at the latest.
+    """
+
+    def __init__(
+        self,
+        maxEntries: int = 10_000,
+        maxAge: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxEntries = maxEntries
+        self.maxAge = maxAge
+        self._clock = clock
+        self._entries: "OrderedDict[uuid.UUID, Tuple[float, Optional[Principal]]]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, session: Session, userId: uuid.UUID) -> Optional[Principal]:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(userId)
+            if entry is not None and now - entry[0] < self.maxAge:
+                self._entries.move_to_end(userId)
+                return entry[1]
+            generation = self._generation
+
+        row = session.execute(
+            select(users.c.id, users.c.username, users.c.email, users.c.role, users.c.status)
+            .where(users.c.id == userId)
+        ).first()
+        principal = None
+        if row is not None:
+            principal = Principal(row.id, row.username, row.email, row.role, row.status)
+        with self._lock:
+            # An invalidation that landed during the read makes this result suspect: do not keep it.
+            if generation == self._generation:
+                self._entries[userId] = (now, principal)
+                self._entries.move_to_end(userId)
+                while len(self._entries) > self.maxEntries:
+                    self._entries.popitem(last=False)
+        return principal
+
+    def invalidate(self, *userIds: uuid.UUID) -> None:
+        with self._lock:
+            self._generation += 1
+            for userId in userIds:
+                self._entries.pop(userId, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+def _pending(session: Session) -> set:
+    return session.info.setdefault(_PENDING_USERS, set())
+
+
+def _collectFlushed(session: Session, flushContext) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if getattr(obj, "__tablename__", None) == "users":
+            _pending(session).add(obj.id)
+
+
+def _collectBulk(executeState) -> None:
+    if not (executeState.is_update or executeState.is_delete):
+        return
+    mapper = executeState.bind_mapper
+    statement = executeState.statement
+    table = getattr(statement, "table", None)
+    if (mapper is not None and mapper.class_ is UserTable) or table is users:
+        _pending(executeState.session).add(_ALL_USERS)
+
+
+def installPrincipalInvalidation(cache: PrincipalCache, target=Session) -> None:
+    """Evict cached principals once a transaction writing ``users`` commits."""
+    global _installed
+    if _installed:
+        return
+
+    def _publish(session: Session) -> None:
+        userIds = session.info.pop(_PENDING_USERS, None)
+        if not userIds:
+            return
+        if _ALL_USERS in userIds:
+            cache.clear()  # bulk statements do not say which rows they touched
+        else:
+            cache.invalidate(*userIds)
+
+    def _discard(session: Session, transaction=None) -> None:
+        session.info.pop(_PENDING_USERS, None)
+
+    event.listen(target, "after_flush", _collectFlushed)
+    event.listen(target, "do_orm_execute", _collectBulk)
+    event.listen(target, "after_commit", _publish)
+    event.listen(target, "after_rollback", _discard)
+    _installed = True
+
+
+_principals: Optional[PrincipalCache] = None
+
+
+class PrincipalCacheHandler:
+    @staticmethod
+    def cache() -> PrincipalCache:
+        global _principals
+        if _principals is None:
+            settings = getSettings()
+            _principals = PrincipalCache(
+                maxEntries=settings.PRINCIPAL_CACHE_SIZE, maxAge=settings.PRINCIPAL_CACHE_SECONDS
+            )
+        return _principals
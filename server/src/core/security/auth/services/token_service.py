@@ -0,0 +1,121 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+from src.config.settings.config import getSettings
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    userId: uuid.UUID
+    expiresAt: int  # unix seconds
+
+
+class TokenService:
+    """Issues access tokens and verifies them through a small LRU.
+
+    Decoding and checking the signature costs tens of microseconds; a
+    client sends the same token on every call until it expires, so a
+    verified token is kept until its own ``exp`` (never longer) or until it
+    falls out of the LRU. Invalid tokens are not cached.
+    """
+
+    def __init__(
+        self,
+        secretKey: str,
+        algorithm: str = "HS256",
+        expiresInSeconds: int = 1800,
+        maxEntries: int = 10_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._secretKey = secretKey
+        self.algorithm = algorithm
+        self.expiresInSeconds = expiresInSeconds
+        self.maxEntries = maxEntries
+        self._clock = clock
+        self._verified: "OrderedDict[str, TokenClaims]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def issue(self, userId: uuid.UUID) -> Tuple[str, int]:
+        """A signed access token for ``userId`` and its lifetime in seconds."""
+        from jose import jwt
+
+        now = int(self._clock())
+        claims = {
+            "sub": str(userId),
+            "iat": now,
+            "exp": now + self.expiresInSeconds,
+            "type": "access",
+        }
+        return jwt.encode(claims, self._secretKey, algorithm=self.algorithm), self.expiresInSeconds
+
+    def verify(self, token: str) -> Optional[TokenClaims]:
+        now = self._clock()
+        with self._lock:
+            claims = self._verified.get(token)
+            if claims is not None:
+                if claims.expiresAt > now:
+                    self._verified.move_to_end(token)
+                    self.hits += 1
+                    return claims
+                del self._verified[token]
+            self.misses += 1
+
+        claims = self._decode(token, now)
+        if claims is None:
+            return None
+        with self._lock:
+            self._verified[token] = claims
+            if len(self._verified) > self.maxEntries:
+                self._evict(now)
+        return claims
+
+    def clear(self) -> None:
+        with self._lock:
+            self._verified.clear()
+
+    def _decode(self, token: str, now: float) -> Optional[TokenClaims]:
+        from jose import JWTError, jwt
+
+        try:
+            # exp is checked against our clock below, so it agrees with the cache.
+            payload = jwt.decode(
+                token, self._secretKey, algorithms=[self.algorithm], options={"verify_exp": False}
+            )
+            expiresAt = int(payload["exp"])
+            userId = uuid.UUID(payload["sub"])
+        except (JWTError, KeyError, TypeError, ValueError):
+            return None
+        if payload.get("type") != "access" or expiresAt <= now:
+            return None
+        return TokenClaims(userId, expiresAt)
+
+    def _evict(self, now: float) -> None:
+        expired = [token for token, claims in self._verified.items() if claims.expiresAt <= now]
+        for token in expired:
+            del self._verified[token]
+        while len(self._verified) > self.maxEntries:
+            self._verified.popitem(last=False)
+
+
+_tokens: Optional[TokenService] = None
+
+
+class TokenServiceHandler:
+    @staticmethod
+    def tokens() -> TokenService:
+        global _tokens
+        if _tokens is None:
+            settings = getSettings()
+            _tokens = TokenService(
+                settings.SECRET_KEY,
+                algorithm=settings.JWT_ALGORITHM,
+                expiresInSeconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+                maxEntries=settings.TOKEN_CACHE_SIZE,
+            )
+        return _tokens
@@ -0,0 +1,26 @@
+import uuid
+from typing import Optional
+
+from pydantic import BaseModel
+
+from src.features.todos.domain.enums.status import StatusEnum
+from src.features.todos.domain.enums.user_role import UserRole
+
+
+class LoginModel(BaseModel):
+    username: str
+    password: str
+
+
+class TokenModel(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+    expires_in: int  # seconds
+
+
+class PrincipalModel(BaseModel):
+    id: uuid.UUID
+    username: str
+    email: str
+    role: Optional[UserRole] = None
+    status: Optional[StatusEnum] = None
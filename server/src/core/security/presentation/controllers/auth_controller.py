@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from src.config.database.zen_task_db_handler import getDbSession
+from src.config.exceptions.failure_exception import FailureException
+from src.core.security.auth.middlewares.authentication import \
+    getCurrentPrincipal
+from src.core.security.auth.services.password_hasher import \
+    PasswordHasherHandler
+from src.core.security.auth.services.principal_cache import Principal
+from src.core.security.auth.services.token_service import TokenServiceHandler
+from src.core.security.data.models.auth_model import (LoginModel,
+                                                      PrincipalModel,
+                                                      TokenModel)
+from src.core.utils.serialization import FastJSONResponse
+from src.features.todos.data.datasource.tables.user_table import UserTable
+from src.features.todos.domain.enums.status import StatusEnum
+
+router = APIRouter(prefix="/auth", tags=["auth"])
+
+users = UserTable.__table__
+
+
+def _findCredentials(session: Session, username: str):
+    return session.execute(
+        select(users.c.id, users.c.password_hash, users.c.status).where(
+            users.c.username == username
+        )
+    ).first()
+
+
+@router.post("/login", response_model=TokenModel)
+async def login(body: LoginModel, session: Session = Depends(getDbSession)):
+    # The lookup runs in a thread and bcrypt in the hasher's process pool: the loop stays free.
+    row = await run_in_threadpool(_findCredentials, session, body.username)
+    try:
+        valid = await PasswordHasherHandler.hasher().verify(
+            body.password, row.password_hash if row else None
+        )
+    except FailureException as e:
+        return FastJSONResponse(e.toDict(), status_code=503, headers={"Retry-After": "1"})
+    if not valid or row.status not in (None, StatusEnum.active):
+        raise HTTPException(status_code=401, detail="Invalid username or password.")
+    token, expiresIn = TokenServiceHandler.tokens().issue(row.id)
+    return TokenModel(access_token=token, expires_in=expiresIn)
+
+
+@router.get("/me", response_model=PrincipalModel)
+def me(principal: Principal = Depends(getCurrentPrincipal)):
+    return PrincipalModel(
+        id=principal.id,
+        username=principal.username,
+        email=principal.email,
+        role=principal.role,
+        status=principal.status,
+    )
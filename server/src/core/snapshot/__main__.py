@@ -0,0 +1,43 @@
+"""Workspace snapshots.
+
+    python -m src.core.snapshot create backups/2025-06-01
+    python -m src.core.snapshot create backups/acme --project <uuid>
+    python -m src.core.snapshot create backups/2025-06-02 --since 2025-06-01T00:00:00
+    python -m src.core.snapshot restore backups/2025-06-01
+"""
+import argparse
+import uuid
+from datetime import datetime
+
+from src.config.database.zen_task_db_handler import ZenTaskDbHandler
+from src.core.snapshot.restore import restoreSnapshot
+from src.core.snapshot.writer import writeSnapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.core.snapshot")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    create = commands.add_parser("create", help="write a Parquet snapshot")
+    create.add_argument("directory")
+    create.add_argument("--project", type=uuid.UUID, help="only this project's rows")
+    create.add_argument("--since", type=datetime.fromisoformat, help="only rows changed after")
+
+    restore = commands.add_parser("restore", help="load a snapshot with COPY")
+    restore.add_argument("directory")
+    restore.add_argument("--upsert", action="store_true", default=None,
+                         help="merge by primary key even for a full snapshot")
+
+    args = parser.parse_args()
+    engine = ZenTaskDbHandler.db().getEngine()
+    if args.command == "create":
+        manifest = writeSnapshot(engine, args.directory, projectId=args.project, since=args.since)
+        counts = {entry["name"]: entry["rows"] for entry in manifest["tables"]}
+    else:
+        counts = restoreSnapshot(engine, args.directory, upsert=args.upsert)
+    for name, rows in counts.items():
+        print(f"{name:24} {rows:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import array as pyarray
+import enum
+import uuid
+from typing import Any, Callable, List, Optional, Sequence
+
+import orjson
+import pyarrow as pa
+from sqlalchemy import JSON, Boolean, Column, Date, DateTime, Enum, Float
+from sqlalchemy import Integer, String, Text, Time, cast
+from sqlalchemy.types import Uuid
+
+# String columns this short hold statuses, types and categories: few distinct values.
+DICTIONARY_MAX_LENGTH = 50
+
+DICTIONARY_STRING = pa.dictionary(pa.int32(), pa.string())
+UUID_BYTES = pa.binary(16)
+
+
+def arrowType(column: Column) -> pa.DataType:
+    """Columnar type for a table column; enums and short strings are dictionary encoded."""
+    columnType = column.type
+    if isinstance(columnType, Uuid):
+        return UUID_BYTES
+    if isinstance(columnType, Enum):
+        return DICTIONARY_STRING
+    if isinstance(columnType, String) and not isinstance(columnType, Text):
+        length = columnType.length
+        return DICTIONARY_STRING if length and length <= DICTIONARY_MAX_LENGTH else pa.string()
+    if isinstance(columnType, (Text, JSON)):
+        return pa.string()
+    if isinstance(columnType, Boolean):
+        return pa.bool_()
+    if isinstance(columnType, Integer):
+        return pa.int64()
+    if isinstance(columnType, Float):
+        return pa.float64()
+    if isinstance(columnType, DateTime):
+        return pa.timestamp("us")
+    if isinstance(columnType, Date):
+        return pa.date32()
+    if isinstance(columnType, Time):
+        return pa.time64("us")
+    return pa.string()
+
+
+def arrowSchema(columns: Sequence[Column]) -> pa.Schema:
+    return pa.schema([pa.field(column.name, arrowType(column)) for column in columns])
+
+
+def selectExpression(column: Column):
+    # JSON is copied as its stored text: no decode/encode round trip, and COPY takes it as is.
+    if isinstance(column.type, JSON):
+        return cast(column, Text).label(column.name)
+    return column
+
+
+def _enumName(value: Any) -> Optional[str]:
+    # SQLAlchemy persists Enum columns by member name; keep that so COPY can load it back.
+    if value is None:
+        return None
+    return value.name if isinstance(value, enum.Enum) else str(value)
+
+
+def _uuidBytes(value: Any) -> Optional[bytes]:
+    if value is None:
+        return None
+    return value.bytes if isinstance(value, uuid.UUID) else uuid.UUID(str(value)).bytes
+
+
+def toArrowArray(values: List[Any], column: Column, arrowType: pa.DataType) -> pa.Array:
+    if arrowType == UUID_BYTES:
+        return pa.array([_uuidBytes(value) for value in values], UUID_BYTES)
+    if isinstance(column.type, Enum):
+        return pa.array([_enumName(value) for value in values], pa.string()).dictionary_encode()
+    if arrowType == DICTIONARY_STRING:
+        return pa.array(values, pa.string()).dictionary_encode()
+    if arrowType == pa.string() and not isinstance(column.type, (Text, JSON, String)):
+        return pa.array([None if value is None else str(value) for value in values], pa.string())
+    return pa.array(values, arrowType)
+
+
+def uuidHex(array: pa.Array) -> pa.Array:
+    """Vectorised 16-byte UUID -> 32-char hex text, which PostgreSQL accepts as uuid input."""
+    if array.offset:
+        array = pa.concat_arrays([array])
+    count = len(array)
+    validity, data = array.buffers()
+    text = data.to_pybytes()[: count * 16].hex().encode("ascii") if count else b""
+    offsets = pyarray.array("i", range(0, 32 * count + 1, 32))
+    return pa.Array.from_buffers(
+        pa.string(),
+        count,
+        [validity if array.null_count else None, pa.py_buffer(offsets), pa.py_buffer(text)],
+        array.null_count,
+    )
+
+
+def toCopyColumn(array: pa.Array) -> pa.Array:
+    """Plain text-friendly representation of a snapshot column for COPY ... CSV."""
+    if pa.types.is_dictionary(array.type):
+        return array.dictionary_decode()
+    if array.type == UUID_BYTES:
+        return uuidHex(array)
+    return array
+
+
+def pythonConverter(column: Column) -> Callable[[Any], Any]:
+    """Arrow -> Python value conversion for the INSERT fallback used on non-PostgreSQL engines."""
+    columnType = column.type
+    if isinstance(columnType, Uuid):
+        return lambda value: None if value is None else uuid.UUID(bytes=value)
+    if isinstance(columnType, JSON):
+        return lambda value: None if value is None else orjson.loads(value)
+    if isinstance(columnType, Enum) and columnType.enum_class is not None:
+        enumClass = columnType.enum_class
+        return lambda value: None if value is None else enumClass[value]
+    return lambda value: value
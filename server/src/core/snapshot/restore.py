@@ -0,0 +1,197 @@
+import io
+import os
+from typing import Dict, Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from fastapi.logger import logger
+from sqlalchemy import Engine, Table, insert
+from sqlalchemy.dialects.sqlite import insert as sqliteInsert
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import AddConstraint, DropConstraint
+
+from src.config.exceptions.failure_exception import (ExceptionType,
+                                                     FailureException)
+from src.core.snapshot.columns import pythonConverter, toCopyColumn
+from src.core.snapshot.scope import workspaceTables
+from src.core.snapshot.writer import (SNAPSHOT_BATCH_SIZE,
+                                      SNAPSHOT_FORMAT_VERSION, readManifest)
+
+_CSV_OPTIONS = pacsv.WriteOptions(include_header=False)
+
+
+def _batches(path: str, columns: List[str], batchSize: int) -> Iterator[pa.RecordBatch]:
+    yield from pq.ParquetFile(path).iter_batches(batch_size=batchSize, columns=columns)
+
+
+class CopyStream(io.RawIOBase):
+    """File object feeding ``COPY ... FROM STDIN`` one record batch at a time.
+
+    Each batch is rendered as CSV by Arrow (strings quoted, NULL left empty,
+    UUIDs as hex text), so Python never touches individual values.
+    """
+
+    def __init__(self, batches: Iterator[pa.RecordBatch]):
+        self._batches = batches
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            batch = next(self._batches, None)
+            if batch is None:
+                break
+            table = pa.Table.from_arrays(
+                [toCopyColumn(column) for column in batch.columns], names=batch.schema.names
+            )
+            sink = io.BytesIO()
+            pacsv.write_csv(table, sink, _CSV_OPTIONS)
+            self._buffer += sink.getvalue()
+        if size < 0:
+            size = len(self._buffer)
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+def _checkManifest(manifest: dict, tables: Dict[str, Table]) -> None:
+    if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        raise FailureException(
+            type=ExceptionType.VALIDATION,
+            message=f"Unsupported snapshot format {manifest.get('format_version')}.",
+        )
+    for entry in manifest["tables"]:
+        table = tables.get(entry["name"])
+        missing = [name for name in entry["columns"] if table is None or name not in table.c]
+        if missing:
+            raise FailureException(
+                type=ExceptionType.VALIDATION,
+                message=f"Snapshot table {entry['name']} does not match the schema: {missing}",
+            )
+
+
+def _cyclicForeignKeys(entries: List[dict], tables: Dict[str, Table]):
+    # use_alter marks the FKs that close a cycle (tags <-> entity_tags, users <-> user_settings);
+    # whichever side is copied first would fail them, so they are checked once all rows are in.
+    return [
+        constraint
+        for entry in entries
+        for constraint in tables[entry["name"]].foreign_key_constraints
+        if constraint.use_alter
+    ]
+
+
+def _restorePostgres(
+    engine: Engine, directory: str, entries: List[dict], tables: Dict[str, Table],
+    upsert: bool, batchSize: int,
+) -> None:
+    quote = engine.dialect.identifier_preparer.quote
+    ddl = lambda element: str(element.compile(dialect=engine.dialect))  # noqa: E731
+    cyclic = _cyclicForeignKeys(entries, tables)
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        for constraint in cyclic:
+            cursor.execute(ddl(DropConstraint(constraint, if_exists=True)))
+        for entry in entries:
+            table = tables[entry["name"]]
+            columnList = ", ".join(quote(name) for name in entry["columns"])
+            target = quote(table.name)
+            if upsert:
+                # Upserts go through a staging copy: COPY itself cannot resolve conflicts.
+                staging = quote(f"_restore_{table.name}")
+                cursor.execute(
+                    f"CREATE TEMP TABLE {staging} (LIKE {target} INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+            stream = CopyStream(
+                _batches(os.path.join(directory, entry["file"]), entry["columns"], batchSize)
+            )
+            cursor.copy_expert(
+                f"COPY {staging if upsert else target} ({columnList}) FROM STDIN WITH (FORMAT csv)",
+                stream,
+            )
+            if upsert:
+                keys = [column.name for column in table.primary_key.columns]
+                updates = ", ".join(
+                    f"{quote(name)} = EXCLUDED.{quote(name)}"
+                    for name in entry["columns"]
+                    if name not in keys
+                )
+                onConflict = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+                cursor.execute(
+                    f"INSERT INTO {target} ({columnList}) SELECT {columnList} FROM {staging} "
+                    f"ON CONFLICT ({', '.join(quote(key) for key in keys)}) {onConflict}"
+                )
+            logger.info(f"Restored {table.name}: {entry['rows']} rows")
+        for constraint in cyclic:
+            cursor.execute(ddl(AddConstraint(constraint)))  # validates the restored rows
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+
+def _restoreInserts(
+    engine: Engine, directory: str, entries: List[dict], tables: Dict[str, Table],
+    upsert: bool, batchSize: int,
+) -> None:
+    # Engines without COPY (SQLite in tests and local tooling) take batched executemany inserts.
+    if upsert and engine.dialect.name != "sqlite":
+        raise FailureException(
+            type=ExceptionType.VALIDATION,
+            message=f"Upsert restore is not supported on {engine.dialect.name}.",
+        )
+    with Session(engine) as session, session.begin():
+        for entry in entries:
+            table = tables[entry["name"]]
+            names = entry["columns"]
+            converters = [pythonConverter(table.c[name]) for name in names]
+            if upsert:
+                stmt = sqliteInsert(table)
+                keys = [column.name for column in table.primary_key.columns]
+                updates = {name: stmt.excluded[name] for name in names if name not in keys}
+                stmt = (
+                    stmt.on_conflict_do_update(index_elements=keys, set_=updates)
+                    if updates
+                    else stmt.on_conflict_do_nothing()
+                )
+            else:
+                stmt = insert(table)
+            for batch in _batches(os.path.join(directory, entry["file"]), names, batchSize):
+                columns = [
+                    [convert(value) for value in column.to_pylist()]
+                    for convert, column in zip(converters, batch.columns)
+                ]
+                rows = [dict(zip(names, values)) for values in zip(*columns)]
+                if rows:
+                    session.execute(stmt, rows)
+
+
+def restoreSnapshot(
+    engine: Engine,
+    directory: str,
+    upsert: Optional[bool] = None,
+    batchSize: int = SNAPSHOT_BATCH_SIZE,
+) -> dict:
+    """Load a snapshot written by ``writeSnapshot`` in one transaction.
+
+    Full snapshots are copied straight into (empty) tables. Incremental and
+    per-project snapshots upsert by primary key, so they can be layered on
+    top of an existing workspace.
+    """
+    manifest = readManifest(directory)
+    tables = {table.name: table for table in workspaceTables()}
+    _checkManifest(manifest, tables)
+    if upsert is None:
+        upsert = manifest["kind"] != "full" or manifest["project_id"] is not None
+
+    # Parents before children, whatever order the manifest lists them in.
+    order = list(tables)
+    entries = sorted(manifest["tables"], key=lambda entry: order.index(entry["name"]))
+    restore = _restorePostgres if engine.dialect.name == "postgresql" else _restoreInserts
+    restore(engine, directory, entries, tables, upsert, batchSize)
+    return {entry["name"]: entry["rows"] for entry in entries}
@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import Select, Table, select
+
+from src.config.database.base_table import Base
+
+# Bookkeeping table of the declarative base, not workspace data.
+EXCLUDED_TABLES = ("base_table",)
+
+
+def workspaceTables() -> List[Table]:
+    """Every workspace table in foreign-key order (parents before children)."""
+    from src.features.todos.data.datasource.tables.registry import metadata
+
+    return [table for table in metadata.sorted_tables if table.name not in EXCLUDED_TABLES]
+
+
+def _referencing(table: Table, target: str):
+    for foreignKey in table.foreign_keys:
+        if foreignKey.column.table.name == target and foreignKey.parent.table is table:
+            if foreignKey.parent.table.name != target:
+                return foreignKey.parent
+    return None
+
+
+def projectFilter(table: Table, projectId) -> Optional[object]:
+    """WHERE clause restricting ``table`` to one project, or None when it is not project data."""
+    if table.name == "projects":
+        return table.c.id == projectId
+    column = _referencing(table, "projects")
+    if column is not None:
+        return column == projectId
+
+    tasks = Base.metadata.tables["tasks"]
+    projectTaskIds = select(tasks.c.id).where(tasks.c.project_id == projectId)
+    if table.name == "entity_tags":
+        return (
+            (table.c.entity_type == "task") & table.c.entity_id.in_(projectTaskIds)
+        ) | ((table.c.entity_type == "project") & (table.c.entity_id == projectId))
+    column = _referencing(table, "tasks")
+    if column is not None:
+        return column.in_(projectTaskIds)
+    return None
+
+
+def changeColumn(table: Table):
+    """Column an incremental snapshot compares against ``since``."""
+    for name in ("updated_at", "created_at"):
+        if name in table.c:
+            return table.c[name]
+    return None
+
+
+def snapshotQuery(
+    table: Table, columns, projectId=None, since: Optional[datetime] = None
+) -> Optional[Select]:
+    stmt = select(*columns)
+    if projectId is not None:
+        where = projectFilter(table, projectId)
+        if where is None:
+            return None
+        stmt = stmt.where(where)
+    if since is not None:
+        column = changeColumn(table)
+        # Tables without a change timestamp are small lookup data; they are always copied whole.
+        if column is not None:
+            stmt = stmt.where(column > since)
+    return stmt.order_by(*table.primary_key.columns)
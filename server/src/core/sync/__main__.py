@@ -0,0 +1,37 @@
+"""Change log maintenance.
+
+    python -m src.core.sync backfill        # log existing rows once, after deploying delta sync
+    python -m src.core.sync purge --days 90 # drop older tombstones
+"""
+import argparse
+from datetime import datetime, timedelta
+
+from src.config.database.zen_task_db_handler import ZenTaskDbHandler
+from src.config.settings.config import getSettings
+from src.core.sync.changelog import (backfillChangeLog, installChangeLog,
+                                     purgeTombstones)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.core.sync")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("backfill", help="log every synced row that has no change entry")
+    purge = commands.add_parser("purge", help="drop old tombstones")
+    purge.add_argument("--days", type=int, default=getSettings().SYNC_TOMBSTONE_DAYS)
+
+    args = parser.parse_args()
+    installChangeLog()
+    db = ZenTaskDbHandler.db()
+    session = db.getSession()
+    try:
+        if args.command == "backfill":
+            print(f"logged {backfillChangeLog(session)} rows")
+        else:
+            before = datetime.utcnow() - timedelta(days=args.days)
+            print(f"purged {purgeTombstones(session, before)} tombstones")
+    finally:
+        db.closeSession(session)
+
+
+if __name__ == "__main__":
+    main()
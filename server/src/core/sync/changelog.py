@@ -0,0 +1,386 @@
+"""Change log behind delta sync.
+
+Every committed write to a synced table leaves one row per entity and
+user it belongs to (see ``scope``) in ``sync_changes``, carrying a fresh
+version, so "what changed for user U since version N" is a range scan over
+an index and grows with that user's changed entities, not with the
+workspace. A second write to the same entity replaces its rows (the log is
+compacted as it is written); a delete, or a user losing the row, leaves a
+tombstone for that user.
+
+Versions are taken from the ``sync_state`` counter in ``before_commit``.
+The counter row stays locked until the transaction ends, so transactions
+become visible in version order and a reader never skips a version that
+commits late.
+"""
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import (Integer, Table, delete, event, exists, func, insert,
+                        select, tuple_, update)
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import BinaryExpression, BindParameter
+
+from src.core.sync import scope
+from src.features.todos.data.datasource.tables.project_table import \
+    ProjectTable
+from src.features.todos.data.datasource.tables.sync_change_table import (
+    SyncChangeTable, SyncStateTable)
+from src.features.todos.data.datasource.tables.tag_table import TagTable
+from src.features.todos.data.datasource.tables.task_log_table import \
+    TaskLogTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.features.todos.data.datasource.tables.time_block_table import \
+    TimeBlockTable
+
+SYNCED_TABLES = {
+    table.__tablename__: table
+    for table in (ProjectTable, TagTable, TaskTable, TaskLogTable, TimeBlockTable)
+}
+
+changes = SyncChangeTable.__table__
+state = SyncStateTable.__table__
+
+ChangeKey = Tuple[str, uuid.UUID]
+
+_STATE_ID = 1
+_CHUNK = 500
+_PENDING_CHANGES = "sync_pending_changes"
+_EXPECTED_VERSIONS = "sync_expected_versions"
+ASSIGNED_VERSIONS = "sync_assigned_versions"
+_installed = False
+
+
+class StaleVersionError(Exception):
+    """An entity passed to ``expectVersions`` was changed by a transaction that committed first."""
+
+    def __init__(self, keys: List[ChangeKey]):
+        super().__init__(f"{len(keys)} synced row(s) changed concurrently")
+        self.keys = keys
+
+
+def _pending(session: Session) -> Dict[ChangeKey, bool]:
+    return session.info.setdefault(_PENDING_CHANGES, {})
+
+
+def recordChanges(
+    session: Session, tableName: str, ids: Iterable[uuid.UUID], deleted: bool = False
+) -> None:
+    """Log writes the session cannot see, i.e. statements run on ``session.connection()``."""
+    pending = _pending(session)
+    for entityId in ids:
+        pending[(tableName, entityId)] = deleted
+
+
+def expectVersions(session: Session, versions: Dict[ChangeKey, Optional[int]]) -> None:
+    """Fail the commit with ``StaleVersionError`` unless these rows are still at these versions.
+
+    ``None`` means the row has no change log entry yet. The check runs with
+    the counter locked, so nothing can commit in between.
+    """
+    session.info.setdefault(_EXPECTED_VERSIONS, {}).update(versions)
+
+
+def currentVersions(
+    session: Session, keys: Iterable[ChangeKey]
+) -> Dict[ChangeKey, Tuple[int, bool]]:
+    """``{(table, id): (version, deleted)}`` for the keys that have a change log entry.
+
+    ``deleted`` means no one holds the row any more.
+    """
+    found = {}
+    for tableName, ids in _byTable(keys).items():
+        for start in range(0, len(ids), _CHUNK):
+            rows = session.execute(
+                select(
+                    changes.c.entity_id,
+                    func.max(changes.c.version),
+                    func.min(changes.c.deleted.cast(Integer)),
+                )
+                .where(
+                    changes.c.entity_type == tableName,
+                    changes.c.entity_id.in_(ids[start:start + _CHUNK]),
+                )
+                .group_by(changes.c.entity_id)
+            )
+            for entityId, version, deleted in rows:
+                found[(tableName, entityId)] = (version, bool(deleted))
+    return found
+
+
+def _byTable(keys: Iterable[ChangeKey]) -> Dict[str, List[uuid.UUID]]:
+    byTable: Dict[str, List[uuid.UUID]] = {}
+    for tableName, entityId in keys:
+        byTable.setdefault(tableName, []).append(entityId)
+    return byTable
+
+
+def _collectFlushed(session: Session, flushContext) -> None:
+    written = (
+        *((obj, False) for obj in session.new),
+        *((obj, False) for obj in session.dirty if session.is_modified(obj)),
+        *((obj, True) for obj in session.deleted),
+    )
+    for obj, deleted in written:
+        tableName = getattr(obj, "__tablename__", None)
+        if tableName in SYNCED_TABLES:
+            _pending(session)[(tableName, obj.id)] = deleted
+
+
+def _idBindKey(whereclause, table: Table) -> Optional[str]:
+    # ``WHERE id = :key`` run as an executemany names each row in its parameters.
+    if isinstance(whereclause, BinaryExpression) and isinstance(whereclause.right, BindParameter):
+        if whereclause.left.compare(table.c.id):
+            return whereclause.right.key
+    return None
+
+
+def _collectBulk(executeState):
+    if not (executeState.is_insert or executeState.is_update or executeState.is_delete):
+        return None
+    table = getattr(executeState.statement, "table", None)
+    if table is None or table.name not in SYNCED_TABLES:
+        return None
+    session = executeState.session
+    params = executeState.parameters
+    rows = params if isinstance(params, (list, tuple)) else [params] if params else []
+
+    if executeState.is_insert:
+        if any("id" not in row for row in rows):
+            # Give the rows their ids up front (the column default would anyway) so they
+            # can be logged; the caller's dicts are left alone.
+            rows = [row if "id" in row else {**row, "id": uuid.uuid4()} for row in rows]
+            recordChanges(session, table.name, [row["id"] for row in rows])
+            return executeState.invoke_statement(
+                params=rows if isinstance(params, (list, tuple)) else rows[0]
+            )
+        recordChanges(session, table.name, [row["id"] for row in rows])
+        return None
+
+    statement = executeState.statement
+    key = _idBindKey(statement.whereclause, table)
+    if rows and all("id" in row for row in rows):  # ORM bulk UPDATE by primary key
+        ids = [row["id"] for row in rows]
+    elif rows and key is not None and all(key in row for row in rows):
+        ids = [row[key] for row in rows]
+    else:
+        # The statement does not say which rows it touches: ask before it runs.
+        query = select(table.c.id)
+        if statement.whereclause is not None:
+            query = query.where(statement.whereclause)
+        ids = list(session.execute(query, params if isinstance(params, dict) else None).scalars())
+    recordChanges(session, table.name, ids, deleted=executeState.is_delete)
+    return None
+
+
+def _lockCounter(session: Session, increment: int) -> int:
+    """Advance the counter by ``increment`` and return its new value; the row stays locked."""
+    top = session.execute(
+        update(state)
+        .where(state.c.id == _STATE_ID)
+        .values(version=state.c.version + increment)
+        .returning(state.c.version)
+    ).scalar()
+    if top is None:
+        # First write ever; of two transactions racing here, one fails on the primary key.
+        session.execute(insert(state).values(id=_STATE_ID, version=increment, purged_through=0))
+        top = increment
+    return top
+
+
+def _checkExpected(session: Session, expected: Dict[ChangeKey, Optional[int]]) -> None:
+    current = currentVersions(session, expected)
+    stale = [
+        key
+        for key, version in expected.items()
+        if (current[key][0] if key in current else None) != version
+    ]
+    if stale:
+        raise StaleVersionError(stale)
+
+
+def _liveHolders(
+    session: Session, tableName: str, ids: List[uuid.UUID]
+) -> Dict[uuid.UUID, Set[uuid.UUID]]:
+    """The users each row was last logged for and who have no tombstone for it."""
+    found: Dict[uuid.UUID, Set[uuid.UUID]] = {}
+    for start in range(0, len(ids), _CHUNK):
+        rows = session.execute(
+            select(changes.c.entity_id, changes.c.audience).where(
+                changes.c.entity_type == tableName,
+                changes.c.entity_id.in_(ids[start:start + _CHUNK]),
+                changes.c.deleted.is_(False),
+            )
+        )
+        for entityId, userId in rows:
+            found.setdefault(entityId, set()).add(userId)
+    return found
+
+
+def _resolveHolders(
+    session: Session, pending: Dict[ChangeKey, bool]
+) -> Tuple[Dict[ChangeKey, Set[uuid.UUID]], Dict[ChangeKey, Set[uuid.UUID]]]:
+    """``(holders now, holders last logged)`` of every pending row.
+
+    A row whose holders changed takes its children along (a reassigned
+    task's logs and time blocks), so they are added to ``pending``.
+    """
+    now: Dict[ChangeKey, Set[uuid.UUID]] = {}
+    before: Dict[ChangeKey, Set[uuid.UUID]] = {}
+    unresolved = dict(pending)
+    while unresolved:
+        moved: Dict[str, List[uuid.UUID]] = {}
+        for tableName, ids in _byTable(unresolved).items():
+            existing = [entityId for entityId in ids if not pending[(tableName, entityId)]]
+            current = scope.holders(session, tableName, existing)
+            logged = _liveHolders(session, tableName, ids)
+            for entityId in ids:
+                key = (tableName, entityId)
+                now[key] = current.get(entityId, set())
+                before[key] = logged.get(entityId, set())
+                if now[key] != before[key] and tableName in scope.CHILDREN:
+                    moved.setdefault(tableName, []).append(entityId)
+        unresolved = {}
+        for tableName, ids in moved.items():
+            for key in scope.children(session, tableName, ids):
+                if key not in pending:
+                    pending[key] = unresolved[key] = False
+    return now, before
+
+
+def _writeLog(session: Session) -> None:
+    session.flush()  # so after_flush has seen every pending object
+    pending = session.info.pop(_PENDING_CHANGES, None)
+    expected = session.info.pop(_EXPECTED_VERSIONS, None)
+    if not pending and not expected:
+        return
+    pending = pending or {}
+    top = _lockCounter(session, len(pending))
+    if expected:
+        _checkExpected(session, expected)
+    if not pending:
+        return
+
+    requested = len(pending)
+    now, before = _resolveHolders(session, pending)
+    if len(pending) > requested:
+        top = _lockCounter(session, len(pending) - requested)
+
+    changedAt = datetime.utcnow()
+    assigned = {}
+    rowsByTable: Dict[str, List[dict]] = {}
+    for version, ((tableName, entityId), deleted) in enumerate(
+        pending.items(), start=top - len(pending) + 1
+    ):
+        key = (tableName, entityId)
+        assigned[key] = version
+        for userId in now[key] | before[key]:
+            rowsByTable.setdefault(tableName, []).append(
+                {
+                    "entity_type": tableName,
+                    "entity_id": entityId,
+                    "audience": userId,
+                    "version": version,
+                    "deleted": userId not in now[key],
+                    "changed_at": changedAt,
+                }
+            )
+    entry = tuple_(changes.c.entity_type, changes.c.entity_id, changes.c.audience)
+    for tableName, rows in rowsByTable.items():
+        for start in range(0, len(rows), _CHUNK):
+            chunk = rows[start:start + _CHUNK]
+            # Replace, not append: the log keeps only the latest change of each row and user.
+            session.execute(
+                delete(changes).where(
+                    entry.in_(
+                        [(tableName, row["entity_id"], row["audience"]) for row in chunk]
+                    )
+                )
+            )
+            session.execute(insert(changes), chunk)
+    session.info[ASSIGNED_VERSIONS] = assigned
+
+
+def installChangeLog(target=Session) -> None:
+    """Log committed writes to the synced tables in ``sync_changes``.
+
+    ORM flushes are seen in full; ``session.execute`` bulk statements are
+    resolved to ids (UPDATE/DELETE without ids in their parameters cost one
+    extra SELECT). Statements run on ``session.connection()`` bypass the
+    session and must call ``recordChanges``; so must INSERT ... SELECT and
+    ``insert().values(...)`` statements, whose rows are not in the parameters.
+    """
+    global _installed
+    if _installed:
+        return
+
+    def _discard(session: Session, transaction=None) -> None:
+        session.info.pop(_PENDING_CHANGES, None)
+        session.info.pop(_EXPECTED_VERSIONS, None)
+
+    event.listen(target, "after_flush", _collectFlushed)
+    event.listen(target, "do_orm_execute", _collectBulk)
+    event.listen(target, "before_commit", _writeLog)
+    event.listen(target, "after_rollback", _discard)
+    _installed = True
+
+
+def backfillChangeLog(session: Session, batchSize: int = 5000) -> int:
+    """Log every synced row that has no entry yet, so a pull from version 0 is a full sync.
+
+    Run once after deploying the change log; each batch is its own transaction.
+    Rows that belong to no one stay unlogged until they get a holder.
+    """
+    total = 0
+    for tableName, model in SYNCED_TABLES.items():
+        table = model.__table__
+        after = None
+        while True:
+            query = (
+                select(table.c.id)
+                .where(
+                    ~exists().where(
+                        changes.c.entity_type == tableName, changes.c.entity_id == table.c.id
+                    )
+                )
+                .order_by(table.c.id)
+                .limit(batchSize)
+            )
+            if after is not None:
+                query = query.where(table.c.id > after)
+            ids = list(session.execute(query).scalars())
+            if not ids:
+                break
+            recordChanges(session, tableName, ids)
+            session.commit()
+            total += len(ids)
+            after = ids[-1]
+    return total
+
+
+def purgeTombstones(session: Session, before: datetime) -> int:
+    """Drop tombstones older than ``before``; clients whose cursor predates them must re-sync."""
+    newest = session.execute(
+        select(func.max(changes.c.version)).where(
+            changes.c.deleted.is_(True), changes.c.changed_at < before
+        )
+    ).scalar()
+    if newest is None:
+        return 0
+    purged = session.execute(
+        delete(changes).where(changes.c.deleted.is_(True), changes.c.version <= newest)
+    ).rowcount
+    session.execute(
+        update(state)
+        .where(state.c.id == _STATE_ID, state.c.purged_through < newest)
+        .values(purged_through=newest)
+    )
+    session.commit()
+    return purged
+
+
+def purgedThrough(session: Session) -> int:
+    return session.execute(
+        select(state.c.purged_through).where(state.c.id == _STATE_ID)
+    ).scalar() or 0
@@ -0,0 +1,63 @@
+import enum
+import uuid
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class SyncEntity(str, enum.Enum):
+    projects = "projects"
+    tags = "tags"
+    tasks = "tasks"
+    task_logs = "task_logs"
+    time_blocks = "time_blocks"
+
+
+class SyncOp(str, enum.Enum):
+    upsert = "upsert"
+    delete = "delete"
+
+
+class SyncChangeModel(BaseModel):
+    entity: SyncEntity
+    id: uuid.UUID
+    version: int
+    op: SyncOp
+    data: Optional[Dict[str, Any]] = None  # the whole row for upserts
+
+
+class SyncPageModel(BaseModel):
+    changes: List[SyncChangeModel]
+    cursor: int  # pass as ``since`` for the next page
+    has_more: bool
+    reset: bool = False  # the client's cursor predates purged tombstones: drop local data
+
+
+class SyncPushChangeModel(BaseModel):
+    entity: SyncEntity
+    id: uuid.UUID
+    op: SyncOp = SyncOp.upsert
+    base_version: Optional[int] = None  # version the client last saw; None for a new row
+    data: Dict[str, Any] = {}  # changed columns only
+
+
+class SyncPushModel(BaseModel):
+    changes: List[SyncPushChangeModel]
+
+
+class SyncAppliedModel(BaseModel):
+    entity: SyncEntity
+    id: uuid.UUID
+    version: Optional[int] = None
+
+
+class SyncConflictModel(BaseModel):
+    entity: SyncEntity
+    id: uuid.UUID
+    base_version: Optional[int] = None
+    server: Optional[SyncChangeModel] = None  # None when the server never had the row
+
+
+class SyncPushResultModel(BaseModel):
+    applied: List[SyncAppliedModel]
+    conflicts: List[SyncConflictModel]
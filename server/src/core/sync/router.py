@@ -0,0 +1,63 @@
+import zlib
+from typing import Optional
+
+import orjson
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session
+
+from src.config.database.zen_task_db_handler import getDbSession
+from src.config.exceptions.failure_exception import (ExceptionType,
+                                                     FailureException,
+                                                     LogLevel)
+from src.config.settings.config import getSettings
+from src.core.security.auth.middlewares.authentication import \
+    getCurrentPrincipal
+from src.core.security.auth.services.principal_cache import Principal
+from src.core.sync.models import (SyncPageModel, SyncPushModel,
+                                  SyncPushResultModel)
+from src.core.sync.service import SyncService
+from src.core.utils.export import acceptsGzip
+from src.core.utils.serialization import (ORJSON_OPTIONS, FastJSONResponse,
+                                          RawJSONResponse)
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+def _gzipped(request: Request, content: dict) -> RawJSONResponse:
+    body = orjson.dumps(content, option=ORJSON_OPTIONS)
+    headers = {"Vary": "Accept-Encoding"}
+    if len(body) >= getSettings().SYNC_COMPRESS_MIN_BYTES and acceptsGzip(request):
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        body = compressor.compress(body) + compressor.flush()
+        headers["Content-Encoding"] = "gzip"
+    return RawJSONResponse(body, headers=headers)
+
+
+@router.get("/changes", response_model=SyncPageModel)
+def pullChanges(
+    request: Request,
+    since: int = Query(0, ge=0, description="cursor of the previous page; 0 for a full sync"),
+    limit: Optional[int] = Query(None, ge=1),
+    principal: Principal = Depends(getCurrentPrincipal),
+    session: Session = Depends(getDbSession),
+):
+    settings = getSettings()
+    limit = min(limit or settings.SYNC_PAGE_SIZE, settings.SYNC_MAX_PAGE_SIZE)
+    return _gzipped(request, SyncService(session, principal.id).pull(since, limit))
+
+
+@router.post("/changes", response_model=SyncPushResultModel)
+def pushChanges(
+    body: SyncPushModel,
+    principal: Principal = Depends(getCurrentPrincipal),
+    session: Session = Depends(getDbSession),
+):
+    maxChanges = getSettings().SYNC_MAX_PUSH_CHANGES
+    if len(body.changes) > maxChanges:
+        raise FailureException(
+            type=ExceptionType.VALIDATION,
+            level=LogLevel.INFO,
+            message=f"Sync push of {len(body.changes)} changes exceeds {maxChanges}.",
+            userMessage=f"Push at most {maxChanges} changes at a time.",
+        )
+    return FastJSONResponse(SyncService(session, principal.id).push(body.changes))
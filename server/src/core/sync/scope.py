@@ -0,0 +1,93 @@
+"""Who may sync a row.
+
+A project belongs to its owner; a task to its assignee and to its project's
+owner; task logs and time blocks to whoever has their task. Tags have no
+owner: they are one shared vocabulary, logged for ``EVERYONE`` and read-only
+over sync.
+"""
+import uuid
+from typing import Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy import Select, select, union_all
+from sqlalchemy.orm import Session
+
+from src.features.todos.data.datasource.tables.project_table import \
+    ProjectTable
+from src.features.todos.data.datasource.tables.task_log_table import \
+    TaskLogTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.features.todos.data.datasource.tables.time_block_table import \
+    TimeBlockTable
+
+EVERYONE = uuid.UUID(int=0)
+
+# Columns that decide who a row belongs to, or that the server stamps; a push may not set them.
+SERVER_COLUMNS = frozenset({"owner_id", "assigned_to", "created_at"})
+
+projects = ProjectTable.__table__
+tasks = TaskTable.__table__
+_TASK_CHILDREN = (TaskLogTable.__table__, TimeBlockTable.__table__)
+
+# A row's holders change with its parent's, so a moved parent relogs these.
+CHILDREN = {
+    "projects": ((tasks, tasks.c.project_id),),
+    "tasks": tuple((table, table.c.task_id) for table in _TASK_CHILDREN),
+}
+
+# Columns that point at the row's parent; a push may only point them at the caller's rows.
+PARENTS = {
+    "tasks": {"project_id": "projects", "parent_task_id": "tasks"},
+    "task_logs": {"task_id": "tasks"},
+    "time_blocks": {"task_id": "tasks"},
+}
+
+_CHUNK = 500
+
+
+def _holders(tableName: str, ids: List[uuid.UUID]) -> Select:
+    """``(id, user)`` pairs; a row held by no one has none."""
+    if tableName == "projects":
+        return select(projects.c.id, projects.c.owner_id).where(projects.c.id.in_(ids))
+    if tableName == "tasks":
+        table, joined = tasks, tasks
+    else:
+        table = next(child for child in _TASK_CHILDREN if child.name == tableName)
+        joined = table.join(tasks, tasks.c.id == table.c.task_id)
+    return union_all(
+        select(table.c.id, tasks.c.assigned_to).select_from(joined).where(table.c.id.in_(ids)),
+        select(table.c.id, projects.c.owner_id)
+        .select_from(joined.join(projects, projects.c.id == tasks.c.project_id))
+        .where(table.c.id.in_(ids)),
+    )
+
+
+def holders(
+    session: Session, tableName: str, ids: Iterable[uuid.UUID]
+) -> Dict[uuid.UUID, Set[uuid.UUID]]:
+    """The users each existing row belongs to; rows held by no one are left out."""
+    ids = list(ids)
+    if tableName == "tags":
+        return {entityId: {EVERYONE} for entityId in ids}
+    found: Dict[uuid.UUID, Set[uuid.UUID]] = {}
+    for start in range(0, len(ids), _CHUNK):
+        for entityId, userId in session.execute(_holders(tableName, ids[start:start + _CHUNK])):
+            if userId is not None:
+                found.setdefault(entityId, set()).add(userId)
+    return found
+
+
+def children(
+    session: Session, tableName: str, ids: Iterable[uuid.UUID]
+) -> List[Tuple[str, uuid.UUID]]:
+    """``(table, id)`` of the rows whose holders follow these rows'."""
+    ids = list(ids)
+    found = []
+    for table, parent in CHILDREN.get(tableName, ()):
+        for start in range(0, len(ids), _CHUNK):
+            found.extend(
+                (table.name, childId)
+                for childId in session.scalars(
+                    select(table.c.id).where(parent.in_(ids[start:start + _CHUNK]))
+                )
+            )
+    return found
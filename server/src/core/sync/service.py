@@ -0,0 +1,276 @@
+import enum
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Column, Table, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.config.exceptions.failure_exception import (ExceptionType,
+                                                     FailureException,
+                                                     LogLevel)
+from src.core.sync.changelog import (ASSIGNED_VERSIONS, SYNCED_TABLES,
+                                     ChangeKey, StaleVersionError, changes,
+                                     currentVersions, expectVersions,
+                                     purgedThrough)
+from src.core.sync.models import SyncOp, SyncPushChangeModel
+from src.core.sync.scope import EVERYONE, PARENTS, SERVER_COLUMNS, holders
+
+_CHUNK = 500
+
+
+def _invalid(message: str, error: Optional[Exception] = None) -> FailureException:
+    return FailureException(
+        type=ExceptionType.VALIDATION,
+        level=LogLevel.INFO,
+        message=message,
+        userMessage=message,
+        error=error,
+    )
+
+
+def _outOfScope(keys: List[ChangeKey]) -> FailureException:
+    return FailureException(
+        level=LogLevel.NOT_FOUND,
+        message=f"Sync push touches {len(keys)} row(s) outside the caller's scope: {keys[:5]}.",
+        userMessage="Some pushed rows are not yours, or point at rows that are not yours.",
+    )
+
+
+def _coerce(column: Column, value: Any) -> Any:
+    """JSON gives dates, UUIDs and enums as strings; the column types want Python objects."""
+    if not isinstance(value, str):
+        return value
+    try:
+        pythonType = column.type.python_type
+    except NotImplementedError:
+        return value
+    try:
+        if pythonType is datetime:
+            moment = datetime.fromisoformat(value)
+            if moment.tzinfo is not None:  # stored as naive UTC
+                moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+            return moment
+        if pythonType is date:
+            return date.fromisoformat(value)
+        if pythonType is uuid.UUID:
+            return uuid.UUID(value)
+        if issubclass(pythonType, enum.Enum):
+            return pythonType(value)
+    except ValueError as e:
+        raise _invalid(f"Invalid value for {column.table.name}.{column.name}: {value!r}.", e)
+    return value
+
+
+def _columnValues(table: Table, data: Dict[str, Any]) -> Dict[str, Any]:
+    values = {}
+    for name, value in data.items():
+        column = table.c.get(name)
+        if column is None or column.primary_key:
+            raise _invalid(f"{table.name} has no writable column {name!r}.")
+        if name in SERVER_COLUMNS:
+            raise _invalid(f"{table.name}.{name} is set by the server.")
+        values[name] = _coerce(column, value)
+    return values
+
+
+def _change(key: ChangeKey, version: int, row: Optional[dict]) -> dict:
+    tableName, entityId = key
+    if row is None:
+        return {"entity": tableName, "id": entityId, "version": version, "op": "delete"}
+    return {"entity": tableName, "id": entityId, "version": version, "op": "upsert", "data": row}
+
+
+# New rows are stamped as the pushing user's; see ``scope``.
+_OWNER_COLUMNS = {"projects": "owner_id", "tasks": "assigned_to"}
+
+
+class SyncService:
+    """Delta sync over the change log: pull what changed after a version, push with a base version.
+
+    Both work on the rows ``userId`` owns or is assigned (see ``scope``).
+    Pull cost follows the number of that user's changed rows: one indexed
+    range scan of ``sync_changes`` plus one primary-key lookup per synced
+    table on the page.
+    """
+
+    MAX_PUSH_ATTEMPTS = 3
+
+    def __init__(self, session: Session, userId: uuid.UUID):
+        self._session = session
+        self._userId = userId
+
+    def pull(self, since: int, limit: int) -> dict:
+        if since and since < purgedThrough(self._session):
+            # Tombstones this client has not seen are gone; it has to start over from 0.
+            return {"changes": [], "cursor": 0, "has_more": True, "reset": True}
+
+        rows = self._session.execute(
+            select(changes.c.entity_type, changes.c.entity_id, changes.c.version, changes.c.deleted)
+            .where(
+                changes.c.audience.in_([self._userId, EVERYONE]),
+                changes.c.version > since,
+            )
+            .order_by(changes.c.version)
+            .limit(limit + 1)
+        ).all()
+        hasMore = len(rows) > limit
+        rows = rows[:limit]
+        data = self._rows((row.entity_type, row.entity_id) for row in rows if not row.deleted)
+
+        page = []
+        for tableName, entityId, version, deleted in rows:
+            key = (tableName, entityId)
+            if deleted:
+                page.append(_change(key, version, None))
+            elif key in data:
+                page.append(_change(key, version, data[key]))
+            # else: deleted after the log was read; its tombstone has a later version.
+        return {
+            "changes": page,
+            "cursor": rows[-1].version if rows else since,
+            "has_more": hasMore,
+            "reset": False,
+        }
+
+    def push(self, items: List[SyncPushChangeModel]) -> dict:
+        """Apply the changes whose ``base_version`` is current and report the rest as conflicts.
+
+        Applied changes commit together. A concurrent writer that gets in
+        between the version check and the commit makes the commit fail, and
+        the push is re-evaluated against the new versions. Rows that are
+        not the caller's, before or after the change, fail the whole push.
+        """
+        keys = [(item.entity.value, item.id) for item in items]
+        if len(set(keys)) != len(keys):
+            raise _invalid("A push may change each row only once.")
+        for _ in range(self.MAX_PUSH_ATTEMPTS):
+            try:
+                return self._push(items, keys)
+            except StaleVersionError:
+                self._session.rollback()
+        raise FailureException(
+            type=ExceptionType.DATABASE,
+            level=LogLevel.WARNING,
+            message=f"Sync push of {len(items)} change(s) kept losing to concurrent writers.",
+            userMessage="The server is busy; please retry the sync.",
+        )
+
+    def _push(self, items: List[SyncPushChangeModel], keys: List[ChangeKey]) -> dict:
+        session = self._session
+        objects = self._objects(keys)
+        self._requireHeld(objects)
+        current = currentVersions(session, keys)
+        versions = {key: current[key][0] if key in current else None for key in keys}
+        applied: List[Tuple[SyncPushChangeModel, ChangeKey]] = []
+        conflicted: List[Tuple[SyncPushChangeModel, ChangeKey]] = []
+        for item, key in zip(items, keys):
+            (applied if versions[key] == item.base_version else conflicted).append((item, key))
+
+        serverRows = self._rows(key for _, key in conflicted if key in current)
+        conflicts = []
+        for item, key in conflicted:
+            server = None
+            if key in current:
+                version, deleted = current[key]
+                server = _change(key, version, None if deleted else serverRows.get(key))
+            conflicts.append(
+                {
+                    "entity": key[0],
+                    "id": key[1],
+                    "base_version": item.base_version,
+                    "server": server,
+                }
+            )
+
+        upserts = {
+            key: _columnValues(SYNCED_TABLES[key[0]].__table__, item.data)
+            for item, key in applied
+            if item.op is not SyncOp.delete
+        }
+        # Parents pushed alongside are checked with the rest after the flush.
+        self._requireHeld(
+            (parentTable, values[column])
+            for key, values in upserts.items()
+            for column, parentTable in PARENTS.get(key[0], {}).items()
+            if values.get(column) is not None and (parentTable, values[column]) not in upserts
+        )
+        for item, key in applied:
+            model = SYNCED_TABLES[key[0]]
+            obj = objects.get(key)
+            if key not in upserts:
+                if obj is not None:
+                    session.delete(obj)
+                continue
+            values = upserts[key]
+            if obj is None:
+                if key[0] in _OWNER_COLUMNS:
+                    values[_OWNER_COLUMNS[key[0]]] = self._userId
+                session.add(model(id=item.id, **values))
+            else:
+                for name, value in values.items():
+                    setattr(obj, name, value)
+        expectVersions(session, {key: versions[key] for _, key in applied})
+        session.info.pop(ASSIGNED_VERSIONS, None)
+        try:
+            session.flush()
+            # Where the rows ended up: a task moved into someone else's project is not ours.
+            self._requireHeld(upserts)
+            session.commit()
+        except IntegrityError as e:
+            session.rollback()
+            raise _invalid("The pushed rows violate a constraint (missing parent row?).", e)
+        except FailureException:
+            session.rollback()
+            raise
+
+        assigned = session.info.pop(ASSIGNED_VERSIONS, {})
+        return {
+            "applied": [
+                {"entity": key[0], "id": key[1], "version": assigned.get(key, versions[key])}
+                for _, key in applied
+            ],
+            "conflicts": conflicts,
+        }
+
+    def _requireHeld(self, keys: Iterable[ChangeKey]) -> None:
+        """Fail unless the caller holds each of these existing rows."""
+        outside = []
+        for tableName, ids in self._byTable(keys).items():
+            held = holders(self._session, tableName, ids)
+            outside.extend(
+                (tableName, entityId)
+                for entityId in ids
+                if self._userId not in held.get(entityId, ())
+            )
+        if outside:
+            raise _outOfScope(outside)
+
+    def _byTable(self, keys: Iterable[ChangeKey]) -> Dict[str, List[uuid.UUID]]:
+        byTable: Dict[str, List[uuid.UUID]] = {}
+        for tableName, entityId in keys:
+            byTable.setdefault(tableName, []).append(entityId)
+        return byTable
+
+    def _rows(self, keys: Iterable[ChangeKey]) -> Dict[ChangeKey, dict]:
+        """Current column values, one query per table and chunk."""
+        rows = {}
+        for tableName, ids in self._byTable(keys).items():
+            table = SYNCED_TABLES[tableName].__table__
+            for start in range(0, len(ids), _CHUNK):
+                stmt = select(table).where(table.c.id.in_(ids[start:start + _CHUNK]))
+                for row in self._session.execute(stmt).mappings():
+                    rows[(tableName, row["id"])] = dict(row)
+        return rows
+
+    def _objects(self, keys: Iterable[ChangeKey]) -> Dict[ChangeKey, Any]:
+        objects = {}
+        for tableName, ids in self._byTable(keys).items():
+            model = SYNCED_TABLES[tableName]
+            for start in range(0, len(ids), _CHUNK):
+                for obj in self._session.scalars(
+                    select(model).where(model.id.in_(ids[start:start + _CHUNK]))
+                ):
+                    objects[(tableName, obj.id)] = obj
+        return objects
@@ -0,0 +1,171 @@
+import csv
+import io
+import zlib
+from datetime import date, datetime
+from enum import Enum
+from itertools import chain
+from typing import (Any, AsyncIterator, Iterable, Iterator, List, Optional,
+                    Sequence, Tuple)
+
+import orjson
+from fastapi import Request
+from fastapi.logger import logger
+from sqlalchemy import Row, Select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import StreamingResponse
+
+from src.core.utils.serialization import (ORJSON_OPTIONS, RowSerializer,
+                                          iterJsonArray)
+
+EXPORT_BATCH_SIZE = 1000
+
+_NDJSON_OPTIONS = ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+
+
+class ExportFormat(str, Enum):
+    json = "json"
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.json: "application/json",
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+
+def streamBatches(
+    session: Session, stmt: Select, batchSize: int = EXPORT_BATCH_SIZE
+) -> Iterator[List[Row]]:
+    """Run ``stmt`` on a server-side cursor and yield ``batchSize`` rows at a time.
+
+    Only one batch is ever held in memory; the cursor is closed when the
+    generator finishes or is closed early (client went away).
+    """
+    result = session.execute(stmt.execution_options(stream_results=True, yield_per=batchSize))
+    try:
+        for partition in result.partitions():
+            yield partition
+    finally:
+        result.close()
+
+
+def ndjsonChunks(batches: Iterable[Sequence[Row]], serializer: RowSerializer) -> Iterator[bytes]:
+    for batch in batches:
+        yield b"".join(orjson.dumps(serializer(row), option=_NDJSON_OPTIONS) for row in batch)
+
+
+def _csvCell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, dict)):
+        return orjson.dumps(value, option=ORJSON_OPTIONS).decode()
+    return value
+
+
+def csvChunks(batches: Iterable[Sequence[Row]], fields: Tuple[str, ...]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    for batch in batches:
+        writer.writerows([_csvCell(value) for value in row] for row in batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Header only: the export was empty.
+        yield buffer.getvalue().encode("utf-8")
+
+
+def jsonArrayChunks(batches: Iterable[Sequence[Row]], serializer: RowSerializer) -> Iterator[bytes]:
+    return iterJsonArray(chain.from_iterable(batches), serializer, batchSize=EXPORT_BATCH_SIZE)
+
+
+def encodeBatches(
+    batches: Iterable[Sequence[Row]],
+    exportFormat: ExportFormat,
+    fields: Tuple[str, ...],
+    serializer: RowSerializer,
+) -> Iterator[bytes]:
+    if exportFormat is ExportFormat.csv:
+        return csvChunks(batches, fields)
+    if exportFormat is ExportFormat.ndjson:
+        return ndjsonChunks(batches, serializer)
+    return jsonArrayChunks(batches, serializer)
+
+
+def gzipChunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip a chunk stream on the fly, sync-flushing so every chunk reaches the client."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def acceptsGzip(request: Request) -> bool:
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+async def untilDisconnected(
+    request: Request, chunks: Iterator[bytes], source: Optional[Iterator] = None
+) -> AsyncIterator[bytes]:
+    """Pull ``chunks`` in the threadpool and stop as soon as the client disconnects.
+
+    ``source`` (the row generator feeding ``chunks``) is closed explicitly on
+    the way out, so its ``finally`` releases the server-side cursor right away
+    instead of whenever the generator is garbage collected.
+    """
+    done = object()
+    try:
+        while True:
+            chunk = await run_in_threadpool(next, chunks, done)
+            if chunk is done:
+                break
+            if await request.is_disconnected():
+                logger.info(f"Export to {request.url.path} aborted: client disconnected")
+                break
+            yield chunk
+    finally:
+        await run_in_threadpool(_closeAll, chunks, source)
+
+
+def _closeAll(*generators: Optional[Iterator]) -> None:
+    for generator in generators:
+        close = getattr(generator, "close", None)
+        if close is not None:
+            close()
+
+
+def exportResponse(
+    request: Request,
+    batches: Iterator[Sequence[Row]],
+    exportFormat: ExportFormat,
+    fields: Tuple[str, ...],
+    serializer: RowSerializer,
+    filename: str,
+) -> StreamingResponse:
+    chunks = encodeBatches(batches, exportFormat, fields, serializer)
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}.{exportFormat.value}"',
+        "Vary": "Accept-Encoding",
+    }
+    if acceptsGzip(request):
+        chunks = gzipChunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        untilDisconnected(request, chunks, batches),
+        media_type=MEDIA_TYPES[exportFormat],
+        headers=headers,
+    )
@@ -0,0 +1,115 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import Request
+from starlette.responses import Response
+
+from src.config.exceptions.failure_exception import (ExceptionType,
+                                                     FailureException,
+                                                     LogLevel)
+
+CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str
+    lastModified: Optional[datetime] = None
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if self.lastModified is not None:
+            headers["Last-Modified"] = httpDate(self.lastModified)
+        return headers
+
+
+class PreconditionFailure(FailureException):
+    """A write refused by its preconditions: 412 (stale If-Match) or 428 (If-Match missing)."""
+
+    def __init__(self, statusCode: int, message: str, headers: Dict[str, str]):
+        super().__init__(
+            type=ExceptionType.VALIDATION,
+            level=LogLevel.INFO,
+            message=message,
+            userMessage=message,
+        )
+        self.statusCode = statusCode
+        self.headers = headers
+
+
+def _utc(value: datetime) -> datetime:
+    # updated_at columns store naive UTC (datetime.utcnow).
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def httpDate(value: datetime) -> str:
+    return format_datetime(_utc(value).replace(microsecond=0), usegmt=True)
+
+
+def validatorsFor(*parts: Any, lastModified: Optional[datetime] = None) -> Validators:
+    """Weak validators for a resource; ``parts`` must change whenever the representation does."""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=12).hexdigest()
+    return Validators(etag=f'W/"{digest}"', lastModified=lastModified)
+
+
+def resourceHeaders(kind: str, id: Any, updatedAt: Optional[datetime]) -> Dict[str, str]:
+    """Validator headers of a single row; none if its ``updated_at`` was never set."""
+    if updatedAt is None:
+        return {}
+    return validatorsFor(kind, id, updatedAt, lastModified=updatedAt).headers
+
+
+def _opaqueTags(header: str) -> List[str]:
+    return [tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()]
+
+
+def hasConditionalHeaders(request: Request) -> bool:
+    return any(name in request.headers for name in CONDITIONAL_HEADERS)
+
+
+def isNotModified(request: Request, validators: Validators) -> bool:
+    ifNoneMatch = request.headers.get("if-none-match")
+    if ifNoneMatch is not None:
+        # Weak comparison, and If-None-Match wins over If-Modified-Since (RFC 9110 13.2.2).
+        tags = _opaqueTags(ifNoneMatch)
+        return "*" in tags or validators.etag.removeprefix("W/") in tags
+
+    ifModifiedSince = request.headers.get("if-modified-since")
+    if ifModifiedSince and validators.lastModified is not None:
+        try:
+            since = parsedate_to_datetime(ifModifiedSince)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return _utc(validators.lastModified).replace(microsecond=0) <= since
+    return False
+
+
+def notModified(validators: Validators) -> Response:
+    return Response(status_code=304, headers=validators.headers)
+
+
+def requireIfMatch(request: Request, current: Validators, required: bool = False) -> None:
+    """Reject a write made against a stale representation.
+
+    Our validators are weak, so If-Match is compared on the opaque tag; a
+    client that sends no If-Match opts out of the check unless ``required``.
+    """
+    ifMatch = request.headers.get("if-match")
+    if ifMatch is None:
+        if required:
+            raise PreconditionFailure(
+                428, "Send If-Match with the ETag of the version you changed.", current.headers
+            )
+        return
+    tags = _opaqueTags(ifMatch)
+    if "*" not in tags and current.etag.removeprefix("W/") not in tags:
+        raise PreconditionFailure(
+            412, "The resource was modified by someone else; reload it and retry.", current.headers
+        )
@@ -0,0 +1,24 @@
+from typing import Callable, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class LazyASGIApp:
+    """ASGI app built by ``factory`` on its first request.
+
+    Lets optional subsystems with heavy imports (GraphQL) stay out of app
+    startup; the first request to the route pays the import instead.
+    """
+
+    def __init__(self, factory: Callable[[], ASGIApp]):
+        self._factory = factory
+        self._app: Optional[ASGIApp] = None
+
+    @property
+    def isLoaded(self) -> bool:
+        return self._app is not None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self._app is None:
+            self._app = self._factory()
+        await self._app(scope, receive, send)
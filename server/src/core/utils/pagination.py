@@ -0,0 +1,66 @@
+import base64
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Optional, Sequence
+
+import orjson
+
+from src.config.exceptions.failure_exception import (ExceptionType,
+                                                     FailureException,
+                                                     LogLevel)
+
+
+def encodeCursor(values: Sequence[Any]) -> str:
+    """Opaque keyset cursor for the last row of a page, e.g. ``(created_at, id)``."""
+    return base64.urlsafe_b64encode(orjson.dumps(list(values))).rstrip(b"=").decode("ascii")
+
+
+def _invalidCursor(error: Optional[Exception] = None) -> FailureException:
+    return FailureException(
+        type=ExceptionType.VALIDATION,
+        level=LogLevel.INFO,
+        message="Invalid pagination cursor.",
+        userMessage="The pagination cursor is invalid.",
+        error=error,
+    )
+
+
+def decodeCursor(
+    cursor: Optional[str],
+    parsers: Sequence[Callable[[str], Any]] = (datetime.fromisoformat, uuid.UUID),
+) -> Optional[list]:
+    """Values of a cursor from ``encodeCursor``, each parsed by the matching entry of ``parsers``.
+
+    The defaults match ``buildPage``'s ``(created_at, id)`` keys. Anything else a client
+    sends back, whatever its shape, is a validation error rather than a failed query.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = orjson.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, orjson.JSONDecodeError) as e:
+        raise _invalidCursor(e)
+    if not isinstance(values, list) or len(values) != len(parsers):
+        raise _invalidCursor()
+    if not all(isinstance(value, str) for value in values):
+        raise _invalidCursor()
+    try:
+        return [parse(value) for parse, value in zip(parsers, values)]
+    except ValueError as e:
+        raise _invalidCursor(e)
+
+
+def buildPage(
+    rows: Sequence[Sequence[Any]],
+    limit: int,
+    serializer,
+    cursorKeys: Sequence[str] = ("created_at", "id"),
+) -> dict:
+    """Serialize a page fetched with ``limit + 1`` rows; the extra row only signals a next page."""
+    items = [serializer(row) for row in rows[:limit]]
+    nextCursor = None
+    if len(rows) > limit and items:
+        last = items[-1]
+        nextCursor = encodeCursor([last[key] for key in cursorKeys])
+    return {"items": items, "next_cursor": nextCursor}
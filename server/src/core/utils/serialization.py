@@ -0,0 +1,81 @@
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, List, Sequence, Tuple, Type
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import Response
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+RowSerializer = Callable[[Sequence[Any]], dict]
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered by orjson; UUID, datetime, date and str enums need no conversion."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class RawJSONResponse(Response):
+    """Response for bodies that are already JSON-encoded bytes."""
+
+    media_type = "application/json"
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
+@lru_cache(maxsize=None)
+def schemaFields(schema: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(schema.model_fields)
+
+
+@lru_cache(maxsize=None)
+def compileRowSerializer(fields: Tuple[str, ...]) -> RowSerializer:
+    """Build (once per field tuple) a function turning a positional Core row into a dict.
+
+    Rows must be selected in ``fields`` order; no per-row validation or key lookup happens.
+    """
+    keys = fields
+
+    def serialize(row: Sequence[Any]) -> dict:
+        return dict(zip(keys, row))
+
+    return serialize
+
+
+def serializerFor(schema: Type[BaseModel]) -> RowSerializer:
+    return compileRowSerializer(schemaFields(schema))
+
+
+def dumpRows(rows: Iterable[Sequence[Any]], serializer: RowSerializer) -> bytes:
+    return orjson.dumps([serializer(row) for row in rows], option=ORJSON_OPTIONS)
+
+
+def iterJsonArray(
+    rows: Iterable[Sequence[Any]], serializer: RowSerializer, batchSize: int = 1000
+) -> Iterator[bytes]:
+    """Encode rows as one JSON array, ``batchSize`` rows per yielded chunk."""
+    yield b"["
+    first = True
+    batch: List[dict] = []
+    for row in rows:
+        batch.append(serializer(row))
+        if len(batch) >= batchSize:
+            chunk = orjson.dumps(batch, option=ORJSON_OPTIONS)[1:-1]
+            yield chunk if first else b"," + chunk
+            first = False
+            batch = []
+    if batch:
+        chunk = orjson.dumps(batch, option=ORJSON_OPTIONS)[1:-1]
+        yield chunk if first else b"," + chunk
+    yield b"]"
+
+
+@lru_cache(maxsize=None)
+def schemaColumns(table, schema: Type[BaseModel]) -> tuple:
+    """Core columns of ``table`` in the field order of ``schema``, for use with ``serializerFor``."""
+    return tuple(table.c[name] for name in schemaFields(schema))
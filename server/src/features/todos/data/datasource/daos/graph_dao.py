@@ -0,0 +1,80 @@
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.features.todos.data.datasource.tables.milestone_table import \
+    MilestoneTable
+from src.features.todos.data.datasource.tables.project_table import \
+    ProjectTable
+from src.features.todos.data.datasource.tables.tag_table import (
+    EntityTagTable, TagTable)
+from src.features.todos.data.datasource.tables.task_log_table import \
+    TaskLogTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.features.todos.data.datasource.tables.user_table import UserTable
+
+Row = Dict[str, Any]
+
+# Core tables: batch loads never need ORM identity/relationship machinery.
+tasks = TaskTable.__table__
+projects = ProjectTable.__table__
+users = UserTable.__table__
+milestones = MilestoneTable.__table__
+taskLogs = TaskLogTable.__table__
+tags = TagTable.__table__
+entityTags = EntityTagTable.__table__
+
+
+class GraphDao:
+    """One ``IN (...)`` query per relationship for a whole batch of keys."""
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def listTasks(
+        self, projectId: Optional[Any] = None, limit: int = 50, offset: int = 0
+    ) -> List[Row]:
+        stmt = select(tasks).order_by(tasks.c.created_at, tasks.c.id).limit(limit).offset(offset)
+        if projectId is not None:
+            stmt = stmt.where(tasks.c.project_id == projectId)
+        return [dict(row) for row in self._session.execute(stmt).mappings()]
+
+    def projectsByIds(self, ids: Sequence[Any]) -> List[Optional[Row]]:
+        return self._byIds(projects, ids)
+
+    def usersByIds(self, ids: Sequence[Any]) -> List[Optional[Row]]:
+        return self._byIds(users, ids)
+
+    def milestonesByTaskIds(self, taskIds: Sequence[Any]) -> List[List[Row]]:
+        return self._groupedBy(milestones, milestones.c.task_id, taskIds)
+
+    def logsByTaskIds(self, taskIds: Sequence[Any]) -> List[List[Row]]:
+        return self._groupedBy(taskLogs, taskLogs.c.task_id, taskIds, taskLogs.c.date)
+
+    def tagsByTaskIds(self, taskIds: Sequence[Any]) -> List[List[Row]]:
+        stmt = (
+            select(entityTags.c.entity_id, tags)
+            .join(tags, tags.c.id == entityTags.c.tag_id)
+            .where(entityTags.c.entity_type == "task", entityTags.c.entity_id.in_(taskIds))
+        )
+        grouped: Dict[Any, List[Row]] = defaultdict(list)
+        for row in self._session.execute(stmt).mappings():
+            row = dict(row)
+            grouped[row.pop("entity_id")].append(row)
+        return [grouped.get(id, []) for id in taskIds]
+
+    def _byIds(self, table, ids: Sequence[Any]) -> List[Optional[Row]]:
+        rows = self._session.execute(select(table).where(table.c.id.in_(ids))).mappings()
+        byId = {row["id"]: dict(row) for row in rows}
+        return [byId.get(id) for id in ids]
+
+    def _groupedBy(self, table, column, keys: Sequence[Any], orderBy=None) -> List[List[Row]]:
+        stmt = select(table).where(column.in_(keys))
+        if orderBy is not None:
+            stmt = stmt.order_by(orderBy)
+        grouped: Dict[Any, List[Row]] = defaultdict(list)
+        for row in self._session.execute(stmt).mappings():
+            grouped[row[column.key]].append(dict(row))
+        return [grouped.get(key, []) for key in keys]
@@ -0,0 +1,72 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import Row, func, select, tuple_
+from sqlalchemy.orm import Session
+
+from src.core.utils.serialization import schemaColumns
+from src.features.todos.data.datasource.daos.row_mapping import rowToDict
+from src.features.todos.data.datasource.tables.project_table import \
+    ProjectTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.features.todos.data.models.project_model import ProjectModel
+
+projects = ProjectTable.__table__
+
+
+class ProjectDao:
+    def __init__(self, session: Session):
+        self._session = session
+
+    def getProjectDetail(self, projectId) -> Optional[Dict[str, Any]]:
+        project = self._session.execute(
+            select(ProjectTable.__table__).where(ProjectTable.id == projectId)
+        ).mappings().first()
+        if project is None:
+            return None
+
+        statusCounts = self._session.execute(
+            select(TaskTable.status, func.count())
+            .where(TaskTable.project_id == projectId)
+            .group_by(TaskTable.status)
+        ).all()
+
+        detail = rowToDict(project)
+        detail["task_counts"] = {status or "none": count for status, count in statusCounts}
+        return detail
+
+    def listProjects(
+        self, limit: int, after: Optional[Sequence] = None, ownerId=None
+    ) -> List[Row]:
+        stmt = select(*schemaColumns(projects, ProjectModel)).order_by(
+            projects.c.created_at, projects.c.id
+        )
+        if ownerId is not None:
+            stmt = stmt.where(projects.c.owner_id == ownerId)
+        if after:
+            stmt = stmt.where(
+                tuple_(projects.c.created_at, projects.c.id)
+                > tuple_(*after)
+            )
+        return self._session.execute(stmt.limit(limit)).all()
+
+    def getProject(self, projectId) -> Optional[Row]:
+        return self._session.execute(
+            select(*schemaColumns(projects, ProjectModel)).where(projects.c.id == projectId)
+        ).first()
+
+    def getProjectVersion(self, projectId) -> Optional[Row]:
+        """``updated_at`` alone, or None when there is no such project."""
+        return self._session.execute(
+            select(projects.c.updated_at).where(projects.c.id == projectId)
+        ).first()
+
+    def projectsVersion(self, ownerId=None) -> Row:
+        stmt = select(
+            func.count().label("count"), func.max(projects.c.updated_at).label("updated_at")
+        )
+        if ownerId is not None:
+            stmt = stmt.where(projects.c.owner_id == ownerId)
+        return self._session.execute(stmt).one()
+
+    def lockProject(self, projectId) -> Optional[ProjectTable]:
+        return self._session.get(ProjectTable, projectId, with_for_update=True)
@@ -0,0 +1,19 @@
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Mapping
+
+
+def toJsonable(value: Any) -> Any:
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def rowToDict(row: Mapping[str, Any]) -> Dict[str, Any]:
+    return {key: toJsonable(value) for key, value in row.items()}
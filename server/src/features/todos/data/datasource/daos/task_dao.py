@@ -0,0 +1,100 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import Row, Select, func, select, tuple_
+from sqlalchemy.orm import Session
+
+from src.core.utils.serialization import schemaColumns
+from src.features.todos.data.datasource.daos.row_mapping import rowToDict
+from src.features.todos.data.datasource.tables.task_log_table import \
+    TaskLogTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.features.todos.data.models.task_log_model import TaskLogModel
+from src.features.todos.data.models.task_model import TaskModel
+
+tasks = TaskTable.__table__
+taskLogs = TaskLogTable.__table__
+
+BOARD_COLUMNS = (
+    TaskTable.id,
+    TaskTable.title,
+    TaskTable.status,
+    TaskTable.priority,
+    TaskTable.type,
+    TaskTable.parent_task_id,
+    TaskTable.assigned_to,
+    TaskTable.progress_percentage,
+    TaskTable.estimated_hours,
+    TaskTable.due_date,
+    TaskTable.labels,
+    TaskTable.updated_at,
+)
+
+OPEN_TASK_COLUMNS = BOARD_COLUMNS + (TaskTable.project_id,)
+
+
+class TaskDao:
+    def __init__(self, session: Session):
+        self._session = session
+
+    def getProjectBoard(self, projectId) -> List[Dict[str, Any]]:
+        stmt = (
+            select(*BOARD_COLUMNS)
+            .where(TaskTable.project_id == projectId)
+            .order_by(TaskTable.status, TaskTable.priority, TaskTable.created_at)
+        )
+        return [rowToDict(row) for row in self._session.execute(stmt).mappings()]
+
+    def getUserOpenTasks(self, userId) -> List[Dict[str, Any]]:
+        stmt = (
+            select(*OPEN_TASK_COLUMNS)
+            .where(TaskTable.assigned_to == userId, TaskTable.completed_at.is_(None))
+            .order_by(TaskTable.due_date.asc().nulls_last(), TaskTable.priority)
+        )
+        return [rowToDict(row) for row in self._session.execute(stmt).mappings()]
+
+    def projectTasksQuery(self, projectId) -> Select:
+        """Core SELECT of ``TaskModel`` columns for a project, in keyset order."""
+        return (
+            select(*schemaColumns(tasks, TaskModel))
+            .where(tasks.c.project_id == projectId)
+            .order_by(tasks.c.created_at, tasks.c.id)
+        )
+
+    def projectLogsQuery(self, projectId) -> Select:
+        """Core SELECT of ``TaskLogModel`` columns for every task of a project."""
+        return (
+            select(*schemaColumns(taskLogs, TaskLogModel))
+            .join(tasks, tasks.c.id == taskLogs.c.task_id)
+            .where(tasks.c.project_id == projectId)
+            .order_by(taskLogs.c.task_id, taskLogs.c.date, taskLogs.c.id)
+        )
+
+    def listProjectTasks(self, projectId, limit: int, after: Optional[Sequence] = None) -> List[Row]:
+        stmt = self.projectTasksQuery(projectId)
+        if after:
+            stmt = stmt.where(
+                tuple_(tasks.c.created_at, tasks.c.id)
+                > tuple_(*after)
+            )
+        return self._session.execute(stmt.limit(limit)).all()
+
+    def getTask(self, taskId) -> Optional[Row]:
+        return self._session.execute(
+            select(*schemaColumns(tasks, TaskModel)).where(tasks.c.id == taskId)
+        ).first()
+
+    def getTaskVersion(self, taskId) -> Optional[Row]:
+        """Only ``updated_at``: enough to answer a conditional GET without reading the row.
+
+        None when there is no such task; a row whose ``updated_at`` is NULL has no validator.
+        """
+        return self._session.execute(select(tasks.c.updated_at).where(tasks.c.id == taskId)).first()
+
+    def projectTasksVersion(self, projectId) -> Row:
+        return self._session.execute(
+            select(func.count().label("count"), func.max(tasks.c.updated_at).label("updated_at"))
+            .where(tasks.c.project_id == projectId)
+        ).one()
+
+    def lockTask(self, taskId) -> Optional[TaskTable]:
+        return self._session.get(TaskTable, taskId, with_for_update=True)
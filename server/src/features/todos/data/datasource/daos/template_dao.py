@@ -0,0 +1,329 @@
+import hashlib
+import re
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import (ColumnElement, Date, String, Uuid, case, cast, func,
+                        insert, literal, select)
+from sqlalchemy.orm import Session
+
+from src.config.exceptions.failure_exception import (ExceptionType,
+                                                     FailureException,
+                                                     LogLevel)
+from src.core.realtime.hub import projectChannel, userChannel
+from src.core.realtime.publishing import requestResync
+from src.core.sync.changelog import recordChanges
+from src.features.todos.data.datasource.tables.milestone_table import \
+    MilestoneTable
+from src.features.todos.data.datasource.tables.phase_table import PhaseTable
+from src.features.todos.data.datasource.tables.projec_template_table import \
+    ProjectTemplateTable
+from src.features.todos.data.datasource.tables.project_table import \
+    ProjectTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.features.todos.data.datasource.tables.task_template_table import \
+    TaskTemplateTable
+from src.features.todos.domain.enums.priority import PriorityEnum
+
+templates = ProjectTemplateTable.__table__
+phases = PhaseTable.__table__
+taskTemplates = TaskTemplateTable.__table__
+projects = ProjectTable.__table__
+tasks = TaskTable.__table__
+milestones = MilestoneTable.__table__
+
+# "Project Setup (Days 1-2)" -> "Project Setup"
+_DAY_RANGE = re.compile(r"\s*\([^)]*\)\s*$")
+
+
+def _priority(value: Any) -> str:
+    value = str(value or "").lower()
+    return value if value in PriorityEnum.__members__ else PriorityEnum.medium.value
+
+
+def _md5(value: Optional[str]) -> Optional[str]:
+    return None if value is None else hashlib.md5(value.encode()).hexdigest()
+
+
+class TemplateDao:
+    """Roadmap templates: bulk import, and set-based cloning into a project.
+
+    Instantiation never loads template rows into Python. Every clone gets the
+    id ``md5(seed || kind || template id)``, so a child's parent id is known
+    inside the same ``INSERT ... SELECT`` that creates it, and a 500-task
+    template costs three statements rather than 500 ORM flushes.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def importRoadmap(self, document: Dict[str, Any]) -> uuid.UUID:
+        """Store a parsed ``roadmap.yaml`` document; returns the new template id."""
+        project = document.get("project") or {}
+        phaseDocs = document.get("phases") or []
+        if not phaseDocs:
+            raise FailureException(
+                type=ExceptionType.VALIDATION,
+                level=LogLevel.WARNING,
+                message="Roadmap has no phases.",
+                userMessage="The roadmap file does not define any phases.",
+            )
+
+        templateId = uuid.uuid4()
+        phaseRows: List[Dict[str, Any]] = []
+        taskRows: List[Dict[str, Any]] = []
+        for phaseIndex, phaseDoc in enumerate(phaseDocs):
+            phaseId = uuid.uuid4()
+            phaseRows.append(
+                {
+                    "id": phaseId,
+                    "template_id": templateId,
+                    "title": phaseDoc.get("name") or f"Phase {phaseIndex + 1}",
+                    "duration_weeks": phaseDoc.get("duration_weeks") or 1,
+                    "order_index": phaseIndex,
+                    "description": phaseDoc.get("description"),
+                }
+            )
+            for weekDoc in phaseDoc.get("weeks") or []:
+                for categoryDoc in weekDoc.get("categories") or []:
+                    category = _DAY_RANGE.sub("", categoryDoc.get("category") or "") or None
+                    for taskDoc in categoryDoc.get("tasks") or []:
+                        taskId = uuid.uuid4()
+                        shared = {
+                            "phase_id": phaseId,
+                            "default_priority": _priority(taskDoc.get("priority")),
+                            "week_number": weekDoc.get("week_number"),
+                            "category": category,
+                        }
+                        taskRows.append(
+                            {
+                                **shared,
+                                "id": taskId,
+                                "parent_template_id": None,
+                                "title": taskDoc.get("title"),
+                                "description": taskDoc.get("description"),
+                                "estimated_hours": taskDoc.get("estimated_hours"),
+                                "order_index": len(taskRows),
+                            }
+                        )
+                        for subtask in taskDoc.get("subtasks") or []:
+                            taskRows.append(
+                                {
+                                    **shared,
+                                    "id": uuid.uuid4(),
+                                    "parent_template_id": taskId,
+                                    "title": str(subtask),
+                                    "description": None,
+                                    "estimated_hours": None,
+                                    "order_index": len(taskRows),
+                                }
+                            )
+
+        timeline = document.get("timeline") or {}
+        self._session.execute(
+            insert(templates).values(
+                id=templateId,
+                name=project.get("name") or "Untitled roadmap",
+                phases=[
+                    {"title": row["title"], "goals": doc.get("goals") or []}
+                    for row, doc in zip(phaseRows, phaseDocs)
+                ],
+                estimated_duration=timeline.get("total_weeks")
+                or sum(row["duration_weeks"] for row in phaseRows),
+                category=project.get("type"),
+                recommended_tools=document.get("technology_stack"),
+            )
+        )
+        # One executemany per table; parents first for engines that check FKs per statement.
+        self._session.execute(insert(phases), phaseRows)
+        if taskRows:
+            self._session.execute(
+                insert(taskTemplates), [row for row in taskRows if not row["parent_template_id"]]
+            )
+            subtasks = [row for row in taskRows if row["parent_template_id"]]
+            if subtasks:
+                self._session.execute(insert(taskTemplates), subtasks)
+        return templateId
+
+    def instantiateProject(
+        self,
+        templateId,
+        name: Optional[str] = None,
+        ownerId=None,
+        startDate: Optional[date] = None,
+    ) -> uuid.UUID:
+        """Clone a template into a project: one phase task plus milestone per phase,
+        and one task per task template (subtasks stay children of their task).
+
+        Due dates come from the week numbers relative to ``startDate``.
+        """
+        rows = self._session.execute(
+            select(templates.c.name, templates.c.category, phases.c.id, phases.c.duration_weeks)
+            .select_from(templates.outerjoin(phases, phases.c.template_id == templates.c.id))
+            .where(templates.c.id == templateId)
+            .order_by(phases.c.order_index)
+        ).all()
+        if not rows:
+            raise FailureException(
+                level=LogLevel.NOT_FOUND,
+                message=f"Project template {templateId} not found.",
+                userMessage="Project template not found.",
+            )
+        template = rows[0]
+        phaseRows = [row for row in rows if row.id is not None]
+        weekNumbers = self._session.execute(
+            select(taskTemplates.c.week_number)
+            .join(phases, phases.c.id == taskTemplates.c.phase_id)
+            .where(phases.c.template_id == templateId, taskTemplates.c.week_number.is_not(None))
+            .distinct()
+        ).scalars().all()
+
+        startDate = startDate or date.today()
+        phaseEnds: Dict[Any, date] = {}
+        weeks = 0.0
+        for phase in phaseRows:
+            weeks += phase.duration_weeks or 0
+            phaseEnds[phase.id] = _weekEnd(startDate, weeks)
+        weekEnds = {week: _weekEnd(startDate, week) for week in weekNumbers}
+
+        projectId = uuid.uuid4()
+        now = datetime.utcnow()
+        self._prepareIds()
+        seed = projectId.hex
+        self._session.execute(
+            insert(projects).values(
+                id=projectId,
+                name=name or template.name,
+                owner_id=ownerId,
+                category=template.category,
+                status="active",
+                start_date=startDate,
+                end_date=_weekEnd(startDate, weeks) if phaseRows else startDate,
+                progress_percentage=0.0,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+        # Python-side column defaults do not fire for INSERT ... SELECT, so every column is explicit.
+        phaseHours = (
+            select(func.sum(taskTemplates.c.estimated_hours))
+            .where(
+                taskTemplates.c.phase_id == phases.c.id,
+                taskTemplates.c.parent_template_id.is_(None),
+            )
+            .scalar_subquery()
+        )
+        self._session.execute(
+            insert(tasks).from_select(
+                [
+                    "id", "title", "description", "status", "type", "estimated_hours",
+                    "project_id", "assigned_to", "due_date", "progress_percentage",
+                    "created_at", "updated_at",
+                ],
+                select(
+                    _cloneId(seed, "phase", phases.c.id),
+                    phases.c.title,
+                    phases.c.description,
+                    literal("todo"),
+                    literal("phase"),
+                    phaseHours,
+                    literal(projectId, tasks.c.project_id.type),
+                    literal(ownerId, tasks.c.assigned_to.type),
+                    _dateFor(phases.c.id, phaseEnds),
+                    literal(0.0),
+                    literal(now, tasks.c.created_at.type),
+                    literal(now, tasks.c.updated_at.type),
+                ).where(phases.c.template_id == templateId),
+            )
+        )
+        self._session.execute(
+            insert(milestones).from_select(
+                [
+                    "id", "task_id", "title", "target_date", "status", "progress_percentage",
+                    "owner_id", "notes",
+                ],
+                select(
+                    _cloneId(seed, "milestone", phases.c.id),
+                    _cloneId(seed, "phase", phases.c.id),
+                    phases.c.title,
+                    _dateFor(phases.c.id, phaseEnds),
+                    literal("pending"),
+                    literal(0.0),
+                    literal(ownerId, milestones.c.owner_id.type),
+                    phases.c.description,
+                ).where(phases.c.template_id == templateId),
+            )
+        )
+        isSubtask = taskTemplates.c.parent_template_id.is_not(None)
+        self._session.execute(
+            insert(tasks).from_select(
+                [
+                    "id", "title", "description", "status", "priority", "type",
+                    "estimated_hours", "parent_task_id", "project_id", "assigned_to", "due_date",
+                    "progress_percentage", "created_at", "updated_at",
+                ],
+                select(
+                    _cloneId(seed, "task", taskTemplates.c.id),
+                    taskTemplates.c.title,
+                    taskTemplates.c.description,
+                    literal("todo"),
+                    cast(taskTemplates.c.default_priority, tasks.c.priority.type),
+                    case((isSubtask, literal("subtask")), else_=literal("task")),
+                    taskTemplates.c.estimated_hours,
+                    case(
+                        (isSubtask, _cloneId(seed, "task", taskTemplates.c.parent_template_id)),
+                        else_=_cloneId(seed, "phase", taskTemplates.c.phase_id),
+                    ),
+                    literal(projectId, tasks.c.project_id.type),
+                    literal(ownerId, tasks.c.assigned_to.type),
+                    _dateFor(taskTemplates.c.week_number, weekEnds),
+                    literal(0.0),
+                    literal(now, tasks.c.created_at.type),
+                    literal(now, tasks.c.updated_at.type),
+                )
+                .select_from(taskTemplates.join(phases, phases.c.id == taskTemplates.c.phase_id))
+                .where(phases.c.template_id == templateId),
+            )
+        )
+        # The change log cannot see rows written by INSERT ... SELECT or insert().values().
+        recordChanges(self._session, "projects", [projectId])
+        recordChanges(
+            self._session,
+            "tasks",
+            self._session.execute(
+                select(tasks.c.id).where(tasks.c.project_id == projectId)
+            ).scalars().all(),
+        )
+        # Nor can the realtime hooks: the owner's open tasks go out as a fresh snapshot.
+        requestResync(
+            self._session, [projectChannel(projectId), *([userChannel(ownerId)] if ownerId else [])]
+        )
+        return projectId
+
+    def _prepareIds(self) -> None:
+        # PostgreSQL ships md5(); SQLite (tests, local tooling) gets the same function per connection.
+        connection = self._session.connection()
+        if connection.dialect.name == "sqlite":
+            connection.connection.driver_connection.create_function(
+                "md5", 1, _md5, deterministic=True
+            )
+
+
+def _weekEnd(startDate: date, weeks: float) -> date:
+    """Last day of week ``weeks`` counted from ``startDate`` (week 1 ends on day 7)."""
+    return startDate + timedelta(days=round(weeks * 7) - 1)
+
+
+def _cloneId(seed: str, kind: str, templateColumn) -> ColumnElement:
+    return cast(func.md5(literal(f"{seed}:{kind}:") + cast(templateColumn, String)), Uuid())
+
+
+def _dateFor(column, dates: Dict[Any, date]) -> ColumnElement:
+    """CASE mapping a (small) set of keys to bound dates; no dialect date arithmetic needed."""
+    if not dates:
+        return literal(None, Date())
+    return case(
+        {key: literal(value, Date()) for key, value in dates.items()}, value=column
+    )
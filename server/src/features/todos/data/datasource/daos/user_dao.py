@@ -0,0 +1,24 @@
+from typing import Optional
+
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session
+
+from src.core.utils.serialization import schemaColumns
+from src.features.todos.data.datasource.tables.user_table import UserTable
+from src.features.todos.data.models.user_model import UserModel
+
+users = UserTable.__table__
+
+
+class UserDao:
+    def __init__(self, session: Session):
+        self._session = session
+
+    def getUser(self, userId) -> Optional[Row]:
+        return self._session.execute(
+            select(*schemaColumns(users, UserModel)).where(users.c.id == userId)
+        ).first()
+
+    def getUserVersion(self, userId) -> Optional[Row]:
+        """``updated_at`` alone, or None when there is no such user."""
+        return self._session.execute(select(users.c.updated_at).where(users.c.id == userId)).first()
@@ -1,6 +1,7 @@
 import uuid
 
 from sqlalchemy import JSON, UUID, Column, DateTime, Integer, String
+from sqlalchemy.orm import relationship
 
 from src.config.database.base_table import Base
 
@@ -16,4 +17,7 @@ class MarkdownFileTable(Base):
     word_count = Column(Integer)
     linked_tasks = Column(JSON)
     backlinks_count = Column(Integer)
-    frontmatter_data = Column(JSON)
\ No newline at end of file
+    frontmatter_data = Column(JSON)
+
+    source_links = relationship("FileLinkTable", foreign_keys="FileLinkTable.source_file_id", back_populates="source_file")
+    target_files = relationship("FileLinkTable", foreign_keys="FileLinkTable.target_file_id", back_populates="target_file")
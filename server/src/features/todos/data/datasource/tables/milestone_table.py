@@ -1,7 +1,6 @@
 import uuid
 
-from sqlalchemy import (UUID, Column, Date, DateTime, Float, ForeignKey,
-                        Integer, String, Text)
+from sqlalchemy import UUID, Column, Date, Float, ForeignKey, String, Text
 from sqlalchemy.orm import relationship
 
 from src.config.database.base_table import Base
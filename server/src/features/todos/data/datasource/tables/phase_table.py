@@ -18,4 +18,5 @@ class PhaseTable(Base):
     milestone_ids = Column(JSON)
     description = Column(Text)
 
-    template = relationship("ProjectTemplateTable", foreign_keys=[template_id], back_populates="phases")
+    template = relationship("ProjectTemplateTable", foreign_keys=[template_id])
+    task_templates = relationship("TaskTemplateTable", back_populates="phase")
@@ -2,7 +2,7 @@ import uuid
 
 from sqlalchemy import JSON, UUID, Column, Float, String
 
-from server.src.config.database.base_table import Base
+from src.config.database.base_table import Base
 
 
 class ProjectTemplateTable(Base):
@@ -1,15 +1,11 @@
 import uuid
 from datetime import datetime
-from typing import List, Optional
 
-from sqlalchemy import (Boolean, Column, Date, DateTime, Float, ForeignKey,
-                        String, Table, Text)
+from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, String, Text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import relationship
 
 from src.config.database.base_table import Base
-from src.features.todos.data.datasource.tables.task_table import TaskTable
-from src.features.todos.data.datasource.tables.user_table import UserTable
 
 
 class ProjectTable(Base):
@@ -30,4 +26,5 @@ class ProjectTable(Base):
     progress_percentage = Column(Float)
     ai_health_score = Column(Float)
 
-    tasks = relationship("TaskTable", foreign_keys=[owner_id], back_populates="project")
\ No newline at end of file
+    tasks = relationship("TaskTable", foreign_keys="TaskTable.project_id", back_populates="project")
+    issues = relationship("ProjectIssueTable", back_populates="project")
\ No newline at end of file
@@ -1,9 +1,6 @@
-import enum
 import uuid
 
-from sqlalchemy import (JSON, UUID, Boolean, Column, Date, DateTime, Enum,
-                        Float, ForeignKey, Integer, String, Table, Text, Time)
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy import JSON, UUID, Boolean, Column, Date, String
 
 from src.config.database.base_table import Base
 
@@ -0,0 +1,82 @@
+"""Single import point for the todos schema.
+
+Table modules never import each other: relationships name their targets as
+strings and resolve once every class is registered on ``Base``. Anything
+that needs the whole schema (create_all, snapshots, tests) imports this
+module instead of walking the package.
+"""
+from sqlalchemy.orm import configure_mappers
+
+from src.config.database.base_table import Base
+from src.features.todos.data.datasource.tables.ai_suggestion_table import \
+    AISuggestion
+from src.features.todos.data.datasource.tables.file_link_table import \
+    FileLinkTable
+from src.features.todos.data.datasource.tables.markdown_file_table import \
+    MarkdownFileTable
+from src.features.todos.data.datasource.tables.milestone_table import \
+    MilestoneTable
+from src.features.todos.data.datasource.tables.phase_table import PhaseTable
+from src.features.todos.data.datasource.tables.projec_template_table import \
+    ProjectTemplateTable
+from src.features.todos.data.datasource.tables.project_issue_table import \
+    ProjectIssueTable
+from src.features.todos.data.datasource.tables.project_table import \
+    ProjectTable
+from src.features.todos.data.datasource.tables.recurrence_pattern_table import \
+    RecurrencePatternTable
+from src.features.todos.data.datasource.tables.repository_issue_table import \
+    RepositoryIssueTable
+from src.features.todos.data.datasource.tables.sync_change_table import (
+    SyncChangeTable, SyncStateTable)
+from src.features.todos.data.datasource.tables.sync_history_table import \
+    SyncHistoryTable
+from src.features.todos.data.datasource.tables.tag_table import (
+    EntityTagTable, TagTable)
+from src.features.todos.data.datasource.tables.task_log_table import \
+    TaskLogTable
+from src.features.todos.data.datasource.tables.task_schedule_table import \
+    TaskScheduleTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.features.todos.data.datasource.tables.task_template_table import \
+    TaskTemplateTable
+from src.features.todos.data.datasource.tables.time_block_table import \
+    TimeBlockTable
+from src.features.todos.data.datasource.tables.user_pattern_table import \
+    UserPatternTable
+from src.features.todos.data.datasource.tables.user_settings_table import \
+    UserSettingsTable
+from src.features.todos.data.datasource.tables.user_table import UserTable
+
+TABLES = (
+    AISuggestion,
+    EntityTagTable,
+    FileLinkTable,
+    MarkdownFileTable,
+    MilestoneTable,
+    PhaseTable,
+    ProjectIssueTable,
+    ProjectTable,
+    ProjectTemplateTable,
+    RecurrencePatternTable,
+    RepositoryIssueTable,
+    SyncChangeTable,
+    SyncHistoryTable,
+    SyncStateTable,
+    TagTable,
+    TaskLogTable,
+    TaskScheduleTable,
+    TaskTable,
+    TaskTemplateTable,
+    TimeBlockTable,
+    UserPatternTable,
+    UserSettingsTable,
+    UserTable,
+)
+
+metadata = Base.metadata
+
+
+def configureTables() -> None:
+    """Resolve every string relationship now, so a typo fails at startup rather than mid-request."""
+    configure_mappers()
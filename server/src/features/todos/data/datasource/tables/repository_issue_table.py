@@ -1,6 +1,5 @@
 import uuid
 
-from click import DateTime
 from sqlalchemy import (JSON, UUID, Column, DateTime, ForeignKey, Integer,
                         String)
 from sqlalchemy.orm import relationship
@@ -22,3 +21,4 @@ class RepositoryIssueTable(Base):
     closed_at = Column(DateTime)
 
     task = relationship("TaskTable", foreign_keys=[task_id], back_populates="repository_issues")
+    project_issues = relationship("ProjectIssueTable", back_populates="repository_issue")
@@ -0,0 +1,35 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (UUID, BigInteger, Boolean, Column, DateTime, Index,
+                        Integer, String)
+
+from src.config.database.base_table import Base
+
+
+class SyncChangeTable(Base):
+    """Latest change of each synced row for each user it belongs to; versions grow on every write.
+
+    A user who loses a row (reassigned, moved to another owner's project)
+    keeps a tombstone for it.
+    """
+
+    __tablename__ = "sync_changes"
+    __table_args__ = (Index("ix_sync_changes_audience_version", "audience", "version"),)
+
+    entity_type = Column(String(20), primary_key=True)  # table name, e.g. "tasks"
+    entity_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    audience = Column(UUID(as_uuid=True), primary_key=True)  # user id; all zeros for shared rows
+    version = Column(BigInteger, nullable=False, index=True)
+    deleted = Column(Boolean, nullable=False, default=False)  # tombstone
+    changed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class SyncStateTable(Base):
+    """Single row holding the version counter; writers lock it from version assignment to commit."""
+
+    __tablename__ = "sync_state"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    purged_through = Column(BigInteger, nullable=False, default=0)  # newest purged tombstone
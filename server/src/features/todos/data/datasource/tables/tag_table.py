@@ -1,10 +1,7 @@
-import enum
 import uuid
-from datetime import datetime
 
-from sqlalchemy import (JSON, UUID, Boolean, Column, Date, DateTime, Enum,
-                        Float, ForeignKey, Integer, String, Table, Text, Time)
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy import UUID, Column, ForeignKey, String, Text
+from sqlalchemy.orm import relationship
 
 from src.config.database.base_table import Base
 
@@ -13,13 +10,18 @@ class TagTable(Base):
     __tablename__ = "tags"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    entity_id = Column(UUID(as_uuid=True), ForeignKey("entity_tags.id"), nullable=False)
+    # tags <-> entity_tags reference each other; this side is added with ALTER after both exist.
+    entity_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("entity_tags.id", use_alter=True, name="fk_tags_entity_id"),
+        nullable=False,
+    )
     color = Column(String(50), nullable=False)
     icon = Column(String(50), nullable=True)
     description = Column(Text, nullable=True)
     name = Column(String(100), unique=True, nullable=False)
 
-    entities = relationship("EntityTagTable", foreign_keys=[entity_id], back_populates="tag")
+    entities = relationship("EntityTagTable", foreign_keys="EntityTagTable.tag_id", back_populates="tag")
 
 
 class EntityTagTable(Base):
@@ -1,8 +1,7 @@
 import uuid
 
-from sqlalchemy import (JSON, UUID, Boolean, Column, Date, DateTime, Enum,
-                        Float, ForeignKey, Integer, String, Table, Text, Time)
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy import UUID, Column, Date, Float, ForeignKey, Integer, Text
+from sqlalchemy.orm import relationship
 
 from src.config.database.base_table import Base
 
@@ -1,9 +1,9 @@
 import uuid
+from datetime import datetime
 
-from sqlalchemy import (JSON, Boolean, Column, Date, DateTime, Enum, Float,
-                        ForeignKey, String, Table, Text, Time)
+from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, String, Time
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import relationship
 
 from src.config.database.base_table import Base
 
@@ -20,5 +20,8 @@ class TaskScheduleTable(Base):
     priority_window = Column(String(50))
     last_rescheduled_at = Column(DateTime)
     scheduling_confidence = Column(Float)
+    # Reminder moment (UTC) last delivered; claiming it is what keeps dispatchers from doubling up.
+    reminded_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     task = relationship("TaskTable", foreign_keys=[task_id], back_populates="schedules")
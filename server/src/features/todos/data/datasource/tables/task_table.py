@@ -1,16 +1,12 @@
 import uuid
 from datetime import datetime
-from typing import List, Optional
 
-from sqlalchemy import (JSON, Boolean, Column, Date, DateTime, Enum, Float,
-                        ForeignKey, String, Table, Text)
+from sqlalchemy import (JSON, Column, Date, DateTime, Enum, Float, ForeignKey,
+                        String, Text)
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import relationship
 
 from src.config.database.base_table import Base
-from src.features.todos.data.datasource.tables.project_table import \
-    ProjectTable
-from src.features.todos.data.datasource.tables.user_table import UserTable
 from src.features.todos.domain.enums.priority import PriorityEnum
 
 
@@ -40,4 +36,10 @@ class TaskTable(Base):
     ai_priority_score = Column(Float)
     blocked_reason = Column(Text)
 
-    project = relationship("Project", foreign_keys=[project_id], back_populates="tasks")
+    project = relationship("ProjectTable", foreign_keys=[project_id], back_populates="tasks")
+    milestones = relationship("MilestoneTable", back_populates="task")
+    logs = relationship("TaskLogTable", back_populates="task")
+    schedules = relationship("TaskScheduleTable", back_populates="task")
+    time_blocks = relationship("TimeBlockTable", back_populates="task")
+    ai_suggestions = relationship("AISuggestion", back_populates="task")
+    repository_issues = relationship("RepositoryIssueTable", back_populates="task")
@@ -1,6 +1,7 @@
 import uuid
 
-from sqlalchemy import JSON, UUID, Column, Float, ForeignKey, String, Text
+from sqlalchemy import (JSON, UUID, Column, Float, ForeignKey, Integer, String,
+                        Text)
 from sqlalchemy.orm import relationship
 
 from src.config.database.base_table import Base
@@ -11,6 +12,8 @@ class TaskTemplateTable(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     phase_id = Column(UUID(as_uuid=True), ForeignKey("phases.id"))
+    # Subtasks point at their task; top-level tasks hang off the phase.
+    parent_template_id = Column(UUID(as_uuid=True), ForeignKey("task_templates.id"))
     title = Column(String(255))
     description = Column(Text)
     estimated_hours = Column(Float)
@@ -18,5 +21,8 @@ class TaskTemplateTable(Base):
     default_priority = Column(String(50))
     recommended_tools = Column(JSON)
     ai_difficulty_score = Column(Float)
+    week_number = Column(Integer)
+    category = Column(String(255))
+    order_index = Column(Integer)
 
-    phase = relationship("PhaseTable", foreign_keys=[phase_id], back_populates="task_templates")
\ No newline at end of file
+    phase = relationship("PhaseTable", foreign_keys=[phase_id], back_populates="task_templates")
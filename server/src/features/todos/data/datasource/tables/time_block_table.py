@@ -20,5 +20,9 @@ class TimeBlockTable(Base):
     interruptions = Column(Integer)
     location = Column(String(255))
     device_used = Column(String(100))
+    # "scheduler" for blocks the scheduling engine owns; anything else is fixed busy time.
+    source = Column(String(20))
+    # Which plan wrote a scheduler block, so a worker can tell its cached plan was superseded.
+    plan_stamp = Column(UUID(as_uuid=True))
 
     task = relationship("TaskTable", foreign_keys=[task_id], back_populates="time_blocks")
\ No newline at end of file
@@ -1,10 +1,7 @@
-import enum
 import uuid
-from datetime import datetime
 
-from sqlalchemy import (JSON, UUID, Boolean, Column, Date, DateTime, Enum,
-                        Float, ForeignKey, Integer, String, Table, Text, Time)
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy import JSON, UUID, Boolean, Column, ForeignKey, Integer, String
+from sqlalchemy.orm import relationship
 
 from src.config.database.base_table import Base
 
@@ -23,4 +20,4 @@ class UserSettingsTable(Base):
     auto_sync_enabled = Column(Boolean, default=True)
     weekly_goal_hours = Column(Integer)
 
-    user = relationship("UserTable", foreign_keys=[user_id], back_populates="settings")
+    user = relationship("UserTable", foreign_keys=[user_id])
@@ -0,0 +1,42 @@
+import uuid
+from datetime import date, datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ProjectModel(BaseModel):
+    id: uuid.UUID
+    name: str
+    description: Optional[str] = None
+    repo_url: Optional[str] = None
+    owner_id: Optional[uuid.UUID] = None
+    category: Optional[str] = None
+    status: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    progress_percentage: Optional[float] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class ProjectPageModel(BaseModel):
+    items: List[ProjectModel]
+    next_cursor: Optional[str] = None
+
+
+class ProjectUpdateModel(BaseModel):
+    name: Optional[str] = None
+    description: Optional[str] = None
+    repo_url: Optional[str] = None
+    category: Optional[str] = None
+    status: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+
+class ProjectFromTemplateModel(BaseModel):
+    template_id: uuid.UUID
+    name: Optional[str] = None  # defaults to the template's
+    owner_id: Optional[uuid.UUID] = None
+    start_date: Optional[date] = None  # defaults to today
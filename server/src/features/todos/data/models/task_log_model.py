@@ -0,0 +1,17 @@
+import datetime
+import uuid
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class TaskLogModel(BaseModel):
+    id: uuid.UUID
+    task_id: uuid.UUID
+    date: Optional[datetime.date] = None
+    progress_percentage: Optional[float] = None
+    notes: Optional[str] = None
+    time_spent: Optional[float] = None
+    mood_score: Optional[int] = None
+    energy_level: Optional[int] = None
+    obstacles: Optional[str] = None
@@ -0,0 +1,45 @@
+import uuid
+from datetime import date, datetime
+from typing import Any, List, Optional
+
+from pydantic import BaseModel
+
+from src.features.todos.domain.enums.priority import PriorityEnum
+
+
+class TaskModel(BaseModel):
+    id: uuid.UUID
+    title: str
+    status: Optional[str] = None
+    priority: Optional[PriorityEnum] = None
+    type: Optional[str] = None
+    parent_task_id: Optional[uuid.UUID] = None
+    project_id: Optional[uuid.UUID] = None
+    assigned_to: Optional[uuid.UUID] = None
+    estimated_hours: Optional[float] = None
+    actual_hours: Optional[float] = None
+    progress_percentage: Optional[float] = None
+    labels: Optional[List[Any]] = None
+    due_date: Optional[date] = None
+    completed_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class TaskPageModel(BaseModel):
+    items: List[TaskModel]
+    next_cursor: Optional[str] = None
+
+
+class TaskUpdateModel(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+    priority: Optional[PriorityEnum] = None
+    assigned_to: Optional[uuid.UUID] = None
+    estimated_hours: Optional[float] = None
+    actual_hours: Optional[float] = None
+    progress_percentage: Optional[float] = None
+    labels: Optional[List[Any]] = None
+    due_date: Optional[date] = None
+    completed_at: Optional[datetime] = None
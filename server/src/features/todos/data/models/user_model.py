@@ -0,0 +1,21 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from src.features.todos.domain.enums.status import StatusEnum
+from src.features.todos.domain.enums.user_role import UserRole
+
+
+class UserModel(BaseModel):
+    # Never expose password_hash or github_token.
+    id: uuid.UUID
+    username: str
+    email: str
+    role: Optional[UserRole] = None
+    status: Optional[StatusEnum] = None
+    profile_image_url: Optional[str] = None
+    last_login: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
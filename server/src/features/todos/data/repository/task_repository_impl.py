@@ -0,0 +1,49 @@
+from typing import Any, Dict, List, Optional
+
+from src.config.settings.config import Settings
+from src.core.cache.invalidation import projectScope, userScope
+from src.core.cache.redis_cache import RedisCache
+from src.features.todos.data.datasource.daos.project_dao import ProjectDao
+from src.features.todos.data.datasource.daos.task_dao import TaskDao
+from src.features.todos.domain.repository.task_repository import \
+    TaskRepository
+
+
+class TaskRepositoryImpl(TaskRepository):
+    """Serves the hot board/detail reads through the Redis read-through cache."""
+
+    def __init__(
+        self,
+        taskDao: TaskDao,
+        projectDao: ProjectDao,
+        cache: RedisCache,
+        settings: Settings,
+    ):
+        self._taskDao = taskDao
+        self._projectDao = projectDao
+        self._cache = cache
+        self._settings = settings
+
+    def getProjectBoard(self, projectId) -> List[Dict[str, Any]]:
+        return self._cache.getOrLoad(
+            projectScope(projectId),
+            "board",
+            lambda: self._taskDao.getProjectBoard(projectId),
+            self._settings.CACHE_TTL_PROJECT_BOARD,
+        )
+
+    def getUserOpenTasks(self, userId) -> List[Dict[str, Any]]:
+        return self._cache.getOrLoad(
+            userScope(userId),
+            "open_tasks",
+            lambda: self._taskDao.getUserOpenTasks(userId),
+            self._settings.CACHE_TTL_USER_OPEN_TASKS,
+        )
+
+    def getProjectDetail(self, projectId) -> Optional[Dict[str, Any]]:
+        return self._cache.getOrLoad(
+            projectScope(projectId),
+            "detail",
+            lambda: self._projectDao.getProjectDetail(projectId),
+            self._settings.CACHE_TTL_PROJECT_DETAIL,
+        )
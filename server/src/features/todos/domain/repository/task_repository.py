@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+
+class TaskRepository(ABC):
+    @abstractmethod
+    def getProjectBoard(self, projectId) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def getUserOpenTasks(self, userId) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def getProjectDetail(self, projectId) -> Optional[Dict[str, Any]]:
+        pass
@@ -0,0 +1,129 @@
+from typing import Dict, Iterable, Iterator, Optional
+
+from graphql import (FieldNode, FragmentDefinitionNode, FragmentSpreadNode,
+                     GraphQLError, InlineFragmentNode, IntValueNode,
+                     OperationDefinitionNode, SelectionSetNode, ValidationRule)
+from strawberry.extensions import SchemaExtension
+
+
+def _listSize(
+    field: FieldNode,
+    listFields: Iterable[str],
+    defaultListSize: int,
+    variables: dict,
+    maxListSize: Optional[int] = None,
+) -> int:
+    for argument in field.arguments or ():
+        if argument.name.value in ("limit", "first"):
+            value = argument.value
+            if isinstance(value, IntValueNode):
+                size = int(value.value)
+            else:
+                name = getattr(getattr(value, "name", None), "value", None)
+                size = variables.get(name) if name is not None else None
+                if not isinstance(size, int):
+                    # A limit we cannot see may be anything the resolver accepts.
+                    size = maxListSize or defaultListSize
+            return min(size, maxListSize) if maxListSize else size
+    return defaultListSize if field.name.value in listFields else 1
+
+
+def estimateComplexity(
+    selectionSet: Optional[SelectionSetNode],
+    fragments: Dict[str, FragmentDefinitionNode],
+    listFields: Iterable[str],
+    defaultListSize: int,
+    variables: Optional[dict] = None,
+    multiplier: int = 1,
+    maxListSize: Optional[int] = None,
+) -> int:
+    """Every resolved field costs one per parent object; list fields multiply their children."""
+    if selectionSet is None:
+        return 0
+    variables = variables or {}
+    total = 0
+    for selection in selectionSet.selections:
+        if isinstance(selection, FieldNode):
+            if selection.name.value.startswith("__"):
+                continue
+            total += multiplier
+            size = _listSize(selection, listFields, defaultListSize, variables, maxListSize)
+            total += estimateComplexity(
+                selection.selection_set, fragments, listFields, defaultListSize, variables,
+                multiplier * size, maxListSize,
+            )
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                total += estimateComplexity(
+                    fragment.selection_set, fragments, listFields, defaultListSize, variables,
+                    multiplier, maxListSize,
+                )
+        elif isinstance(selection, InlineFragmentNode):
+            total += estimateComplexity(
+                selection.selection_set, fragments, listFields, defaultListSize, variables,
+                multiplier, maxListSize,
+            )
+    return total
+
+
+def complexityRule(
+    maxComplexity: int,
+    listFields: Iterable[str],
+    defaultListSize: int = 10,
+    maxListSize: Optional[int] = None,
+    variables: Optional[dict] = None,
+):
+    listFields = frozenset(listFields)
+
+    class QueryComplexityRule(ValidationRule):
+        def enter_operation_definition(self, node: OperationDefinitionNode, *args):
+            fragments = {
+                definition.name.value: definition
+                for definition in self.context.document.definitions
+                if isinstance(definition, FragmentDefinitionNode)
+            }
+            cost = estimateComplexity(
+                node.selection_set, fragments, listFields, defaultListSize, variables,
+                maxListSize=maxListSize,
+            )
+            if cost > maxComplexity:
+                self.report_error(
+                    GraphQLError(
+                        f"Query complexity {cost} exceeds the maximum of {maxComplexity}.",
+                        node,
+                    )
+                )
+
+    return QueryComplexityRule
+
+
+class QueryComplexityLimiter(SchemaExtension):
+    """Adds ``complexityRule`` per operation, bound to that request's variables.
+
+    Validation rules never see variable values, so a static rule would cost
+    ``tasks(limit: $l)`` at the default list size whatever ``$l`` is.
+    """
+
+    def __init__(
+        self,
+        maxComplexity: int,
+        listFields: Iterable[str],
+        defaultListSize: int = 10,
+        maxListSize: Optional[int] = None,
+    ):
+        self.maxComplexity = maxComplexity
+        self.listFields = tuple(listFields)
+        self.defaultListSize = defaultListSize
+        self.maxListSize = maxListSize
+
+    def on_operation(self) -> Iterator[None]:
+        rule = complexityRule(
+            self.maxComplexity,
+            self.listFields,
+            self.defaultListSize,
+            self.maxListSize,
+            self.execution_context.variables,
+        )
+        self.execution_context.validation_rules = self.execution_context.validation_rules + (rule,)
+        yield
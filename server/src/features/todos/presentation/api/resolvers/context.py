@@ -0,0 +1,18 @@
+from fastapi import Depends
+from sqlalchemy.orm import Session
+from strawberry.fastapi import BaseContext
+
+from src.config.database.zen_task_db_handler import getDbSession
+from src.features.todos.data.datasource.daos.graph_dao import GraphDao
+from src.features.todos.presentation.api.resolvers.loaders import GraphLoaders
+
+
+class GraphContext(BaseContext):
+    def __init__(self, session: Session):
+        super().__init__()
+        self.dao = GraphDao(session)
+        self.loaders = GraphLoaders(self.dao)
+
+
+async def getGraphContext(session: Session = Depends(getDbSession)) -> GraphContext:
+    return GraphContext(session)
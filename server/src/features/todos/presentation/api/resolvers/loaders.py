@@ -0,0 +1,30 @@
+import asyncio
+from typing import Any, Callable, List, Sequence
+
+from starlette.concurrency import run_in_threadpool
+from strawberry.dataloader import DataLoader
+
+from src.features.todos.data.datasource.daos.graph_dao import GraphDao
+
+
+def _batched(fetch: Callable[[Sequence[Any]], List[Any]], lock: asyncio.Lock) -> DataLoader:
+    async def load(keys: List[Any]) -> List[Any]:
+        async with lock:  # batches of one request share its Session, which is not thread-safe
+            return await run_in_threadpool(fetch, keys)
+
+    return DataLoader(load_fn=load)
+
+
+class GraphLoaders:
+    """Request-scoped loaders; every relationship costs one query per request, not per row.
+
+    The loaders' batches run one at a time, each on a pool thread.
+    """
+
+    def __init__(self, dao: GraphDao):
+        lock = asyncio.Lock()
+        self.projectById = _batched(dao.projectsByIds, lock)
+        self.userById = _batched(dao.usersByIds, lock)
+        self.milestonesByTaskId = _batched(dao.milestonesByTaskIds, lock)
+        self.logsByTaskId = _batched(dao.logsByTaskIds, lock)
+        self.tagsByTaskId = _batched(dao.tagsByTaskIds, lock)
@@ -0,0 +1,26 @@
+import uuid
+from typing import List, Optional
+
+import strawberry
+from starlette.concurrency import run_in_threadpool
+from strawberry.types import Info
+
+from src.features.todos.presentation.api.types.task_types import TaskType
+
+MAX_PAGE_SIZE = 200
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    async def tasks(
+        self,
+        info: Info,
+        project_id: Optional[strawberry.ID] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[TaskType]:
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        projectId = uuid.UUID(str(project_id)) if project_id else None
+        rows = await run_in_threadpool(info.context.dao.listTasks, projectId, limit, offset)
+        return [TaskType.fromRow(row) for row in rows]
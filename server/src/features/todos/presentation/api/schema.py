@@ -0,0 +1,37 @@
+import strawberry
+from fastapi import FastAPI
+from strawberry.extensions import QueryDepthLimiter
+from strawberry.fastapi import GraphQLRouter
+
+from src.features.todos.presentation.api.complexity import \
+    QueryComplexityLimiter
+from src.features.todos.presentation.api.resolvers.context import \
+    getGraphContext
+from src.features.todos.presentation.api.resolvers.task_resolvers import (
+    MAX_PAGE_SIZE, Query)
+
+MAX_QUERY_DEPTH = 6
+MAX_QUERY_COMPLEXITY = 10000  # a nested 100-task page costs about 7100
+LIST_FIELDS = ("tasks", "milestones", "logs", "tags")
+
+schema = strawberry.Schema(
+    query=Query,
+    extensions=[
+        lambda: QueryDepthLimiter(max_depth=MAX_QUERY_DEPTH),
+        lambda: QueryComplexityLimiter(
+            MAX_QUERY_COMPLEXITY, LIST_FIELDS, maxListSize=MAX_PAGE_SIZE
+        ),
+    ],
+)
+
+
+def createGraphQLRouter() -> GraphQLRouter:
+    return GraphQLRouter(schema, context_getter=getGraphContext)
+
+
+def createGraphQLApp(parent: FastAPI, path: str = "/graphql") -> FastAPI:
+    """Standalone app serving GraphQL at ``path``; shares ``parent``'s dependency overrides."""
+    graphApp = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+    graphApp.dependency_overrides = parent.dependency_overrides
+    graphApp.include_router(createGraphQLRouter(), prefix=path)
+    return graphApp
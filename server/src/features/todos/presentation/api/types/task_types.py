@@ -0,0 +1,160 @@
+from datetime import date, datetime
+from typing import List, Optional
+
+import strawberry
+from strawberry.types import Info
+
+
+def _enumValue(value):
+    return getattr(value, "value", value)
+
+
+@strawberry.type
+class UserType:
+    id: strawberry.ID
+    username: str
+    profile_image_url: Optional[str]
+
+    @classmethod
+    def fromRow(cls, row: dict) -> "UserType":
+        return cls(
+            id=strawberry.ID(str(row["id"])),
+            username=row["username"],
+            profile_image_url=row.get("profile_image_url"),
+        )
+
+
+@strawberry.type
+class ProjectType:
+    id: strawberry.ID
+    name: str
+    description: Optional[str]
+    status: Optional[str]
+    progress_percentage: Optional[float]
+
+    @classmethod
+    def fromRow(cls, row: dict) -> "ProjectType":
+        return cls(
+            id=strawberry.ID(str(row["id"])),
+            name=row["name"],
+            description=row.get("description"),
+            status=row.get("status"),
+            progress_percentage=row.get("progress_percentage"),
+        )
+
+
+@strawberry.type
+class MilestoneType:
+    id: strawberry.ID
+    title: str
+    status: Optional[str]
+    target_date: Optional[date]
+    progress_percentage: Optional[float]
+
+    @classmethod
+    def fromRow(cls, row: dict) -> "MilestoneType":
+        return cls(
+            id=strawberry.ID(str(row["id"])),
+            title=row["title"],
+            status=row.get("status"),
+            target_date=row.get("target_date"),
+            progress_percentage=row.get("progress_percentage"),
+        )
+
+
+@strawberry.type
+class TaskLogType:
+    id: strawberry.ID
+    date: Optional[date]
+    progress_percentage: Optional[float]
+    time_spent: Optional[float]
+    notes: Optional[str]
+
+    @classmethod
+    def fromRow(cls, row: dict) -> "TaskLogType":
+        return cls(
+            id=strawberry.ID(str(row["id"])),
+            date=row.get("date"),
+            progress_percentage=row.get("progress_percentage"),
+            time_spent=row.get("time_spent"),
+            notes=row.get("notes"),
+        )
+
+
+@strawberry.type
+class TagType:
+    id: strawberry.ID
+    name: str
+    color: str
+    icon: Optional[str]
+
+    @classmethod
+    def fromRow(cls, row: dict) -> "TagType":
+        return cls(
+            id=strawberry.ID(str(row["id"])),
+            name=row["name"],
+            color=row["color"],
+            icon=row.get("icon"),
+        )
+
+
+@strawberry.type
+class TaskType:
+    id: strawberry.ID
+    title: str
+    description: Optional[str]
+    status: Optional[str]
+    priority: Optional[str]
+    estimated_hours: Optional[float]
+    progress_percentage: Optional[float]
+    due_date: Optional[date]
+    updated_at: Optional[datetime]
+    project_id: strawberry.Private[Optional[object]]
+    assigned_to: strawberry.Private[Optional[object]]
+    row_id: strawberry.Private[object]
+
+    @classmethod
+    def fromRow(cls, row: dict) -> "TaskType":
+        return cls(
+            id=strawberry.ID(str(row["id"])),
+            title=row["title"],
+            description=row.get("description"),
+            status=row.get("status"),
+            priority=_enumValue(row.get("priority")),
+            estimated_hours=row.get("estimated_hours"),
+            progress_percentage=row.get("progress_percentage"),
+            due_date=row.get("due_date"),
+            updated_at=row.get("updated_at"),
+            project_id=row.get("project_id"),
+            assigned_to=row.get("assigned_to"),
+            row_id=row["id"],
+        )
+
+    @strawberry.field
+    async def project(self, info: Info) -> Optional[ProjectType]:
+        if self.project_id is None:
+            return None
+        row = await info.context.loaders.projectById.load(self.project_id)
+        return ProjectType.fromRow(row) if row else None
+
+    @strawberry.field
+    async def assignee(self, info: Info) -> Optional[UserType]:
+        if self.assigned_to is None:
+            return None
+        row = await info.context.loaders.userById.load(self.assigned_to)
+        return UserType.fromRow(row) if row else None
+
+    @strawberry.field
+    async def milestones(self, info: Info) -> List[MilestoneType]:
+        rows = await info.context.loaders.milestonesByTaskId.load(self.row_id)
+        return [MilestoneType.fromRow(row) for row in rows]
+
+    @strawberry.field
+    async def logs(self, info: Info) -> List[TaskLogType]:
+        rows = await info.context.loaders.logsByTaskId.load(self.row_id)
+        return [TaskLogType.fromRow(row) for row in rows]
+
+    @strawberry.field
+    async def tags(self, info: Info) -> List[TagType]:
+        rows = await info.context.loaders.tagsByTaskId.load(self.row_id)
+        return [TagType.fromRow(row) for row in rows]
@@ -0,0 +1,20 @@
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from src.config.database.zen_task_db_handler import getDbSession
+from src.config.settings.config import getSettings
+from src.features.todos.data.datasource.daos.project_dao import ProjectDao
+from src.features.todos.data.datasource.daos.task_dao import TaskDao
+from src.features.todos.domain.repository.task_repository import TaskRepository
+
+
+def getTaskRepository(session: Session = Depends(getDbSession)) -> TaskRepository:
+    """FastAPI dependency: the board/detail reads, served through the Redis cache."""
+    # Imported by the first cached read, so importing the app never loads redis.
+    from src.core.cache.cache_handler import CacheHandler
+    from src.features.todos.data.repository.task_repository_impl import \
+        TaskRepositoryImpl
+
+    return TaskRepositoryImpl(
+        TaskDao(session), ProjectDao(session), CacheHandler.cache(), getSettings()
+    )
@@ -0,0 +1,139 @@
+import uuid
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session
+
+from src.config.database.zen_task_db_handler import getDbSession
+from src.config.exceptions.failure_exception import FailureException, LogLevel
+from src.config.settings.config import getSettings
+from src.core.utils.http_cache import (hasConditionalHeaders, isNotModified,
+                                       notModified, requireIfMatch,
+                                       resourceHeaders, validatorsFor)
+from src.core.utils.pagination import buildPage, decodeCursor
+from src.core.utils.serialization import (FastJSONResponse, schemaFields,
+                                          serializerFor)
+from src.features.todos.data.datasource.daos.project_dao import ProjectDao
+from src.features.todos.data.datasource.daos.template_dao import TemplateDao
+from src.features.todos.data.models.project_model import (
+    ProjectFromTemplateModel, ProjectModel, ProjectPageModel,
+    ProjectUpdateModel)
+from src.features.todos.domain.repository.task_repository import TaskRepository
+from src.features.todos.presentation.controllers.dependencies import \
+    getTaskRepository
+
+MAX_PAGE_SIZE = 5000
+
+router = APIRouter(prefix="/projects", tags=["projects"])
+
+
+def _projectNotFound(projectId) -> FailureException:
+    return FailureException(
+        level=LogLevel.NOT_FOUND,
+        message=f"Project {projectId} not found.",
+        userMessage="Project not found.",
+    )
+
+
+@router.get("", response_model=ProjectPageModel, response_class=FastJSONResponse)
+def listProjects(
+    request: Request,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    ownerId: Optional[uuid.UUID] = None,
+    session: Session = Depends(getDbSession),
+):
+    dao = ProjectDao(session)
+    version = dao.projectsVersion(ownerId)
+    validators = validatorsFor(
+        "projects", ownerId, version.count, version.updated_at, limit, cursor,
+        lastModified=version.updated_at,
+    )
+    if isNotModified(request, validators):
+        return notModified(validators)
+
+    rows = dao.listProjects(limit + 1, decodeCursor(cursor), ownerId)
+    return FastJSONResponse(
+        buildPage(rows, limit, serializerFor(ProjectModel)), headers=validators.headers
+    )
+
+
+@router.post(
+    "/from-template", response_model=ProjectModel, status_code=201, response_class=FastJSONResponse
+)
+def createProjectFromTemplate(
+    template: ProjectFromTemplateModel, session: Session = Depends(getDbSession)
+):
+    """Instantiate a roadmap template (see ``TemplateDao``) as a new project."""
+    projectId = TemplateDao(session).instantiateProject(
+        template.template_id, template.name, template.owner_id, template.start_date
+    )
+    session.commit()
+
+    project = serializerFor(ProjectModel)(ProjectDao(session).getProject(projectId))
+    return FastJSONResponse(
+        project,
+        status_code=201,
+        headers=resourceHeaders("project", projectId, project["updated_at"]),
+    )
+
+
+@router.get("/{projectId}", response_model=ProjectModel, response_class=FastJSONResponse)
+def getProject(request: Request, projectId: uuid.UUID, session: Session = Depends(getDbSession)):
+    dao = ProjectDao(session)
+    if hasConditionalHeaders(request):
+        version = dao.getProjectVersion(projectId)
+        if version is None:
+            raise _projectNotFound(projectId)
+        if version.updated_at is not None:
+            validators = validatorsFor(
+                "project", projectId, version.updated_at, lastModified=version.updated_at
+            )
+            if isNotModified(request, validators):
+                return notModified(validators)
+
+    row = dao.getProject(projectId)
+    if row is None:
+        raise _projectNotFound(projectId)
+    project = serializerFor(ProjectModel)(row)
+    return FastJSONResponse(
+        project, headers=resourceHeaders("project", projectId, project["updated_at"])
+    )
+
+
+@router.get("/{projectId}/detail", response_class=FastJSONResponse)
+def getProjectDetail(projectId: uuid.UUID, repository: TaskRepository = Depends(getTaskRepository)):
+    """The project with its task counts by status; cached until the project or a task changes."""
+    detail = repository.getProjectDetail(projectId)
+    if detail is None:
+        raise _projectNotFound(projectId)
+    return FastJSONResponse(detail)
+
+
+@router.patch("/{projectId}", response_model=ProjectModel, response_class=FastJSONResponse)
+def updateProject(
+    request: Request,
+    projectId: uuid.UUID,
+    changes: ProjectUpdateModel,
+    session: Session = Depends(getDbSession),
+):
+    project = ProjectDao(session).lockProject(projectId)
+    if project is None:
+        raise _projectNotFound(projectId)
+    requireIfMatch(
+        request,
+        validatorsFor("project", projectId, project.updated_at, lastModified=project.updated_at),
+        required=getSettings().REQUIRE_IF_MATCH,
+    )
+
+    for field, value in changes.model_dump(exclude_unset=True).items():
+        setattr(project, field, value)
+    session.commit()
+
+    body = serializerFor(ProjectModel)(
+        tuple(getattr(project, field) for field in schemaFields(ProjectModel))
+    )
+    validators = validatorsFor(
+        "project", projectId, project.updated_at, lastModified=project.updated_at
+    )
+    return FastJSONResponse(body, headers=validators.headers)
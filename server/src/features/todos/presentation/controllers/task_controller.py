@@ -0,0 +1,155 @@
+import uuid
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session
+
+from src.config.database.zen_task_db_handler import getDbSession
+from src.config.exceptions.failure_exception import FailureException, LogLevel
+from src.config.settings.config import getSettings
+from src.core.utils.export import ExportFormat, exportResponse, streamBatches
+from src.core.utils.http_cache import (hasConditionalHeaders, isNotModified,
+                                       notModified, requireIfMatch,
+                                       resourceHeaders, validatorsFor)
+from src.core.utils.pagination import buildPage, decodeCursor
+from src.core.utils.serialization import (FastJSONResponse, schemaFields,
+                                          serializerFor)
+from src.features.todos.data.datasource.daos.task_dao import TaskDao
+from src.features.todos.data.models.task_log_model import TaskLogModel
+from src.features.todos.data.models.task_model import (TaskModel,
+                                                       TaskPageModel,
+                                                       TaskUpdateModel)
+from src.features.todos.domain.repository.task_repository import TaskRepository
+from src.features.todos.presentation.controllers.dependencies import \
+    getTaskRepository
+
+MAX_PAGE_SIZE = 5000
+
+router = APIRouter(tags=["tasks"])
+
+
+def _taskNotFound(taskId) -> FailureException:
+    return FailureException(
+        level=LogLevel.NOT_FOUND,
+        message=f"Task {taskId} not found.",
+        userMessage="Task not found.",
+    )
+
+
+@router.get(
+    "/projects/{projectId}/tasks", response_model=TaskPageModel, response_class=FastJSONResponse
+)
+def listProjectTasks(
+    request: Request,
+    projectId: uuid.UUID,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    session: Session = Depends(getDbSession),
+):
+    dao = TaskDao(session)
+    version = dao.projectTasksVersion(projectId)
+    validators = validatorsFor(
+        "tasks", projectId, version.count, version.updated_at, limit, cursor,
+        lastModified=version.updated_at,
+    )
+    if isNotModified(request, validators):
+        return notModified(validators)
+
+    # Returning a Response skips response_model validation; the model only documents the shape.
+    rows = dao.listProjectTasks(projectId, limit + 1, decodeCursor(cursor))
+    return FastJSONResponse(
+        buildPage(rows, limit, serializerFor(TaskModel)), headers=validators.headers
+    )
+
+
+@router.get("/projects/{projectId}/board", response_class=FastJSONResponse)
+def getProjectBoard(projectId: uuid.UUID, repository: TaskRepository = Depends(getTaskRepository)):
+    """Every task of the project, grouped for the board; cached until a task changes."""
+    return FastJSONResponse(repository.getProjectBoard(projectId))
+
+
+@router.get("/users/{userId}/tasks/open", response_class=FastJSONResponse)
+def getUserOpenTasks(userId: uuid.UUID, repository: TaskRepository = Depends(getTaskRepository)):
+    """The user's unfinished tasks, soonest due first; cached until one of them changes."""
+    return FastJSONResponse(repository.getUserOpenTasks(userId))
+
+
+@router.get("/projects/{projectId}/tasks/export", response_model=list[TaskModel])
+def exportProjectTasks(
+    request: Request,
+    projectId: uuid.UUID,
+    exportFormat: ExportFormat = Query(ExportFormat.json, alias="format"),
+    session: Session = Depends(getDbSession),
+):
+    return exportResponse(
+        request,
+        streamBatches(session, TaskDao(session).projectTasksQuery(projectId)),
+        exportFormat,
+        schemaFields(TaskModel),
+        serializerFor(TaskModel),
+        filename=f"project-{projectId}-tasks",
+    )
+
+
+@router.get("/projects/{projectId}/logs/export", response_model=list[TaskLogModel])
+def exportProjectLogs(
+    request: Request,
+    projectId: uuid.UUID,
+    exportFormat: ExportFormat = Query(ExportFormat.json, alias="format"),
+    session: Session = Depends(getDbSession),
+):
+    return exportResponse(
+        request,
+        streamBatches(session, TaskDao(session).projectLogsQuery(projectId)),
+        exportFormat,
+        schemaFields(TaskLogModel),
+        serializerFor(TaskLogModel),
+        filename=f"project-{projectId}-logs",
+    )
+
+
+@router.get("/tasks/{taskId}", response_model=TaskModel, response_class=FastJSONResponse)
+def getTask(request: Request, taskId: uuid.UUID, session: Session = Depends(getDbSession)):
+    dao = TaskDao(session)
+    if hasConditionalHeaders(request):
+        # Answer revalidation from updated_at alone; the row is only read if it changed.
+        version = dao.getTaskVersion(taskId)
+        if version is None:
+            raise _taskNotFound(taskId)
+        if version.updated_at is not None:  # never stamped: no validator, send it all
+            validators = validatorsFor(
+                "task", taskId, version.updated_at, lastModified=version.updated_at
+            )
+            if isNotModified(request, validators):
+                return notModified(validators)
+
+    row = dao.getTask(taskId)
+    if row is None:
+        raise _taskNotFound(taskId)
+    task = serializerFor(TaskModel)(row)
+    return FastJSONResponse(task, headers=resourceHeaders("task", taskId, task["updated_at"]))
+
+
+@router.patch("/tasks/{taskId}", response_model=TaskModel, response_class=FastJSONResponse)
+def updateTask(
+    request: Request,
+    taskId: uuid.UUID,
+    changes: TaskUpdateModel,
+    session: Session = Depends(getDbSession),
+):
+    task = TaskDao(session).lockTask(taskId)
+    if task is None:
+        raise _taskNotFound(taskId)
+    requireIfMatch(
+        request,
+        validatorsFor("task", taskId, task.updated_at, lastModified=task.updated_at),
+        required=getSettings().REQUIRE_IF_MATCH,
+    )
+
+    for field, value in changes.model_dump(exclude_unset=True).items():
+        setattr(task, field, value)
+    session.commit()
+
+    body = serializerFor(TaskModel)(tuple(getattr(task, field) for field in schemaFields(TaskModel)))
+    validators = validatorsFor("task", taskId, task.updated_at, lastModified=task.updated_at)
+    return FastJSONResponse(body, headers=validators.headers)
@@ -0,0 +1,44 @@
+import uuid
+
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.orm import Session
+
+from src.config.database.zen_task_db_handler import getDbSession
+from src.config.exceptions.failure_exception import FailureException, LogLevel
+from src.core.utils.http_cache import (hasConditionalHeaders, isNotModified,
+                                       notModified, resourceHeaders,
+                                       validatorsFor)
+from src.core.utils.serialization import FastJSONResponse, serializerFor
+from src.features.todos.data.datasource.daos.user_dao import UserDao
+from src.features.todos.data.models.user_model import UserModel
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+
+def _userNotFound(userId) -> FailureException:
+    return FailureException(
+        level=LogLevel.NOT_FOUND,
+        message=f"User {userId} not found.",
+        userMessage="User not found.",
+    )
+
+
+@router.get("/{userId}", response_model=UserModel, response_class=FastJSONResponse)
+def getUser(request: Request, userId: uuid.UUID, session: Session = Depends(getDbSession)):
+    dao = UserDao(session)
+    if hasConditionalHeaders(request):
+        version = dao.getUserVersion(userId)
+        if version is None:
+            raise _userNotFound(userId)
+        if version.updated_at is not None:
+            validators = validatorsFor(
+                "user", userId, version.updated_at, lastModified=version.updated_at
+            )
+            if isNotModified(request, validators):
+                return notModified(validators)
+
+    row = dao.getUser(userId)
+    if row is None:
+        raise _userNotFound(userId)
+    user = serializerFor(UserModel)(row)
+    return FastJSONResponse(user, headers=resourceHeaders("user", userId, user["updated_at"]))
@@ -0,0 +1,67 @@
+from celery import Celery
+from kombu import Exchange, Queue
+
+from src.config.settings.config import getSettings
+
+INTERACTIVE_QUEUE = "interactive"
+BATCH_QUEUE = "batch"
+
+TASK_MODULES = [
+    "src.workers.tasks.analytics",
+    "src.workers.tasks.rescoring",
+    "src.workers.tasks.scheduling",
+    "src.workers.tasks.sync",
+    "src.workers.tasks.vault_scan",
+]
+
+# Work a user is waiting on goes to "interactive"; everything else is "batch".
+TASK_ROUTES = {
+    "src.workers.tasks.rescoring.rescoreProjectTasks": {"queue": INTERACTIVE_QUEUE},
+    "src.workers.tasks.scheduling.replanUserSchedule": {"queue": INTERACTIVE_QUEUE},
+    "src.workers.tasks.analytics.*": {"queue": BATCH_QUEUE},
+    "src.workers.tasks.rescoring.*": {"queue": BATCH_QUEUE},
+    "src.workers.tasks.sync.*": {"queue": BATCH_QUEUE},
+    "src.workers.tasks.vault_scan.*": {"queue": BATCH_QUEUE},
+}
+
+
+def _buildConfig() -> dict:
+    settings = getSettings()
+    return {
+        "broker_url": settings.CELERY_BROKER_URL,
+        "result_backend": settings.CELERY_RESULT_BACKEND,
+        "result_expires": settings.CELERY_RESULT_EXPIRES,
+        "task_always_eager": settings.CELERY_TASK_ALWAYS_EAGER,
+        "task_eager_propagates": True,
+        "task_queues": (
+            Queue(INTERACTIVE_QUEUE, Exchange(INTERACTIVE_QUEUE), routing_key=INTERACTIVE_QUEUE),
+            Queue(BATCH_QUEUE, Exchange(BATCH_QUEUE), routing_key=BATCH_QUEUE),
+        ),
+        "task_default_queue": BATCH_QUEUE,
+        "task_routes": TASK_ROUTES,
+        # Tasks are idempotent, so redelivery after a worker crash is safe.
+        "task_acks_late": True,
+        "task_reject_on_worker_lost": True,
+        "worker_prefetch_multiplier": 1,
+        "task_serializer": "json",
+        "result_serializer": "json",
+        "accept_content": ["json"],
+        "timezone": "UTC",
+    }
+
+
+celery_app = Celery("zen_task_manager", include=TASK_MODULES)
+# Settings are read on first use so importing task modules never requires the environment.
+celery_app.add_defaults(_buildConfig)
+
+
+def configureEager(app: Celery = celery_app) -> Celery:
+    """Run every task in-process, with an in-memory broker and result store."""
+    app.conf.update(
+        broker_url="memory://",
+        result_backend="cache+memory://",
+        task_always_eager=True,
+        task_eager_propagates=True,
+        task_store_eager_result=True,
+    )
+    return app
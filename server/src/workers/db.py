@@ -0,0 +1,23 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy.orm import Session
+
+
+@contextmanager
+def sessionScope() -> Iterator[Session]:
+    # Imported lazily so task modules can be loaded (and run eagerly) without a database.
+    from src.config.database.zen_task_db_handler import ZenTaskDbHandler
+    from src.core.sync.changelog import installChangeLog
+
+    installChangeLog()  # worker writes reach offline clients like API writes do
+    db = ZenTaskDbHandler.db()
+    session = db.getSession()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        db.closeSession(session)
@@ -0,0 +1,23 @@
+from typing import Iterable, Optional
+
+from celery import Task
+from celery.result import GroupResult
+
+from src.config.settings.config import getSettings
+from src.workers.celery_app import BATCH_QUEUE
+
+
+def fanOut(
+    task: Task,
+    ids: Iterable[str],
+    chunkSize: Optional[int] = None,
+    queue: str = BATCH_QUEUE,
+) -> GroupResult:
+    """Dispatch ``task(id)`` for every id, ``chunkSize`` calls per message.
+
+    Chunking keeps a 10k-project rollup from flooding the broker with 10k
+    messages while still spreading the work across workers. Chunks always go
+    to ``queue`` (batch by default), whatever the task's own route is.
+    """
+    chunkSize = chunkSize or getSettings().WORKER_FANOUT_CHUNK_SIZE
+    return task.chunks(((id,) for id in ids), chunkSize).group().apply_async(queue=queue)
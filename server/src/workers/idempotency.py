@@ -0,0 +1,103 @@
+import functools
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional
+
+import redis
+from fastapi.logger import logger
+
+from src.config.settings.config import getSettings
+
+
+class IdempotencyStore(ABC):
+    @abstractmethod
+    def claim(self, key: str, ttl: int) -> bool:
+        """Return True if the caller now owns ``key`` for ``ttl`` seconds."""
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        pass
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    def __init__(self):
+        self._claims: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def claim(self, key: str, ttl: int) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            expiresAt = self._claims.get(key)
+            if expiresAt is not None and expiresAt > now:
+                return False
+            self._claims[key] = now + ttl
+            return True
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._claims.pop(key, None)
+
+
+class RedisIdempotencyStore(IdempotencyStore):
+    def __init__(self, client: redis.Redis, prefix: str = "zen:job"):
+        self._client = client
+        self._prefix = prefix
+
+    def claim(self, key: str, ttl: int) -> bool:
+        try:
+            return bool(self._client.set(f"{self._prefix}:{key}", 1, nx=True, ex=ttl))
+        except redis.RedisError as e:
+            # Running twice is safe; never running is not.
+            logger.warning(f"Idempotency store unavailable, running job {key}: {e}")
+            return True
+
+    def release(self, key: str) -> None:
+        try:
+            self._client.delete(f"{self._prefix}:{key}")
+        except redis.RedisError:
+            pass
+
+
+_store: Optional[IdempotencyStore] = None
+
+
+def getIdempotencyStore() -> IdempotencyStore:
+    global _store
+    if _store is None:
+        settings = getSettings()
+        if settings.CELERY_TASK_ALWAYS_EAGER:
+            _store = MemoryIdempotencyStore()
+        else:
+            _store = RedisIdempotencyStore(redis.Redis.from_url(settings.CELERY_BROKER_URL))
+    return _store
+
+
+def setIdempotencyStore(store: Optional[IdempotencyStore]) -> None:
+    global _store
+    _store = store
+
+
+def idempotent(keyOf: Callable[..., str], ttl: Optional[int] = None):
+    """Skip a job while another run with the same key is in flight or recently finished.
+
+    The claim is released when the job fails so a retry can run again.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = f"{fn.__name__}:{keyOf(*args, **kwargs)}"
+            store = getIdempotencyStore()
+            if not store.claim(key, ttl or getSettings().WORKER_IDEMPOTENCY_TTL):
+                logger.info(f"Skipping duplicate job {key}")
+                return None
+            try:
+                return fn(*args, **kwargs)
+            except Exception:
+                store.release(key)
+                raise
+
+        return wrapper
+
+    return decorator
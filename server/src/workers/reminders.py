@@ -0,0 +1,33 @@
+import signal
+import threading
+from datetime import timedelta
+
+from src.config.settings.config import getSettings
+from src.core.reminders.notifier import LoggingNotifier
+from src.core.reminders.service import ReminderService
+from src.workers.db import sessionScope
+
+
+def buildReminderService() -> ReminderService:
+    settings = getSettings()
+    return ReminderService(
+        sessionScope,
+        LoggingNotifier(),
+        horizon=timedelta(minutes=settings.REMINDER_HORIZON_MINUTES),
+        refreshEvery=timedelta(seconds=settings.REMINDER_REFRESH_SECONDS),
+        batchSize=settings.REMINDER_BATCH_SIZE,
+        shardIndex=settings.REMINDER_SHARD_INDEX,
+        shardCount=settings.REMINDER_SHARD_COUNT,
+    )
+
+
+def main() -> None:
+    """Run one reminder dispatcher shard: ``python -m src.workers.reminders``."""
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    buildReminderService().run(stop)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+from typing import Iterable, Optional, Sequence
+
+from sqlalchemy import select, update
+
+from src.features.todos.data.datasource.tables.project_table import \
+    ProjectTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.workers.celery_app import celery_app
+from src.workers.db import sessionScope
+from src.workers.fanout import fanOut
+from src.workers.idempotency import idempotent
+
+
+def computeProjectRollup(rows: Iterable[Sequence]) -> dict:
+    """Aggregate ``(status, progress_percentage, estimated_hours)`` rows into a project rollup.
+
+    Progress is weighted by estimated hours; unestimated tasks count as one hour.
+    """
+    totalWeight = 0.0
+    weightedProgress = 0.0
+    statusCounts: dict = {}
+    for status, progress, estimatedHours in rows:
+        weight = estimatedHours or 1.0
+        totalWeight += weight
+        weightedProgress += weight * (progress or 0.0)
+        statusCounts[status or "none"] = statusCounts.get(status or "none", 0) + 1
+
+    return {
+        "task_count": sum(statusCounts.values()),
+        "status_counts": statusCounts,
+        "progress_percentage": round(weightedProgress / totalWeight, 2) if totalWeight else 0.0,
+    }
+
+
+@celery_app.task
+@idempotent(lambda projectId, revision=None: f"{projectId}:{revision}")
+def recomputeProjectRollup(projectId: str, revision: Optional[str] = None) -> dict:
+    with sessionScope() as session:
+        rows = session.execute(
+            select(TaskTable.status, TaskTable.progress_percentage, TaskTable.estimated_hours)
+            .where(TaskTable.project_id == projectId)
+        ).all()
+        rollup = computeProjectRollup(rows)
+        session.execute(
+            update(ProjectTable)
+            .where(ProjectTable.id == projectId)
+            .values(progress_percentage=rollup["progress_percentage"])
+        )
+    return rollup
+
+
+@celery_app.task
+def recomputeAllProjectRollups(chunkSize: Optional[int] = None) -> int:
+    with sessionScope() as session:
+        projectIds = [str(id) for id in session.scalars(select(ProjectTable.id))]
+    fanOut(recomputeProjectRollup, projectIds, chunkSize)
+    return len(projectIds)
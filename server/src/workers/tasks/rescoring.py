@@ -0,0 +1,96 @@
+from datetime import date
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import bindparam, select, update
+
+from src.core.sync.changelog import recordChanges
+from src.features.todos.data.datasource.tables.project_table import \
+    ProjectTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.workers.celery_app import celery_app
+from src.workers.db import sessionScope
+from src.workers.fanout import fanOut
+from src.workers.idempotency import idempotent
+
+PRIORITY_WEIGHTS = {
+    "low": 1.0,
+    "medium": 2.0,
+    "high": 3.0,
+    "urgent": 4.0,
+    "critical": 5.0,
+}
+
+
+def countDependents(tasks: Iterable[dict]) -> Dict[str, int]:
+    dependents: Dict[str, int] = {}
+    for task in tasks:
+        for dependencyId in task.get("dependencies") or []:
+            dependents[str(dependencyId)] = dependents.get(str(dependencyId), 0) + 1
+    return dependents
+
+
+def scoreTask(task: dict, dependentsCount: int, today: date) -> float:
+    """Heuristic priority score: base priority, due-date urgency and how much work it unblocks."""
+    priority = task.get("priority")
+    score = PRIORITY_WEIGHTS.get(getattr(priority, "value", priority), 2.0)
+
+    dueDate = task.get("due_date")
+    if dueDate is not None:
+        daysLeft = (dueDate - today).days
+        score += 3.0 if daysLeft < 0 else 2.0 / (1 + max(daysLeft, 0) / 7)
+
+    score += min(dependentsCount, 5) * 0.5
+    score *= 1 - min(task.get("progress_percentage") or 0.0, 100.0) / 200
+    return round(score, 3)
+
+
+@celery_app.task
+@idempotent(lambda projectId, revision=None: f"{projectId}:{revision}")
+def rescoreProjectTasks(projectId: str, revision: Optional[str] = None) -> int:
+    with sessionScope() as session:
+        tasks = [
+            dict(row)
+            for row in session.execute(
+                select(
+                    TaskTable.id,
+                    TaskTable.priority,
+                    TaskTable.due_date,
+                    TaskTable.dependencies,
+                    TaskTable.progress_percentage,
+                    TaskTable.ai_priority_score,
+                ).where(TaskTable.project_id == projectId, TaskTable.completed_at.is_(None))
+            ).mappings()
+        ]
+        if not tasks:
+            return 0
+
+        today = date.today()
+        dependents = countDependents(tasks)
+        scores = [
+            {"task_id": task["id"], "score": scoreTask(task, dependents.get(str(task["id"]), 0), today)}
+            for task in tasks
+        ]
+        # Unchanged scores are not rewritten, so they do not show up in every client's next sync.
+        changed = [
+            score
+            for score, task in zip(scores, tasks)
+            if score["score"] != task["ai_priority_score"]
+        ]
+        if changed:
+            # One executemany round-trip instead of an UPDATE per task.
+            session.connection().execute(
+                update(TaskTable.__table__)
+                .where(TaskTable.__table__.c.id == bindparam("task_id"))
+                .values(ai_priority_score=bindparam("score")),
+                changed,
+            )
+            recordChanges(session, TaskTable.__tablename__, [score["task_id"] for score in changed])
+    return len(scores)
+
+
+@celery_app.task
+def rescoreAllProjects(chunkSize: Optional[int] = None) -> int:
+    with sessionScope() as session:
+        projectIds = [str(id) for id in session.scalars(select(ProjectTable.id))]
+    fanOut(rescoreProjectTasks, projectIds, chunkSize)
+    return len(projectIds)
@@ -0,0 +1,16 @@
+import uuid
+
+from src.core.scheduling.scheduler import Scheduler
+from src.workers.celery_app import celery_app
+from src.workers.db import sessionScope
+
+# Per worker process: keeps the last plan of recently scheduled users for incremental replans.
+scheduler = Scheduler()
+
+
+@celery_app.task
+def replanUserSchedule(userId: str, full: bool = False) -> int:
+    """Refresh a user's time blocks after their tasks, settings or busy time changed."""
+    with sessionScope() as session:
+        result = scheduler.replan(session, uuid.UUID(str(userId)), full=full)
+    return len(result.diff.changed) + len(result.diff.removed)
@@ -0,0 +1,15 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.config.settings.config import getSettings
+from src.core.sync.changelog import purgeTombstones
+from src.workers.celery_app import celery_app
+from src.workers.db import sessionScope
+
+
+@celery_app.task
+def purgeSyncTombstones(days: Optional[int] = None) -> int:
+    """Forget deletes older than SYNC_TOMBSTONE_DAYS; clients that slept longer re-sync fully."""
+    days = days if days is not None else getSettings().SYNC_TOMBSTONE_DAYS
+    with sessionScope() as session:
+        return purgeTombstones(session, datetime.utcnow() - timedelta(days=days))
@@ -0,0 +1,92 @@
+import hashlib
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from sqlalchemy import select
+
+from src.features.todos.data.datasource.tables.markdown_file_table import \
+    MarkdownFileTable
+from src.features.todos.data.datasource.tables.user_settings_table import \
+    UserSettingsTable
+from src.workers.celery_app import celery_app
+from src.workers.db import sessionScope
+from src.workers.fanout import fanOut
+from src.workers.idempotency import idempotent
+
+_WIKI_LINK = re.compile(r"\[\[([^\]|#]+)")
+
+
+def readVaultFile(path: Path) -> dict:
+    content = path.read_bytes()
+    text = content.decode("utf-8", errors="replace")
+    return {
+        "content_hash": hashlib.sha256(content).hexdigest(),
+        "word_count": len(text.split()),
+        "links": sorted(set(link.strip() for link in _WIKI_LINK.findall(text))),
+        "last_modified": datetime.utcfromtimestamp(path.stat().st_mtime),
+    }
+
+
+@celery_app.task
+@idempotent(lambda vaultPath: vaultPath, ttl=60)
+def scanVault(vaultPath: str) -> Dict[str, int]:
+    """Sync ``markdown_files`` with a vault, re-reading only files whose mtime moved."""
+    root = Path(vaultPath).expanduser()
+    counts = {"scanned": 0, "created": 0, "updated": 0}
+    if not root.is_dir():
+        return counts
+
+    with sessionScope() as session:
+        known: Dict[str, MarkdownFileTable] = {
+            row.file_path: row
+            for row in session.scalars(
+                select(MarkdownFileTable).where(MarkdownFileTable.obsidian_vault == vaultPath)
+            )
+        }
+        for path in root.rglob("*.md"):
+            counts["scanned"] += 1
+            relativePath = str(path.relative_to(root))
+            existing: Optional[MarkdownFileTable] = known.get(relativePath)
+            mtime = datetime.utcfromtimestamp(path.stat().st_mtime)
+            if existing is not None and existing.last_modified == mtime:
+                continue
+
+            info = readVaultFile(path)
+            if existing is None:
+                session.add(
+                    MarkdownFileTable(
+                        file_path=relativePath,
+                        obsidian_vault=vaultPath,
+                        last_modified=info["last_modified"],
+                        content_hash=info["content_hash"],
+                        word_count=info["word_count"],
+                        linked_tasks=info["links"],
+                    )
+                )
+                counts["created"] += 1
+            elif existing.content_hash != info["content_hash"]:
+                existing.content_hash = info["content_hash"]
+                existing.word_count = info["word_count"]
+                existing.linked_tasks = info["links"]
+                existing.last_modified = info["last_modified"]
+                counts["updated"] += 1
+            else:
+                existing.last_modified = info["last_modified"]
+    return counts
+
+
+@celery_app.task
+def scanAllVaults(chunkSize: Optional[int] = None) -> int:
+    with sessionScope() as session:
+        vaults = [
+            path
+            for path in session.scalars(
+                select(UserSettingsTable.obsidian_vault_path)
+                .where(UserSettingsTable.obsidian_vault_path.is_not(None))
+                .distinct()
+            )
+        ]
+    fanOut(scanVault, vaults, chunkSize)
+    return len(vaults)
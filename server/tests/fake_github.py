@@ -0,0 +1,239 @@
+"""A small in-process stand-in for the GitHub REST API, for docs/roadmap tooling tests.
+
+Only the endpoints the issue generator uses are served. Every request is
+recorded in ``FakeGitHub.requests`` so tests can assert on API traffic.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlencode, urlparse
+
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeGitHub:
+    def __init__(self, owner: str = "zen", repo: str = "roadmap", perPageLimit: int = 100):
+        self.owner = owner
+        self.repo = repo
+        self.perPageLimit = perPageLimit
+        self.issues: List[dict] = []
+        self.labels: List[dict] = []
+        self.milestones: List[dict] = []
+        self.collaborators: List[str] = [owner]
+        self.requests: List[Tuple[str, str]] = []
+        # Called with (method, path, payload); returning (status, headers, body) overrides the reply
+        self.interceptors: List[Callable[[str, str, dict], Optional[tuple]]] = []
+        self.latency = 0.0
+        self.inFlight = 0
+        self.peakInFlight = 0
+        self._ticks = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def repoPath(self) -> str:
+        return f"/repos/{self.owner}/{self.repo}"
+
+    def start(self) -> "FakeGitHub":
+        fake = self
+
+        class Handler(_Handler):
+            github = fake
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def calls(self, method: str, path: str) -> int:
+        return sum(1 for request in self.requests if request == (method, path))
+
+    def stamp(self) -> str:
+        """A timestamp later than every one handed out before"""
+        with self._lock:
+            self._ticks += 1
+            return (EPOCH + timedelta(minutes=self._ticks)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def addIssue(self, title: str, body: str = "", **fields) -> dict:
+        stamp = self.stamp()
+        with self._lock:
+            number = len(self.issues) + 1
+            issue = {
+                "id": number,
+                "number": number,
+                "title": title,
+                "body": body,
+                "state": "open",
+                "labels": [],
+                "assignees": [],
+                "milestone": None,
+                "created_at": stamp,
+                "updated_at": stamp,
+                "url": f"{self.url}{self.repoPath}/issues/{number}",
+                "html_url": f"https://github.com/{self.owner}/{self.repo}/issues/{number}",
+                **fields,
+            }
+            self.issues.append(issue)
+            return issue
+
+    def addLabel(self, name: str, color: str = "ededed", description: str = "") -> dict:
+        label = {"name": name, "color": color, "description": description}
+        self.labels.append(label)
+        return label
+
+    def addMilestone(self, title: str, description: str = "", **fields) -> dict:
+        milestone = {
+            "number": len(self.milestones) + 1,
+            "title": title,
+            "description": description,
+            "state": "open",
+            "due_on": None,
+            **fields,
+        }
+        self.milestones.append(milestone)
+        return milestone
+
+    def repoJson(self) -> dict:
+        return {
+            "id": 1,
+            "name": self.repo,
+            "full_name": f"{self.owner}/{self.repo}",
+            "owner": {"login": self.owner},
+            "url": f"{self.url}{self.repoPath}",
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    github: FakeGitHub
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def _dispatch(self, method: str) -> None:
+        github = self.github
+        with github._lock:
+            github.inFlight += 1
+            github.peakInFlight = max(github.peakInFlight, github.inFlight)
+        try:
+            time.sleep(github.latency)
+            self._route(method)
+        finally:
+            with github._lock:
+                github.inFlight -= 1
+
+    def _route(self, method: str) -> None:
+        github = self.github
+        parsed = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        payload = self._body() if method in ("POST", "PATCH") else {}
+        github.requests.append((method, parsed.path))
+        for interceptor in github.interceptors:
+            override = interceptor(method, parsed.path, payload)
+            if override is not None:
+                status, headers, body = override
+                return self._send(status, json.dumps(body).encode(), headers)
+
+        if method == "GET" and parsed.path == github.repoPath:
+            return self._json(200, github.repoJson())
+        if method == "GET" and parsed.path == f"{github.repoPath}/issues":
+            issues = sorted(github.issues, key=lambda issue: issue["updated_at"], reverse=True)
+            return self._list(parsed.path, issues, query)
+        if method == "GET" and parsed.path == f"{github.repoPath}/labels":
+            return self._list(parsed.path, github.labels, query)
+        if method == "POST" and parsed.path == f"{github.repoPath}/labels":
+            return self._json(201, github.addLabel(**payload))
+        if method == "PATCH" and parsed.path.startswith(f"{github.repoPath}/labels/"):
+            name = unquote(parsed.path.rsplit("/", 1)[1]).lower()
+            label = next(label for label in github.labels if label["name"].lower() == name)
+            label.update(payload)
+            return self._json(200, label)
+        if method == "GET" and parsed.path == f"{github.repoPath}/milestones":
+            return self._list(parsed.path, github.milestones, query)
+        if method == "POST" and parsed.path == f"{github.repoPath}/milestones":
+            return self._json(201, github.addMilestone(**payload))
+        if method == "PATCH" and parsed.path.startswith(f"{github.repoPath}/milestones/"):
+            milestone = github.milestones[int(parsed.path.rsplit("/", 1)[1]) - 1]
+            milestone.update(payload)
+            return self._json(200, milestone)
+        if method == "POST" and parsed.path == f"{github.repoPath}/issues":
+            issue = github.addIssue(
+                payload.pop("title"),
+                payload.pop("body", "") or "",
+                labels=[{"name": name} for name in payload.get("labels", [])],
+                assignees=[{"login": login} for login in payload.get("assignees", [])],
+            )
+            return self._json(201, issue)
+        if method == "PATCH" and parsed.path.startswith(f"{github.repoPath}/issues/"):
+            number = int(parsed.path.rsplit("/", 1)[1])
+            issue = github.issues[number - 1]
+            if "labels" in payload:
+                payload["labels"] = [{"name": name} for name in payload["labels"]]
+            issue.update(payload, updated_at=github.stamp())
+            return self._json(200, issue)
+        if method == "GET" and parsed.path == f"{github.repoPath}/collaborators":
+            return self._json(200, [{"login": login} for login in github.collaborators])
+        if method == "GET" and parsed.path == "/search/issues":
+            return self._json(200, {"total_count": 0, "incomplete_results": False, "items": []})
+        self._json(404, {"message": "Not Found"})
+
+    def _list(self, path: str, items: List[dict], query: Dict[str, str]) -> None:
+        """One page of ``items`` with an ETag, answering 304 to a matching If-None-Match."""
+        github = self.github
+        perPage = min(int(query.get("per_page", 30)), github.perPageLimit)
+        page = int(query.get("page", 1))
+        chunk = items[(page - 1) * perPage : page * perPage]
+        body = json.dumps(chunk).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        headers = {"ETag": etag}
+        if page * perPage < len(items):
+            nextQuery = urlencode({**query, "page": page + 1})
+            headers["Link"] = f'<{github.url}{path}?{nextQuery}>; rel="next"'
+        self._send(200, body, headers)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _json(self, status: int, payload) -> None:
+        self._send(status, json.dumps(payload).encode())
+
+    def _send(self, status: int, body: bytes, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def signatureComment(signature: str) -> str:
+    return f"<!-- UNIQUE_SIGNATURE: {signature} -->"
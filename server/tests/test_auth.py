@@ -0,0 +1,245 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.config.database.base_table import Base
+from src.config.database.zen_task_db_handler import getDbSession
+from src.config.exceptions.failure_exception import FailureException
+from src.core.security.auth.services import (password_hasher, principal_cache,
+                                             token_service)
+from src.core.security.auth.services.password_hasher import (PasswordHasher,
+                                                             hashPassword)
+from src.core.security.auth.services.principal_cache import PrincipalCache
+from src.core.security.auth.services.token_service import TokenService
+from src.features.todos.data.datasource.tables.user_table import UserTable
+from src.features.todos.domain.enums.status import StatusEnum
+
+tables = Base.metadata.tables
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(scope="module")
+def hasher():
+    hasher = PasswordHasher(workers=2, maxPending=8, rounds=4)
+    yield hasher
+    hasher.shutdown()
+
+
+def test_hashing_runs_in_the_pool_and_verifies(hasher):
+    async def scenario():
+        passwordHash = await hasher.hash("correct horse")
+        return (
+            passwordHash,
+            await hasher.verify("correct horse", passwordHash),
+            await hasher.verify("wrong horse", passwordHash),
+            await hasher.verify("correct horse", None),
+            await hasher.verify("correct horse", "not-a-bcrypt-hash"),
+        )
+
+    passwordHash, good, bad, missing, garbage = asyncio.run(scenario())
+
+    assert passwordHash.startswith("$2b$04$")
+    assert (good, bad, missing, garbage) == (True, False, False, False)
+    assert not hasher.needsRehash(passwordHash)
+    assert PasswordHasher(rounds=12).needsRehash(passwordHash)
+
+
+def test_event_loop_keeps_ticking_during_a_login_storm():
+    hasher = PasswordHasher(workers=2, maxPending=64, rounds=10)
+    passwordHash = hashPassword("pw", 10)
+
+    async def scenario():
+        await hasher.verify("pw", passwordHash)  # start the pool outside the measurement
+        gaps, last = [], time.perf_counter()
+
+        async def heartbeat():
+            nonlocal last
+            while True:
+                await asyncio.sleep(0.005)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        beat = asyncio.ensure_future(heartbeat())
+        results = await asyncio.gather(*(hasher.verify("pw", passwordHash) for _ in range(12)))
+        beat.cancel()
+        return results, gaps
+
+    try:
+        results, gaps = asyncio.run(scenario())
+    finally:
+        hasher.shutdown()
+
+    assert all(results)
+    # Hashing on the loop would run the storm back to back, with no heartbeat in between.
+    assert len(gaps) >= 3
+
+
+def test_a_full_queue_turns_logins_away(hasher):
+    small = PasswordHasher(workers=1, maxPending=2, rounds=4)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(small.verify("pw", None) for _ in range(3)), return_exceptions=True
+        )
+
+    try:
+        results = asyncio.run(scenario())
+    finally:
+        small.shutdown()
+
+    assert [isinstance(result, FailureException) for result in results] == [False, False, True]
+
+
+def test_verified_tokens_are_cached_until_they_expire():
+    clock = FakeClock()
+    tokens = TokenService("secret", expiresInSeconds=60, clock=clock)
+    userId = uuid.uuid4()
+    token, expiresIn = tokens.issue(userId)
+
+    assert expiresIn == 60
+    assert tokens.verify(token).userId == userId
+    assert tokens.verify(token).userId == userId
+    assert (tokens.hits, tokens.misses) == (1, 1)
+
+    clock.now += 60
+    assert tokens.verify(token) is None
+    assert tokens.verify(token[:-2] + "xx") is None
+    assert TokenService("other-secret", clock=clock).verify(tokens.issue(userId)[0]) is None
+
+
+def test_token_cache_is_bounded():
+    clock = FakeClock()
+    tokens = TokenService("secret", expiresInSeconds=60, maxEntries=3, clock=clock)
+    issued = []
+    for _ in range(5):
+        issued.append(tokens.issue(uuid.uuid4())[0])
+        clock.now += 1
+    for token in issued:
+        tokens.verify(token)
+
+    assert len(tokens._verified) == 3
+    assert list(tokens._verified) == issued[2:]
+
+
+@pytest.fixture
+def users(sqlite_engine):
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    with Session(sqlite_engine) as session:
+        session.execute(
+            insert(tables["users"]),
+            [
+                {
+                    "id": userId,
+                    "username": f"user{index}",
+                    "email": f"user{index}@x.io",
+                    "password_hash": hashPassword(f"pw{index}", 4),
+                }
+                for index, userId in enumerate(ids)
+            ],
+        )
+        session.commit()
+    return ids
+
+
+def test_principals_are_cached_and_invalidated_on_commit(sqlite_engine, users, query_budget,
+                                                         monkeypatch):
+    cache = PrincipalCache()
+    sessions = sessionmaker(sqlite_engine)
+    monkeypatch.setattr(principal_cache, "_installed", False)
+    principal_cache.installPrincipalInvalidation(cache, target=sessions)
+    first, second = users
+
+    with sessions() as session:
+        assert cache.get(session, first).username == "user0"
+        with query_budget(0):
+            assert cache.get(session, first).username == "user0"
+        cache.get(session, second)
+
+    with sessions() as session:
+        session.get(UserTable, first).username = "renamed"
+        session.flush()
+        assert cache.get(session, first).username == "user0"  # not committed yet
+        session.commit()
+        assert cache.get(session, first).username == "renamed"
+        with query_budget(0):
+            cache.get(session, second)
+
+        session.execute(
+            update(UserTable).where(UserTable.id == second).values(status=StatusEnum.suspended)
+        )
+        session.commit()
+        assert not cache.get(session, second).isActive
+
+
+def test_principal_cache_expires_entries_and_skips_racing_loads(sqlite_engine, users):
+    clock = FakeClock(0.0)
+    cache = PrincipalCache(maxEntries=1, maxAge=30, clock=clock)
+    first, second = users
+
+    with Session(sqlite_engine) as session:
+        cache.get(session, first)
+        cache.get(session, second)
+        assert list(cache._entries) == [second]
+        clock.now = 31
+        assert cache.get(session, second) is not None
+        assert cache._entries[second][0] == 31
+
+        original = session.execute
+
+        def invalidatingExecute(*args, **kwargs):
+            cache.invalidate(first)  # a commit lands while the principal is being read
+            return original(*args, **kwargs)
+
+        session.execute = invalidatingExecute
+        cache.get(session, first)
+        assert first not in cache._entries
+
+
+@pytest.fixture
+def client(sqlite_engine, hasher, monkeypatch):
+    from src.app.main import app
+
+    def sqliteSession():
+        with Session(sqlite_engine) as session:
+            yield session
+
+    monkeypatch.setattr(password_hasher, "_hasher", hasher)
+    monkeypatch.setattr(token_service, "_tokens", TokenService("secret"))
+    monkeypatch.setattr(principal_cache, "_principals", PrincipalCache())
+    app.dependency_overrides[getDbSession] = sqliteSession
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_login_issues_a_token_that_authenticates(client, users):
+    response = client.post("/api/v1/auth/login", json={"username": "user0", "password": "pw0"})
+    assert response.status_code == 200
+    token = response.json()["access_token"]
+
+    me = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {token}"})
+    assert me.status_code == 200
+    assert me.json()["id"] == str(users[0])
+
+
+def test_login_and_tokens_are_rejected_when_wrong(client, users):
+    wrong = client.post("/api/v1/auth/login", json={"username": "user0", "password": "nope"})
+    unknown = client.post("/api/v1/auth/login", json={"username": "ghost", "password": "pw0"})
+    anonymous = client.get("/api/v1/auth/me")
+    forged = client.get("/api/v1/auth/me", headers={"Authorization": "Bearer not.a.token"})
+
+    assert [wrong.status_code, unknown.status_code] == [401, 401]
+    assert [anonymous.status_code, forged.status_code] == [401, 401]
+    assert forged.headers["WWW-Authenticate"] == "Bearer"
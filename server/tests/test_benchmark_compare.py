@@ -0,0 +1,36 @@
+import json
+
+from benchmarks.compare import compare, main, regressions
+
+
+def _write(path, stats):
+    path.write_text(
+        json.dumps({"benchmarks": [{"name": name, "stats": s} for name, s in stats.items()]})
+    )
+    return str(path)
+
+
+def test_regressions_above_threshold_fail_the_comparison(tmp_path, capsys):
+    baseline = _write(
+        tmp_path / "baseline.json",
+        {"test_a": {"median": 1.0e-3}, "test_b": {"median": 2.0e-3}, "test_gone": {"median": 1.0}},
+    )
+    current = _write(
+        tmp_path / "current.json",
+        {"test_a": {"median": 1.05e-3}, "test_b": {"median": 2.6e-3}, "test_new": {"median": 1.0}},
+    )
+
+    assert main([baseline, current, "--threshold", "10"]) == 1
+    output = capsys.readouterr().out
+    assert "test_b" in output and "+30.0%  REGRESSION" in output
+    assert "missing" in output and "new" in output
+
+    assert main([baseline, current, "--threshold", "50"]) == 0
+
+
+def test_faster_or_unmatched_benchmarks_are_not_regressions():
+    comparisons = compare({"a": 2.0, "b": 1.0}, {"a": 1.0, "c": 5.0})
+
+    assert [item.name for item in comparisons] == ["a", "b", "c"]
+    assert comparisons[0].change == -50.0
+    assert regressions(comparisons, 0) == []
@@ -0,0 +1,22 @@
+from sqlalchemy import text
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from src.config.database import zen_task_db_handler
+from src.config.database.zen_task_db import ZenTaskDatabase
+
+
+def test_each_request_gets_its_own_session(sqlite_engine, monkeypatch):
+    db = ZenTaskDatabase.__new__(ZenTaskDatabase)
+    db._engine = sqlite_engine
+    db._sessionFactory = sessionmaker(sqlite_engine)
+    db._scopedSession = scoped_session(db._sessionFactory)
+    monkeypatch.setattr(zen_task_db_handler, "_db", db)
+
+    # Two requests interleaving on one pool thread.
+    first, second = zen_task_db_handler.getDbSession(), zen_task_db_handler.getDbSession()
+    firstSession, secondSession = next(first), next(second)
+    assert firstSession is not secondSession
+    secondSession.execute(text("SELECT 1"))
+    first.close()  # the first request finishes; the second keeps its transaction
+    assert secondSession.in_transaction()
+    second.close()
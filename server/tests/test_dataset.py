@@ -0,0 +1,113 @@
+import asyncio
+import uuid
+
+import httpx
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from benchmarks.dataset import TABLE_ORDER, SyntheticDataset, loadDataset
+from benchmarks.load_test import (Targets, discoverTargets, percentile,
+                                  runLoadTest, summarize)
+from src.config.database.base_table import Base
+from src.config.database.zen_task_db_handler import getDbSession
+
+
+def test_same_seed_generates_the_same_rows():
+    first, second = SyntheticDataset(600, seed=3), SyntheticDataset(600, seed=3)
+
+    for name in TABLE_ORDER:
+        assert list(first.rows(name)) == list(second.rows(name))
+    assert next(SyntheticDataset(600, seed=4).rows("tasks"))["id"] != next(first.rows("tasks"))["id"]
+
+
+def test_task_graph_is_nested_acyclic_and_project_local():
+    dataset = SyntheticDataset(2000, seed=11)
+    seen = {}
+    for task in dataset.rows("tasks"):
+        if task["parent_task_id"] is not None:
+            assert seen[task["parent_task_id"]] == task["project_id"]
+        for dependency in task["dependencies"]:
+            # Only tasks emitted earlier in the same project, so no cycles.
+            assert seen[uuid.UUID(dependency)] == task["project_id"]
+        seen[task["id"]] = task["project_id"]
+
+    assert len(seen) == 2000
+    assert sum(dataset.projectSizes) == 2000
+    logged = {log["task_id"] for log in dataset.rows("task_logs")}
+    assert logged <= set(seen)
+    entityTagIds = {row["id"] for row in dataset.rows("entity_tags")}
+    assert {tag["entity_id"] for tag in dataset.rows("tags")} <= entityTagIds
+
+
+def test_load_dataset_populates_every_table(sqlite_engine):
+    dataset = SyntheticDataset(1000, seed=5)
+
+    counts = loadDataset(sqlite_engine, dataset, batchSize=700)
+
+    with Session(sqlite_engine) as session:
+        for name in TABLE_ORDER:
+            table = Base.metadata.tables[name]
+            assert session.scalar(select(func.count()).select_from(table)) == counts[name]
+        orphans = session.scalar(
+            text(
+                "SELECT count(*) FROM tasks child LEFT JOIN tasks parent "
+                "ON parent.id = child.parent_task_id "
+                "WHERE child.parent_task_id IS NOT NULL AND parent.id IS NULL"
+            )
+        )
+    assert counts["tasks"] == 1000
+    assert counts["task_logs"] > 0 and counts["time_blocks"] > 0
+    assert orphans == 0
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([0.2], 95) == 0.2
+    assert percentile([], 50) == 0.0
+
+
+def test_load_test_replays_the_api_mix_in_process(sqlite_engine):
+    from src.app.main import app
+
+    loadDataset(sqlite_engine, SyntheticDataset(500, seed=9))
+
+    def sqliteSession():
+        with Session(sqlite_engine) as session:
+            yield session
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            targets = await discoverTargets(client)
+            return await runLoadTest(client, targets, duration=1.0, concurrency=1, seed=1)
+
+    app.dependency_overrides[getDbSession] = sqliteSession
+    try:
+        results = asyncio.run(scenario())
+    finally:
+        app.dependency_overrides.clear()
+
+    rows = {row["endpoint"]: row for row in summarize(results, 1.0)}
+    assert rows["total"]["requests"] > 20
+    assert rows["total"]["failures"] == 0
+    assert rows["total"]["throttled"] == 0
+    assert rows["GET /projects/{projectId}/tasks"]["requests"] > 0
+    assert rows["total"]["p50_ms"] <= rows["total"]["p99_ms"]
+
+
+def test_load_test_reports_rate_limited_requests_apart():
+    targets = Targets(projectIds=["p"], taskIds=["t"], userIds=["u"])
+    transport = httpx.MockTransport(lambda request: httpx.Response(429))
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=transport, base_url="http://api") as client:
+            return await runLoadTest(client, targets, duration=0.2, concurrency=1, seed=1)
+
+    total = summarize(asyncio.run(scenario()), 0.2)[-1]
+
+    assert total["throttled"] > 0
+    assert total["statuses"] == {"429": total["throttled"]}
+    assert total["requests"] == 0
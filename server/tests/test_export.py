@@ -0,0 +1,141 @@
+import asyncio
+import csv
+import gzip
+import io
+import uuid
+from datetime import date, datetime, timedelta
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from src.config.database.base_table import Base
+from src.config.database.zen_task_db_handler import getDbSession
+from src.core.utils.export import gzipChunks, streamBatches, untilDisconnected
+from src.features.todos.domain.enums.priority import PriorityEnum
+
+TASKS = 2500
+
+
+@pytest.fixture
+def client(sqlite_engine):
+    from src.app.main import app
+
+    def sqliteSession():
+        with Session(sqlite_engine) as session:
+            yield session
+
+    app.dependency_overrides[getDbSession] = sqliteSession
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def projectId(sqlite_engine):
+    projectId = uuid.uuid4()
+    taskIds = [uuid.uuid4() for _ in range(TASKS)]
+    with Session(sqlite_engine) as session:
+        session.execute(insert(Base.metadata.tables["projects"]), [{"id": projectId, "name": "Zen"}])
+        session.execute(
+            insert(Base.metadata.tables["tasks"]),
+            [
+                {
+                    "id": taskId,
+                    "title": f"task, {i}",
+                    "project_id": projectId,
+                    "priority": PriorityEnum.high,
+                    "labels": ["a", "b"],
+                    "created_at": datetime(2025, 1, 1) + timedelta(seconds=i),
+                }
+                for i, taskId in enumerate(taskIds)
+            ],
+        )
+        session.execute(
+            insert(Base.metadata.tables["task_logs"]),
+            [{"id": uuid.uuid4(), "task_id": taskIds[0], "date": date(2025, 1, 2), "notes": "ok"}],
+        )
+        session.commit()
+    return projectId
+
+
+def test_ndjson_export_is_gzipped_when_accepted(client, projectId):
+    response = client.get(
+        f"/api/v1/projects/{projectId}/tasks/export",
+        params={"format": "ndjson"},
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.content.splitlines()
+    assert len(lines) == TASKS
+    assert orjson.loads(lines[-1])["title"] == f"task, {TASKS - 1}"
+
+
+def test_csv_export_quotes_and_flattens_values(client, projectId):
+    response = client.get(
+        f"/api/v1/projects/{projectId}/tasks/export",
+        params={"format": "csv"},
+        headers={"Accept-Encoding": "identity"},
+    )
+
+    assert "content-encoding" not in response.headers
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == TASKS
+    assert rows[0]["title"] == "task, 0"
+    assert rows[0]["priority"] == "high"
+    assert rows[0]["labels"] == '["a","b"]'
+    assert rows[0]["completed_at"] == ""
+
+
+def test_log_export(client, projectId):
+    logs = client.get(f"/api/v1/projects/{projectId}/logs/export").json()
+
+    assert [(log["date"], log["notes"]) for log in logs] == [("2025-01-02", "ok")]
+
+
+def test_batches_are_bounded(sqlite_engine, projectId):
+    tasks = Base.metadata.tables["tasks"]
+    with Session(sqlite_engine) as session:
+        sizes = [len(batch) for batch in streamBatches(session, select(tasks.c.id), batchSize=1000)]
+
+    assert sizes == [1000, 1000, 500]
+
+
+def test_gzip_stream_round_trips():
+    chunks = [f"line {i}\n".encode() * 50 for i in range(20)]
+
+    assert gzip.decompress(b"".join(gzipChunks(iter(chunks)))) == b"".join(chunks)
+
+
+class _Request:
+    def __init__(self, disconnectAfter: int):
+        self.url = type("Url", (), {"path": "/export"})()
+        self._checks = 0
+        self._disconnectAfter = disconnectAfter
+
+    async def is_disconnected(self) -> bool:
+        self._checks += 1
+        return self._checks > self._disconnectAfter
+
+
+def test_disconnect_stops_the_stream_and_closes_the_source():
+    closed = []
+
+    def source():
+        try:
+            for i in range(1_000_000):
+                yield [i]
+        finally:
+            closed.append(True)
+
+    batches = source()
+    chunks = (str(batch[0]).encode() for batch in batches)
+
+    async def consume():
+        return [chunk async for chunk in untilDisconnected(_Request(3), chunks, batches)]
+
+    assert asyncio.run(consume()) == [b"0", b"1", b"2"]
+    assert closed == [True]
@@ -0,0 +1,192 @@
+import asyncio
+import uuid
+from datetime import date
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from src.config.database.base_table import Base
+from src.features.todos.presentation.api.resolvers.context import GraphContext
+from src.features.todos.presentation.api.schema import schema
+
+NESTED_QUERY = """
+query ($limit: Int!) {
+  tasks(limit: $limit) {
+    id
+    title
+    project { id name }
+    assignee { id username }
+    milestones { id title }
+    logs { id notes }
+    tags { id name }
+  }
+}
+"""
+
+
+def _seed(session: Session, taskCount: int) -> None:
+    t = Base.metadata.tables
+    userIds = [uuid.uuid4() for _ in range(5)]
+    projectIds = [uuid.uuid4() for _ in range(5)]
+    tagIds = [uuid.uuid4() for _ in range(3)]
+    session.execute(
+        insert(t["users"]),
+        [{"id": id, "username": f"user{i}", "email": f"user{i}@zen.test"} for i, id in enumerate(userIds)],
+    )
+    session.execute(
+        insert(t["projects"]),
+        [{"id": id, "name": f"project{i}"} for i, id in enumerate(projectIds)],
+    )
+    session.execute(
+        insert(t["tags"]),
+        [{"id": id, "name": f"tag{i}", "color": "blue", "entity_id": uuid.uuid4()} for i, id in enumerate(tagIds)],
+    )
+    taskIds = [uuid.uuid4() for _ in range(taskCount)]
+    session.execute(
+        insert(t["tasks"]),
+        [
+            {"id": id, "title": f"task{i}", "project_id": projectIds[i % 5], "assigned_to": userIds[i % 5]}
+            for i, id in enumerate(taskIds)
+        ],
+    )
+    session.execute(
+        insert(t["milestones"]),
+        [{"id": uuid.uuid4(), "task_id": id, "title": f"m{n}"} for id in taskIds for n in range(2)],
+    )
+    session.execute(
+        insert(t["task_logs"]),
+        [{"id": uuid.uuid4(), "task_id": id, "date": date(2025, 1, n + 1), "notes": "ok"} for id in taskIds for n in range(3)],
+    )
+    session.execute(
+        insert(t["entity_tags"]),
+        [
+            {"id": uuid.uuid4(), "tag_id": tagIds[i % 3], "title": "t", "entity_type": "task", "entity_id": id}
+            for i, id in enumerate(taskIds)
+        ],
+    )
+    session.commit()
+
+
+def _runCounted(engine, taskCount: int):
+    statements = []
+    with Session(engine) as session:
+        _seed(session, taskCount)
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        result = asyncio.run(
+            schema.execute(
+                NESTED_QUERY,
+                variable_values={"limit": taskCount},
+                context_value=GraphContext(session),
+            )
+        )
+    assert result.errors is None, result.errors
+    return result.data["tasks"], statements
+
+
+@pytest.mark.parametrize("taskCount", [10, 100])
+def test_nested_task_query_uses_constant_query_count(sqlite_engine, taskCount):
+    tasks, statements = _runCounted(sqlite_engine, taskCount)
+
+    assert len(tasks) == taskCount
+    assert all(task["project"] and task["assignee"] for task in tasks)
+    assert all(len(task["milestones"]) == 2 and len(task["logs"]) == 3 for task in tasks)
+    assert all(len(task["tags"]) == 1 for task in tasks)
+    # tasks + project + assignee + milestones + logs + tags
+    assert len(statements) == 6
+
+
+def test_depth_limit_rejects_deep_queries():
+    deep = "{ tasks { " + "project { " * 6 + "id" + " }" * 6 + " } }"
+
+    result = asyncio.run(schema.execute(deep))
+
+    assert result.errors
+    assert "depth" in result.errors[0].message
+
+
+def test_complexity_limit_rejects_expensive_queries():
+    result = asyncio.run(
+        schema.execute(
+            "{ tasks(limit: 200) { logs { id notes timeSpent date progressPercentage } "
+            "milestones { id title status targetDate } tags { id name color icon } } }"
+        )
+    )
+
+    assert result.errors
+    assert "complexity" in result.errors[0].message
+
+
+@pytest.mark.parametrize("limit", [200, None])
+def test_complexity_limit_costs_limits_passed_as_variables(limit):
+    query = (
+        "query ($l: Int) { tasks(limit: $l) { logs { id notes timeSpent date progressPercentage } "
+        "milestones { id title status targetDate } tags { id name color icon } } }"
+    )
+    # None: the limit is not visible at all, so it is costed at the largest page the resolver serves.
+    result = asyncio.run(schema.execute(query, variable_values={"l": limit}))
+
+    assert result.errors
+    assert "complexity" in result.errors[0].message
+
+
+def test_graphql_route_loads_on_first_request(sqlite_engine):
+    from fastapi.testclient import TestClient
+
+    from src.app.main import app
+    from src.config.database.zen_task_db_handler import getDbSession
+
+    def sqliteSession():
+        with Session(sqlite_engine) as session:
+            yield session
+
+    app.dependency_overrides[getDbSession] = sqliteSession
+    try:
+        with Session(sqlite_engine) as session:
+            _seed(session, 3)
+        response = TestClient(app).post(
+            "/graphql", json={"query": NESTED_QUERY, "variables": {"limit": 10}}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert len(response.json()["data"]["tasks"]) == 3
+
+
+
+def test_loader_batches_of_one_request_never_share_its_session_concurrently():
+    import threading
+    import time
+    from types import SimpleNamespace
+
+    from src.features.todos.presentation.api.resolvers.loaders import \
+        GraphLoaders
+
+    running, overlaps = [], []
+    guard = threading.Lock()
+
+    def fetch(keys):
+        with guard:
+            running.append(keys)
+            overlaps.append(len(running))
+        time.sleep(0.01)  # long enough for another pool thread to start
+        with guard:
+            running.remove(keys)
+        return list(keys)
+
+    dao = SimpleNamespace(
+        projectsByIds=fetch, usersByIds=fetch, milestonesByTaskIds=fetch,
+        logsByTaskIds=fetch, tagsByTaskIds=fetch,
+    )
+
+    async def resolveAll():
+        loaders = GraphLoaders(dao)
+        return await asyncio.gather(
+            loaders.projectById.load(1), loaders.userById.load(2),
+            loaders.milestonesByTaskId.load(3), loaders.logsByTaskId.load(4),
+            loaders.tagsByTaskId.load(5),
+        )
+
+    assert asyncio.run(resolveAll()) == [1, 2, 3, 4, 5]
+    assert max(overlaps) == 1
@@ -0,0 +1,147 @@
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from src.config.database.base_table import Base
+from src.config.database.zen_task_db_handler import getDbSession
+from src.features.todos.domain.enums.priority import PriorityEnum
+
+
+@pytest.fixture
+def client(sqlite_engine):
+    from src.app.main import app
+
+    def sqliteSession():
+        with Session(sqlite_engine) as session:
+            yield session
+
+    app.dependency_overrides[getDbSession] = sqliteSession
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def task(sqlite_engine):
+    projectId, taskId = uuid.uuid4(), uuid.uuid4()
+    with Session(sqlite_engine) as session:
+        session.execute(
+            insert(Base.metadata.tables["projects"]),
+            [{"id": projectId, "name": "Zen", "updated_at": datetime(2025, 1, 1)}],
+        )
+        session.execute(
+            insert(Base.metadata.tables["tasks"]),
+            [
+                {
+                    "id": taskId,
+                    "title": "write docs",
+                    "project_id": projectId,
+                    "priority": PriorityEnum.medium,
+                    "updated_at": datetime(2025, 1, 1, 12),
+                }
+            ],
+        )
+        session.commit()
+    return projectId, taskId
+
+
+def test_task_revalidation_returns_304(client, task):
+    _, taskId = task
+    first = client.get(f"/api/v1/tasks/{taskId}")
+    etag = first.headers["etag"]
+
+    assert first.status_code == 200
+    assert first.json()["title"] == "write docs"
+    assert first.headers["last-modified"] == "Wed, 01 Jan 2025 12:00:00 GMT"
+
+    revalidated = client.get(f"/api/v1/tasks/{taskId}", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
+
+    since = client.get(
+        f"/api/v1/tasks/{taskId}", headers={"If-Modified-Since": first.headers["last-modified"]}
+    )
+    assert since.status_code == 304
+
+
+def test_stale_if_match_is_rejected(client, task):
+    _, taskId = task
+    etag = client.get(f"/api/v1/tasks/{taskId}").headers["etag"]
+
+    updated = client.patch(
+        f"/api/v1/tasks/{taskId}", json={"status": "done"}, headers={"If-Match": etag}
+    )
+    assert updated.status_code == 200
+    assert updated.json()["status"] == "done"
+    assert updated.headers["etag"] != etag
+
+    stale = client.patch(
+        f"/api/v1/tasks/{taskId}", json={"status": "todo"}, headers={"If-Match": etag}
+    )
+    assert stale.status_code == 412
+    assert stale.headers["etag"] == updated.headers["etag"]
+    assert client.get(f"/api/v1/tasks/{taskId}").json()["status"] == "done"
+
+
+def test_collection_etag_changes_with_contents(client, task):
+    projectId, taskId = task
+    url = f"/api/v1/projects/{projectId}/tasks"
+    etag = client.get(url).headers["etag"]
+
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(url, params={"limit": 1}, headers={"If-None-Match": etag}).status_code == 200
+
+    client.patch(f"/api/v1/tasks/{taskId}", json={"title": "write better docs"})
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_missing_entity_is_404_even_when_revalidating(client):
+    response = client.get(f"/api/v1/tasks/{uuid.uuid4()}", headers={"If-None-Match": '"x"'})
+    assert response.status_code == 404
+
+
+def test_rows_without_updated_at_are_served_in_full(client, sqlite_engine):
+    tables = Base.metadata.tables
+    projectId, taskId, userId = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    with Session(sqlite_engine) as session:
+        session.execute(
+            insert(tables["projects"]), [{"id": projectId, "name": "Old", "updated_at": None}]
+        )
+        session.execute(
+            insert(tables["tasks"]), [{"id": taskId, "title": "old", "updated_at": None}]
+        )
+        session.execute(
+            insert(tables["users"]),
+            [{"id": userId, "username": "old", "email": "old@zen.test", "updated_at": None}],
+        )
+        session.commit()
+
+    for url in (
+        f"/api/v1/projects/{projectId}", f"/api/v1/tasks/{taskId}", f"/api/v1/users/{userId}"
+    ):
+        response = client.get(url, headers={"If-None-Match": '"anything"'})
+        assert response.status_code == 200, url
+        assert response.json()["updated_at"] is None
+        assert "etag" not in response.headers
+
+
+def test_precondition_failures_use_the_error_body(client, task, monkeypatch):
+    from src.config.settings.config import getSettings
+
+    _, taskId = task
+    stale = client.patch(
+        f"/api/v1/tasks/{taskId}", json={"status": "done"}, headers={"If-Match": '"stale"'}
+    )
+    assert stale.status_code == 412
+    assert stale.json()["type"] == "VALIDATION" and stale.json()["user_message"]
+    assert "etag" in stale.headers
+
+    monkeypatch.setattr(getSettings(), "REQUIRE_IF_MATCH", True)
+    blind = client.patch(f"/api/v1/tasks/{taskId}", json={"status": "done"})
+    assert blind.status_code == 428
+    assert blind.json()["type"] == "VALIDATION"
+    assert client.get(f"/api/v1/tasks/{taskId}").json()["status"] != "done"
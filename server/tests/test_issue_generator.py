@@ -0,0 +1,364 @@
+import asyncio
+import hashlib
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+from tests.fake_github import FakeGitHub, signatureComment
+
+pytest.importorskip("github", reason="docs/roadmap/issue_generator.py needs PyGithub")
+
+ROADMAP_DIR = Path(__file__).resolve().parents[2] / "docs" / "roadmap"
+sys.path.insert(0, str(ROADMAP_DIR))
+try:
+    from github_async import AsyncGitHubClient, GitHubAPIError
+    from issue_generator import GitHubIssueGenerator, Phase, Task
+finally:
+    sys.path.remove(str(ROADMAP_DIR))
+
+
+@pytest.fixture
+def github():
+    fake = FakeGitHub().start()
+    yield fake
+    fake.stop()
+
+
+def makeGenerator(github: FakeGitHub, cacheDir: Path) -> GitHubIssueGenerator:
+    return GitHubIssueGenerator(
+        "token", github.owner, github.repo, api_url=github.url, cache_dir=str(cacheDir)
+    )
+
+
+def seedIssues(generator: GitHubIssueGenerator, github: FakeGitHub, count: int) -> list:
+    signatures = []
+    for index in range(count):
+        signature = generator._generate_signature(f"Task {index}", "Phase 1: Core", 1)
+        github.addIssue(f"Task {index}", f"{signatureComment(signature)}\n\nBody")
+        signatures.append(signature)
+    return signatures
+
+
+def makeTask(generator: GitHubIssueGenerator, title: str, subtasks=None) -> Task:
+    return Task(
+        title=title,
+        description=generator._generate_yaml_task_description(
+            title, "", "Phase 1: Core", "Week 1", 1, "Backend", 2.0, [], "Zen"
+        ),
+        phase="Phase 1: Core",
+        week=1,
+        day_range="1-2",
+        category="Backend",
+        priority="high",
+        labels=["backend"],
+        estimated_hours=3.0,
+        subtasks=subtasks,
+    )
+
+
+def makePhases(tasks: list) -> list:
+    return [Phase(name="Phase 1: Core", description="", duration_weeks=1, tasks=tasks, labels=[])]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_index_is_built_from_one_paginated_listing(github, tmp_path):
+    generator = makeGenerator(github, tmp_path)
+    signatures = seedIssues(generator, github, 250)
+    github.addIssue("Hand-written issue", None)
+
+    index = generator.load_signature_index()
+
+    assert index == {signature: number for number, signature in enumerate(signatures, 1)}
+    assert github.calls("GET", f"{github.repoPath}/issues") == 3
+    assert all(generator._issue_exists(signature) for signature in signatures)
+    assert (tmp_path / f"{github.owner}_{github.repo}_signatures.json").exists()
+
+
+def test_cached_index_is_revalidated_with_etag(github, tmp_path):
+    signatures = seedIssues(makeGenerator(github, tmp_path), github, 250)
+    makeGenerator(github, tmp_path).load_signature_index()
+    github.requests.clear()
+
+    unchanged = makeGenerator(github, tmp_path).load_signature_index()
+    assert set(unchanged) == set(signatures)
+    assert github.calls("GET", f"{github.repoPath}/issues") == 1
+
+    generator = makeGenerator(github, tmp_path)
+    newest = generator._generate_signature("Late task", "Phase 2: Sync", 3)
+    github.addIssue("Late task", signatureComment(newest))
+    github.requests.clear()
+
+    # Only the first page is read: it already reaches issues older than the cache.
+    assert set(generator.load_signature_index()) == set(signatures) | {newest}
+    assert github.calls("GET", f"{github.repoPath}/issues") == 1
+
+
+def test_create_issues_skips_duplicates_without_searching(github, tmp_path):
+    generator = makeGenerator(github, tmp_path)
+    phases = makePhases([makeTask(generator, title) for title in ("Schema", "API", "Schema")])
+    seedIssues(generator, github, 120)
+
+    created = generator.create_issues(phases, {}, max_tasks=10)
+
+    assert [issue["title"] for issue in created] == ["Schema", "API"]
+    assert github.calls("GET", "/search/issues") == 0
+    assert github.calls("GET", f"{github.repoPath}/issues") == 2
+
+    rerun = makeGenerator(github, tmp_path)
+    assert rerun.create_issues(phases, {}, max_tasks=10) == []
+    assert github.calls("POST", f"{github.repoPath}/issues") == 2
+
+
+def test_epics_and_sub_issues_are_created_concurrently(github, tmp_path):
+    github.latency = 0.05
+    generator = makeGenerator(github, tmp_path)
+    tasks = [makeTask(generator, f"Task {index}") for index in range(4)] + [
+        makeTask(generator, f"Epic {index}", subtasks=["Model", "Routes", "Tests"])
+        for index in range(2)
+    ]
+
+    created = generator.create_issues(makePhases(tasks), {}, max_tasks=10, concurrency=4)
+
+    assert len(created) == 12
+    assert 1 < github.peakInFlight <= 4
+    epic = next(issue for issue in github.issues if issue["title"] == "Epic 0 (Coordination)")
+    subNumbers = [
+        issue["number"] for issue in github.issues if issue["title"].endswith("(part of Epic 0)")
+    ]
+    assert all(f"[#{number}]" in epic["body"] for number in subNumbers)
+    assert {label["name"] for label in epic["labels"]} == {"backend", "epic", "coordination"}
+    assert not (tmp_path / f"{github.owner}_{github.repo}_checkpoint.json").exists()
+
+
+def test_client_backs_off_on_primary_and_secondary_limits(github):
+    clock = FakeClock()
+    responses = [
+        (403, {"Retry-After": "3"}, {"message": "You have exceeded a secondary rate limit."}),
+        (
+            429,
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(clock.now) + 60)},
+            {"message": "API rate limit exceeded"},
+        ),
+    ]
+    github.interceptors.append(
+        lambda method, path, payload: responses.pop(0) if method == "POST" and responses else None
+    )
+
+    async def scenario():
+        client = AsyncGitHubClient(
+            "token", github.url, concurrency=4, sleep=clock.sleep, clock=clock
+        )
+        async with client:
+            issue = await client.post(f"{github.repoPath}/issues", {"title": "Limited"})
+        return client, issue
+
+    client, issue = asyncio.run(scenario())
+
+    assert issue["title"] == "Limited"
+    assert client.retries == 2
+    assert client.limiter.limit == 2
+    assert clock.sleeps[0] == 3.0
+    assert clock.now >= 1_000.0 + 60
+
+
+def test_post_is_not_resent_blindly_after_a_server_error(github):
+    github.interceptors.append(
+        lambda method, path, payload: (502, {}, {"message": "Bad Gateway"})
+        if method == "POST" else None
+    )
+
+    async def scenario():
+        async with AsyncGitHubClient("token", github.url, backoff_base=0) as client:
+            with pytest.raises(GitHubAPIError):
+                await client.post(f"{github.repoPath}/issues", {"title": "Once"})
+            return client
+
+    client = asyncio.run(scenario())
+
+    assert github.calls("POST", f"{github.repoPath}/issues") == 1
+    assert client.retries == 0
+
+
+@pytest.mark.parametrize("createdBeforeFailing", [True, False])
+def test_failed_issue_post_is_looked_up_before_reposting(github, tmp_path, createdBeforeFailing):
+    failures = [1]
+
+    def flaky(method, path, payload):
+        if method != "POST" or not failures:
+            return None
+        failures.pop()
+        if createdBeforeFailing:
+            github.addIssue(payload["title"], payload["body"])
+        return (502, {}, {"message": "Server Error"})
+
+    github.interceptors.append(flaky)
+    generator = makeGenerator(github, tmp_path)
+    created = generator.create_issues(makePhases([makeTask(generator, "Sync")]), {}, max_tasks=1)
+
+    assert [issue["title"] for issue in github.issues] == ["Sync"]
+    assert created[0]["number"] == github.issues[0]["number"]
+    assert github.calls("POST", f"{github.repoPath}/issues") == (1 if createdBeforeFailing else 2)
+
+
+def test_interrupted_run_resumes_from_checkpoint(github, tmp_path):
+    checkpoint = tmp_path / f"{github.owner}_{github.repo}_checkpoint.json"
+    rejected = (422, {}, {"message": "Validation Failed"})
+    github.interceptors.append(
+        lambda method, path, payload: rejected
+        if method == "POST" and payload.get("title", "").startswith("Subtask 2")
+        else None
+    )
+    generator = makeGenerator(github, tmp_path)
+    phases = makePhases(
+        [makeTask(generator, "Sync"), makeTask(generator, "Auth", ["Login", "Logout"])]
+    )
+
+    generator.create_issues(phases, {}, max_tasks=10)
+    byTitle = {issue["title"]: issue for issue in github.issues}
+    epic = byTitle["Auth (Coordination)"]
+
+    assert checkpoint.exists()
+    assert "### Sub-issues" not in epic["body"]
+
+    github.interceptors.clear()
+    github.requests.clear()
+    created = makeGenerator(github, tmp_path).create_issues(phases, {}, max_tasks=10)
+
+    assert [issue["title"] for issue in created] == ["Subtask 2: Logout (part of Auth)"]
+    assert github.calls("POST", f"{github.repoPath}/issues") == 1
+    assert github.calls("PATCH", f"{github.repoPath}/issues/{epic['number']}") == 1
+    login = byTitle["Subtask 1: Login (part of Auth)"]["number"]
+    assert f"[#{login}] Login" in epic["body"]
+    assert f"[#{created[0]['number']}] Logout" in epic["body"]
+    assert not checkpoint.exists()
+
+
+def writeRoadmap(path: Path, data: dict) -> str:
+    path.write_text(yaml.safe_dump(data, allow_unicode=True, sort_keys=False), encoding="utf-8")
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@pytest.fixture
+def appliedRoadmap(github, tmp_path):
+    """docs/roadmap/roadmap.yaml fully applied to the fake repository."""
+    data = yaml.safe_load((ROADMAP_DIR / "roadmap.yaml").read_text(encoding="utf-8"))
+    path = tmp_path / "roadmap.yaml"
+    sourceHash = writeRoadmap(path, data)
+    generator = makeGenerator(github, tmp_path)
+    plan = generator.plan_changes(generator.parse_yaml_roadmap(str(path)), sourceHash)
+    created = generator.apply_plan(plan, {}, concurrency=8)
+    assert len(created) == len(plan.of("create")) == len(github.issues)
+    return data, path
+
+
+def replan(github, tmp_path, data: dict, path: Path):
+    sourceHash = writeRoadmap(path, data)
+    generator = makeGenerator(github, tmp_path)
+    github.requests.clear()
+    return generator, generator.plan_changes(generator.parse_yaml_roadmap(str(path)), sourceHash)
+
+
+def test_editing_one_task_makes_one_api_call(github, tmp_path, appliedRoadmap):
+    data, path = appliedRoadmap
+    unchanged = makeGenerator(github, tmp_path).roadmap_planner()
+    assert unchanged.unchanged(hashlib.sha256(path.read_bytes()).hexdigest())
+
+    task = data["phases"][1]["weeks"][0]["categories"][0]["tasks"][0]
+    task["description"] = "Rewritten while the roadmap was being reviewed."
+    generator, plan = replan(github, tmp_path, data, path)
+
+    assert [(change.action, change.fields) for change in plan.changes] == [("update", ["body"])]
+    generator.apply_plan(plan, {})
+
+    assert github.requests == [("PATCH", f"{github.repoPath}/issues/{plan.changes[0].number}")]
+    epic = github.issues[plan.changes[0].number - 1]
+    assert "Rewritten while the roadmap" in epic["body"]
+    assert "### Sub-issues" in epic["body"]
+    _, again = replan(github, tmp_path, data, path)
+    assert again.changes == []
+
+
+def test_plan_adds_sub_issues_and_closes_removed_tasks(github, tmp_path, appliedRoadmap):
+    data, path = appliedRoadmap
+    tasks = data["phases"][0]["weeks"][0]["categories"][0]["tasks"]
+    tasks[0]["subtasks"].append("Write the README")
+    removed = data["phases"][0]["weeks"][0]["categories"].pop(1)["tasks"]
+    generator, plan = replan(github, tmp_path, data, path)
+
+    closing = sum(1 + len(task["subtasks"]) for task in removed)
+    # The epic's hours are now split five ways, so the four existing sub-issue bodies change too
+    assert len(plan.of("create")) == 1
+    assert [change.fields for change in plan.of("update")] == [["body"]] * 5
+    assert len(plan.of("close")) == closing
+
+    created = generator.apply_plan(plan, {})
+
+    assert [issue["title"] for issue in created] == [
+        f"Subtask 5: Write the README (part of {tasks[0]['title']})"
+    ]
+    assert github.calls("POST", f"{github.repoPath}/issues") == 1
+    assert sum(1 for method, _ in github.requests if method == "PATCH") == 5 + closing
+    assert sum(1 for issue in github.issues if issue["state"] == "closed") == closing
+    epic = github.issues[plan.of("update")[0].number - 1]
+    assert epic["title"] == f"{tasks[0]['title']} (Coordination)"
+    assert f"[#{created[0]['number']}] Write the README" in epic["body"]
+
+
+def test_labels_and_milestones_are_reconciled_in_bulk(github, tmp_path):
+    for index in range(150):
+        github.addLabel(f"legacy-{index}")
+    github.addLabel("High", color="000000", description="High priority task")
+    github.addLabel("medium", color="fbca04", description="Medium priority task")
+    generator = makeGenerator(github, tmp_path)
+    phases = generator.parse_yaml_roadmap(str(ROADMAP_DIR / "roadmap.yaml"))
+    github.addMilestone(phases[0].name, "Outdated description", due_on="2025-03-01T00:00:00Z")
+    wanted = {label["name"] for label in generator._standard_labels(phases)}
+    labelsPath = f"{github.repoPath}/labels"
+    milestonesPath = f"{github.repoPath}/milestones"
+    github.requests.clear()
+
+    generator.create_labels(phases)
+    milestones = generator.create_milestones(phases)
+
+    assert github.calls("GET", labelsPath) == 2
+    assert github.calls("POST", labelsPath) == len(wanted) - 2
+    assert github.calls("PATCH", f"{labelsPath}/High") == 1
+    assert github.labels[150]["color"] == "d73a4a"
+    assert github.calls("GET", milestonesPath) == 1
+    assert github.calls("POST", milestonesPath) == len(phases) - 1
+    assert github.calls("PATCH", f"{milestonesPath}/1") == 1
+    assert github.milestones[0]["due_on"] == "2025-03-01T00:00:00Z"
+    assert list(milestones) == [phase.name for phase in phases]
+    assert milestones[phases[0].name] == 1
+    assert sorted(milestones.values()) == list(range(1, len(phases) + 1))
+
+    for run in range(2):
+        github.requests.clear()
+        rerun = makeGenerator(github, tmp_path)
+        rerun.create_labels(phases)
+        assert rerun.create_milestones(phases) == milestones
+        assert {method for method, _ in github.requests} == {"GET"}
+    # The second rerun revalidates both cached listings: one 304 per page
+    assert github.calls("GET", labelsPath) == 2
+    assert github.calls("GET", milestonesPath) == 1
+
+    # Edited behind the cache's back, on the second page of labels
+    github.labels[150]["color"] = "000000"
+    github.requests.clear()
+    makeGenerator(github, tmp_path).create_labels(phases)
+    assert github.calls("PATCH", f"{labelsPath}/{github.labels[150]['name']}") == 1
+    assert github.labels[150]["color"] == "d73a4a"
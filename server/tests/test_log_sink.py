@@ -0,0 +1,94 @@
+import threading
+from datetime import datetime
+
+import pytest
+
+from src.config.exceptions.failure_exception import (ExceptionType,
+                                                     FailureException,
+                                                     LogLevel)
+from src.config.exceptions.log_sink import BufferedLogSink, setLogSink
+
+
+class FakeClock:
+    def __init__(self, now: datetime):
+        self.now = now.timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def sink(tmp_path):
+    sink = BufferedLogSink(tmp_path, maxBytes=10_000, maxFiles=3, flushInterval=0.01)
+    setLogSink(sink)
+    yield sink
+    setLogSink(None)
+    sink.close()
+
+
+def test_failure_exception_is_logged_off_thread(sink, tmp_path):
+    writes = []
+    original = sink._write
+    sink._write = lambda lines: (writes.append(threading.current_thread().name), original(lines))
+
+    FailureException(type=ExceptionType.DATABASE, level=LogLevel.ERROR, message="db down")
+    assert sink.flush()
+
+    assert writes == ["failure-log-sink"]
+    assert "Type: DATABASE - Message: db down" in sink.currentPath.read_text()
+
+
+def test_lines_are_written_in_batches(tmp_path):
+    sink = BufferedLogSink(tmp_path, batchSize=100, flushInterval=0.01)
+    sink._queue.mutex.acquire()  # hold the writer back so the whole burst is queued first
+    try:
+        for i in range(250):
+            sink._queue.queue.append(f"line {i}")
+        sink._queue.not_empty.notify()
+    finally:
+        sink._queue.mutex.release()
+    assert sink.flush()
+    sink.close()
+
+    assert sink.batches == 3
+    assert (tmp_path / f"Artaban_logs_{datetime.now().date()}.txt").read_text().count("\n") == 250
+
+
+def test_rotates_by_size_and_keeps_max_files(tmp_path):
+    sink = BufferedLogSink(tmp_path, maxBytes=200, maxFiles=3, batchSize=1, flushInterval=0.01)
+    for i in range(40):
+        sink.emit(f"{i:04d} " + "x" * 60)
+    sink.flush()
+    sink.close()
+
+    files = sorted(tmp_path.glob("Artaban_logs_*.txt"))
+    assert len(files) == 3
+    assert all(file.stat().st_size <= 200 for file in files)
+    assert "0039" in "".join(file.read_text() for file in files)
+
+
+def test_rotates_when_the_day_changes(tmp_path):
+    clock = FakeClock(datetime(2025, 3, 1, 23, 59))
+    sink = BufferedLogSink(tmp_path, flushInterval=0.01, clock=clock)
+    sink.emit("before midnight")
+    sink.flush()
+    clock.now += 120
+    sink.emit("after midnight")
+    sink.flush()
+    sink.close()
+
+    assert (tmp_path / "Artaban_logs_2025-03-01.txt").read_text() == "before midnight\n"
+    assert (tmp_path / "Artaban_logs_2025-03-02.txt").read_text() == "after midnight\n"
+
+
+def test_a_burst_of_raises_is_written_by_the_sink_thread(sink):
+    # Only queueing happens on the caller's thread; the old path did a directory scan per call.
+    writes = []
+    original = sink._write
+    sink._write = lambda lines: (writes.append(threading.current_thread().name), original(lines))
+    for _ in range(100):
+        FailureException(type=ExceptionType.VALIDATION, level=LogLevel.IGNORE, message="bad")
+    assert sink.flush()
+
+    assert set(writes) == {"failure-log-sink"}
+    assert sink.currentPath.read_text().count("Message: bad") == 100
@@ -0,0 +1,101 @@
+import threading
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.config.database.zen_task_db_handler import getDbSession
+from src.core.metrics.multiprocess import MultiprocessStore
+from src.core.metrics.registry import MetricsRegistry, mergeSnapshots, renderText
+
+
+@pytest.fixture
+def client(sqlite_engine):
+    from src.app.main import app
+
+    def sqliteSession():
+        with Session(sqlite_engine) as session:
+            yield session
+
+    app.dependency_overrides[getDbSession] = sqliteSession
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _value(text: str, prefix: str) -> float:
+    return sum(float(line.rsplit(" ", 1)[1]) for line in text.splitlines() if line.startswith(prefix))
+
+
+def test_counters_sum_across_threads():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs.", ("kind",))
+
+    def work():
+        for _ in range(10_000):
+            counter.inc(("a",))
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.samples() == {("a",): 80_000}
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, ("/x",))
+
+    text = renderText(registry.snapshot())
+
+    assert 'latency_seconds_bucket{route="/x",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/x",le="1.0"} 3' in text
+    assert 'latency_seconds_bucket{route="/x",le="+Inf"} 4' in text
+    assert 'latency_seconds_count{route="/x"} 4' in text
+    assert 'latency_seconds_sum{route="/x"} 4.05' in text
+
+
+def test_requests_are_recorded_by_route_template(client):
+    before = client.get("/metrics").text
+    missing = f"/api/v1/tasks/{uuid.uuid4()}"
+    client.get(missing)
+    client.get(missing)
+    client.get("/health")
+    text = client.get("/metrics").text
+
+    notFound = 'http_requests_total{method="GET",route="/api/v1/tasks/{taskId}",status="404"}'
+    assert _value(text, notFound) - _value(before, notFound) == 2
+    assert _value(text, 'failure_exceptions_total{type="NONE",level="NOT_FOUND"}') >= 2
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/health",le="+Inf"}' in text
+    assert missing not in text
+    assert text.startswith("# HELP")
+
+
+def test_multiprocess_store_merges_workers_and_drops_dead_gauges(tmp_path):
+    worker = MetricsRegistry()
+    worker.counter("requests_total", "Requests.").inc(amount=3)
+    worker.gauge("in_flight", "In flight.").inc(amount=2)
+    # A pid that cannot exist: its counters stay, its gauge is dropped.
+    MultiprocessStore(str(tmp_path), pid=2**22 + 12345).write(worker.snapshot())
+
+    own = MetricsRegistry()
+    own.counter("requests_total", "Requests.").inc(amount=4)
+    own.gauge("in_flight", "In flight.").inc()
+    merged = MultiprocessStore(str(tmp_path)).readAll(own.snapshot())
+
+    assert merged["requests_total"]["samples"] == [[[], 7]]
+    assert merged["in_flight"]["samples"] == [[[], 1]]
+
+
+def test_merge_adds_histograms_elementwise():
+    first, second = MetricsRegistry(), MetricsRegistry()
+    first.histogram("h", "H.", buckets=(1.0,)).observe(0.5)
+    second.histogram("h", "H.", buckets=(1.0,)).observe(2.0)
+
+    merged = mergeSnapshots([first.snapshot(), second.snapshot()])
+
+    assert merged["h"]["samples"] == [[[], [1, 1, 2.5]]]
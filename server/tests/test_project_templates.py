@@ -0,0 +1,231 @@
+import os
+import uuid
+from datetime import date
+
+import pytest
+import yaml
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.config.database.zen_task_db_handler import getDbSession
+from src.config.exceptions.failure_exception import FailureException
+from src.core.realtime import publishing
+from src.features.todos.data.datasource.daos.template_dao import TemplateDao
+from src.features.todos.data.datasource.tables.milestone_table import \
+    MilestoneTable
+from src.features.todos.data.datasource.tables.phase_table import PhaseTable
+from src.features.todos.data.datasource.tables.project_table import \
+    ProjectTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.features.todos.data.datasource.tables.task_template_table import \
+    TaskTemplateTable
+from src.features.todos.domain.enums.priority import PriorityEnum
+
+ROADMAP = os.path.join(os.path.dirname(__file__), "..", "..", "docs", "roadmap", "roadmap.yaml")
+
+tasks = TaskTable.__table__
+
+
+def _roadmap(phaseCount=4, weeksPerPhase=4, tasksPerWeek=5, subtasksPerTask=4):
+    week = 0
+    phaseDocs = []
+    for phase in range(phaseCount):
+        weekDocs = []
+        for _ in range(weeksPerPhase):
+            week += 1
+            weekDocs.append(
+                {
+                    "week_number": week,
+                    "categories": [
+                        {
+                            "category": "Build (Days 1-5)",
+                            "tasks": [
+                                {
+                                    "title": f"Week {week} task {index}",
+                                    "estimated_hours": 4,
+                                    "priority": "high" if index % 2 else "Unknown",
+                                    "subtasks": [f"step {n}" for n in range(subtasksPerTask)],
+                                }
+                                for index in range(tasksPerWeek)
+                            ],
+                        }
+                    ],
+                }
+            )
+        phaseDocs.append(
+            {"name": f"Phase {phase + 1}", "duration_weeks": weeksPerPhase, "weeks": weekDocs}
+        )
+    return {"project": {"name": "Synthetic", "type": "client-server"}, "phases": phaseDocs}
+
+
+def test_imports_the_real_roadmap(sqlite_engine):
+    with open(ROADMAP, encoding="utf-8") as file:
+        document = yaml.safe_load(file)
+    with Session(sqlite_engine) as session:
+        templateId = TemplateDao(session).importRoadmap(document)
+        session.commit()
+
+        phases = session.execute(
+            select(PhaseTable.title, PhaseTable.order_index)
+            .where(PhaseTable.template_id == templateId)
+            .order_by(PhaseTable.order_index)
+        ).all()
+        templates = session.execute(select(TaskTemplateTable)).scalars().all()
+
+    assert [phase.title for phase in phases] == [doc["name"] for doc in document["phases"]]
+    topLevel = [row for row in templates if row.parent_template_id is None]
+    subtasks = [row for row in templates if row.parent_template_id is not None]
+    assert len(topLevel) == 48
+    assert len(topLevel) + len(subtasks) == 257
+    first = min(topLevel, key=lambda row: row.order_index)
+    assert first.title == "Set up the project with FastAPI and Docker"
+    assert first.category == "Project Setup"
+    assert first.week_number == 1
+    assert first.default_priority == "high"
+
+
+def test_instantiation_clones_phases_tasks_and_milestones(sqlite_engine, query_budget):
+    ownerId = uuid.uuid4()
+    with Session(sqlite_engine) as session:
+        dao = TemplateDao(session)
+        templateId = dao.importRoadmap(_roadmap(phaseCount=2, weeksPerPhase=2, tasksPerWeek=2))
+        session.commit()
+
+        with query_budget(7):  # includes reading back the task ids for the sync change log
+            projectId = dao.instantiateProject(
+                templateId, name="Launch", ownerId=ownerId, startDate=date(2025, 1, 6)
+            )
+        session.commit()
+
+        project = session.get(ProjectTable, projectId)
+        rows = session.execute(select(tasks).where(tasks.c.project_id == projectId)).all()
+        milestones = session.execute(
+            select(MilestoneTable).order_by(MilestoneTable.target_date)
+        ).scalars().all()
+
+    assert (project.name, project.start_date, project.end_date) == (
+        "Launch", date(2025, 1, 6), date(2025, 2, 2)
+    )
+    byId = {row.id: row for row in rows}
+    phaseTasks = [row for row in rows if row.type == "phase"]
+    taskRows = [row for row in rows if row.type == "task"]
+    subtaskRows = [row for row in rows if row.type == "subtask"]
+    assert (len(phaseTasks), len(taskRows), len(subtaskRows)) == (2, 8, 32)
+
+    assert all(byId[row.parent_task_id].type == "phase" for row in taskRows)
+    assert all(byId[row.parent_task_id].type == "task" for row in subtaskRows)
+    assert all(row.assigned_to == ownerId and row.status == "todo" for row in rows)
+    assert {row.priority for row in taskRows} == {PriorityEnum.high, PriorityEnum.medium}
+    assert sorted(row.estimated_hours for row in phaseTasks) == [16, 16]
+
+    week3 = [row for row in taskRows if row.title.startswith("Week 3 ")]
+    assert {row.due_date for row in week3} == {date(2025, 1, 26)}
+    assert [(m.title, m.target_date) for m in milestones] == [
+        ("Phase 1", date(2025, 1, 19)),
+        ("Phase 2", date(2025, 2, 2)),
+    ]
+    assert {m.task_id for m in milestones} == {row.id for row in phaseTasks}
+
+
+def test_each_instantiation_gets_fresh_ids(sqlite_engine):
+    with Session(sqlite_engine) as session:
+        dao = TemplateDao(session)
+        templateId = dao.importRoadmap(_roadmap(phaseCount=1, weeksPerPhase=1, tasksPerWeek=3))
+        first = dao.instantiateProject(templateId)
+        second = dao.instantiateProject(templateId)
+        session.commit()
+
+        counts = dict(
+            session.execute(
+                select(tasks.c.project_id, func.count()).group_by(tasks.c.project_id)
+            ).all()
+        )
+        distinct = session.execute(select(func.count(func.distinct(tasks.c.id)))).scalar()
+
+    assert counts == {first: 1 + 3 + 12, second: 1 + 3 + 12}
+    assert distinct == 32
+
+
+def test_instantiates_a_500_task_template(sqlite_engine):
+    with Session(sqlite_engine) as session:
+        dao = TemplateDao(session)
+        # 4 phases x 5 weeks x 5 tasks x (1 + 4 subtasks) = 500 tasks
+        templateId = dao.importRoadmap(_roadmap(weeksPerPhase=5))
+        session.commit()
+
+        projectId = dao.instantiateProject(templateId)
+        session.commit()
+
+        count = session.execute(
+            select(func.count()).where(tasks.c.project_id == projectId, tasks.c.type != "phase")
+        ).scalar()
+
+    assert count == 500
+
+
+def test_unknown_template_is_rejected(sqlite_engine):
+    with Session(sqlite_engine) as session:
+        with pytest.raises(FailureException):
+            TemplateDao(session).instantiateProject(uuid.uuid4())
+
+
+def test_projects_are_created_from_a_template_over_http(sqlite_engine):
+    from src.app.main import app
+
+    def sqliteSession():
+        with Session(sqlite_engine) as session:
+            yield session
+
+    with Session(sqlite_engine) as session:
+        templateId = TemplateDao(session).importRoadmap(_roadmap(phaseCount=1, weeksPerPhase=1))
+        session.commit()
+
+    app.dependency_overrides[getDbSession] = sqliteSession
+    try:
+        client = TestClient(app)
+        created = client.post(
+            "/api/v1/projects/from-template",
+            json={"template_id": str(templateId), "name": "Launch", "start_date": "2025-01-06"},
+        )
+        missing = client.post(
+            "/api/v1/projects/from-template", json={"template_id": str(uuid.uuid4())}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert created.status_code == 201
+    assert created.json()["name"] == "Launch"
+    assert missing.status_code == 404
+    with Session(sqlite_engine) as session:
+        count = session.execute(
+            select(func.count()).where(tasks.c.project_id == uuid.UUID(created.json()["id"]))
+        ).scalar()
+    assert count == 1 + 5 * 5
+
+
+def test_instantiation_resyncs_the_owners_realtime_channel(sqlite_engine, monkeypatch):
+    resynced = []
+
+    class RecordingHub:
+        def publishThreadsafe(self, channel, entityId, change):
+            pass
+
+        def resyncThreadsafe(self, channel):
+            resynced.append(channel)
+
+    sessions = sessionmaker(sqlite_engine)
+    monkeypatch.setattr(publishing, "_installed", False)
+    publishing.installRealtimePublishing(RecordingHub(), target=sessions)
+    ownerId = uuid.uuid4()
+    with sessions() as session:
+        dao = TemplateDao(session)
+        templateId = dao.importRoadmap(_roadmap(phaseCount=1, weeksPerPhase=1))
+        session.commit()
+        dao.instantiateProject(templateId, ownerId=ownerId)
+        session.rollback()
+        projectId = dao.instantiateProject(templateId, ownerId=ownerId)
+        session.commit()
+        session.commit()
+
+    assert sorted(resynced) == sorted([f"project:{projectId}", f"user:{ownerId}"])
@@ -0,0 +1,189 @@
+import asyncio
+import uuid
+
+import pytest
+import redis
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.ratelimit.buckets import LocalBucketStore, RateLimit
+from src.core.ratelimit.middleware import RateLimitMiddleware
+from src.core.ratelimit.redis_buckets import RedisBucketStore
+from src.core.security.auth.services.token_service import TokenService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rates_parse_into_refill_and_burst():
+    assert RateLimit.parse("120/minute") == RateLimit(rate=2.0, burst=120)
+    assert RateLimit.parse("10/30seconds") == RateLimit(rate=10 / 30, burst=10)
+    assert RateLimit.parse(" 5 / hour ").burst == 5
+    with pytest.raises(ValueError):
+        RateLimit.parse("lots")
+
+
+def test_local_buckets_burst_then_refill():
+    clock = FakeClock()
+    store = LocalBucketStore(clock=clock)
+    limit = RateLimit(rate=1.0, burst=3)
+
+    assert [store.takeNow("a", limit) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert store.takeNow("a", limit) == pytest.approx(1.0)
+    assert store.takeNow("b", limit) == 0.0  # independent bucket
+
+    clock.now += 0.5
+    assert store.takeNow("a", limit) == pytest.approx(0.5)
+    clock.now += 0.5
+    assert store.takeNow("a", limit) == 0.0
+    clock.now += 100
+    assert [store.takeNow("a", limit) for _ in range(4)][-1] > 0  # refill stops at the burst
+
+
+def test_local_buckets_forget_full_buckets_first():
+    clock = FakeClock()
+    store = LocalBucketStore(maxKeys=3, clock=clock)
+    limit = RateLimit(rate=1.0, burst=2)
+    store.takeNow("idle", limit)
+    clock.now += 5
+    store.takeNow("busy1", limit)
+    store.takeNow("busy2", limit)
+    store.takeNow("busy2", limit)
+
+    store.takeNow("new", limit)
+
+    assert set(store._buckets) == {"busy1", "busy2", "new"}
+    assert store.takeNow("busy2", limit) > 0
+
+
+@pytest.fixture
+def tokens():
+    return TokenService("secret")
+
+
+@pytest.fixture
+def client(tokens):
+    app = FastAPI()
+
+    @app.get("/api/v1/tasks")
+    def listTasks():
+        return []
+
+    @app.post("/api/v1/tasks")
+    def createTask():
+        return {}
+
+    @app.post("/api/v1/auth/login")
+    def login():
+        return {}
+
+    @app.get("/health")
+    def health():
+        return {}
+
+    limits = {
+        "auth": RateLimit(rate=0.1, burst=1),
+        "read": RateLimit(rate=1.0, burst=3),
+        "write": RateLimit(rate=0.5, burst=2),
+        "graphql": None,
+    }
+    app.add_middleware(
+        RateLimitMiddleware,
+        limits=limits,
+        store=LocalBucketStore(),
+        tokens=tokens,
+        exemptPaths=["/health"],
+        verifyApiKey=lambda key: key == "sync-job",
+    )
+    return TestClient(app)
+
+
+def _statuses(client, count, method="get", path="/api/v1/tasks", **kwargs):
+    return [getattr(client, method)(path, **kwargs).status_code for _ in range(count)]
+
+
+def test_denied_requests_get_429_with_retry_after(client):
+    assert _statuses(client, 3) == [200, 200, 200]
+
+    denied = client.get("/api/v1/tasks")
+    assert denied.status_code == 429
+    assert denied.headers["Retry-After"] == "1"
+    assert denied.json()["user_message"].startswith("Too many requests")
+
+    # Writes and logins have their own buckets and limits.
+    assert _statuses(client, 3, "post") == [200, 200, 429]
+    login = client.post("/api/v1/auth/login")
+    assert (login.status_code, client.post("/api/v1/auth/login").headers["Retry-After"]) == (
+        200, "10",
+    )
+    assert _statuses(client, 5, path="/health") == [200] * 5
+
+
+def test_users_and_api_keys_get_their_own_buckets(client, tokens):
+    alice, bob = (tokens.issue(uuid.uuid4())[0] for _ in range(2))
+    asAlice = {"Authorization": f"Bearer {alice}"}
+
+    assert _statuses(client, 4, headers=asAlice) == [200, 200, 200, 429]
+    assert _statuses(client, 1, headers={"Authorization": f"Bearer {bob}"}) == [200]
+    assert _statuses(client, 4, headers={"X-API-Key": "sync-job"}) == [200, 200, 200, 429]
+    # An invalid token falls back to the client address, which still has its whole bucket.
+    assert _statuses(client, 3, headers={"Authorization": "Bearer forged"}) == [200] * 3
+    assert _statuses(client, 1) == [429]
+
+
+def test_unverified_api_keys_do_not_get_their_own_buckets(client):
+    logins = [
+        client.post("/api/v1/auth/login", headers={"X-API-Key": str(uuid.uuid4())}).status_code
+        for _ in range(3)
+    ]
+    assert logins == [200, 429, 429]
+
+
+class ScriptedRedis:
+    """Stands in for redis.asyncio.Redis: runs the bucket script's logic in Python."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.data = {}
+        self.down = False
+
+    def register_script(self, source):
+        async def script(keys, args):
+            if self.down:
+                raise redis.ConnectionError("connection refused")
+            rate, burst = float(args[0]), float(args[1])
+            tokens, updated = self.data.get(keys[0], (burst, self.clock.now))
+            tokens = min(burst, tokens + (self.clock.now - updated) * rate)
+            retry = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                retry = (1 - tokens) / rate
+            self.data[keys[0]] = (tokens, self.clock.now)
+            return str(retry).encode()
+
+        return script
+
+
+def test_redis_buckets_are_shared_and_fall_back_to_local_buckets():
+    clock = FakeClock()
+    server = ScriptedRedis(clock)
+    workers = [RedisBucketStore(server, retryAfterSeconds=5) for _ in range(2)]
+    limit = RateLimit(rate=1.0, burst=2)
+
+    async def scenario():
+        shared = [await worker.take("key:secret-api-key|read", limit) for worker in workers * 2]
+        server.down = True
+        local = [await workers[0].take("key:secret-api-key|read", limit) for _ in range(3)]
+        return shared, local
+
+    shared, local = asyncio.run(scenario())
+
+    assert shared[:2] == [0.0, 0.0] and all(retry > 0 for retry in shared[2:])
+    assert local[:2] == [0.0, 0.0] and local[2] > 0
+    assert all("secret" not in key for key in server.data)
@@ -0,0 +1,221 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlalchemy.orm import scoped_session, sessionmaker
+from starlette.websockets import WebSocketDisconnect
+
+from src.config.database import zen_task_db_handler
+from src.config.database.base_table import Base
+from src.config.database.zen_task_db import ZenTaskDatabase
+from src.core.realtime import publishing
+from src.core.realtime import router as realtime_router
+from src.core.realtime.hub import RealtimeHub
+from src.core.security.auth.services import principal_cache, token_service
+from src.core.security.auth.services.principal_cache import PrincipalCache
+from src.core.security.auth.services.token_service import TokenService
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+
+
+class FakeSocket:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.messages = []
+        self.closed = False
+
+    async def send_text(self, data: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.messages.append(json.loads(data))
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed = True
+
+
+async def snapshot(channel):
+    return {"channel": channel, "tasks": []}
+
+
+def test_snapshot_then_coalesced_delta():
+    async def scenario():
+        hub = RealtimeHub(snapshot, coalesceMs=10)
+        socket = FakeSocket()
+        client = hub.connect(socket)
+        hub.subscribe(client, "project:p1")
+        await asyncio.sleep(0.01)
+
+        hub.publish("project:p1", "t1", {"status": "doing"})
+        hub.publish("project:p1", "t1", {"progress_percentage": 50})
+        hub.publish("project:p1", "t2", {"op": "delete"})
+        await asyncio.sleep(0.05)
+        return hub, socket
+
+    hub, socket = asyncio.run(scenario())
+
+    assert [m["type"] for m in socket.messages] == ["snapshot", "delta"]
+    assert socket.messages[0]["version"] == 0
+    delta = socket.messages[1]
+    assert delta["version"] == 1
+    assert delta["changes"] == [
+        {"id": "t1", "op": "upsert", "status": "doing", "progress_percentage": 50},
+        {"id": "t2", "op": "delete"},
+    ]
+    assert hub.stats.coalesced == 1
+
+
+def test_resync_sends_subscribers_a_fresh_snapshot():
+    loads = []
+
+    async def countingSnapshot(channel):
+        loads.append(channel)
+        return {"channel": channel, "load": len(loads)}
+
+    async def scenario():
+        hub = RealtimeHub(countingSnapshot, coalesceMs=10)
+        socket = FakeSocket()
+        hub.subscribe(hub.connect(socket), "user:u1")
+        await asyncio.sleep(0.01)
+        hub.resync("user:u1")
+        hub.resync("user:nobody")
+        await asyncio.sleep(0.01)
+        return socket
+
+    socket = asyncio.run(scenario())
+
+    assert [(m["type"], m["version"], m["data"]["load"]) for m in socket.messages] == [
+        ("snapshot", 0, 1),
+        ("snapshot", 1, 2),
+    ]
+    assert loads == ["user:u1", "user:u1"]
+
+
+def test_publish_without_subscribers_is_ignored():
+    async def scenario():
+        hub = RealtimeHub(snapshot, coalesceMs=1)
+        hub.publish("project:nobody", "t1", {"status": "done"})
+        await asyncio.sleep(0.01)
+        return hub
+
+    hub = asyncio.run(scenario())
+
+    assert hub.stats.published == 0
+    assert hub.stats.messages == 0
+
+
+def test_slow_consumer_resyncs_then_is_dropped():
+    async def scenario():
+        hub = RealtimeHub(snapshot, coalesceMs=1, maxQueue=8, maxChangesPerMessage=1)
+        slow = FakeSocket(delay=1.0)
+        client = hub.connect(slow)
+        hub.subscribe(client, "project:p1")
+        await asyncio.sleep(0)
+
+        for i in range(20):
+            hub.publish("project:p1", f"t{i}", {"status": "done"})
+        hub.flush()
+        resyncsAfterFirstBurst = hub.stats.resyncs
+
+        for i in range(20):
+            hub.publish("project:p1", f"t{i}", {"status": "todo"})
+        hub.flush()
+        await asyncio.sleep(0)
+        return hub, slow, resyncsAfterFirstBurst
+
+    hub, slow, resyncs = asyncio.run(scenario())
+
+    assert resyncs == 1
+    assert hub.stats.dropped == 1
+    assert slow.closed
+    assert hub.subscriberCount("project:p1") == 0
+
+
+def test_socket_needs_a_token_and_only_subscribes_to_the_users_own_channels(
+    sqlite_engine, monkeypatch
+):
+    from src.app.main import app
+
+    t = Base.metadata.tables
+    me, other = uuid.uuid4(), uuid.uuid4()
+    owned, assigned, foreign = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    with sqlite_engine.begin() as connection:
+        connection.execute(
+            insert(t["users"]),
+            [{"id": id, "username": f"u{i}", "email": f"u{i}@zen.test"}
+             for i, id in enumerate([me, other])],
+        )
+        connection.execute(
+            insert(t["projects"]),
+            [{"id": owned, "name": "mine", "owner_id": me},
+             {"id": assigned, "name": "theirs, with my task", "owner_id": other},
+             {"id": foreign, "name": "theirs", "owner_id": other}],
+        )
+        connection.execute(
+            insert(t["tasks"]),
+            [{"id": uuid.uuid4(), "title": "mine", "project_id": assigned, "assigned_to": me}],
+        )
+    db = ZenTaskDatabase.__new__(ZenTaskDatabase)
+    db._engine = sqlite_engine
+    db._sessionFactory = sessionmaker(sqlite_engine)
+    db._scopedSession = scoped_session(db._sessionFactory)
+    tokens = TokenService("secret")
+    hub = RealtimeHub(snapshot, coalesceMs=1)
+    monkeypatch.setattr(zen_task_db_handler, "_db", db)
+    monkeypatch.setattr(token_service, "_tokens", tokens)
+    monkeypatch.setattr(principal_cache, "_principals", PrincipalCache())
+    monkeypatch.setattr(realtime_router, "_hub", hub)
+    client = TestClient(app)
+
+    with pytest.raises(WebSocketDisconnect) as refused:
+        with client.websocket_connect("/ws?projects=" + str(owned)):
+            pass
+    assert refused.value.code == 1008
+
+    query = "&".join(f"projects={id}" for id in (owned, assigned, foreign, "not-a-uuid"))
+    with client.websocket_connect(
+        f"/ws?{query}&user={other}", headers={"Authorization": f"Bearer {tokens.issue(me)[0]}"}
+    ) as socket:
+        first = {socket.receive_json()["channel"], socket.receive_json()["channel"]}
+        socket.send_json({"action": "subscribe", "user": str(other)})
+        socket.send_json({"action": "subscribe", "project": str(foreign)})
+        socket.send_json({"action": "subscribe", "user": str(me)})
+        last = socket.receive_json()["channel"]
+        subscribed = set(hub.subscribedChannels())
+
+    assert first == {f"project:{owned}", f"project:{assigned}"}
+    assert last == f"user:{me}"
+    assert subscribed == {f"project:{owned}", f"project:{assigned}", f"user:{me}"}
+
+
+def test_a_moved_task_is_deleted_from_the_channels_it_left(sqlite_engine, monkeypatch):
+    published = []
+
+    class RecordingHub:
+        def publishThreadsafe(self, channel, entityId, change):
+            published.append((channel, change))
+
+    sessions = sessionmaker(sqlite_engine)
+    monkeypatch.setattr(publishing, "_installed", False)
+    publishing.installRealtimePublishing(RecordingHub(), target=sessions)
+    oldProject, newProject, oldUser, newUser = (uuid.uuid4() for _ in range(4))
+    with sessions() as session:
+        task = TaskTable(title="moving", project_id=oldProject, assigned_to=oldUser)
+        session.add(task)
+        session.commit()
+        published.clear()
+
+        task.project_id, task.assigned_to = newProject, newUser
+        session.commit()
+
+    change = {"project_id": newProject, "assigned_to": newUser}
+    assert sorted(published, key=lambda event: event[0]) == sorted(
+        [
+            (f"project:{newProject}", change),
+            (f"user:{newUser}", change),
+            (f"project:{oldProject}", {"op": "delete"}),
+            (f"user:{oldUser}", {"op": "delete"}),
+        ],
+        key=lambda event: event[0],
+    )
@@ -0,0 +1,63 @@
+import asyncio
+import random
+
+from src.core.realtime.hub import RealtimeHub
+
+CLIENTS = 5000
+PROJECTS = 20
+TASKS_PER_PROJECT = 500
+UPDATES = 10000
+
+
+class CountingSocket:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.received = 0
+        self.closed = False
+
+    async def send_text(self, data: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received += 1
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed = True
+
+
+async def snapshot(channel):
+    return {"channel": channel}
+
+
+def test_bulk_import_fan_out_to_5k_clients_on_one_worker():
+    """A 10k-task bulk import reaches 5k sockets as a handful of coalesced deltas."""
+    rng = random.Random(7)
+
+    async def scenario():
+        hub = RealtimeHub(snapshot, coalesceMs=20, maxQueue=32, maxChangesPerMessage=500)
+        sockets = []
+        for i in range(CLIENTS):
+            # One in a hundred clients is on a terrible connection.
+            socket = CountingSocket(delay=5.0 if i % 100 == 0 else 0.0)
+            client = hub.connect(socket)
+            hub.subscribe(client, f"project:p{i % PROJECTS}")
+            hub.subscribe(client, f"user:u{i}")
+            sockets.append(socket)
+        await asyncio.sleep(0.05)
+
+        for _ in range(UPDATES):
+            project = rng.randrange(PROJECTS)
+            task = rng.randrange(TASKS_PER_PROJECT)
+            hub.publish(f"project:p{project}", f"t{project}-{task}", {"progress_percentage": rng.random()})
+
+        await asyncio.sleep(0.2)
+        return hub, sockets
+
+    hub, sockets = asyncio.run(scenario())
+
+    fast = [s for i, s in enumerate(sockets) if i % 100 != 0]
+    # Snapshot for the project and the user channel, then one delta per project.
+    assert all(s.received == 3 for s in fast)
+    assert hub.stats.messages == PROJECTS
+    assert hub.stats.published - hub.stats.coalesced <= PROJECTS * TASKS_PER_PROJECT
+    assert hub.stats.enqueued == CLIENTS
+    assert hub.stats.snapshots <= PROJECTS + CLIENTS
@@ -0,0 +1,180 @@
+import threading
+import time
+import uuid
+
+import fakeredis
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import sessionmaker
+
+from src.core.cache import invalidation
+from src.core.cache.invalidation import projectScope
+from src.core.cache.redis_cache import RedisCache
+from src.features.todos.data.datasource.tables.project_table import \
+    ProjectTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def cache(server):
+    return RedisCache(fakeredis.FakeRedis(server=server), lockPollSeconds=0.01)
+
+
+def test_read_through_hit_ratio(cache):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [{"id": "t1", "title": "Write docs"}]
+
+    for _ in range(4):
+        assert cache.getOrLoad("project:p1", "board", loader, 30) == [
+            {"id": "t1", "title": "Write docs"}
+        ]
+
+    assert len(calls) == 1
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 1
+    assert cache.stats.hitRatio == 0.75
+
+
+def test_invalidate_bumps_scope_version(cache):
+    values = iter(["old", "new"])
+
+    def load():
+        return next(values)
+
+    assert cache.getOrLoad("project:p1", "detail", load, 30) == "old"
+    assert cache.getOrLoad("project:p1", "detail", load, 30) == "old"
+
+    cache.invalidate("project:p1")
+    assert cache.getOrLoad("project:p1", "detail", load, 30) == "new"
+
+
+def test_invalidate_leaves_other_scopes_cached(cache):
+    cache.getOrLoad("project:p1", "board", lambda: 1, 30)
+    cache.getOrLoad("project:p2", "board", lambda: 2, 30)
+
+    cache.invalidate("project:p1")
+
+    assert cache.getOrLoad("project:p2", "board", lambda: 99, 30) == 2
+    assert cache.getOrLoad("project:p1", "board", lambda: 3, 30) == 3
+
+
+def test_falls_back_to_loader_when_redis_is_down(server, cache):
+    server.connected = False
+
+    assert cache.getOrLoad("user:u1", "open_tasks", lambda: ["a"], 30) == ["a"]
+    assert cache.getOrLoad("user:u1", "open_tasks", lambda: ["b"], 30) == ["b"]
+    assert cache.stats.errors == 1
+    assert cache.stats.bypassed == 1
+
+
+def test_concurrent_misses_load_once(cache):
+    calls = []
+
+    def slowLoader():
+        calls.append(1)
+        time.sleep(0.05)
+        return "board"
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                cache.getOrLoad("project:p1", "board", slowLoader, 30)
+            )
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["board"] * 8
+    assert len(calls) == 1
+
+
+@pytest.fixture
+def sessions(sqlite_engine, cache, monkeypatch):
+    factory = sessionmaker(sqlite_engine, expire_on_commit=False)
+    monkeypatch.setattr(invalidation, "_installed", False)
+    invalidation.installCacheInvalidation(cache, target=factory)
+    return factory
+
+
+def test_committed_writes_evict_and_rolled_back_writes_do_not(cache, sessions):
+    with sessions() as session:
+        project = ProjectTable(name="Apollo")
+        task = TaskTable(title="Write docs", project=project)
+        session.add_all([project, task])
+        session.commit()
+    scope = projectScope(project.id)
+    cache.getOrLoad(scope, "board", lambda: "cached", 30)
+
+    with sessions() as session:
+        session.get(TaskTable, task.id).title = "Draft"
+        session.flush()
+        session.rollback()
+        session.commit()  # nothing left to publish from the rolled-back flush
+    assert cache.getOrLoad(scope, "board", lambda: "reloaded", 30) == "cached"
+
+    with sessions() as session:
+        session.get(TaskTable, task.id).title = "Write better docs"
+        session.commit()
+    assert cache.getOrLoad(scope, "board", lambda: "reloaded", 30) == "reloaded"
+
+    # Bulk statements do not say which projects they touch: every scope is invalidated.
+    with sessions() as session:
+        session.execute(update(TaskTable).values(progress_percentage=50.0))
+        session.commit()
+    assert cache.getOrLoad(scope, "board", lambda: "after bulk", 30) == "after bulk"
+
+
+def test_board_and_detail_routes_read_through_the_cache_and_show_on_metrics(
+    sqlite_engine, cache, monkeypatch
+):
+    from fastapi.testclient import TestClient
+
+    from src.app.main import app
+    from src.config.database.zen_task_db_handler import getDbSession
+    from src.core.cache import cache_handler
+
+    def sqliteSession():
+        with sessionmaker(sqlite_engine)() as session:
+            yield session
+
+    with sessionmaker(sqlite_engine, expire_on_commit=False)() as session:
+        project = ProjectTable(name="Apollo")
+        task = TaskTable(
+            title="Write docs", project=project, status="todo", assigned_to=uuid.uuid4()
+        )
+        session.add_all([project, task])
+        session.commit()
+
+    monkeypatch.setattr(cache_handler, "_cache", cache)
+    monkeypatch.setattr(invalidation, "_installed", True)  # keep the fake off the global Session
+    app.dependency_overrides[getDbSession] = sqliteSession
+    try:
+        with TestClient(app) as client:
+            boards = [client.get(f"/api/v1/projects/{project.id}/board").json() for _ in range(2)]
+            detail = client.get(f"/api/v1/projects/{project.id}/detail").json()
+            openTasks = client.get(f"/api/v1/users/{task.assigned_to}/tasks/open").json()
+            missing = client.get(f"/api/v1/projects/{uuid.uuid4()}/detail")
+            metrics = client.get("/metrics").text
+    finally:
+        app.dependency_overrides.clear()
+
+    assert boards[0] == boards[1] and [row["title"] for row in boards[0]] == ["Write docs"]
+    assert detail["task_counts"] == {"todo": 1}
+    assert [row["id"] for row in openTasks] == [str(task.id)]
+    assert missing.status_code == 404
+    assert (cache.stats.hits, cache.stats.misses) == (1, 4)
+    assert "cache_hits_total 1" in metrics and "cache_misses_total 4" in metrics
+    assert "cache_hit_ratio{pid=" in metrics
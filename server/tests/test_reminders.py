@@ -0,0 +1,280 @@
+import random
+import uuid
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import insert, update
+from sqlalchemy.orm import sessionmaker
+
+from src.config.database.base_table import Base
+from src.core.reminders.service import ReminderService
+from src.core.reminders.timing_wheel import TimingWheel
+from src.features.todos.data.datasource.tables.task_schedule_table import \
+    TaskScheduleTable
+
+START = datetime(2025, 3, 3, 8, 0)
+
+tables = Base.metadata.tables
+
+
+class FakeClock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, **delta) -> None:
+        self.now += timedelta(**delta)
+
+
+class StubNotifier:
+    def __init__(self, failures: int = 0):
+        self.batches = []
+        self.failures = failures
+
+    def send(self, reminders):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("push gateway unavailable")
+        self.batches.append(list(reminders))
+
+    @property
+    def sent(self):
+        return [reminder for batch in self.batches for reminder in batch]
+
+
+def test_wheel_fires_entries_across_levels_and_overflow():
+    wheel = TimingWheel(START)
+    offsets = {"soon": 5, "minutes": 90, "hours": 2 * 3600 + 7, "days": 3 * 86400 + 11}
+    for key, seconds in offsets.items():
+        wheel.add(key, START + timedelta(seconds=seconds), key)
+
+    fired = {}
+    moment = START
+    while moment < START + timedelta(days=4):
+        moment += timedelta(seconds=37)
+        for key, payload in wheel.advance(moment):
+            fired[key] = moment
+
+    for key, seconds in offsets.items():
+        due = START + timedelta(seconds=seconds)
+        assert due <= fired[key] < due + timedelta(seconds=37)
+    assert len(wheel) == 0
+
+
+def test_wheel_matches_a_sorted_reference_with_moves_and_cancels():
+    rng = random.Random(3)
+    wheel = TimingWheel(START)
+    expected = {}
+    now = START
+    for step in range(3000):
+        key = rng.randrange(400)
+        action = rng.random()
+        if action < 0.6:
+            due = now + timedelta(seconds=rng.randint(-5, 2 * 86400))
+            wheel.add(key, due, step)
+            expected[key] = (due, step)
+        elif action < 0.7:
+            assert wheel.cancel(key) == (key in expected)
+            expected.pop(key, None)
+        else:
+            now += timedelta(seconds=rng.randint(1, 900))
+            fired = dict(wheel.advance(now))
+            cutoff = now + timedelta(seconds=1)
+            due = {key: payload for key, (at, payload) in expected.items() if at < cutoff}
+            assert fired == due
+            for key in fired:
+                del expected[key]
+    assert len(wheel) == len(expected)
+
+
+@pytest.fixture
+def sessions(sqlite_engine):
+    return sessionmaker(sqlite_engine)
+
+
+@pytest.fixture
+def user(sessions):
+    userId = uuid.uuid4()
+    with sessions() as session:
+        session.execute(
+            insert(tables["users"]), [{"id": userId, "username": "ana", "email": "a@x.io"}]
+        )
+        session.execute(
+            insert(tables["user_settings"]),
+            [{"id": uuid.uuid4(), "user_id": userId, "timezone": "Europe/Berlin"}],
+        )
+        session.commit()
+    return userId
+
+
+def _addReminders(sessions, userId, moments):
+    """One task and schedule per (due_date, reminder_time) in the user's local time."""
+    scheduleIds = []
+    with sessions() as session:
+        taskRows, scheduleRows = [], []
+        for index, (dueDate, reminderTime) in enumerate(moments):
+            taskId, scheduleId = uuid.uuid4(), uuid.uuid4()
+            taskRows.append(
+                {"id": taskId, "title": f"task {index}", "status": "todo", "assigned_to": userId}
+            )
+            scheduleRows.append(
+                {
+                    "id": scheduleId,
+                    "task_id": taskId,
+                    "due_date": dueDate,
+                    "reminder_time": reminderTime,
+                }
+            )
+            scheduleIds.append(scheduleId)
+        session.execute(insert(tables["tasks"]), taskRows)
+        session.execute(insert(tables["task_schedules"]), scheduleRows)
+        session.commit()
+    return scheduleIds
+
+
+def _service(sessions, notifier, clock, **options):
+    return ReminderService(sessions, notifier, clock=clock, **options)
+
+
+def test_reminders_fire_at_local_time_once(sessions, user):
+    # 09:30 in Berlin is 08:30 UTC in March (CET); 11:00 is outside the one-hour horizon.
+    first, later = _addReminders(
+        sessions, user, [(date(2025, 3, 3), time(9, 30)), (date(2025, 3, 3), time(11, 0))]
+    )
+    clock, notifier = FakeClock(START), StubNotifier()
+    service = _service(sessions, notifier, clock)
+
+    assert service.tick() == 0
+    assert service.scheduled == 1
+    clock.advance(minutes=29, seconds=59)
+    assert service.tick() == 0
+    clock.advance(seconds=1)
+    assert service.tick() == 1
+    assert notifier.sent[0].scheduleId == first
+    assert notifier.sent[0].remindAt == datetime(2025, 3, 3, 8, 30)
+    assert notifier.sent[0].userId == user
+
+    # The horizon slides over 10:00 UTC, and the delivered reminder is not loaded again.
+    clock.advance(minutes=31)
+    service.tick()
+    assert service.scheduled == 1
+    clock.now = datetime(2025, 3, 3, 10, 0)
+    assert service.tick() == 1
+    assert [reminder.scheduleId for reminder in notifier.sent] == [first, later]
+
+
+def test_committed_changes_move_and_cancel_reminders(sessions, user):
+    moved, cancelled = _addReminders(
+        sessions, user, [(date(2025, 3, 3), time(9, 10)), (date(2025, 3, 3), time(9, 20))]
+    )
+    clock, notifier = FakeClock(START), StubNotifier()
+    service = _service(sessions, notifier, clock, refreshEvery=timedelta(seconds=30))
+    service.tick()
+
+    with sessions() as session:
+        session.get(TaskScheduleTable, moved).reminder_time = time(9, 45)
+        session.get(TaskScheduleTable, cancelled).reminder_time = None
+        session.commit()
+
+    clock.now = datetime(2025, 3, 3, 8, 30)
+    assert service.tick() == 0
+    clock.now = datetime(2025, 3, 3, 8, 45)
+    assert service.tick() == 1
+    assert [reminder.scheduleId for reminder in notifier.sent] == [moved]
+
+
+def test_core_writes_are_picked_up_by_the_updated_at_sweep(sessions, user):
+    (scheduleId,) = _addReminders(sessions, user, [(date(2025, 3, 3), time(9, 10))])
+    clock, notifier = FakeClock(START), StubNotifier()
+    service = _service(sessions, notifier, clock, refreshEvery=timedelta(seconds=30))
+    service.tick()
+
+    schedules = tables["task_schedules"]
+    with sessions() as session:
+        session.execute(
+            update(schedules).where(schedules.c.id == scheduleId).values(reminder_time=time(9, 40))
+        )
+        session.commit()
+
+    clock.now = datetime(2025, 3, 3, 8, 10)
+    assert service.tick() == 0
+    clock.now = datetime(2025, 3, 3, 8, 40)
+    assert service.tick() == 1
+
+
+def test_completed_tasks_are_not_reminded(sessions, user):
+    (scheduleId,) = _addReminders(sessions, user, [(date(2025, 3, 3), time(9, 10))])
+    clock, notifier = FakeClock(START), StubNotifier()
+    service = _service(sessions, notifier, clock)
+    service.tick()
+
+    tasksTable = tables["tasks"]
+    with sessions() as session:
+        session.execute(update(tasksTable).values(completed_at=START))
+        session.commit()
+
+    clock.now = datetime(2025, 3, 3, 8, 10)
+    assert service.tick() == 0
+    assert notifier.sent == []
+
+
+def test_batches_and_shards_split_the_work(sessions, user):
+    _addReminders(sessions, user, [(date(2025, 3, 3), time(9, 5))] * 1200)
+    clock = FakeClock(START)
+    notifiers = [StubNotifier(), StubNotifier()]
+    shards = [
+        _service(sessions, notifier, clock, batchSize=250, shardIndex=index, shardCount=2)
+        for index, notifier in enumerate(notifiers)
+    ]
+    for shard in shards:
+        shard.tick()
+
+    clock.advance(minutes=5)
+    delivered = [shard.tick() for shard in shards]
+
+    assert sum(delivered) == 1200
+    assert all(count > 400 for count in delivered)
+    assert all(len(batch) <= 250 for notifier in notifiers for batch in notifier.batches)
+    ids = [reminder.scheduleId for notifier in notifiers for reminder in notifier.sent]
+    assert len(set(ids)) == 1200
+
+
+def test_overlapping_instances_deliver_once(sessions, user):
+    _addReminders(sessions, user, [(date(2025, 3, 3), time(9, 5))] * 50)
+    clock = FakeClock(START)
+    notifiers = [StubNotifier(), StubNotifier()]
+    instances = [_service(sessions, notifier, clock) for notifier in notifiers]
+    for instance in instances:
+        instance.tick()
+
+    clock.advance(minutes=5)
+    delivered = [instance.tick() for instance in instances]
+
+    assert delivered == [50, 0]
+
+
+def test_failed_batches_are_retried(sessions, user):
+    _addReminders(sessions, user, [(date(2025, 3, 3), time(9, 5))] * 3)
+    clock, notifier = FakeClock(START), StubNotifier(failures=1)
+    service = _service(sessions, notifier, clock, retryAfter=timedelta(seconds=30))
+    service.tick()
+
+    clock.advance(minutes=5)
+    assert service.tick() == 0
+    clock.advance(seconds=30)
+    assert service.tick() == 3
+    assert len(notifier.sent) == 3
+
+
+def test_restart_catches_up_on_missed_reminders(sessions, user):
+    _addReminders(
+        sessions, user, [(date(2025, 3, 3), time(8, 50)), (date(2025, 3, 3), time(9, 2))]
+    )
+    # Started at 08:04 UTC: 07:50 UTC is beyond the catch-up window, 08:02 UTC is not.
+    clock, notifier = FakeClock(START + timedelta(minutes=4)), StubNotifier()
+    service = _service(sessions, notifier, clock, catchUp=timedelta(minutes=5))
+
+    assert service.tick() == 1
+    assert notifier.sent[0].remindAt == datetime(2025, 3, 3, 8, 2)
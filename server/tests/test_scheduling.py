@@ -0,0 +1,417 @@
+import dataclasses
+import random
+import uuid
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.config.database.base_table import Base
+from src.core.scheduling import triggers
+from src.core.scheduling.engine import PlanTask, ScheduleEngine
+from src.core.scheduling.scheduler import Scheduler
+from src.core.scheduling.store import SCHEDULER_SOURCE, ScheduleStore
+from src.core.scheduling.work_calendar import WorkCalendar
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.features.todos.data.datasource.tables.time_block_table import \
+    TimeBlockTable
+from src.features.todos.data.datasource.tables.user_settings_table import \
+    UserSettingsTable
+from src.features.todos.domain.enums.priority import PriorityEnum
+
+MONDAY = datetime(2025, 1, 6, 7, 0)  # before the 09:00 UTC window opens
+
+tables = Base.metadata.tables
+
+
+def _engine(tasks, **calendar):
+    engine = ScheduleEngine(WorkCalendar(MONDAY, **calendar))
+    engine.load(tasks)
+    return engine
+
+
+def _randomBacklog(rng: random.Random, size: int):
+    ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(size)]
+    tasks = []
+    for index, id in enumerate(ids):
+        window = ids[max(0, index - 30) : index]
+        dependencies = tuple(rng.sample(window, min(len(window), rng.randint(1, 2))))
+        tasks.append(
+            PlanTask(
+                id,
+                minutes=rng.randint(15, 600),
+                deadline=rng.randint(600, 1_000_000) if rng.random() < 0.6 else None,
+                priority=rng.randint(0, 4),
+                dependencies=dependencies if rng.random() < 0.3 else (),
+                order=index,
+            )
+        )
+    return tasks
+
+
+def test_calendar_skips_nights_weekends_and_busy_time():
+    busy = [(datetime(2025, 1, 6, 10, 0), datetime(2025, 1, 6, 11, 30))]
+    calendar = WorkCalendar(MONDAY, hoursPerDay=4, busy=busy)
+
+    # Monday 09:00-13:00 minus 10:00-11:30 leaves 150 minutes; the rest spills into Tuesday.
+    assert calendar.spans(0, 300) == [
+        (datetime(2025, 1, 6, 9, 0), datetime(2025, 1, 6, 10, 0)),
+        (datetime(2025, 1, 6, 11, 30), datetime(2025, 1, 6, 13, 0)),
+        (datetime(2025, 1, 7, 9, 0), datetime(2025, 1, 7, 11, 30)),
+    ]
+    # Friday's window ends the week; the next minute is Monday morning.
+    fridayEnd = calendar.offsetOf(datetime(2025, 1, 10, 13, 0))
+    assert calendar.spans(fridayEnd, fridayEnd + 60) == [
+        (datetime(2025, 1, 13, 9, 0), datetime(2025, 1, 13, 10, 0))
+    ]
+
+
+def test_calendar_follows_the_user_timezone():
+    calendar = WorkCalendar(MONDAY, timezoneName="Asia/Tehran", hoursPerDay=8)
+
+    # 09:00 in Tehran (UTC+03:30) is 05:30 UTC, already past on Monday: work starts at the origin.
+    assert calendar.spans(0, 30) == [(datetime(2025, 1, 6, 7, 0), datetime(2025, 1, 6, 7, 30))]
+    assert calendar.localDate(datetime(2025, 1, 6, 22, 0)) == date(2025, 1, 7)
+
+
+def test_dependencies_run_first_and_deadlines_pull_them_forward():
+    a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    engine = _engine(
+        [
+            PlanTask(a, 120, priority=4, order=0),
+            PlanTask(b, 60, order=1),
+            # Urgent, but only after b: b inherits the deadline and overtakes a.
+            PlanTask(c, 60, deadline=180, dependencies=(b,), order=2),
+        ]
+    )
+
+    assert engine.sequence == [b, c, a]
+    assert engine.interval(c) == (60, 120)
+    assert engine.confidence(c) > 0.5
+    assert engine.confidence(a) == 1.0
+
+
+def test_late_tasks_get_low_confidence():
+    a, b = uuid.uuid4(), uuid.uuid4()
+    engine = _engine([PlanTask(a, 480, deadline=60), PlanTask(b, 60, deadline=10_000)])
+
+    assert engine.lateness(a) == 420
+    assert engine.confidence(a) < 0.5 < engine.confidence(b)
+
+
+def test_dependency_cycles_are_broken_not_dropped():
+    a, b = uuid.uuid4(), uuid.uuid4()
+    engine = _engine([PlanTask(a, 30, dependencies=(b,)), PlanTask(b, 30, dependencies=(a,))])
+
+    assert engine.cyclic
+    assert sorted(engine.sequence, key=str) == sorted([a, b], key=str)
+
+
+def test_incremental_apply_matches_a_full_replan():
+    rng = random.Random(7)
+    tasks = _randomBacklog(rng, 600)
+    engine = _engine(tasks)
+
+    for _ in range(60):
+        current = list(engine.tasks.values())
+        victim = rng.choice(current)
+        move = rng.random()
+        if move < 0.5:
+            changed = dataclasses.replace(
+                victim,
+                minutes=rng.randint(15, 600),
+                deadline=rng.choice([None, rng.randint(600, 1_000_000)]),
+                priority=rng.randint(0, 4),
+            )
+            diff = engine.apply([changed])
+        elif move < 0.7:
+            others = [task.id for task in rng.sample(current, 2) if task.id != victim.id]
+            diff = engine.apply([dataclasses.replace(victim, dependencies=tuple(others[:1]))])
+        elif move < 0.85:
+            diff = engine.apply(removed=[victim.id])
+        else:
+            newTask = PlanTask(
+                uuid.uuid4(), rng.randint(15, 600), rng.randint(600, 100_000),
+                dependencies=(victim.id,), order=10_000,
+            )
+            diff = engine.apply([newTask])
+
+        reference = _engine(list(engine.tasks.values()))
+        assert engine.sequence == reference.sequence
+        assert engine.starts == reference.starts
+        assert diff.changed <= set(engine.tasks)
+
+
+def test_a_change_late_in_the_plan_resumes_it_midway():
+    engine = _engine(_randomBacklog(random.Random(11), 2_000))
+
+    victim = engine.tasks[engine.sequence[len(engine.sequence) // 2]]
+    diff = engine.apply([dataclasses.replace(victim, minutes=victim.minutes + 45)])
+
+    assert diff.resumedAt > 0
+    assert len(diff.changed) < len(engine.sequence)
+
+
+@pytest.fixture
+def backlog(sqlite_engine):
+    userId = uuid.uuid4()
+    taskIds = [uuid.uuid4() for _ in range(4)]
+    with Session(sqlite_engine) as session:
+        session.execute(
+            insert(tables["users"]), [{"id": userId, "username": "sam", "email": "s@x.io"}]
+        )
+        session.execute(
+            insert(tables["user_settings"]),
+            [{"id": uuid.uuid4(), "user_id": userId, "work_hours_per_day": 4, "timezone": "UTC"}],
+        )
+        session.execute(
+            insert(tables["tasks"]),
+            [
+                {
+                    "id": taskId,
+                    "title": f"task {index}",
+                    "status": "todo",
+                    "priority": PriorityEnum.high if index == 0 else PriorityEnum.medium,
+                    "assigned_to": userId,
+                    "estimated_hours": 2,
+                    "dependencies": [str(taskIds[0])] if index == 3 else [],
+                    "due_date": date(2025, 1, 7) if index == 1 else None,
+                    "created_at": datetime(2025, 1, 1, index),
+                    "updated_at": datetime(2025, 1, 1, index),
+                }
+                for index, taskId in enumerate(taskIds)
+            ],
+        )
+        # A meeting on Monday morning that the plan has to work around
+        session.execute(
+            insert(tables["time_blocks"]),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "task_id": taskIds[2],
+                    "scheduled_start": datetime(2025, 1, 6, 9, 0),
+                    "scheduled_end": datetime(2025, 1, 6, 10, 0),
+                }
+            ],
+        )
+        session.commit()
+    return userId, taskIds
+
+
+def _plannedBlocks(session):
+    blocks = tables["time_blocks"]
+    return session.execute(
+        select(blocks.c.task_id, blocks.c.scheduled_start, blocks.c.scheduled_end)
+        .where(blocks.c.source == SCHEDULER_SOURCE)
+        .order_by(blocks.c.scheduled_start)
+    ).all()
+
+
+def test_scheduler_fills_time_blocks_and_schedules(sqlite_engine, backlog):
+    userId, taskIds = backlog
+    scheduler = Scheduler(clock=lambda: MONDAY)
+    with Session(sqlite_engine) as session:
+        result = scheduler.replan(session, userId)
+        session.commit()
+        blocks = _plannedBlocks(session)
+        schedules = {
+            row.task_id: row
+            for row in session.execute(select(tables["task_schedules"])).all()
+        }
+
+    assert not result.incremental
+    # Task 1 is due Tuesday, task 0 is high priority and spills into Tuesday morning.
+    assert [block.task_id for block in blocks][:3] == [taskIds[1], taskIds[0], taskIds[0]]
+    assert (blocks[0].scheduled_start, blocks[0].scheduled_end) == (
+        datetime(2025, 1, 6, 10, 0), datetime(2025, 1, 6, 12, 0)
+    )
+    assert blocks[-1].task_id in (taskIds[2], taskIds[3])
+    assert all(block.scheduled_start.hour >= 9 and block.scheduled_end.hour <= 13 for block in blocks)
+    assert set(schedules) == set(taskIds)
+    assert schedules[taskIds[1]].scheduling_confidence > 0.5
+    assert schedules[taskIds[1]].last_rescheduled_at == MONDAY
+
+
+def test_scheduler_replans_incrementally_after_one_task_changes(sqlite_engine, backlog):
+    userId, taskIds = backlog
+    tasks = tables["tasks"]
+    scheduler = Scheduler(clock=lambda: MONDAY)
+    with Session(sqlite_engine) as session:
+        scheduler.replan(session, userId)
+        session.commit()
+        lastTask = scheduler._plans[userId].engine.sequence[-1]
+
+        session.execute(
+            update(tasks)
+            .where(tasks.c.id == lastTask)
+            .values(estimated_hours=3, updated_at=datetime(2025, 1, 2))
+        )
+        result = scheduler.replan(session, userId)
+        session.commit()
+        blocks = _plannedBlocks(session)
+
+        session.execute(
+            update(tasks)
+            .where(tasks.c.id == taskIds[0])
+            .values(completed_at=MONDAY, updated_at=datetime(2025, 1, 3))
+        )
+        afterDone = scheduler.replan(session, userId)
+        session.commit()
+        remaining = {block.task_id for block in _plannedBlocks(session)}
+        scheduleCount = session.execute(
+            select(func.count()).select_from(tables["task_schedules"])
+        ).scalar()
+
+    assert result.incremental
+    assert result.diff.changed == {lastTask}
+    assert sum(
+        (block.scheduled_end - block.scheduled_start for block in blocks if block.task_id == lastTask),
+        timedelta(),
+    ) == timedelta(hours=3)
+    assert afterDone.incremental
+    assert taskIds[0] not in remaining
+    assert scheduleCount == 4
+
+
+def test_scheduler_falls_back_to_a_full_plan_when_tasks_leave_silently(sqlite_engine, backlog):
+    userId, taskIds = backlog
+    tasks = tables["tasks"]
+    scheduler = Scheduler(clock=lambda: MONDAY)
+    with Session(sqlite_engine) as session:
+        scheduler.replan(session, userId)
+        session.commit()
+        # Reassigned without touching updated_at: only the count gives it away
+        session.execute(update(tasks).where(tasks.c.id == taskIds[2]).values(assigned_to=None))
+        result = scheduler.replan(session, userId)
+        session.commit()
+
+    assert not result.incremental
+    assert taskIds[2] not in scheduler._plans[userId].engine.tasks
+
+
+def test_plans_are_only_cached_and_advanced_when_the_replan_commits(sqlite_engine, backlog):
+    userId, taskIds = backlog
+    tasks = tables["tasks"]
+    scheduler = Scheduler(clock=lambda: MONDAY)
+    with Session(sqlite_engine) as session:
+        scheduler.replan(session, userId)
+        uncommitted = userId in scheduler._plans
+        session.rollback()
+        afterRollback = userId in scheduler._plans
+
+        scheduler.replan(session, userId)
+        session.commit()
+        watermark = scheduler._plans[userId].watermark
+        session.execute(
+            update(tasks)
+            .where(tasks.c.id == taskIds[3])
+            .values(estimated_hours=3, updated_at=datetime(2025, 1, 2))
+        )
+        scheduler.replan(session, userId)
+        pendingWatermark = scheduler._plans[userId].watermark
+        session.rollback()
+        # The engine already took the rolled-back change: the plan cannot be resumed.
+        droppedOnRollback = userId not in scheduler._plans
+
+        result = scheduler.replan(session, userId)
+        session.commit()
+
+    assert not uncommitted and not afterRollback
+    assert pendingWatermark == watermark
+    assert droppedOnRollback
+    assert not result.incremental
+    assert scheduler._plans[userId].watermark is not None
+
+
+def test_a_plan_superseded_by_another_process_is_not_resumed(sqlite_engine, backlog):
+    userId, taskIds = backlog
+    tasks = tables["tasks"]
+    # Two worker processes, each with its own cache
+    first, second = Scheduler(clock=lambda: MONDAY), Scheduler(clock=lambda: MONDAY)
+    with Session(sqlite_engine) as session:
+        first.replan(session, userId)
+        session.commit()
+        planned = len(_plannedBlocks(session))
+        second.replan(session, userId)
+        session.execute(
+            update(tasks)
+            .where(tasks.c.id == taskIds[3])
+            .values(estimated_hours=3, updated_at=datetime(2025, 1, 2))
+        )
+        session.commit()
+
+        result = first.replan(session, userId)
+        session.commit()
+        blocks = _plannedBlocks(session)
+
+    assert not result.incremental
+    assert len({(block.scheduled_start, block.scheduled_end) for block in blocks}) == len(blocks)
+    assert len(blocks) in (planned, planned + 1)
+    assert first._plans[userId].stamp != second._plans[userId].stamp
+
+
+def test_commits_that_change_a_schedule_enqueue_a_replan(sqlite_engine, backlog, monkeypatch):
+    userId, taskIds = backlog
+    enqueued = []
+    sessions = sessionmaker(sqlite_engine)
+    monkeypatch.setattr(triggers, "_installed", False)
+    triggers.installReplanScheduling(enqueued.append, target=sessions)
+    otherUser = uuid.uuid4()
+    with sessions() as session:
+        task = session.get(TaskTable, taskIds[0])
+        task.title = "renamed"
+        session.commit()
+        renamed = list(enqueued)
+
+        task.estimated_hours = 5
+        session.commit()
+        task.assigned_to = otherUser
+        session.commit()
+
+        session.scalars(select(UserSettingsTable)).one().timezone = "Europe/Paris"
+        session.commit()
+
+        session.add(
+            TimeBlockTable(
+                task_id=taskIds[1],
+                scheduled_start=datetime(2025, 1, 7, 9),
+                scheduled_end=datetime(2025, 1, 7, 10),
+            )
+        )
+        session.commit()
+        beforeScheduler = len(enqueued)
+        session.add(TimeBlockTable(task_id=taskIds[1], source=SCHEDULER_SOURCE))
+        session.commit()
+
+        task.estimated_hours = 6
+        session.flush()
+        session.rollback()
+
+    assert renamed == []
+    assert enqueued[0] == str(userId)
+    # Reassigned: both the old and the new assignee's schedules change.
+    assert sorted(enqueued[1:3]) == sorted([str(userId), str(otherUser)])
+    # Settings, then the busy block; the scheduler's block and the rolled-back edit add nothing.
+    assert enqueued[3:] == [str(userId), str(userId)]
+    assert len(enqueued) == beforeScheduler
+
+
+def test_replans_take_a_per_user_advisory_lock_on_postgres():
+    statements = []
+
+    class RecordingSession:
+        def get_bind(self):
+            return SimpleNamespace(dialect=postgresql.dialect())
+
+        def execute(self, statement):
+            statements.append(statement.compile(dialect=postgresql.dialect()))
+
+    userId = uuid.UUID("12345678-0000-0000-0000-000000000000")
+    ScheduleStore(RecordingSession()).lockUser(userId)
+
+    (statement,) = statements
+    assert "pg_advisory_xact_lock" in str(statement)
+    assert list(statement.params.values())[1] == 0x12345678
@@ -0,0 +1,115 @@
+import base64
+import uuid
+from datetime import datetime, timedelta
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from src.config.database.base_table import Base
+from src.config.database.zen_task_db_handler import getDbSession
+from src.config.exceptions.failure_exception import (ExceptionType,
+                                                     FailureException)
+from src.core.utils.pagination import decodeCursor, encodeCursor
+from src.core.utils.serialization import (compileRowSerializer,
+                                          iterJsonArray, serializerFor)
+from src.features.todos.data.models.task_model import TaskModel
+from src.features.todos.domain.enums.priority import PriorityEnum
+
+
+def test_compiled_serializer_is_cached_per_schema():
+    assert serializerFor(TaskModel) is serializerFor(TaskModel)
+    assert compileRowSerializer(("a", "b"))((1, 2)) == {"a": 1, "b": 2}
+
+
+def test_json_array_stream_matches_single_dump():
+    serializer = compileRowSerializer(("id", "priority", "due"))
+    rows = [(uuid.uuid4(), PriorityEnum.high, datetime(2025, 1, 1) + timedelta(days=i)) for i in range(25)]
+
+    streamed = b"".join(iterJsonArray(rows, serializer, batchSize=7))
+
+    assert orjson.loads(streamed) == orjson.loads(orjson.dumps([serializer(row) for row in rows]))
+    assert b"".join(iterJsonArray([], serializer)) == b"[]"
+
+
+def test_cursor_round_trip():
+    createdAt, id = datetime(2025, 1, 1, 10), uuid.uuid4()
+
+    assert decodeCursor(encodeCursor([createdAt.isoformat(), str(id)])) == [createdAt, id]
+    assert decodeCursor(None) is None
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        {"created_at": "2025-01-01T10:00:00"},
+        [],
+        ["2025-01-01T10:00:00"],
+        ["2025-01-01T10:00:00", str(uuid.uuid4()), "extra"],
+        [20250101, str(uuid.uuid4())],
+        ["2025-01-01T10:00:00", None],
+        ["yesterday", str(uuid.uuid4())],
+        ["2025-01-01T10:00:00", "not-a-uuid"],
+    ],
+)
+def test_malformed_cursors_are_validation_errors(values):
+    with pytest.raises(FailureException) as raised:
+        decodeCursor(base64.urlsafe_b64encode(orjson.dumps(values)).decode())
+
+    assert raised.value.type is ExceptionType.VALIDATION
+
+
+@pytest.fixture
+def client(sqlite_engine):
+    from src.app.main import app
+
+    def sqliteSession():
+        with Session(sqlite_engine) as session:
+            yield session
+
+    app.dependency_overrides[getDbSession] = sqliteSession
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_task_list_pages_with_keyset_cursor(client, sqlite_engine):
+    projectId = uuid.uuid4()
+    created = datetime(2025, 1, 1)
+    with Session(sqlite_engine) as session:
+        session.execute(insert(Base.metadata.tables["projects"]), [{"id": projectId, "name": "Zen"}])
+        session.execute(
+            insert(Base.metadata.tables["tasks"]),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "title": f"task{i}",
+                    "project_id": projectId,
+                    "priority": PriorityEnum.medium,
+                    "created_at": created + timedelta(minutes=i),
+                }
+                for i in range(5)
+            ],
+        )
+        session.commit()
+
+    first = client.get(f"/api/v1/projects/{projectId}/tasks", params={"limit": 3}).json()
+    second = client.get(
+        f"/api/v1/projects/{projectId}/tasks", params={"limit": 3, "cursor": first["next_cursor"]}
+    ).json()
+
+    assert [t["title"] for t in first["items"]] == ["task0", "task1", "task2"]
+    assert [t["title"] for t in second["items"]] == ["task3", "task4"]
+    assert second["next_cursor"] is None
+    assert first["items"][0]["priority"] == "medium"
+
+    exported = client.get(f"/api/v1/projects/{projectId}/tasks/export").json()
+    assert [t["title"] for t in exported] == [f"task{i}" for i in range(5)]
+
+
+@pytest.mark.parametrize("cursor", ["%%%", encodeCursor(["2025-01-01T10:00:00"])])
+def test_invalid_cursor_is_a_bad_request(client, cursor):
+    response = client.get(f"/api/v1/projects/{uuid.uuid4()}/tasks", params={"cursor": cursor})
+
+    assert response.status_code == 400
@@ -0,0 +1,110 @@
+import logging
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, select, text
+from sqlalchemy.orm import Session
+
+from src.config.database.base_table import Base
+from src.config.database.zen_task_db_handler import getDbSession
+from src.core.profiling.middleware import SqlProfilerMiddleware
+from src.core.profiling.sql_profiler import (SqlProfiler, SqlProfilerHandler,
+                                             endProfile, startProfile,
+                                             statementShape)
+from src.features.todos.domain.enums.priority import PriorityEnum
+
+
+@pytest.fixture
+def seeded(sqlite_engine):
+    projectId = uuid.uuid4()
+    taskIds = [uuid.uuid4() for _ in range(6)]
+    with Session(sqlite_engine) as session:
+        session.execute(
+            insert(Base.metadata.tables["projects"]),
+            [{"id": projectId, "name": "Zen", "updated_at": datetime(2025, 1, 1)}],
+        )
+        session.execute(
+            insert(Base.metadata.tables["tasks"]),
+            [
+                {
+                    "id": taskId,
+                    "title": f"task {i}",
+                    "project_id": projectId,
+                    "priority": PriorityEnum.low,
+                    "updated_at": datetime(2025, 1, 1),
+                }
+                for i, taskId in enumerate(taskIds)
+            ],
+        )
+        session.commit()
+    return projectId, taskIds
+
+
+def test_statement_shape_collapses_literals_and_in_lists():
+    assert statementShape("SELECT * FROM t WHERE id IN (?, ?, ?)") == statementShape(
+        "SELECT *  FROM t\nWHERE id IN (?)"
+    )
+    assert statementShape("SELECT * FROM t WHERE n = 42 AND s = 'x'") == (
+        "SELECT * FROM t WHERE n = ? AND s = ?"
+    )
+
+
+def test_slow_queries_are_timed_and_logged_with_params(sqlite_engine, caplog):
+    profiler = SqlProfiler(slowQueryMs=0, target=sqlite_engine).install()
+    profile, token = startProfile()
+    try:
+        with caplog.at_level(logging.WARNING), sqlite_engine.connect() as conn:
+            conn.execute(text("SELECT :value"), {"value": 7})
+    finally:
+        endProfile(token)
+        profiler.uninstall()
+
+    assert profile.count >= 1
+    assert profile.seconds > 0
+    assert (7,) in [slow.parameters for slow in profile.slow]
+    assert "Slow query" in caplog.text and "(7,)" in caplog.text
+
+
+def test_repeated_selects_in_one_request_are_flagged_as_n_plus_one(sqlite_engine, seeded, caplog):
+    _, taskIds = seeded
+    tasks = Base.metadata.tables["tasks"]
+    inner = FastAPI()
+
+    @inner.get("/loop")
+    def loop():
+        with Session(sqlite_engine) as session:
+            for taskId in taskIds:
+                session.execute(select(tasks.c.title).where(tasks.c.id == taskId)).one()
+        return {}
+
+    app = SqlProfilerMiddleware(inner, nPlusOneThreshold=5, exposeHeaders=True)
+    SqlProfilerHandler.profiler().install()
+    with caplog.at_level(logging.WARNING):
+        response = TestClient(app).get("/loop")
+
+    assert response.headers["x-query-count"] == "6"
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert "Possible N+1 in GET /loop: 6 x SELECT tasks.title" in caplog.text
+
+
+def test_task_detail_stays_within_query_budget(sqlite_engine, seeded, query_budget):
+    from src.app.main import app
+
+    def sqliteSession():
+        with Session(sqlite_engine) as session:
+            yield session
+
+    app.dependency_overrides[getDbSession] = sqliteSession
+    try:
+        client = TestClient(app)
+        with query_budget(1):
+            assert client.get(f"/api/v1/tasks/{seeded[1][0]}").status_code == 200
+        with pytest.raises(AssertionError, match="query budget of 1 exceeded"):
+            with query_budget(1):
+                client.get(f"/api/v1/projects/{seeded[0]}/tasks")
+                client.get(f"/api/v1/tasks/{seeded[1][0]}")
+    finally:
+        app.dependency_overrides.clear()
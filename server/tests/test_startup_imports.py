@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+import warnings
+from pathlib import Path
+
+from sqlalchemy.exc import SAWarning
+
+SERVER_ROOT = Path(__file__).resolve().parents[1]
+
+# Cumulative import time of src.app.main, in ms. Generous for slow CI runners; override locally.
+IMPORT_BUDGET_MS = int(os.environ.get("ZEN_IMPORT_BUDGET_MS", "2500"))
+
+# Optional subsystems that must only load on first use.
+LAZY_MODULES = ("strawberry", "redis", "celery", "pyarrow", "click")
+
+
+def _importTimes(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SERVER_ROOT,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative.strip())
+    return times
+
+
+def test_app_import_stays_within_budget():
+    times = _importTimes("src.app.main")
+
+    assert times["src.app.main"] / 1000 < IMPORT_BUDGET_MS
+
+
+def test_optional_subsystems_are_not_imported_at_startup():
+    times = _importTimes("src.app.main")
+
+    loaded = sorted({name.split(".")[0] for name in times} & set(LAZY_MODULES))
+    assert loaded == []
+
+
+def test_registry_sorts_tables_without_cycles():
+    from src.features.todos.data.datasource.tables.registry import (
+        configureTables, metadata)
+
+    configureTables()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", SAWarning)
+        names = [table.name for table in metadata.sorted_tables]
+
+    assert names.index("projects") < names.index("tasks") < names.index("task_logs")
@@ -0,0 +1,423 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.orm import sessionmaker
+
+from src.config.database.base_table import Base
+from src.config.database.zen_task_db_handler import getDbSession
+from src.core.security.auth.middlewares.authentication import \
+    getCurrentPrincipal
+from src.core.security.auth.services.principal_cache import Principal
+from src.core.sync import changelog, service
+from src.core.sync.changelog import (StaleVersionError, backfillChangeLog,
+                                     expectVersions, purgeTombstones,
+                                     recordChanges)
+from src.core.sync.models import SyncPushChangeModel
+from src.core.sync.service import SyncService
+from src.features.todos.data.datasource.daos.template_dao import TemplateDao
+from src.features.todos.data.datasource.tables.project_table import \
+    ProjectTable
+from src.features.todos.data.datasource.tables.task_log_table import \
+    TaskLogTable
+from src.features.todos.data.datasource.tables.task_table import TaskTable
+from src.features.todos.domain.enums.priority import PriorityEnum
+
+tables = Base.metadata.tables
+
+OWNER = uuid.uuid4()
+
+
+@pytest.fixture
+def sessions(sqlite_engine, monkeypatch):
+    factory = sessionmaker(sqlite_engine, expire_on_commit=False)
+    monkeypatch.setattr(changelog, "_installed", False)
+    changelog.installChangeLog(target=factory)
+    return factory
+
+
+def _pullAll(session, since=0, limit=1000, userId=OWNER):
+    changes = []
+    while True:
+        page = SyncService(session, userId).pull(since, limit)
+        changes.extend(page["changes"])
+        since = page["cursor"]
+        if not page["has_more"]:
+            return changes, since
+
+
+def test_orm_writes_are_logged_compacted_and_tombstoned(sessions):
+    with sessions() as session:
+        project = ProjectTable(name="Apollo", owner_id=OWNER)
+        tasks = [TaskTable(title=f"task {i}", project=project) for i in range(3)]
+        session.add_all([project, *tasks])
+        session.commit()
+        session.add(TaskLogTable(task_id=tasks[0].id, notes="started"))
+        tasks[1].title = "renamed"
+        tasks[1].title = "renamed twice"
+        session.commit()
+        session.delete(tasks[2])
+        session.commit()
+
+        changes, cursor = _pullAll(session, limit=2)
+
+    # Every row appears once, at its latest version, in version order.
+    assert [change["version"] for change in changes] == sorted(c["version"] for c in changes)
+    assert len({(change["entity"], change["id"]) for change in changes}) == len(changes) == 5
+    byId = {change["id"]: change for change in changes}
+    assert byId[tasks[1].id]["data"]["title"] == "renamed twice"
+    assert byId[tasks[2].id] == {
+        "entity": "tasks", "id": tasks[2].id, "version": cursor, "op": "delete",
+    }
+    assert byId[project.id]["data"]["name"] == "Apollo"
+
+
+def test_pulls_scale_with_changes_not_with_the_dataset(sessions, query_budget):
+    with sessions() as session:
+        session.execute(
+            insert(tables["tasks"]),
+            [{"id": uuid.uuid4(), "title": f"t{i}", "assigned_to": OWNER} for i in range(2000)],
+        )
+        session.commit()
+        _, cursor = _pullAll(session)
+
+        touched = session.scalars(select(TaskTable).limit(3)).all()
+        for task in touched:
+            task.priority = PriorityEnum.high
+        session.commit()
+
+        with query_budget(3):  # purge check, log range, one lookup for the one table involved
+            page = SyncService(session, OWNER).pull(cursor, 500)
+
+    assert {change["id"] for change in page["changes"]} == {task.id for task in touched}
+    assert page["changes"][0]["data"]["priority"] is PriorityEnum.high
+    assert page["has_more"] is False
+
+
+def test_bulk_statements_are_resolved_to_the_rows_they_touch(sessions):
+    blocks = tables["time_blocks"]
+    taskId = uuid.uuid4()
+    with sessions() as session:
+        session.execute(
+            insert(tables["tasks"]), [{"id": taskId, "title": "focus", "assigned_to": OWNER}]
+        )
+        session.execute(insert(blocks), [{"task_id": taskId, "source": "scheduler"}] * 3)
+        session.commit()
+        _, cursor = _pullAll(session)
+        blockIds = list(session.scalars(select(blocks.c.id).order_by(blocks.c.id)))
+
+        session.execute(update(blocks).where(blocks.c.id == blockIds[0]).values(location="desk"))
+        session.execute(
+            update(blocks)
+            .where(blocks.c.id == bindparam("key"))
+            .values(focus_score=bindparam("s")),
+            [{"key": blockIds[1], "s": 0.9}],
+        )
+        session.execute(delete(blocks).where(blocks.c.id == blockIds[2]))
+        session.commit()
+        changes, _ = _pullAll(session, cursor)
+
+    assert {(change["id"], change["op"]) for change in changes} == {
+        (blockIds[0], "upsert"), (blockIds[1], "upsert"), (blockIds[2], "delete"),
+    }
+
+
+def test_rolled_back_writes_leave_no_trace_and_connection_writes_are_recorded(sessions):
+    tasksTable = tables["tasks"]
+    taskId = uuid.uuid4()
+    with sessions() as session:
+        session.add(TaskTable(id=taskId, title="draft", assigned_to=OWNER))
+        session.flush()
+        session.rollback()
+        assert _pullAll(session) == ([], 0)
+
+        session.execute(insert(tasksTable), [{"id": taskId, "title": "kept", "assigned_to": OWNER}])
+        session.commit()
+        session.connection().execute(
+            update(tasksTable).where(tasksTable.c.id == taskId).values(ai_priority_score=2.5)
+        )
+        recordChanges(session, "tasks", [taskId])
+        session.commit()
+        changes, cursor = _pullAll(session)
+
+    assert [change["version"] for change in changes] == [cursor] == [2]
+    assert changes[0]["data"]["ai_priority_score"] == 2.5
+
+
+def test_expected_versions_are_checked_at_commit(sessions):
+    with sessions() as session:
+        task = TaskTable(title="shared", assigned_to=OWNER)
+        session.add(task)
+        session.commit()
+        key = ("tasks", task.id)
+
+        task.title = "mine"
+        expectVersions(session, {key: 0})
+        with pytest.raises(StaleVersionError) as raised:
+            session.commit()
+        session.rollback()
+        assert raised.value.keys == [key]
+
+        task.title = "mine"
+        expectVersions(session, {key: 1})
+        session.commit()
+        assert _pullAll(session)[0][0]["data"]["title"] == "mine"
+
+
+def test_purged_tombstones_send_old_clients_back_to_a_full_sync(sessions):
+    with sessions() as session:
+        tasks = [TaskTable(title=f"t{i}", assigned_to=OWNER) for i in range(3)]
+        session.add_all(tasks)
+        session.commit()
+        session.delete(tasks[0])
+        session.commit()
+        staleCursor = 1
+
+        assert purgeTombstones(session, datetime.utcnow() + timedelta(seconds=1)) == 1
+        assert SyncService(session, OWNER).pull(staleCursor, 100)["reset"] is True
+        changes, _ = _pullAll(session)
+        assert {change["id"] for change in changes} == {tasks[1].id, tasks[2].id}
+
+
+def test_backfill_logs_rows_written_before_the_change_log(sqlite_engine, sessions):
+    with sqlite_engine.begin() as connection:  # no session, so nothing is logged
+        connection.execute(
+            insert(tables["projects"]), [{"id": uuid.uuid4(), "name": "old", "owner_id": OWNER}]
+        )
+        connection.execute(
+            insert(tables["tasks"]),
+            [{"id": uuid.uuid4(), "title": "old", "assigned_to": OWNER}, {"id": uuid.uuid4(), "title": "nobody's", "assigned_to": None}],
+        )
+
+    with sessions() as session:
+        assert backfillChangeLog(session, batchSize=1) == 3
+        assert backfillChangeLog(session) == 1  # the unheld task is looked at, but not logged
+        assert {change["entity"] for change in _pullAll(session)[0]} == {"projects", "tasks"}
+
+
+def test_instantiated_templates_are_logged(sessions):
+    roadmap = {
+        "project": {"name": "Template"},
+        "phases": [
+            {
+                "name": "Build",
+                "duration_weeks": 1,
+                "weeks": [
+                    {
+                        "week_number": 1,
+                        "categories": [
+                            {"category": "Code", "tasks": [{"title": "API", "subtasks": ["a"]}]}
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+    with sessions() as session:
+        dao = TemplateDao(session)
+        templateId = dao.importRoadmap(roadmap)
+        session.commit()
+        projectId = dao.instantiateProject(templateId, ownerId=OWNER)
+        session.commit()
+
+        changes, _ = _pullAll(session)
+        taskIds = session.scalars(
+            select(TaskTable.id).where(TaskTable.project_id == projectId)
+        ).all()
+
+    assert {(change["entity"], change["id"]) for change in changes} == {
+        ("projects", projectId), *(("tasks", taskId) for taskId in taskIds),
+    }
+    assert len(changes) == 1 + 3  # the project, its phase task, the task and its subtask
+
+
+def _principal(userId):
+    return Principal(id=userId, username="u", email="u@example.com", role=None, status=None)
+
+
+@pytest.fixture
+def client(sessions):
+    from src.app.main import app
+
+    def sqliteSession():
+        with sessions() as session:
+            yield session
+
+    app.dependency_overrides[getDbSession] = sqliteSession
+    app.dependency_overrides[getCurrentPrincipal] = lambda: _principal(OWNER)
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_push_applies_current_changes_and_reports_conflicts(client):
+    projectId, taskId = uuid.uuid4(), uuid.uuid4()
+    created = client.post(
+        "/api/v1/sync/changes",
+        json={
+            "changes": [
+                {"entity": "projects", "id": str(projectId), "data": {"name": "Offline"}},
+                {
+                    "entity": "tasks",
+                    "id": str(taskId),
+                    "data": {
+                        "title": "written offline",
+                        "project_id": str(projectId),
+                        "priority": "high",
+                        "due_date": "2025-06-01",
+                        "completed_at": "2025-05-30T10:00:00+02:00",
+                    },
+                },
+            ]
+        },
+    ).json()
+    assert created["conflicts"] == []
+    versions = {item["id"]: item["version"] for item in created["applied"]}
+
+    # Another device edits the task; this one's edit is based on the old version.
+    client.post(
+        "/api/v1/sync/changes",
+        json={"changes": [{"entity": "tasks", "id": str(taskId),
+                           "base_version": versions[str(taskId)], "data": {"title": "theirs"}}]},
+    )
+    result = client.post(
+        "/api/v1/sync/changes",
+        json={"changes": [
+            {"entity": "tasks", "id": str(taskId), "base_version": versions[str(taskId)],
+             "data": {"title": "mine"}},
+            {"entity": "projects", "id": str(projectId), "base_version": versions[str(projectId)],
+             "op": "delete"},
+        ]},
+    ).json()
+
+    assert [item["id"] for item in result["applied"]] == [str(projectId)]
+    (conflict,) = result["conflicts"]
+    assert conflict["server"]["data"]["title"] == "theirs"
+    assert conflict["server"]["data"]["completed_at"] == "2025-05-30T08:00:00"
+    assert conflict["server"]["version"] > versions[str(taskId)]
+
+    page = client.get("/api/v1/sync/changes", params={"since": max(versions.values())}).json()
+    assert [(change["entity"], change["op"]) for change in page["changes"]] == [
+        ("tasks", "upsert"), ("projects", "delete"),
+    ]
+
+
+def test_push_retries_when_a_writer_commits_after_the_version_check(sessions, monkeypatch):
+    with sessions() as session:
+        task = TaskTable(title="shared", assigned_to=OWNER)
+        session.add(task)
+        session.commit()
+        taskId = task.id
+
+    real, calls = service.currentVersions, []
+
+    def staleFirstRead(session, keys):
+        calls.append(keys)
+        return {} if len(calls) == 1 else real(session, keys)  # as read before another commit
+
+    monkeypatch.setattr(service, "currentVersions", staleFirstRead)
+    with sessions() as session:
+        result = SyncService(session, OWNER).push(
+            [SyncPushChangeModel(entity="tasks", id=taskId, data={"title": "clobber"})]
+        )
+        assert session.get(TaskTable, taskId).title == "shared"
+
+    assert len(calls) == 2
+    assert result["applied"] == [] and result["conflicts"][0]["server"]["version"] == 1
+
+
+def test_push_rejects_unknown_columns_and_pull_is_gzipped(client):
+    bad = client.post(
+        "/api/v1/sync/changes",
+        json={"changes": [{"entity": "tasks", "id": str(uuid.uuid4()), "data": {"nope": 1}}]},
+    )
+    assert bad.status_code == 400
+
+    client.post(
+        "/api/v1/sync/changes",
+        json={"changes": [
+            {"entity": "tasks", "id": str(uuid.uuid4()), "data": {"title": f"task {i}" * 10}}
+            for i in range(50)
+        ]},
+    )
+    response = client.get(
+        "/api/v1/sync/changes", params={"limit": 20}, headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    page = response.json()
+    assert (len(page["changes"]), page["has_more"], page["cursor"]) == (20, True, 20)
+    small = client.get("/api/v1/sync/changes", params={"since": 49})
+    assert "content-encoding" not in small.headers
+
+
+def test_users_pull_only_their_rows_and_tombstones_for_rows_they_lose(sessions):
+    assignee, other = uuid.uuid4(), uuid.uuid4()
+    with sessions() as session:
+        project = ProjectTable(name="Apollo", owner_id=OWNER)
+        task = TaskTable(title="shared", project=project, assigned_to=assignee)
+        elsewhere = ProjectTable(name="Gemini", owner_id=other)
+        session.add_all([project, task, elsewhere])
+        session.flush()
+        log = TaskLogTable(task_id=task.id, notes="started")
+        session.add(log)
+        session.commit()
+
+        def seen(userId, since=0):
+            changes, cursor = _pullAll(session, since, userId=userId)
+            return {change["id"]: change["op"] for change in changes}, cursor
+
+        assert seen(OWNER)[0] == {project.id: "upsert", task.id: "upsert", log.id: "upsert"}
+        assert seen(assignee)[0] == {task.id: "upsert", log.id: "upsert"}
+        assert seen(other)[0] == {elsewhere.id: "upsert"}
+        cursor = seen(OWNER)[1]
+
+        task.assigned_to = other  # the log is not written, but moves with its task
+        session.commit()
+
+        assert seen(assignee, cursor)[0] == {task.id: "delete", log.id: "delete"}
+        assert seen(other, cursor)[0] == {task.id: "upsert", log.id: "upsert"}
+        assert seen(OWNER, cursor)[0] == {task.id: "upsert", log.id: "upsert"}
+
+
+def test_pushes_stay_within_the_callers_rows(client):
+    projectId, taskId = uuid.uuid4(), uuid.uuid4()
+    created = client.post(
+        "/api/v1/sync/changes",
+        json={"changes": [
+            {"entity": "projects", "id": str(projectId), "data": {"name": "Mine"}},
+            {"entity": "tasks", "id": str(taskId),
+             "data": {"title": "mine", "project_id": str(projectId)}},
+        ]},
+    ).json()
+    assert created["conflicts"] == []
+    owners = {
+        change["id"]: change["data"].get("owner_id") or change["data"].get("assigned_to")
+        for change in client.get("/api/v1/sync/changes").json()["changes"]
+    }
+    assert owners == {str(projectId): str(OWNER), str(taskId): str(OWNER)}
+
+    handOver = client.post(
+        "/api/v1/sync/changes",
+        json={"changes": [{"entity": "tasks", "id": str(taskId), "base_version": 2,
+                           "data": {"assigned_to": str(uuid.uuid4())}}]},
+    )
+    assert handOver.status_code == 400
+
+    intruder = uuid.uuid4()
+    client.app.dependency_overrides[getCurrentPrincipal] = lambda: _principal(intruder)
+    assert client.get("/api/v1/sync/changes").json()["changes"] == []
+    edit = client.post(
+        "/api/v1/sync/changes",
+        json={"changes": [{"entity": "tasks", "id": str(taskId), "base_version": 2,
+                           "data": {"title": "hijacked"}}]},
+    )
+    planted = client.post(
+        "/api/v1/sync/changes",
+        json={"changes": [{"entity": "tasks", "id": str(uuid.uuid4()),
+                           "data": {"title": "planted", "project_id": str(projectId)}}]},
+    )
+    assert (edit.status_code, planted.status_code) == (404, 404)
+
+    del client.app.dependency_overrides[getCurrentPrincipal]
+    assert client.get("/api/v1/sync/changes").status_code == 401
@@ -0,0 +1,151 @@
+import asyncio
+
+from pydantic import BaseModel
+from returns.result import Failure, Success
+
+from src.config.exceptions.failure_exception import FailureException
+from src.config.generics.usecase import Usecase
+from src.config.generics.usecase_executor import (SingleFlightUsecase,
+                                                  UsecaseExecutor, paramsKey)
+from src.core.metrics.registry import MetricsRegistry
+
+
+class BoardParams(BaseModel):
+    projectId: str
+    limit: int = 100
+
+
+class GetBoard(Usecase[dict, BoardParams]):
+    def __init__(self, delay: float = 0.01, fail: bool = False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    async def call(self, params: BoardParams):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            return Failure(FailureException(message="board unavailable"))
+        return Success({"project": params.projectId, "load": self.calls})
+
+    def singleFlightKey(self, params: BoardParams):
+        return params  # the same board for everyone allowed to see it
+
+
+class GetMyBoard(GetBoard):
+    """Per-user: only the caller's own cards."""
+
+    def __init__(self, userId: str, **kwargs):
+        super().__init__(**kwargs)
+        self.userId = userId
+
+    def singleFlightKey(self, params: BoardParams):
+        return (self.userId, params)
+
+
+class GetUnkeyedBoard(GetBoard):
+    def singleFlightKey(self, params: BoardParams):
+        return None
+
+
+class GetArchivedBoard(GetBoard):
+    pass
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_concurrent_equal_reads_share_one_call():
+    registry = MetricsRegistry()
+    executor = UsecaseExecutor(registry=registry)
+    usecase = GetBoard()
+
+    async def scenario():
+        return await asyncio.gather(
+            *(executor.read(usecase, BoardParams(projectId="p1")) for _ in range(200)),
+            executor.read(usecase, BoardParams(projectId="p2")),
+        )
+
+    results = asyncio.run(scenario())
+
+    assert usecase.calls == 2
+    assert {result.unwrap()["load"] for result in results[:200]} == {results[0].unwrap()["load"]}
+    assert executor.stats.toDict() == {"calls": 201, "executed": 2, "collapsed": 199, "memoized": 0}
+    samples = registry.snapshot()["usecase_calls_total"]["samples"]
+    assert [["GetBoard", "collapsed"], 199] in samples
+
+
+def test_reads_are_only_shared_within_their_key():
+    executor = UsecaseExecutor()
+    alice, alsoAlice, bob = GetMyBoard("alice"), GetMyBoard("alice"), GetMyBoard("bob")
+    unkeyed = GetUnkeyedBoard()
+    params = BoardParams(projectId="p1")
+
+    async def scenario():
+        return await asyncio.gather(
+            executor.read(alice, params),
+            executor.read(alsoAlice, params),
+            executor.read(bob, params),
+            *(executor.read(unkeyed, params) for _ in range(3)),
+        )
+
+    results = asyncio.run(scenario())
+
+    assert (alice.calls, alsoAlice.calls, bob.calls, unkeyed.calls) == (1, 0, 1, 3)
+    assert results[0] is results[1]
+    assert results[2] is not results[0]
+    assert executor.stats.collapsed == 1
+
+
+def test_memo_window_serves_recent_successes_only():
+    clock = FakeClock()
+    executor = UsecaseExecutor(memoSeconds=0.5, clock=clock)
+    board, broken = GetBoard(delay=0), GetArchivedBoard(delay=0, fail=True)
+    params = BoardParams(projectId="p1")
+
+    async def scenario():
+        await executor.read(board, params)
+        await executor.read(board, params)
+        clock.now = 0.6
+        await executor.read(board, params)
+        await executor.read(broken, params)
+        await executor.read(broken, params)
+
+    asyncio.run(scenario())
+
+    assert board.calls == 2
+    assert broken.calls == 2
+    assert executor.stats.memoized == 1
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_read():
+    executor = UsecaseExecutor()
+    usecase = GetBoard(delay=0.05)
+
+    async def scenario():
+        first = asyncio.ensure_future(executor.read(usecase, BoardParams(projectId="p1")))
+        second = asyncio.ensure_future(executor.read(usecase, BoardParams(projectId="p1")))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(scenario()).unwrap()["project"] == "p1"
+    assert usecase.calls == 1
+
+
+def test_wrapped_usecase_and_unhashable_params():
+    executor = UsecaseExecutor()
+    wrapped = SingleFlightUsecase(GetBoard(), executor)
+
+    async def scenario():
+        return await asyncio.gather(*(wrapped.call(BoardParams(projectId="p1")) for _ in range(5)))
+
+    assert len(asyncio.run(scenario())) == 5
+    assert executor.stats.executed == 1
+    assert paramsKey({"b": [1], "a": 2}) == paramsKey({"a": 2, "b": [1]})
+    assert paramsKey(BoardParams(projectId="p1")) != paramsKey(BoardParams(projectId="p1", limit=5))
@@ -0,0 +1,69 @@
+import pytest
+
+from src.workers.celery_app import BATCH_QUEUE, celery_app, configureEager
+from src.workers.fanout import fanOut
+from src.workers.idempotency import (MemoryIdempotencyStore, idempotent,
+                                     setIdempotencyStore)
+
+processed = []
+
+
+@celery_app.task(name="tests.collectProject")
+@idempotent(lambda projectId, revision=None: f"{projectId}:{revision}")
+def collectProject(projectId, revision=None):
+    processed.append(projectId)
+    return projectId
+
+
+@celery_app.task(name="tests.failingJob")
+@idempotent(lambda key: key)
+def failingJob(key):
+    processed.append(key)
+    raise RuntimeError("boom")
+
+
+@pytest.fixture(autouse=True)
+def eagerPipeline():
+    configureEager()
+    setIdempotencyStore(MemoryIdempotencyStore())
+    processed.clear()
+    yield
+    setIdempotencyStore(None)
+
+
+def test_eager_mode_runs_without_broker():
+    assert collectProject.delay("p1").get() == "p1"
+    assert processed == ["p1"]
+
+
+def test_duplicate_job_is_skipped_until_revision_changes():
+    collectProject.delay("p1", "r1")
+    collectProject.delay("p1", "r1")
+    collectProject.delay("p1", "r2")
+
+    assert processed == ["p1", "p1"]
+
+
+def test_failed_job_releases_its_claim():
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            failingJob.delay("k1")
+
+    assert processed == ["k1", "k1"]
+
+
+def test_fan_out_chunks_every_project():
+    projectIds = [f"p{i}" for i in range(23)]
+
+    fanOut(collectProject, projectIds, chunkSize=5)
+
+    assert sorted(processed) == sorted(projectIds)
+
+
+def test_queues_split_by_priority():
+    routes = celery_app.conf.task_routes
+    queues = {queue.name for queue in celery_app.conf.task_queues}
+
+    assert queues == {"interactive", "batch"}
+    assert celery_app.conf.task_default_queue == BATCH_QUEUE
+    assert routes["src.workers.tasks.rescoring.rescoreProjectTasks"]["queue"] == "interactive"